@@ -8,10 +8,23 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from app.import_profile import enable_from_argv
+
+# --import-profile: 종료 시 모듈별 import 비용을 stderr로 출력
+_profiler = enable_from_argv()
+if _profiler is not None:
+    import atexit
+
+    atexit.register(lambda: print(_profiler.report(), file=sys.stderr))
+
 from config import settings
+from scraper.control import CrawlControl
 from scraper.dabang_scraper import DabangScraper, ScrapeOptions
+from scraper.memprof import MemoryProfiler
+from scraper.metrics import REGISTRY, serve_metrics
+from scraper.progress import ProgressTracker, start_reporter
+from scraper.tracing import Tracer, set_tracer, span
 from storage.exporter import save_to_excel
-import threading
 
 
 def main() -> None:
@@ -25,9 +38,37 @@ def main() -> None:
     p.add_argument("--headless", dest="headless", action="store_true", default=settings.browser.headless)
     p.add_argument("--no-headless", dest="headless", action="store_false")
     p.add_argument("--outdir", default=settings.paths.output)
+    p.add_argument("--progress-interval", type=float, default=10.0,
+                   help="진행 상황(처리량/ETA) 출력 주기(초), 0이면 끔")
+    p.add_argument("--deadline", type=float, default=0,
+                   help="최대 실행 시간(초). 지나면 모은 결과까지만 저장, 0이면 무제한")
+    p.add_argument("--trace", metavar="PATH",
+                   help="단계별 구간을 Chrome trace JSON으로 저장 (chrome://tracing, ui.perfetto.dev)")
+    p.add_argument("--har", metavar="PATH", help="세션의 요청/응답을 HAR로 기록 (.har 또는 .zip)")
+    p.add_argument("--replay-har", metavar="PATH", help="기록한 HAR로 네트워크 없이 재생")
+    p.add_argument("--net-latency", type=float, default=0.0,
+                   help="응답 지연(ms): 재생 중에는 HAR 응답마다, 라이브에서는 CDP로 RTT 추가")
+    p.add_argument("--net-jitter", type=float, default=0.0, help="재생 지연 ± 흔들림(ms)")
+    p.add_argument("--net-kbps", type=float, default=0.0, help="라이브 다운로드 대역폭 제한(kbps), 0이면 무제한")
+    p.add_argument("--memprof", type=int, default=0, metavar="N",
+                   help="N페이지마다 Python(tracemalloc)/Chromium(CDP) 메모리 기록, 종료 시 증가 상위 출력. 0이면 끔")
+    p.add_argument("--memprof-out", metavar="PATH", help="메모리 샘플/증가 위치를 JSON으로 저장")
+    p.add_argument("--metrics-port", type=int, default=0,
+                   help="127.0.0.1:<port>/metrics 로 Prometheus 지표 노출, 0이면 끔")
+    p.add_argument("--metrics-out", metavar="PATH",
+                   help="종료 시 지표를 파일로 저장 (.json이면 JSON, 아니면 Prometheus 텍스트)")
+    p.add_argument("--daemon", action="store_true",
+                   help="떠 있는 수집 데몬(python -m app.daemon)에 작업을 맡김 (브라우저 기동 생략)")
+    # 실제 처리는 모듈 로드 시 enable_from_argv()가 담당 (도움말 표시용)
+    p.add_argument("--import-profile", action="store_true", help="종료 시 모듈별 import 비용 출력")
     args = p.parse_args()
+    if args.daemon:
+        sys.exit(run_via_daemon(args))
 
-    stop = threading.Event()
+    tracer = Tracer() if args.trace else None
+    set_tracer(tracer)
+    metrics_server = serve_metrics(args.metrics_port) if args.metrics_port else None
+    stop = CrawlControl(deadline_s=args.deadline or None)
     opts = ScrapeOptions(
         region=args.region,
         property_type=args.type,
@@ -36,13 +77,85 @@ def main() -> None:
         max_items=args.limit,
         max_pages=args.pages,
         headless=args.headless,
+        record_har_path=args.har,
+        replay_har_path=args.replay_har,
+        net_latency_ms=args.net_latency,
+        net_jitter_ms=args.net_jitter,
+        net_download_kbps=args.net_kbps,
     )
-    scraper = DabangScraper(opts, stop)
+    n_types = 6 if args.type == "전체" else 1
+    tracker = ProgressTracker(target=args.limit * n_types)
+    reporter = None
+    if args.progress_interval > 0:
+        reporter = start_reporter(tracker, lambda m: print(m, file=sys.stderr, flush=True), args.progress_interval)
+    memprof = MemoryProfiler(every_pages=args.memprof) if args.memprof > 0 else None
+    scraper = DabangScraper(opts, stop, progress=tracker, memprof=memprof)
     items = scraper.run()
-    out = save_to_excel(items, Path(args.outdir), args.region)
+    tracker.set_phase("export")
+    with span("export", items=len(items)):
+        out = save_to_excel(items, Path(args.outdir), args.region)
+    if reporter:
+        reporter.set()
+    tracker.set_phase("done")
+    print(tracker.snapshot().format(), file=sys.stderr)
+    if tracer is not None:
+        trace_path = tracer.export(Path(args.trace))
+        print(f"trace: {trace_path} ({tracer.format_summary(6)})", file=sys.stderr)
+    if memprof is not None:
+        print(memprof.format_report(), file=sys.stderr)
+        if args.memprof_out:
+            print(f"memprof: {memprof.export(Path(args.memprof_out))}", file=sys.stderr)
+    if args.metrics_out:
+        print(f"metrics: {REGISTRY.dump(Path(args.metrics_out))}", file=sys.stderr)
+    if metrics_server is not None:
+        metrics_server.shutdown()
     print(str(out))
 
 
+def run_via_daemon(args: argparse.Namespace) -> int:
+    """데몬에 제출하고 결과를 받아 보며 기다린다. 추적/HAR/메모리 옵션은 데몬 쪽에 적용되지 않는다."""
+    from app.daemon_client import DaemonClient, DaemonError
+
+    client = DaemonClient()
+    if not client.is_running():
+        print(f"수집 데몬에 연결할 수 없습니다 ({client.base_url}). 먼저 python -m app.daemon 을 실행하세요.",
+              file=sys.stderr)
+        return 2
+    job_id = client.submit(
+        region=args.region,
+        property_type=args.type,
+        max_items=args.limit,
+        max_pages=args.pages,
+        headless=args.headless,
+        deadline=args.deadline,
+        outdir=str(Path(args.outdir).resolve()),
+    )
+    print(f"작업 {job_id} 제출", file=sys.stderr, flush=True)
+    job = {}
+    n = 0
+    try:
+        for event in client.stream(job_id):
+            if event["type"] == "item":
+                n += 1
+                if n % 10 == 0:
+                    print(f"{n}건 수신", file=sys.stderr, flush=True)
+            elif event["type"] == "end":
+                job = event["job"]
+    except KeyboardInterrupt:
+        print(f"작업 취소 요청: {client.cancel(job_id)}", file=sys.stderr)
+        return 130
+    except DaemonError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    print(f"작업 {job_id} {job.get('status')}: {job.get('items', n)}건", file=sys.stderr)
+    if job.get("status") == "failed":
+        print(job.get("error") or "", file=sys.stderr)
+        return 1
+    if job.get("output"):
+        print(job["output"])
+    return 0
+
+
 if __name__ == "__main__":
     main()
 
@@ -8,6 +8,7 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from scraper.control import CrawlControl
 from scraper.dabang_selenium import DabangSelenium, SelOptions
 from storage.exporter import save_to_excel
 
@@ -19,10 +20,11 @@ def main() -> None:
     p.add_argument("--limit", type=int, default=100)
     p.add_argument("--headless", action="store_true", default=True)
     p.add_argument("--outdir", default="output")
+    p.add_argument("--deadline", type=float, default=0, help="최대 실행 시간(초), 0이면 무제한")
     args = p.parse_args()
 
     opts = SelOptions(region=args.region, property_type=args.type, max_items=args.limit, headless=args.headless)
-    rows = DabangSelenium(opts).run()
+    rows = DabangSelenium(opts, CrawlControl(deadline_s=args.deadline or None)).run()
     out = save_to_excel(rows, Path(args.outdir), args.region)
     print(str(out))
 
@@ -0,0 +1,174 @@
+"""분산 수집 작업자 CLI (storage.work_queue).
+
+여러 머신이 같은 대기열(공유 디스크의 SQLite 파일)을 바라보고 지역 × 매물 종류 작업을 나눠 수집한다.
+
+예) python -m app.cli_worker add --region 강남구 --region 마포구 --types 원룸,투룸
+    python -m app.cli_worker work            # 머신마다 하나씩 (작업이 떨어질 때까지)
+    python -m app.cli_worker status
+    python -m app.cli_worker export --outdir output
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import sys
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from loguru import logger  # noqa: E402
+
+from config import settings  # noqa: E402
+from scraper.control import CrawlControl  # noqa: E402
+from storage.work_queue import PROPERTY_TYPES, WorkQueue, open_queue, run_worker  # noqa: E402
+
+
+def _split(values: List[str]) -> List[str]:
+    return [v.strip() for value in values for v in value.split(",") if v.strip()]
+
+
+def make_scrape(headless: bool):
+    """작업 하나를 DabangScraper로 수집하는 함수와, 작업 사이에 계속 쓰는 브라우저."""
+    from app.daemon import WarmBrowser
+    from scraper.dabang_scraper import DabangScraper, ScrapeOptions
+
+    warm = WarmBrowser(headless)
+    d = settings.defaults
+
+    def scrape(task, control, on_item) -> None:
+        p = task.params
+        opts = ScrapeOptions(
+            region=task.region,
+            property_type=task.property_type,
+            price_min=int(p.get("price_min", d.price_min)),
+            price_max=int(p.get("price_max", d.price_max)),
+            max_items=int(p.get("max_items", d.max_items)),
+            max_pages=int(p.get("max_pages", d.max_pages)),
+            headless=headless,
+        )
+        scraper = DabangScraper(opts, control, item_cb=lambda it: on_item(asdict(it)), browser=warm.get())
+        scraper.run()
+        if scraper.error:
+            raise RuntimeError(scraper.error)
+
+    return scrape, warm
+
+
+def cmd_add(queue: WorkQueue, args: argparse.Namespace) -> int:
+    regions = _split(args.region)
+    if args.regions_file:
+        regions += [ln.strip() for ln in Path(args.regions_file).read_text(encoding="utf-8").splitlines() if ln.strip()]
+    types = _split([args.types])
+    if not regions:
+        print("--region 또는 --regions-file이 필요합니다", file=sys.stderr)
+        return 2
+    if "전체" in types:
+        types = PROPERTY_TYPES
+    params = {"max_items": args.limit, "max_pages": args.pages, "price_min": args.price_min, "price_max": args.price_max}
+    added = queue.add_tasks(regions, types, params)
+    print(f"작업 {added}개 추가 (지역 {len(regions)} × 종류 {len(types)}, 이미 있던 작업 제외)")
+    return 0
+
+
+def cmd_work(queue: WorkQueue, args: argparse.Namespace) -> int:
+    cfg = settings.work_queue
+    scrape, warm = make_scrape(args.headless)
+    control = CrawlControl()
+    total = 0
+    try:
+        while True:
+            total += run_worker(
+                queue, args.owner, scrape, control,
+                lease_s=cfg.lease_s, heartbeat_s=cfg.heartbeat_s, upload_batch=cfg.upload_batch,
+                max_tasks=args.max_tasks - total if args.max_tasks else 0,
+            )
+            # --wait: 다른 작업자가 쥐고 있는 작업이 만료되면 이어 받는다
+            if not args.wait or control.should_stop() or queue.stats()["leased"] == 0:
+                break
+            if args.max_tasks and total >= args.max_tasks:
+                break
+            control.sleep(cfg.heartbeat_s)
+    except KeyboardInterrupt:
+        # 쥐고 있던 작업은 임대 만료 후 다른 작업자가 가져간다
+        control.request_stop("user")
+    finally:
+        warm.close()
+    print(f"{args.owner}: 작업 {total}개 완료 · {queue.stats()}")
+    return 0
+
+
+def cmd_status(queue: WorkQueue, args: argparse.Namespace) -> int:
+    tasks = queue.tasks()
+    print(f"{queue.stats()} · 결과 {sum(t.items for t in tasks)}건")
+    for t in tasks:
+        if args.all or t.status in ("leased", "failed"):
+            who = f" · {t.owner}" if t.status == "leased" else ""
+            err = f" · {t.error}" if t.error and t.status != "done" else ""
+            print(f"  {t.status:<8}{t.id:<24} 시도 {t.attempts} · {t.items}건{who}{err}")
+    return 0
+
+
+def cmd_export(queue: WorkQueue, args: argparse.Namespace) -> int:
+    from scraper.dabang_scraper import Item
+    from storage.exporter import save_to_excel
+
+    names = {f.name for f in fields(Item)}
+    items = [Item(**{k: v for k, v in row.items() if k in names}) for row in queue.results()]
+    if not items:
+        print("결과 없음", file=sys.stderr)
+        return 1
+    print(str(save_to_excel(items, Path(args.outdir), args.name)))
+    return 0
+
+
+def main() -> int:
+    d = settings.defaults
+    p = argparse.ArgumentParser(description="분산 수집 작업 대기열")
+    p.add_argument("--queue", default=settings.work_queue.path, help="대기열 SQLite 경로 (머신끼리 공유)")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    a = sub.add_parser("add", help="지역 × 매물 종류 작업 추가")
+    a.add_argument("--region", action="append", default=[], help="지역 (여러 번 또는 쉼표로)")
+    a.add_argument("--regions-file", help="한 줄에 지역 하나")
+    a.add_argument("--types", default="전체", help=f"쉼표로 구분: {','.join(PROPERTY_TYPES)} 또는 전체")
+    a.add_argument("--limit", type=int, default=d.max_items)
+    a.add_argument("--pages", type=int, default=d.max_pages)
+    a.add_argument("--price-min", type=int, default=d.price_min)
+    a.add_argument("--price-max", type=int, default=d.price_max)
+
+    w = sub.add_parser("work", help="작업을 가져와 수집")
+    w.add_argument("--owner", default=f"{socket.gethostname()}-{os.getpid()}", help="작업자 이름")
+    w.add_argument("--max-tasks", type=int, default=0, help="이만큼 끝내면 종료, 0이면 대기열이 빌 때까지")
+    w.add_argument("--wait", action="store_true", help="남은 작업이 다른 작업자 손에 있으면 만료를 기다려 이어 받기")
+    w.add_argument("--headless", dest="headless", action="store_true", default=settings.browser.headless)
+    w.add_argument("--no-headless", dest="headless", action="store_false")
+
+    s = sub.add_parser("status", help="작업 현황")
+    s.add_argument("--all", action="store_true", help="완료/대기 작업도 표시")
+
+    e = sub.add_parser("export", help="합쳐진 결과를 엑셀로 저장")
+    e.add_argument("--outdir", default=settings.paths.output)
+    e.add_argument("--name", default="sweep", help="파일 이름에 들어갈 지역 자리")
+
+    args = p.parse_args()
+    queue = open_queue(Path(args.queue))
+    if args.cmd == "work":
+        Path(settings.paths.logs).mkdir(parents=True, exist_ok=True)
+        logger.add(
+            Path(settings.paths.logs) / "worker_{time:YYYYMMDD}.log",
+            encoding="utf-8", rotation="00:00", level=settings.logging.file_level, enqueue=True,
+        )
+    try:
+        return {"add": cmd_add, "work": cmd_work, "status": cmd_status, "export": cmd_export}[args.cmd](queue, args)
+    finally:
+        queue.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,551 @@
+"""로컬 수집 데몬.
+
+브라우저를 미리 띄워 둔(warm) 작업자 스레드와 SQLite 작업 저장소를 두고,
+127.0.0.1 JSON API로 작업을 받는다. 클라이언트(app.daemon_client)는 제출·조회·취소·결과 스트리밍만 하므로
+연달아 제출한 작업은 브라우저 기동 비용 없이 바로 시작된다. 데몬이 죽거나 종료됐다 다시 뜨면 실행 중이던 작업은 다시 대기열로 간다.
+
+현재 데몬을 쓰는 프런트엔드는 app/cli_collect.py --daemon 뿐이다. GUI(app/gui.py)는 유형별 동시 수집
+(scraper.batch)을 프로세스 안에서 돌리고, realestate_dabang main_runner는 Selenium 엔진이라 데몬(Playwright
+DabangScraper)과 엔진이 달라 둘 다 자체 브라우저로 수집한다.
+
+API
+  GET  /health                  {"ok": true, "workers": 1, "warm": 1, "queued": 0}
+  POST /jobs        {params}    {"id": "...", ...}   params: region(필수), property_type, max_items, max_pages,
+                                                     price_min, price_max, headless, deadline, outdir
+  GET  /jobs?limit=50           [job, ...] (최근 순)
+  GET  /jobs/<id>               job (실행 중이면 progress 포함)
+  POST /jobs/<id>/cancel        {"ok": true, "status": "..."}
+  GET  /jobs/<id>/items?after=N {"items": [{"seq": .., "item": {..}}], "next": M, "status": "..."}
+  GET  /jobs/<id>/stream        NDJSON 한 줄씩: {"type": "item", "seq": .., "item": {..}} ... {"type": "end", "job": {..}}
+
+실행: python -m app.daemon [--port 8766] [--workers 1] [--db PATH] [--no-headless]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from loguru import logger  # noqa: E402
+
+from config import settings  # noqa: E402
+from scraper.control import CrawlControl  # noqa: E402
+from scraper.progress import ProgressTracker  # noqa: E402
+
+TERMINAL = ("done", "failed", "cancelled")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    params TEXT NOT NULL,
+    created REAL NOT NULL,
+    started REAL,
+    finished REAL,
+    error TEXT,
+    output TEXT,
+    items INTEGER NOT NULL DEFAULT 0,
+    cancel INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status, created);
+CREATE TABLE IF NOT EXISTS job_items (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    item TEXT NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+_COLUMNS = ("id", "status", "params", "created", "started", "finished", "error", "output", "items", "cancel")
+
+
+class JobStore:
+    """작업/결과 저장소 (SQLite 한 파일). 여러 스레드가 한 연결을 잠금으로 나눠 쓴다."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        # 결과/상태가 바뀔 때마다 깨워 스트리밍 응답이 폴링하지 않게
+        self._changed = threading.Condition()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def _row(self, row: Optional[Tuple[Any, ...]]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(zip(_COLUMNS, row))
+        job["params"] = json.loads(job["params"])
+        job["cancel"] = bool(job["cancel"])
+        return job
+
+    def _notify(self) -> None:
+        with self._changed:
+            self._changed.notify_all()
+
+    def wait_change(self, timeout: float) -> None:
+        with self._changed:
+            self._changed.wait(timeout)
+
+    def submit(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        job_id = uuid.uuid4().hex[:12]
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, status, params, created) VALUES (?, 'queued', ?, ?)",
+                (job_id, json.dumps(params, ensure_ascii=False), time.time()),
+            )
+        self._notify()
+        return self.get(job_id)  # type: ignore[return-value]
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row(row)
+
+    def list(self, limit: int = 50) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM jobs ORDER BY created DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [self._row(r) for r in rows]  # type: ignore[misc]
+
+    def count(self, status: str) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (status,)).fetchone()[0]
+
+    def claim_next(self) -> Optional[Dict[str, Any]]:
+        """가장 오래된 대기 작업을 running으로 바꿔 돌려준다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' ORDER BY created LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE jobs SET status = 'running', started = ? WHERE id = ? AND status = 'queued'", (time.time(), row[0])
+            )
+        self._notify()
+        return self.get(row[0])
+
+    def add_item(self, job_id: str, item: Dict[str, Any]) -> int:
+        with self._lock:
+            seq = self._conn.execute("SELECT items FROM jobs WHERE id = ?", (job_id,)).fetchone()[0] + 1
+            self._conn.execute("BEGIN")
+            self._conn.execute(
+                "INSERT INTO job_items (job_id, seq, item) VALUES (?, ?, ?)",
+                (job_id, seq, json.dumps(item, ensure_ascii=False)),
+            )
+            self._conn.execute("UPDATE jobs SET items = ? WHERE id = ?", (seq, job_id))
+            self._conn.execute("COMMIT")
+        self._notify()
+        return seq
+
+    def items(self, job_id: str, after: int = 0, limit: int = 500) -> List[Tuple[int, Dict[str, Any]]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, item FROM job_items WHERE job_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (job_id, after, limit),
+            ).fetchall()
+        return [(seq, json.loads(item)) for seq, item in rows]
+
+    def finish(self, job_id: str, status: str, error: Optional[str] = None, output: Optional[str] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, finished = ?, error = ?, output = ? WHERE id = ?",
+                (status, time.time(), error, output, job_id),
+            )
+        self._notify()
+
+    def request_cancel(self, job_id: str) -> Optional[str]:
+        """대기 중이면 바로 cancelled, 실행 중이면 취소 표시만. 바뀐 뒤 상태(없는 작업이면 None)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'cancelled', finished = ? WHERE id = ? AND status = 'queued'",
+                (time.time(), job_id),
+            )
+            self._conn.execute("UPDATE jobs SET cancel = 1 WHERE id = ? AND status = 'running'", (job_id,))
+            row = self._conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        self._notify()
+        return row[0] if row else None
+
+    def requeue_running(self) -> int:
+        """이전 데몬이 끝내지 못한 작업을 대기열로 되돌린다 (받은 결과는 지우고 처음부터)."""
+        with self._lock:
+            ids = [r[0] for r in self._conn.execute("SELECT id FROM jobs WHERE status = 'running'").fetchall()]
+            for job_id in ids:
+                self._conn.execute("DELETE FROM job_items WHERE job_id = ?", (job_id,))
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'queued', started = NULL, items = 0 WHERE id = ?", (job_id,)
+                )
+        return len(ids)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class WarmBrowser:
+    """작업자 스레드 하나가 계속 쓰는 Playwright 브라우저. 만든 스레드에서만 써야 한다.
+
+    sync Playwright는 스레드당 하나만 시작할 수 있으므로(두 번째 sync_playwright()는
+    "Sync API inside the asyncio loop" 오류), 창 표시 여부별 브라우저를 같은 Playwright에서 띄운다.
+    """
+
+    def __init__(self, headless: bool = True) -> None:
+        # 미리 띄우는(기본) 모드
+        self.headless = headless
+        self._pw: Any = None
+        self._browsers: Dict[bool, Any] = {}
+
+    @staticmethod
+    def _connected(browser: Any) -> bool:
+        try:
+            return browser is not None and browser.is_connected()
+        except Exception:
+            return False
+
+    @property
+    def ready(self) -> bool:
+        return self._connected(self._browsers.get(self.headless))
+
+    def get(self, headless: Optional[bool] = None) -> Any:
+        mode = self.headless if headless is None else headless
+        browser = self._browsers.get(mode)
+        if self._connected(browser):
+            return browser
+        if not any(self._connected(b) for b in self._browsers.values()):
+            # Playwright 드라이버까지 죽었을 수 있으니 처음부터
+            self.close()
+        elif browser is not None:
+            self._close_one(self._browsers.pop(mode), "close")
+        if self._pw is None:
+            from playwright.sync_api import sync_playwright  # type: ignore[reportMissingImports]
+
+            self._pw = sync_playwright().start()
+        from scraper.dabang_scraper import LAUNCH_ARGS
+
+        browser = self._browsers[mode] = self._pw.chromium.launch(headless=mode, args=LAUNCH_ARGS)
+        return browser
+
+    @staticmethod
+    def _close_one(obj: Any, method: str) -> None:
+        try:
+            getattr(obj, method)()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        for browser in self._browsers.values():
+            self._close_one(browser, "close")
+        if self._pw is not None:
+            self._close_one(self._pw, "stop")
+        self._browsers = {}
+        self._pw = None
+
+
+# (작업, 정지 신호, 아이템 콜백, 진행 상황, warm 브라우저) → 결과 파일 경로
+Runner = Callable[[Dict[str, Any], CrawlControl, Callable[[Dict[str, Any]], None], ProgressTracker, WarmBrowser], Optional[str]]
+
+
+def scrape_job(
+    job: Dict[str, Any],
+    control: CrawlControl,
+    on_item: Callable[[Dict[str, Any]], None],
+    progress: ProgressTracker,
+    warm: WarmBrowser,
+) -> Optional[str]:
+    """기본 실행기: DabangScraper로 수집하고 outdir이 있으면 엑셀로 저장."""
+    from scraper.dabang_scraper import DabangScraper, ScrapeOptions
+
+    p = job["params"]
+    d = settings.defaults
+    opts = ScrapeOptions(
+        region=p["region"],
+        property_type=p.get("property_type", d.property_type),
+        price_min=int(p.get("price_min", d.price_min)),
+        price_max=int(p.get("price_max", d.price_max)),
+        max_items=int(p.get("max_items", d.max_items)),
+        max_pages=int(p.get("max_pages", d.max_pages)),
+        headless=bool(p.get("headless", True)),
+    )
+    # 창 표시 여부별 warm 브라우저 (처음 쓰는 모드면 같은 Playwright에서 하나 더 띄워 둔다)
+    browser = warm.get(opts.headless)
+    scraper = DabangScraper(opts, control, item_cb=lambda it: on_item(asdict(it)), progress=progress, browser=browser)
+    items = scraper.run()
+    # run()은 실행 오류를 삼키고 error에 남긴다 → 0건 'done' 대신 'failed'로
+    if scraper.error:
+        raise RuntimeError(scraper.error)
+    if not p.get("outdir"):
+        return None
+    from storage.exporter import save_to_excel
+
+    return str(save_to_excel(items, Path(p["outdir"]), opts.region))
+
+
+class CrawlDaemon:
+    def __init__(
+        self,
+        store: JobStore,
+        workers: int = 1,
+        headless: bool = True,
+        runner: Runner = scrape_job,
+        prewarm: bool = True,
+    ) -> None:
+        self.store = store
+        self.workers = max(1, workers)
+        self.headless = headless
+        self.runner = runner
+        self.prewarm = prewarm
+        self._threads: List[threading.Thread] = []
+        self._controls: Dict[str, CrawlControl] = {}
+        self._progress: Dict[str, ProgressTracker] = {}
+        self._warm: List[WarmBrowser] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+
+    @property
+    def warm_count(self) -> int:
+        return sum(1 for w in self._warm if w.ready)
+
+    def start(self) -> "CrawlDaemon":
+        requeued = self.store.requeue_running()
+        if requeued:
+            logger.warning("이전 실행에서 끝나지 않은 작업 {}개를 다시 대기열에 넣었습니다", requeued)
+        for i in range(self.workers):
+            t = threading.Thread(target=self._worker, name=f"crawl-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        return self
+
+    def stop(self, timeout: float = 30.0) -> None:
+        self._stop.set()
+        with self._lock:
+            for control in self._controls.values():
+                control.request_stop("shutdown")
+        self._wake.set()
+        for t in self._threads:
+            t.join(timeout)
+
+    def submit(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if not str(params.get("region") or "").strip():
+            raise ValueError("region이 필요합니다")
+        job = self.store.submit(params)
+        self._wake.set()
+        return job
+
+    def cancel(self, job_id: str) -> Optional[str]:
+        status = self.store.request_cancel(job_id)
+        with self._lock:
+            control = self._controls.get(job_id)
+        if control is not None:
+            control.request_stop("cancel")
+        return status
+
+    def job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self.store.get(job_id)
+        if job is not None:
+            with self._lock:
+                tracker = self._progress.get(job_id)
+            if tracker is not None:
+                job["progress"] = tracker.snapshot().format()
+        return job
+
+    def _worker(self) -> None:
+        warm = WarmBrowser(self.headless)
+        with self._lock:
+            self._warm.append(warm)
+        if self.prewarm:
+            try:
+                warm.get()
+            except Exception as e:
+                logger.warning("브라우저 미리 띄우기 실패(작업 시작 시 다시 시도): {}", e)
+        try:
+            while not self._stop.is_set():
+                job = self.store.claim_next()
+                if job is None:
+                    self._wake.wait(1.0)
+                    self._wake.clear()
+                    continue
+                self._run(job, warm)
+        finally:
+            warm.close()
+
+    def _run(self, job: Dict[str, Any], warm: WarmBrowser) -> None:
+        job_id = job["id"]
+        control = CrawlControl(deadline_s=float(job["params"].get("deadline") or 0) or None)
+        tracker = ProgressTracker()
+        with self._lock:
+            self._controls[job_id] = control
+            self._progress[job_id] = tracker
+        # 등록 전에 들어온 취소/종료 요청
+        if (self.store.get(job_id) or {}).get("cancel"):
+            control.request_stop("cancel")
+        elif self._stop.is_set():
+            control.request_stop("shutdown")
+        logger.info("작업 시작 {}: {}", job_id, job["params"])
+        try:
+            output = self.runner(job, control, lambda item: self.store.add_item(job_id, item), tracker, warm)
+            if control.stop_reason == "shutdown":
+                # 일부만 받은 상태 → running으로 남겨 다음 기동 때 requeue_running()이 처음부터 다시 돌린다
+                logger.warning("데몬 종료로 작업 {} 중단 (다음 기동 때 다시 실행)", job_id)
+                return
+            status = "cancelled" if control.stop_reason == "cancel" else "done"
+            self.store.finish(job_id, status, output=output)
+            logger.info("작업 {} {}: {}건", job_id, status, (self.store.get(job_id) or {}).get("items"))
+        except Exception as e:
+            if control.stop_reason == "shutdown":
+                logger.warning("데몬 종료 중 작업 {} 중단 (다음 기동 때 다시 실행): {}", job_id, e)
+                return
+            logger.exception("작업 {} 실패", job_id)
+            self.store.finish(job_id, "failed", error=f"{type(e).__name__}: {e}")
+        finally:
+            with self._lock:
+                self._controls.pop(job_id, None)
+                self._progress.pop(job_id, None)
+
+
+def make_server(daemon: CrawlDaemon, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """daemon을 노출하는 HTTP 서버 (serve_forever는 호출 측이)."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, payload: Any) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _parts(self) -> Tuple[List[str], Dict[str, List[str]]]:
+            url = urlparse(self.path)
+            return [p for p in url.path.split("/") if p], parse_qs(url.query)
+
+        def do_GET(self) -> None:  # noqa: N802
+            parts, query = self._parts()
+            if parts == ["health"]:
+                self._send(200, {
+                    "ok": True, "workers": daemon.workers, "warm": daemon.warm_count,
+                    "queued": daemon.store.count("queued"), "running": daemon.store.count("running"),
+                })
+            elif parts == ["jobs"]:
+                self._send(200, daemon.store.list(int(query.get("limit", ["50"])[0])))
+            elif len(parts) >= 2 and parts[0] == "jobs":
+                job = daemon.job(parts[1])
+                if job is None:
+                    self._send(404, {"error": "작업 없음"})
+                elif len(parts) == 2:
+                    self._send(200, job)
+                elif parts[2:] == ["items"]:
+                    after = int(query.get("after", ["0"])[0])
+                    rows = daemon.store.items(job["id"], after)
+                    self._send(200, {
+                        "items": [{"seq": s, "item": it} for s, it in rows],
+                        "next": rows[-1][0] if rows else after,
+                        "status": job["status"],
+                    })
+                elif parts[2:] == ["stream"]:
+                    self._stream(job["id"])
+                else:
+                    self._send(404, {"error": "알 수 없는 경로"})
+            else:
+                self._send(404, {"error": "알 수 없는 경로"})
+
+        def do_POST(self) -> None:  # noqa: N802
+            parts, _ = self._parts()
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                self._send(400, {"error": "JSON 본문이 아닙니다"})
+                return
+            if parts == ["jobs"]:
+                try:
+                    self._send(201, daemon.submit(body))
+                except ValueError as e:
+                    self._send(400, {"error": str(e)})
+            elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "cancel":
+                status = daemon.cancel(parts[1])
+                self._send(404 if status is None else 200, {"ok": status is not None, "status": status})
+            else:
+                self._send(404, {"error": "알 수 없는 경로"})
+
+        def _stream(self, job_id: str) -> None:
+            """결과를 NDJSON으로 흘려보내고 작업이 끝나면 end 줄을 쓰고 닫는다 (HTTP/1.0, 길이 없음)."""
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+            self.end_headers()
+            after = 0
+            try:
+                while True:
+                    job = daemon.job(job_id) or {}
+                    rows = daemon.store.items(job_id, after)
+                    for seq, item in rows:
+                        self.wfile.write(json.dumps({"type": "item", "seq": seq, "item": item}, ensure_ascii=False).encode("utf-8") + b"\n")
+                        after = seq
+                    if rows:
+                        self.wfile.flush()
+                        continue
+                    if job.get("status") in TERMINAL or not job:
+                        self.wfile.write(json.dumps({"type": "end", "job": job}, ensure_ascii=False).encode("utf-8") + b"\n")
+                        return
+                    daemon.store.wait_change(1.0)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug("daemon http: " + format, *args)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def main() -> None:
+    cfg = settings.daemon
+    p = argparse.ArgumentParser(description="로컬 수집 데몬 (warm 브라우저 + 작업 대기열)")
+    p.add_argument("--host", default=cfg.host)
+    p.add_argument("--port", type=int, default=cfg.port)
+    p.add_argument("--db", default=cfg.db, help="작업 저장소 SQLite 경로")
+    p.add_argument("--workers", type=int, default=cfg.workers, help="warm 브라우저(동시 작업) 수")
+    p.add_argument("--headless", dest="headless", action="store_true", default=settings.browser.headless)
+    p.add_argument("--no-headless", dest="headless", action="store_false")
+    args = p.parse_args()
+
+    Path(settings.paths.logs).mkdir(parents=True, exist_ok=True)
+    logger.add(
+        Path(settings.paths.logs) / "daemon_{time:YYYYMMDD}.log",
+        encoding="utf-8", rotation="00:00", level=settings.logging.file_level, enqueue=True,
+    )
+    daemon = CrawlDaemon(JobStore(Path(args.db)), workers=args.workers, headless=args.headless).start()
+    server = make_server(daemon, args.host, args.port)
+    logger.info("수집 데몬 시작: http://{}:{} (작업자 {}, 저장소 {})", args.host, args.port, args.workers, args.db)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        daemon.stop()
+        daemon.store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""수집 데몬(app.daemon) 클라이언트. 표준 라이브러리(urllib)만 쓴다."""
+
+from __future__ import annotations
+
+import json
+import urllib.error
+import urllib.request
+from typing import Any, Dict, Iterator, List, Optional
+
+from config import settings
+
+
+class DaemonError(RuntimeError):
+    pass
+
+
+class DaemonClient:
+    def __init__(self, base_url: Optional[str] = None, timeout: float = 10.0) -> None:
+        self.base_url = (base_url or f"http://{settings.daemon.host}:{settings.daemon.port}").rstrip("/")
+        self.timeout = timeout
+
+    def _open(self, method: str, path: str, body: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8") if body is not None else None
+        req = urllib.request.Request(self.base_url + path, data=data, method=method)
+        if data is not None:
+            req.add_header("Content-Type", "application/json")
+        try:
+            return urllib.request.urlopen(req, timeout=timeout if timeout is not None else self.timeout)
+        except urllib.error.HTTPError as e:
+            try:
+                msg = json.loads(e.read()).get("error") or e.reason
+            except ValueError:
+                msg = e.reason
+            raise DaemonError(f"{method} {path}: {e.code} {msg}") from None
+        except (urllib.error.URLError, OSError) as e:
+            raise DaemonError(f"데몬에 연결할 수 없습니다 ({self.base_url}): {e}") from None
+
+    def _request(self, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Any:
+        with self._open(method, path, body) as resp:
+            return json.loads(resp.read())
+
+    def health(self) -> Optional[Dict[str, Any]]:
+        """데몬 상태, 떠 있지 않으면 None."""
+        try:
+            return self._request("GET", "/health")
+        except DaemonError:
+            return None
+
+    def is_running(self) -> bool:
+        return self.health() is not None
+
+    def submit(self, **params: Any) -> str:
+        return self._request("POST", "/jobs", params)["id"]
+
+    def jobs(self, limit: int = 50) -> List[Dict[str, Any]]:
+        return self._request("GET", f"/jobs?limit={limit}")
+
+    def job(self, job_id: str) -> Dict[str, Any]:
+        return self._request("GET", f"/jobs/{job_id}")
+
+    def cancel(self, job_id: str) -> str:
+        return self._request("POST", f"/jobs/{job_id}/cancel", {})["status"]
+
+    def items(self, job_id: str, after: int = 0) -> Dict[str, Any]:
+        return self._request("GET", f"/jobs/{job_id}/items?after={after}")
+
+    def stream(self, job_id: str) -> Iterator[Dict[str, Any]]:
+        """{"type": "item", ...} 이벤트를 차례로, 마지막에 {"type": "end", "job": ...}."""
+        # 결과 사이 간격은 수집 속도에 달려 있으므로 읽기 제한 시간은 두지 않는다
+        with self._open("GET", f"/jobs/{job_id}/stream", timeout=None) as resp:
+            for line in resp:
+                if line.strip():
+                    yield json.loads(line)
@@ -4,7 +4,7 @@ import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 from loguru import logger
 import subprocess
 import json
@@ -35,7 +35,11 @@ if str(ROOT) not in sys.path:
 
 from config import settings  # noqa: E402
 from app.widgets.region_picker import RegionPicker  # noqa: E402
+from app.widgets.log_view import LogBuffer, LogView  # noqa: E402
+from app.widgets.results_table import ResultsTable  # noqa: E402
 from app.updater import check_updates  # noqa: E402
+from scraper.control import CrawlControl  # noqa: E402
+from scraper.progress import ProgressTracker  # noqa: E402
 
 
 class App(tk.Tk):
@@ -56,9 +60,12 @@ class App(tk.Tk):
 
         # state
         self._worker: Optional[threading.Thread] = None
-        self._stop = threading.Event()
+        # 정지 요청은 진행 중인 대기까지 바로 깨운다 (모든 유형 스레드가 공유)
+        self._stop = CrawlControl()
         self._last_output: Optional[Path] = None
         self._process: Optional[subprocess.Popen] = None
+        self._tracker: Optional[ProgressTracker] = None
+        self.log_buffer = LogBuffer(settings.gui.log_buffer_size, settings.gui.log_level)
 
         # widgets
         self._build_widgets()
@@ -212,26 +219,39 @@ class App(tk.Tk):
         progress_frame = ttk.Frame(self)
         progress_frame.pack(fill=tk.X, padx=pad, pady=pad)
         
-        self.progress = ttk.Progressbar(progress_frame, mode="indeterminate")
+        self.progress = ttk.Progressbar(progress_frame, mode="determinate", maximum=100)
         self.progress.pack(fill=tk.X, expand=True, side=tk.LEFT, padx=(0, pad))
         
         self.var_status = tk.StringVar(value="대기 중")
         ttk.Label(progress_frame, textvariable=self.var_status, width=20).pack(side=tk.RIGHT)
+        
+        # 처리량 / ETA / 현재 단계
+        self.var_progress = tk.StringVar(value="")
+        ttk.Label(self, textvariable=self.var_progress).pack(fill=tk.X, padx=pad)
 
-        # 로그 표시
-        log_frame = ttk.LabelFrame(self, text="실시간 로그")
-        log_frame.pack(fill=tk.BOTH, expand=True, padx=pad, pady=pad)
+        # 로그 / 실시간 결과 탭
+        notebook = ttk.Notebook(self)
+        notebook.pack(fill=tk.BOTH, expand=True, padx=pad, pady=pad)
         
-        # 로그 텍스트 위젯과 스크롤바
-        log_container = ttk.Frame(log_frame)
-        log_container.pack(fill=tk.BOTH, expand=True, padx=pad, pady=pad)
+        log_frame = ttk.Frame(notebook)
+        notebook.add(log_frame, text="실시간 로그")
         
-        self.log_text = tk.Text(log_container, height=20, font=("Consolas", 9))
-        scrollbar = ttk.Scrollbar(log_container, orient=tk.VERTICAL, command=self.log_text.yview)
-        self.log_text.configure(yscrollcommand=scrollbar.set)
+        results_frame = ttk.Frame(notebook)
+        notebook.add(results_frame, text="수집 결과")
+        self.results_table = ResultsTable(results_frame)
+        self.results_table.pack(fill=tk.BOTH, expand=True, padx=pad, pady=pad)
         
-        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # 로그 뷰: 워커 스레드는 링버퍼에만 쓰고, UI 타이머가 일괄 반영
+        self.log_view = LogView(
+            log_frame,
+            self.log_buffer,
+            max_lines=settings.gui.log_max_lines,
+            flush_ms=settings.gui.log_flush_ms,
+            height=20,
+            font=("Consolas", 9),
+        )
+        self.log_view.pack(fill=tk.BOTH, expand=True, padx=pad, pady=pad)
+        self.log_text = self.log_view.text
         
         # 로그 컨트롤
         log_control_frame = ttk.Frame(log_frame)
@@ -239,19 +259,30 @@ class App(tk.Tk):
         
         ttk.Button(log_control_frame, text="🗑️ 로그 지우기", command=self._clear_log).pack(side=tk.LEFT)
         ttk.Button(log_control_frame, text="💾 로그 저장", command=self._save_log).pack(side=tk.LEFT, padx=pad)
+        
+        ttk.Label(log_control_frame, text="표시 레벨:").pack(side=tk.LEFT, padx=(pad * 2, 0))
+        self.var_log_level = tk.StringVar(value=settings.gui.log_level)
+        level_cb = ttk.Combobox(
+            log_control_frame,
+            textvariable=self.var_log_level,
+            values=["DEBUG", "INFO", "WARNING", "ERROR"],
+            state="readonly",
+            width=10,
+        )
+        level_cb.pack(side=tk.LEFT, padx=pad)
+        level_cb.bind("<<ComboboxSelected>>", lambda *_: self.log_buffer.set_level(self.var_log_level.get()))
 
     def _choose_dir(self) -> None:
         chosen = filedialog.askdirectory()
         if chosen:
             self.var_outdir.set(chosen)
 
-    def _append_log(self, msg: str) -> None:
-        self.log_text.insert(tk.END, msg + "\n")
-        self.log_text.see(tk.END)
-        self.update_idletasks()  # GUI 업데이트 강제
+    def _append_log(self, msg: str, level: str = "INFO") -> None:
+        # 어느 스레드에서 호출해도 안전: 링버퍼에만 넣고 위젯 반영은 LogView 타이머가 담당
+        self.log_buffer.push(msg, level)
 
     def _clear_log(self) -> None:
-        self.log_text.delete(1.0, tk.END)
+        self.log_view.clear()
 
     def _save_log(self) -> None:
         filename = filedialog.asksaveasfilename(
@@ -260,7 +291,7 @@ class App(tk.Tk):
         )
         if filename:
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write(self.log_text.get(1.0, tk.END))
+                f.write(self.log_view.get_text())
 
     def _on_start(self) -> None:
         if self._worker and self._worker.is_alive():
@@ -274,13 +305,33 @@ class App(tk.Tk):
             return
             
         self._stop.clear()
-        self.progress.start(10)
+        self.results_table.clear()
+        selected_types = [name for name, var in self.property_types.items() if var.get()]
+        try:
+            limit = int(self.var_limit.get())
+        except ValueError:
+            limit = 0
+        self._tracker = ProgressTracker(target=limit * len(selected_types))
+        self.progress.configure(value=0)
         self.var_status.set("수집 중...")
         self.start_btn.config(state=tk.DISABLED)
         self.stop_btn.config(state=tk.NORMAL)
         
         self._worker = threading.Thread(target=self._run, daemon=True)
         self._worker.start()
+        self.after(500, self._poll_progress)
+
+    def _poll_progress(self) -> None:
+        """진행 상황 스냅샷을 주기적으로 읽어 진행바/상태줄에 반영."""
+        tracker = self._tracker
+        if tracker is None:
+            return
+        snap = tracker.snapshot()
+        if snap.fraction is not None:
+            self.progress.configure(value=snap.fraction * 100)
+        self.var_progress.set(snap.format())
+        if self._worker and self._worker.is_alive():
+            self.after(500, self._poll_progress)
 
     def _on_stop(self) -> None:
         self._stop.set()
@@ -295,7 +346,6 @@ class App(tk.Tk):
         
         self.start_btn.config(state=tk.NORMAL)
         self.stop_btn.config(state=tk.DISABLED)
-        self.progress.stop()
 
     def _open_folder(self) -> None:
         outdir = Path(self.var_outdir.get())
@@ -361,65 +411,42 @@ class App(tk.Tk):
             self._append_log(f"📊 최대 수집 건수: {self.var_limit.get()}")
             self._append_log("─" * 80)
             
-            # Python 스크래퍼 직접 실행
-            from scraper.dabang_scraper import DabangScraper, ScrapeOptions
+            # 매물 유형별 작업을 동시에 실행 (유형마다 별도 브라우저)
+            from scraper.batch import run_types
+            from scraper.dabang_scraper import ScrapeOptions
             from storage.exporter import save_to_excel
-            
-            all_items = []
-            
-            # 각 매물 유형별로 순차 실행
-            for i, property_type in enumerate(selected_types):
-                if self._stop.is_set():
-                    break
-                    
-                self._append_log(f"\n📋 [{i+1}/{len(selected_types)}] {property_type} 크롤링 시작...")
-                
-                try:
-                    # 스크래핑 옵션 설정
-                    opts = ScrapeOptions(
-                        region=region_query,
-                        property_type=property_type,
-                        price_min=0,
-                        price_max=2000000,
-                        max_items=int(self.var_limit.get()),
-                        max_pages=5,
-                        headless=self.var_headless.get(),
-                    )
-                    
-                    # 스크래퍼 실행
-                    scraper = DabangScraper(opts, self._stop)
-                    items = scraper.run()
-                    
-                    if items:
-                        all_items.extend(items)
-                        self._append_log(f"✅ {property_type} 크롤링 완료! {len(items)}개 수집")
-                        
-                        # 개별 매물 유형 완료 후에도 엑셀 열기 (옵션에 따라)
-                        if self.var_auto_open_excel.get():
-                            self._append_log(f"📊 {property_type} 결과 확인을 위해 엑셀 파일을 여는 중...")
-                            self._open_latest_excel()
-                    else:
-                        self._append_log(f"⚠️ {property_type} 크롤링 완료했지만 수집된 데이터가 없습니다.")
-                        
-                except Exception as e:
-                    self._append_log(f"❌ {property_type} 크롤링 중 오류 발생: {e}")
-                    logger.exception(f"{property_type} 크롤링 오류")
-                    continue
-                
-                # 다음 매물 유형으로 넘어가기 전 잠시 대기
-                if i < len(selected_types) - 1 and not self._stop.is_set():
-                    self._append_log("⏳ 다음 매물 유형으로 넘어가는 중...")
-                    import time
-                    time.sleep(2)
-                
 
-                
-                # 다음 매물 유형으로 넘어가기 전 잠시 대기
-                if i < len(selected_types) - 1 and not self._stop.is_set():
-                    self._append_log("⏳ 다음 매물 유형으로 넘어가는 중...")
-                    import time
-                    time.sleep(2)
-            
+            opts = ScrapeOptions(
+                region=region_query,
+                property_type=selected_types[0],
+                price_min=0,
+                price_max=2000000,
+                max_items=int(self.var_limit.get()),
+                max_pages=5,
+                headless=self.var_headless.get(),
+            )
+
+            def on_type_done(property_type: str, items, err) -> None:
+                if err is not None:
+                    self._append_log(f"❌ {property_type} 크롤링 중 오류 발생: {err}", "ERROR")
+                elif items:
+                    self._append_log(f"✅ {property_type} 크롤링 완료! {len(items)}개 수집")
+                else:
+                    self._append_log(f"⚠️ {property_type} 크롤링 완료했지만 수집된 데이터가 없습니다.", "WARNING")
+
+            batch = run_types(
+                opts,
+                selected_types,
+                self._stop,
+                max_concurrency=settings.browser.max_concurrency,
+                # 레벨째 링버퍼로 (min_level을 따르므로 DEBUG 선택 시에만 DEBUG 줄을 만든다)
+                log_cb=self.log_buffer.push,
+                item_cb=self.results_table.append_item,
+                progress=self._tracker,
+                on_type_done=on_type_done,
+            )
+            all_items = batch.items
+
             # 모든 매물 유형 완료
             if not self._stop.is_set() and all_items:
                 self.var_status.set("완료")
@@ -428,6 +455,7 @@ class App(tk.Tk):
                 # 최종 결과를 엑셀로 저장
                 try:
                     output_path = Path(settings.paths.output)
+                    self._tracker.set_phase("export")
                     output_file = save_to_excel(all_items, output_path, region_query)
                     self._append_log(f"📊 결과가 저장되었습니다: {output_file}")
                     
@@ -453,7 +481,8 @@ class App(tk.Tk):
             self._append_log(f"❌ 오류 발생: {e}")
             self.var_status.set("오류")
         finally:
-            self.progress.stop()
+            if self._tracker:
+                self._tracker.set_phase("done")
             self.start_btn.config(state=tk.NORMAL)
             self.stop_btn.config(state=tk.DISABLED)
             self._process = None
@@ -481,8 +510,10 @@ class App(tk.Tk):
             self._append_log(f"❌ 업데이트 체크 실패: {e}")
 
 
-def main() -> None:
+def main(on_ready: Optional[Callable[[], None]] = None) -> None:
     app = App()
+    if on_ready is not None:
+        app.after_idle(on_ready)
     app.mainloop()
 
 
@@ -0,0 +1,79 @@
+"""모듈 import 비용 측정 (`--import-profile`).
+
+`python -X importtime`과 같은 정보를 PyInstaller exe에서도 얻기 위해
+builtins.__import__를 감싸 처음 로드되는 모듈의 누적/자체 시간을 기록한다.
+다른 모듈보다 먼저 install()해야 의미가 있다.
+"""
+
+from __future__ import annotations
+
+import builtins
+import importlib.util
+import sys
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+FLAG = "--import-profile"
+
+
+class ImportProfiler:
+    def __init__(self) -> None:
+        # (모듈명, 누적초, 자체초, 깊이)
+        self.records: List[Tuple[str, float, float, int]] = []
+        self._stack: List[List[Any]] = []
+        self._orig: Optional[Callable[..., Any]] = None
+        self._t0 = time.perf_counter()
+
+    def install(self) -> "ImportProfiler":
+        if self._orig is None:
+            self._orig = builtins.__import__
+            builtins.__import__ = self._import
+        return self
+
+    def uninstall(self) -> None:
+        if self._orig is not None:
+            builtins.__import__ = self._orig
+            self._orig = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        orig = self._orig or builtins.__import__
+        full = name
+        if level:
+            try:
+                full = importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__") or "")
+            except Exception:
+                full = name
+        if full in sys.modules:
+            return orig(name, globals, locals, fromlist, level)
+        frame = [full, 0.0]  # [이름, 하위 import 시간]
+        self._stack.append(frame)
+        t = time.perf_counter()
+        try:
+            return orig(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - t
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] += elapsed
+            self.records.append((full, elapsed, elapsed - frame[1], len(self._stack)))
+
+    def report(self, top: int = 25) -> str:
+        total = sum(r[1] for r in self.records if r[3] == 0)
+        lines = [
+            f"import profile: 최상위 import 합계 {total * 1000:.0f} ms, "
+            f"모듈 {len(self.records)}개, 경과 {(time.perf_counter() - self._t0) * 1000:.0f} ms",
+            f"{'누적(ms)':>10} {'자체(ms)':>10}  모듈",
+        ]
+        for name, cum, own, depth in sorted(self.records, key=lambda r: r[1], reverse=True)[:top]:
+            lines.append(f"{cum * 1000:10.1f} {own * 1000:10.1f}  {'  ' * depth}{name}")
+        return "\n".join(lines)
+
+
+def enable_from_argv(argv: Optional[List[str]] = None) -> Optional[ImportProfiler]:
+    """argv에 --import-profile이 있으면 제거하고 프로파일러를 설치해 반환."""
+    argv = sys.argv if argv is None else argv
+    if FLAG not in argv:
+        return None
+    while FLAG in argv:
+        argv.remove(FLAG)
+    return ImportProfiler().install()
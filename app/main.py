@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from loguru import logger
 from pathlib import Path
 import sys
 
@@ -9,6 +8,12 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+# --import-profile: 이후 모든 import를 측정하도록 가장 먼저 설치
+from app.import_profile import enable_from_argv  # noqa: E402
+
+_profiler = enable_from_argv()
+
+from loguru import logger  # noqa: E402
 from config import settings  # noqa: E402
 from app.gui import main as gui_main  # noqa: E402
 
@@ -17,12 +22,24 @@ def setup_logging() -> None:
     Path(settings.paths.logs).mkdir(parents=True, exist_ok=True)
     logger.remove()
     logger.add(sys.stderr, level="INFO")
-    logger.add(Path(settings.paths.logs) / "app_{time:YYYYMMDD}.log", encoding="utf-8", rotation="00:00")
+    # 파일 쓰기는 별도 스레드에서 (enqueue), 아이템별 상세는 file_level=DEBUG일 때만
+    logger.add(
+        Path(settings.paths.logs) / "app_{time:YYYYMMDD}.log",
+        encoding="utf-8",
+        rotation="00:00",
+        level=settings.logging.file_level,
+        serialize=settings.logging.json,
+        enqueue=True,
+    )
 
 
 def main() -> None:
     setup_logging()
-    gui_main()
+    on_ready = None
+    if _profiler is not None:
+        # 창이 처음 그려진 시점까지의 import 비용을 출력
+        on_ready = lambda: logger.info("\n{}", _profiler.report())  # noqa: E731
+    gui_main(on_ready=on_ready)
 
 
 if __name__ == "__main__":
@@ -4,7 +4,6 @@
 GitHub Releases API를 사용하여 최신 버전을 확인합니다.
 """
 
-import requests
 import json
 import re
 from pathlib import Path
@@ -22,6 +21,8 @@ class Updater:
         
     def get_latest_version(self) -> Optional[str]:
         """최신 버전 정보 가져오기"""
+        import requests  # 업데이트 확인 시에만 필요
+
         try:
             response = requests.get(self.api_url, timeout=10)
             response.raise_for_status()
@@ -82,6 +83,8 @@ class Updater:
     
     def get_release_notes(self, version: str) -> Optional[str]:
         """릴리즈 노트 가져오기"""
+        import requests
+
         try:
             response = requests.get(self.api_url, timeout=10)
             response.raise_for_status()
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import threading
+import tkinter as tk
+from collections import deque
+from tkinter import ttk
+from typing import Deque, List, Optional, Tuple
+
+
+# loguru 레벨 번호와 동일
+LEVELS = {
+    "TRACE": 5,
+    "DEBUG": 10,
+    "INFO": 20,
+    "SUCCESS": 25,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+}
+
+
+def level_no(level: str | int) -> int:
+    if isinstance(level, int):
+        return level
+    return LEVELS.get(str(level).upper(), LEVELS["INFO"])
+
+
+class LogBuffer:
+    """워커 스레드 → UI 로그 전달용 고정 크기 링버퍼.
+
+    - 용량을 넘으면 가장 오래된 줄부터 버리고 버린 개수를 센다.
+    - min_level 미만 메시지는 버퍼에 넣지 않는다.
+    """
+
+    def __init__(self, capacity: int = 5000, min_level: str | int = "INFO") -> None:
+        self._lines: Deque[Tuple[int, str]] = deque(maxlen=max(1, capacity))
+        self._lock = threading.Lock()
+        self._dropped = 0
+        self.min_level = level_no(min_level)
+
+    def set_level(self, level: str | int) -> None:
+        self.min_level = level_no(level)
+
+    def push(self, msg: str, level: str | int = "INFO") -> None:
+        no = level_no(level)
+        if no < self.min_level:
+            return
+        with self._lock:
+            if len(self._lines) == self._lines.maxlen:
+                self._dropped += 1
+            self._lines.append((no, msg))
+
+    def sink(self, message) -> None:
+        """loguru sink (`logger.add(buf.sink)`)."""
+        record = message.record
+        self.push(record["message"], record["level"].no)
+
+    def drain(self, max_items: Optional[int] = None) -> Tuple[List[str], int]:
+        """쌓인 줄을 꺼낸다. 반환: (줄 목록, 직전 drain 이후 버려진 줄 수)"""
+        with self._lock:
+            n = len(self._lines) if max_items is None else min(max_items, len(self._lines))
+            out = [self._lines.popleft()[1] for _ in range(n)]
+            dropped, self._dropped = self._dropped, 0
+        return out, dropped
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._lines)
+
+
+class LogView(ttk.Frame):
+    """LogBuffer를 UI 타이머로 일괄 반영하는 Text 뷰.
+
+    줄마다 insert/see 하지 않고 flush_ms 주기로 한 번에 넣으며,
+    위젯에는 최대 max_lines 줄만 유지한다.
+    """
+
+    def __init__(
+        self,
+        master,
+        buffer: LogBuffer,
+        max_lines: int = 2000,
+        flush_ms: int = 200,
+        batch_max: int = 500,
+        **text_kwargs,
+    ) -> None:
+        super().__init__(master)
+        self.buffer = buffer
+        self.max_lines = max(1, max_lines)
+        self.flush_ms = max(16, flush_ms)
+        self.batch_max = max(1, batch_max)
+
+        self.text = tk.Text(self, **text_kwargs)
+        scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.text.yview)
+        self.text.configure(yscrollcommand=scrollbar.set)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self._after_id: Optional[str] = self.after(self.flush_ms, self._flush)
+
+    def _at_bottom(self) -> bool:
+        try:
+            return self.text.yview()[1] >= 0.999
+        except Exception:
+            return True
+
+    def _flush(self) -> None:
+        try:
+            lines, dropped = self.buffer.drain(self.batch_max)
+            if lines or dropped:
+                follow = self._at_bottom()
+                chunk = ""
+                if dropped:
+                    chunk += f"… 로그 {dropped}줄 생략 (전체 로그는 logs/ 파일 참고)\n"
+                chunk += "\n".join(lines) + ("\n" if lines else "")
+                self.text.insert(tk.END, chunk)
+                self._trim()
+                if follow:
+                    self.text.see(tk.END)
+        finally:
+            # 밀린 줄이 남아 있으면 바로 다음 배치를 처리
+            delay = 1 if len(self.buffer) else self.flush_ms
+            self._after_id = self.after(delay, self._flush)
+
+    def _trim(self) -> None:
+        # 줄마다 개행으로 끝나므로 마지막 빈 줄은 제외
+        total = int(self.text.index("end-1c").split(".")[0]) - 1
+        excess = total - self.max_lines
+        if excess > 0:
+            self.text.delete("1.0", f"{excess + 1}.0")
+
+    def clear(self) -> None:
+        self.text.delete("1.0", tk.END)
+
+    def get_text(self) -> str:
+        return self.text.get("1.0", tk.END)
+
+    def destroy(self) -> None:
+        if self._after_id:
+            try:
+                self.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        super().destroy()
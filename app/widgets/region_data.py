@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import abc
+import hashlib
+import json
+import pickle
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+JSON_PATH = DATA_DIR / "regions_kr.json"
+BIN_PATH = DATA_DIR / "regions_kr.bin"
+
+# 파일 구조: MAGIC | 헤더 길이(uint32 LE) | 헤더(pickle) | 시/도별 블롭(pickle)...
+# 헤더의 source = 원본 JSON의 (크기, sha256). git clone 등은 mtime을 보존하지 않으므로 내용으로 비교한다.
+MAGIC = b"RGN1"
+_HEAD = struct.Struct("<4sI")
+VERSION = 2
+
+
+def _compact(p: Dict) -> Tuple:
+    return (
+        p["code"],
+        p["name"],
+        tuple(
+            (c["code"], c["name"], tuple((t["code"], t["name"]) for t in c.get("children", [])))
+            for c in p.get("children", [])
+        ),
+    )
+
+
+def _expand(blob: Tuple) -> Dict:
+    code, name, cities = blob
+    return {
+        "code": code,
+        "name": name,
+        "children": [
+            {"code": cc, "name": cn, "children": [{"code": tc, "name": tn} for tc, tn in towns]}
+            for cc, cn, towns in cities
+        ],
+    }
+
+
+def source_fingerprint(path: Path) -> Tuple[int, str]:
+    """원본 JSON의 (크기, sha256 hex)."""
+    raw = Path(path).read_bytes()
+    return len(raw), hashlib.sha256(raw).hexdigest()
+
+
+def write_region_bin(data: Dict, path: Path = BIN_PATH, source_path: Optional[Path] = None) -> Path:
+    """regions JSON 구조를 시/도 단위로 나눠 미리 직렬화한 바이너리로 저장.
+
+    source_path(원본 JSON)를 주면 그 지문을 헤더에 남겨, 나중에 JSON이 바뀌었는지 판별한다.
+    """
+    blobs: List[bytes] = []
+    toc: List[Tuple[str, str, int, int]] = []
+    offset = 0
+    for p in data.get("provinces", []):
+        blob = pickle.dumps(_compact(p), protocol=pickle.HIGHEST_PROTOCOL)
+        toc.append((p["code"], p["name"], offset, len(blob)))
+        blobs.append(blob)
+        offset += len(blob)
+    source = source_fingerprint(source_path) if source_path is not None else None
+    header = pickle.dumps({"version": VERSION, "provinces": toc, "source": source}, protocol=pickle.HIGHEST_PROTOCOL)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(_HEAD.pack(MAGIC, len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    tmp.replace(path)
+    return path
+
+
+class RegionSource(abc.ABC):
+    """지역 데이터 공급원. provinces()는 목차만, load(code)는 시/도 하나만 읽는다."""
+
+    @abc.abstractmethod
+    def provinces(self) -> List[Tuple[str, str]]:
+        ...
+
+    @abc.abstractmethod
+    def load(self, code: str) -> Optional[Dict]:
+        ...
+
+
+class BinRegionSource(RegionSource):
+    def __init__(self, path: Path = BIN_PATH) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            magic, hlen = _HEAD.unpack(f.read(_HEAD.size))
+            if magic != MAGIC:
+                raise ValueError(f"not a region table: {self.path}")
+            header = pickle.loads(f.read(hlen))
+        if header.get("version") != VERSION:
+            raise ValueError(f"unsupported region table version: {header.get('version')}")
+        self.source: Optional[Tuple[int, str]] = header.get("source")
+        self._base = _HEAD.size + hlen
+        self._toc = {code: (name, off, ln) for code, name, off, ln in header["provinces"]}
+        self._order = [(code, name) for code, name, _, _ in header["provinces"]]
+        self._lock = threading.Lock()
+
+    def provinces(self) -> List[Tuple[str, str]]:
+        return list(self._order)
+
+    def load(self, code: str) -> Optional[Dict]:
+        meta = self._toc.get(code)
+        if meta is None:
+            return None
+        _, off, ln = meta
+        with self._lock, self.path.open("rb") as f:
+            f.seek(self._base + off)
+            raw = f.read(ln)
+        return _expand(pickle.loads(raw))
+
+
+class JsonRegionSource(RegionSource):
+    """바이너리가 없을 때의 대체 경로. 첫 접근 시 JSON 전체를 한 번 읽는다."""
+
+    def __init__(self, path: Path = JSON_PATH) -> None:
+        self.path = Path(path)
+        self._by_code: Optional[Dict[str, Dict]] = None
+        self._lock = threading.Lock()
+
+    def _data(self) -> Dict[str, Dict]:
+        with self._lock:
+            if self._by_code is None:
+                data = json.loads(self.path.read_text("utf-8"))
+                self._by_code = {p["code"]: p for p in data.get("provinces", [])}
+            return self._by_code
+
+    def provinces(self) -> List[Tuple[str, str]]:
+        return [(code, p["name"]) for code, p in self._data().items()]
+
+    def load(self, code: str) -> Optional[Dict]:
+        return self._data().get(code)
+
+
+def _bin_matches_json(src: BinRegionSource, json_path: Path) -> bool:
+    """.bin이 지금의 JSON에서 만들어졌는지. JSON이 없으면 .bin을 그대로 믿는다."""
+    try:
+        size = json_path.stat().st_size
+    except OSError:
+        return True
+    if src.source is None or src.source[0] != size:
+        return False
+    return source_fingerprint(json_path) == tuple(src.source)
+
+
+def open_region_source(data_path: Optional[Path] = None) -> RegionSource:
+    """data_path(.json/.bin) 또는 기본 경로에서 가장 빠른 공급원을 고른다.
+
+    .bin 헤더의 원본 지문이 현재 JSON과 다르면(재생성 누락) 오래된 .bin 대신 JSON을 쓴다.
+    """
+    path = Path(data_path) if data_path else None
+    if path is not None and path.suffix == ".json":
+        bin_path = path.with_suffix(".bin")
+        json_path = path
+    else:
+        bin_path = path or BIN_PATH
+        json_path = bin_path.with_suffix(".json")
+    if bin_path.exists():
+        try:
+            src = BinRegionSource(bin_path)
+            if _bin_matches_json(src, json_path):
+                return src
+        except Exception:
+            pass
+    return JsonRegionSource(json_path)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import json
 import os
 import re
+import threading
 import time
 import tkinter as tk
 from tkinter import ttk
@@ -10,6 +10,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from app.widgets.region_data import open_region_source
+
 
 HANGUL_INITIALS = [
     "ㄱ","ㄲ","ㄴ","ㄷ","ㄸ","ㄹ","ㅁ","ㅂ","ㅃ","ㅅ","ㅆ","ㅇ","ㅈ","ㅉ","ㅊ","ㅋ","ㅌ","ㅍ","ㅎ"
@@ -37,68 +39,200 @@ class RegionNode:
     children: List["RegionNode"]
 
 
+LEVEL_NAMES = ("시/도", "시/군/구", "읍/면/동")
+
+
+@dataclass(frozen=True)
+class RegionEntry:
+    level: int  # 0=시/도, 1=시/군/구, 2=읍/면/동
+    code: str
+    name: str
+    path: Tuple[str, ...]  # 시/도부터 자기 자신까지의 이름
+    codes: Tuple[str, ...]
+
+    @property
+    def full_name(self) -> str:
+        return " ".join(self.path)
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids", "terminal")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.ids: List[int] = []  # 이 접두를 가진 항목 (랭크순)
+        self.terminal: List[int] = []  # 이름이 정확히 이 접두인 항목
+
+
+def _is_initials(s: str) -> bool:
+    return bool(s) and all("ㄱ" <= ch <= "ㅎ" for ch in s)
+
+
 class RegionIndex:
-    def __init__(self, data: Dict) -> None:
-        self.provinces: List[RegionNode] = [
-            RegionNode(p["code"], p["name"], [RegionNode(c["code"], c["name"], [RegionNode(t["code"], t["name"], []) for t in c.get("children", [])]) for c in p.get("children", [])])
-            for p in data.get("provinces", [])
-        ]
-        # 인덱스
-        self.by_prefix: Dict[str, List[Tuple[str, str, str]]] = {}
-        self.by_initial: Dict[str, List[Tuple[str, str, str]]] = {}
-        self.by_contains: Dict[str, List[Tuple[str, str, str]]] = {}
-        self._build()
-
-    def _build(self) -> None:
-        for p in self.provinces:
-            for c in p.children:
-                key = normalize_name(c.name)
-                init = initials(c.name)
-                triple = (p.code, c.code, c.name)
-                self.by_prefix.setdefault(key[:1], []).append(triple)
-                self.by_contains.setdefault(key, []).append(triple)
-                self.by_initial.setdefault(init[:1], []).append(triple)
-
-    def search(self, q: str, limit: int = 100) -> List[Tuple[str, str, str]]:
-        qn = normalize_name(q)
-        if not qn:
+    """시/도·시/군/구·읍/면/동 전체 검색 인덱스.
+
+    - 이름 접두 트라이, 초성 접두 트라이
+    - 1·2글자 n-gram 역색인 (부분 일치 후보)
+    - 정규화 이름/초성/경로는 빌드 시 한 번만 계산
+    포스팅 목록은 랭크(상위 행정단위 → 짧은 이름 → 코드) 순으로 정렬해 두고,
+    직전 질의의 확장 입력이면 직전 후보에서만 다시 거른다.
+    """
+
+    def __init__(self, data: Optional[Dict] = None) -> None:
+        self.provinces: List[RegionNode] = []
+        self.entries: List[RegionEntry] = []
+        self.by_code: Dict[str, RegionEntry] = {}
+        self._norm: List[str] = []
+        self._path_norm: List[str] = []
+        self._rank: List[Tuple[int, int, str]] = []
+        self._trie = _TrieNode()
+        self._init_trie = _TrieNode()
+        self._grams: Dict[str, List[int]] = {}
+        self._dirty = False
+        self._last: Tuple[str, List[int]] = ("", [])
+        for p in (data or {}).get("provinces", []):
+            self.add_province(p)
+
+    # ---- 빌드 ----
+    def add_province(self, p: Dict) -> RegionNode:
+        """시/도 하나(하위 포함)를 트리와 인덱스에 추가."""
+        prov = RegionNode(
+            p["code"],
+            p["name"],
+            [
+                RegionNode(c["code"], c["name"], [RegionNode(t["code"], t["name"], []) for t in c.get("children", [])])
+                for c in p.get("children", [])
+            ],
+        )
+        self.provinces.append(prov)
+        self._add(0, prov, (prov.name,), (prov.code,))
+        for c in prov.children:
+            cpath, ccodes = (prov.name, c.name), (prov.code, c.code)
+            self._add(1, c, cpath, ccodes)
+            for t in c.children:
+                self._add(2, t, cpath + (t.name,), ccodes + (t.code,))
+        self._dirty = True
+        self._last = ("", [])
+        return prov
+
+    def _add(self, level: int, node: RegionNode, path: Tuple[str, ...], codes: Tuple[str, ...]) -> None:
+        i = len(self.entries)
+        entry = RegionEntry(level, node.code, node.name, path, codes)
+        norm = normalize_name(node.name)
+        self.entries.append(entry)
+        self.by_code.setdefault(node.code, entry)
+        self._norm.append(norm)
+        self._path_norm.append("".join(normalize_name(x) for x in path))
+        self._rank.append((level, len(norm), node.code))
+        self._insert(self._trie, norm, i)
+        self._insert(self._init_trie, initials(node.name), i)
+        for n in (1, 2):
+            for g in {norm[k:k + n] for k in range(len(norm) - n + 1)}:
+                self._grams.setdefault(g, []).append(i)
+
+    @staticmethod
+    def _insert(root: _TrieNode, key: str, i: int) -> None:
+        node = root
+        for ch in key:
+            node = node.children.setdefault(ch, _TrieNode())
+            node.ids.append(i)
+        if key:
+            node.terminal.append(i)
+
+    def _ensure_sorted(self) -> None:
+        if not self._dirty:
+            return
+        rank = self._rank.__getitem__
+        stack = [self._trie, self._init_trie]
+        while stack:
+            node = stack.pop()
+            node.ids.sort(key=rank)
+            node.terminal.sort(key=rank)
+            stack.extend(node.children.values())
+        for ids in self._grams.values():
+            ids.sort(key=rank)
+        self._dirty = False
+
+    # ---- 검색 ----
+    @staticmethod
+    def _walk(root: _TrieNode, key: str) -> Optional[_TrieNode]:
+        node = root
+        for ch in key:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def _contains(self, qn: str) -> List[int]:
+        """qn을 이름에 포함하는 항목 (랭크순). 직전 질의를 확장한 입력이면 직전 후보만 거른다."""
+        last_q, last_ids = self._last
+        if last_q and qn.startswith(last_q):
+            base = last_ids
+        else:
+            grams = [qn[k:k + 2] for k in range(len(qn) - 1)] or [qn]
+            base = min((self._grams.get(g, []) for g in grams), key=len)
+        norm = self._norm
+        ids = [i for i in base if qn in norm[i]]
+        self._last = (qn, ids)
+        return ids
+
+    def search(self, q: str, limit: int = 100) -> List[RegionEntry]:
+        """정확 일치 → 접두 → 부분 일치 → 초성 순으로 랭크된 결과.
+
+        공백으로 나눈 앞 단어들은 상위 지역 조건으로 쓴다 (예: "부산 중구").
+        """
+        tokens = [normalize_name(t) for t in (q or "").split()]
+        tokens = [t for t in tokens if t]
+        if not tokens:
             return []
-        results: List[Tuple[str, str, str]] = []
-        # 1) 접두
-        for k, arr in self.by_prefix.items():
-            if qn.startswith(k):
-                results.extend([t for t in arr if normalize_name(t[2]).startswith(qn)])
-        if len(results) < limit:
-            # 2) 포함
-            for k, arr in self.by_contains.items():
-                if qn in k:
-                    results.extend(arr)
-                    if len(results) >= limit:
-                        break
-        if len(results) < limit:
-            # 3) 초성
-            qi = initials(q)
-            for k, arr in self.by_initial.items():
-                if qi and qi.startswith(k):
-                    results.extend([t for t in arr if initials(t[2]).startswith(qi)])
-                    if len(results) >= limit:
-                        break
-        # 중복 제거
+        self._ensure_sorted()
+        qn, context = tokens[-1], tokens[:-1]
+        path_norm = self._path_norm
+
+        def ok(i: int) -> bool:
+            return all(c in path_norm[i] for c in context)
+
+        out: List[int] = []
         seen = set()
-        uniq: List[Tuple[str, str, str]] = []
-        for t in results:
-            if t not in seen:
-                seen.add(t)
-                uniq.append(t)
-        return uniq[:limit]
+
+        def take(ids) -> bool:
+            for i in ids:
+                if i not in seen and ok(i):
+                    seen.add(i)
+                    out.append(i)
+                    if len(out) >= limit:
+                        return True
+            return False
+
+        if _is_initials(qn):
+            node = self._walk(self._init_trie, qn)
+            if node:
+                take(node.terminal) or take(node.ids)
+        else:
+            node = self._walk(self._trie, qn)
+            done = bool(node) and (take(node.terminal) or take(node.ids))
+            if not done:
+                take(self._contains(qn))
+        entries = self.entries
+        return [entries[i] for i in out]
 
 
 class RegionPicker(ttk.Frame):
+    """시/도·시/군/구·읍/면/동 선택 + 통합 검색.
+
+    지역 데이터는 생성자에서 읽지 않는다. 백그라운드 스레드가 시/도 단위로
+    불러와 인덱스에 추가하고, 사용자가 아직 안 읽힌 시/도를 고르면 그 시/도만 먼저 읽는다.
+    """
+
     def __init__(self, master, data_path: Optional[Path] = None) -> None:
         super().__init__(master)
-        path = data_path or Path(__file__).resolve().parents[2] / "data" / "regions_kr.json"
-        data = json.loads(Path(path).read_text("utf-8"))
-        self.index = RegionIndex(data)
+        self.source = open_region_source(data_path)
+        self.index = RegionIndex()
+        self._lock = threading.Lock()
+        self._prov_meta: List[Tuple[str, str]] = []
+        self._prov_nodes: Dict[str, RegionNode] = {}
+        self._meta_ready = False
+        self._all_loaded = False
 
         self.var_prov = tk.StringVar()
         self.var_city = tk.StringVar()
@@ -117,25 +251,79 @@ class RegionPicker(ttk.Frame):
         self.cb_town.grid(row=0, column=2, padx=4, pady=4)
         self.entry.grid(row=0, column=3, padx=6, pady=4)
         self.listbox.grid(row=1, column=0, columnspan=4, sticky="ew")
+        self.cb_prov.set("불러오는 중...")
 
-        self._fill_provinces()
         self.cb_prov.bind("<<ComboboxSelected>>", self._on_prov)
         self.cb_city.bind("<<ComboboxSelected>>", self._on_city)
         self.cb_town.bind("<<ComboboxSelected>>", self._on_town)
         self.entry.bind("<KeyRelease>", self._on_search)
         self.listbox.bind("<<ListboxSelect>>", self._on_pick_from_list)
         self._debounce_id: Optional[str] = None
+        self._poll_id: Optional[str] = None
+        self._results: List[RegionEntry] = []
+
+        threading.Thread(target=self._load_all, name="region-loader", daemon=True).start()
+        self._poll_id = self.after(30, self._poll_loader)
+
+    # ---- 지연 로딩 ----
+    def _load_all(self) -> None:
+        try:
+            meta = self.source.provinces()
+        except Exception:
+            meta = []
+        self._prov_meta = meta
+        self._meta_ready = True
+        for code, _ in meta:
+            try:
+                self.ensure_province(code)
+            except Exception:
+                continue
+        self._all_loaded = True
+
+    def ensure_province(self, code: str) -> Optional[RegionNode]:
+        """시/도 하나를 (아직이면) 읽어 인덱스에 추가. 어느 스레드에서든 호출 가능."""
+        with self._lock:
+            node = self._prov_nodes.get(code)
+            if node is None:
+                data = self.source.load(code)
+                if data is None:
+                    return None
+                node = self.index.add_province(data)
+                self._prov_nodes[code] = node
+            return node
+
+    def _poll_loader(self) -> None:
+        self._poll_id = None
+        if self._meta_ready and not self.cb_prov["values"]:
+            self._fill_provinces()
+        if not self._all_loaded:
+            self._poll_id = self.after(100, self._poll_loader)
+        elif self.var_search.get().strip():
+            # 로딩 중에 입력된 검색어는 전체 로딩 후 다시 검색
+            self._do_search()
+
+    def wait_loaded(self, timeout: Optional[float] = None) -> bool:
+        """테스트/CLI용: 백그라운드 로딩 완료까지 대기."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._all_loaded:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _province_by_name(self, name: str) -> Optional[RegionNode]:
+        code = next((c for c, n in self._prov_meta if n == name), None)
+        return self.ensure_province(code) if code else None
 
     def _fill_provinces(self) -> None:
-        names = [p.name for p in self.index.provinces]
+        names = [n for _, n in self._prov_meta]
         self.cb_prov["values"] = names
         if names:
             self.cb_prov.current(0)
             self._on_prov()
 
     def _on_prov(self, *_):
-        name = self.cb_prov.get()
-        prov = next((p for p in self.index.provinces if p.name == name), None)
+        prov = self._province_by_name(self.cb_prov.get())
         cities = prov.children if prov else []
         self.cb_city["values"] = [c.name for c in cities]
         if cities:
@@ -143,7 +331,7 @@ class RegionPicker(ttk.Frame):
             self._on_city()
 
     def _on_city(self, *_):
-        prov = next((p for p in self.index.provinces if p.name == self.cb_prov.get()), None)
+        prov = self._province_by_name(self.cb_prov.get())
         city = next((c for c in (prov.children if prov else []) if c.name == self.cb_city.get()), None)
         towns = city.children if city else []
         self.cb_town["values"] = [t.name for t in towns]
@@ -165,27 +353,33 @@ class RegionPicker(ttk.Frame):
     def _do_search(self):
         q = self.var_search.get().strip()
         self.listbox.delete(0, tk.END)
-        if not q:
-            return
-        for _, code, name in self.index.search(q):
-            self.listbox.insert(tk.END, name)
+        with self._lock:
+            self._results = self.index.search(q) if q else []
+        for e in self._results:
+            self.listbox.insert(tk.END, f"{e.full_name} ({LEVEL_NAMES[e.level]})")
 
     def _on_pick_from_list(self, *_):
         if not self.listbox.curselection():
             return
-        name = self.listbox.get(self.listbox.curselection()[0])
-        # 해당 이름을 가진 city를 찾아 동기화
-        for p in self.index.provinces:
-            for c in p.children:
-                if c.name == name:
-                    self.cb_prov.set(p.name)
-                    self._on_prov()
-                    self.cb_city.set(c.name)
-                    self._on_city()
-                    return
+        idx = self.listbox.curselection()[0]
+        if idx >= len(self._results):
+            return
+        self.select_path(self._results[idx].path)
+
+    def select_path(self, path: Tuple[str, ...]) -> None:
+        """경로(시/도, 시/군/구, 읍/면/동)에 맞춰 세 콤보박스를 동기화."""
+        self.cb_prov.set(path[0])
+        self._on_prov()
+        if len(path) > 1:
+            self.cb_city.set(path[1])
+            self._on_city()
+        else:
+            self.cb_city.set("")
+            self.cb_town["values"] = []
+        self.cb_town.set(path[2] if len(path) > 2 else "")
 
     def get_selected(self) -> Dict[str, Tuple[str, str]]:
-        p = next((x for x in self.index.provinces if x.name == self.cb_prov.get()), None)
+        p = self._province_by_name(self.cb_prov.get())
         c = next((x for x in (p.children if p else []) if x.name == self.cb_city.get()), None)
         t = next((x for x in (c.children if c else []) if x.name == self.cb_town.get()), None)
         parts = [x.name for x in (p, c) if x]
@@ -199,4 +393,13 @@ class RegionPicker(ttk.Frame):
             "query": query,
         }
 
-
+    def destroy(self) -> None:
+        for attr in ("_poll_id", "_debounce_id"):
+            aid = getattr(self, attr, None)
+            if aid:
+                try:
+                    self.after_cancel(aid)
+                except Exception:
+                    pass
+                setattr(self, attr, None)
+        super().destroy()
@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import threading
+import tkinter as tk
+from dataclasses import asdict, is_dataclass
+from tkinter import ttk
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from scraper.parsers import price_to_won
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# (컬럼 키, 헤더, 폭)
+COLUMNS: List[Tuple[str, str, int]] = [
+    ("property_type", "유형", 70),
+    ("address", "주소", 280),
+    ("price_text", "금액", 120),
+    ("maintenance_fee", "관리비", 80),
+    ("realtor", "부동산", 180),
+    ("posted_at", "등록일", 90),
+    ("url", "URL", 260),
+]
+
+# 정렬 시 표시 컬럼 대신 사용할 숫자 컬럼
+SORT_KEYS = {"price_text": "price_won"}
+
+DF_COLUMNS = [c for c, _, _ in COLUMNS] + ["price_won"]
+
+
+class ResultsModel:
+    """수집 결과 모델 (pandas 백엔드).
+
+    - append()는 어느 스레드에서든 호출 가능: 대기열에만 쌓는다.
+    - commit()은 UI 스레드에서 주기적으로 호출: 대기열을 DataFrame에 한 번에 합치고
+      정렬/필터 뷰(행 위치 배열)를 다시 계산한다.
+    - pandas/numpy는 첫 결과가 들어올 때 불러온다 (GUI 시작 시간 단축).
+    """
+
+    def __init__(self) -> None:
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self.df: Optional[pd.DataFrame] = None
+        self.view: Sequence[int] = ()
+        self.sort_col: Optional[str] = None
+        self.ascending = True
+        self.price_min: Optional[int] = None
+        self.price_max: Optional[int] = None
+        self.realtor_q = ""
+        self.region_q = ""
+
+    def append(self, item: Any) -> None:
+        row = asdict(item) if is_dataclass(item) else dict(item)
+        row["price_won"] = price_to_won(row.get("price_text") or "")
+        with self._lock:
+            self._pending.append(row)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+        if self.df is not None:
+            self.df = self.df.iloc[0:0]
+        self.view = ()
+
+    def commit(self) -> bool:
+        """대기 행을 반영. 변경이 있었으면 True."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return False
+        import pandas as pd
+
+        new = pd.DataFrame(pending, columns=DF_COLUMNS)
+        self.df = new if self.df is None or self.df.empty else pd.concat([self.df, new], ignore_index=True)
+        self._rebuild_view()
+        return True
+
+    @property
+    def total(self) -> int:
+        return 0 if self.df is None else len(self.df)
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def set_sort(self, col: str) -> None:
+        """같은 컬럼을 다시 누르면 오름/내림 전환."""
+        if self.sort_col == col:
+            self.ascending = not self.ascending
+        else:
+            self.sort_col, self.ascending = col, True
+        self._rebuild_view()
+
+    def set_filter(
+        self,
+        price_min: Optional[int] = None,
+        price_max: Optional[int] = None,
+        realtor: str = "",
+        region: str = "",
+    ) -> None:
+        self.price_min, self.price_max = price_min, price_max
+        self.realtor_q, self.region_q = (realtor or "").strip(), (region or "").strip()
+        self._rebuild_view()
+
+    def _rebuild_view(self) -> None:
+        df = self.df
+        if df is None:
+            self.view = ()
+            return
+        import numpy as np
+        import pandas as pd
+
+        mask = None
+        if self.price_min is not None or self.price_max is not None:
+            price = pd.to_numeric(df["price_won"], errors="coerce")
+            m = price.notna()
+            if self.price_min is not None:
+                m &= price >= self.price_min
+            if self.price_max is not None:
+                m &= price <= self.price_max
+            mask = m
+        for col, q in (("realtor", self.realtor_q), ("address", self.region_q)):
+            if q:
+                m = df[col].fillna("").astype(str).str.contains(q, regex=False)
+                mask = m if mask is None else (mask & m)
+        positions = np.arange(len(df)) if mask is None else np.flatnonzero(mask.to_numpy())
+        if self.sort_col and len(positions):
+            key = SORT_KEYS.get(self.sort_col, self.sort_col)
+            values = df[key].iloc[positions]
+            if key == "price_won":
+                values = pd.to_numeric(values, errors="coerce")
+            else:
+                values = values.fillna("").astype(str)
+            order = values.reset_index(drop=True).sort_values(
+                ascending=self.ascending, kind="mergesort", na_position="last"
+            ).index.to_numpy()
+            positions = positions[order]
+        self.view = positions
+
+    def rows(self, start: int, count: int) -> List[Tuple[str, ...]]:
+        """뷰 기준 [start, start+count) 구간의 표시용 값."""
+        pos = self.view[start:start + count]
+        if self.df is None or not len(pos):
+            return []
+        part = self.df.iloc[pos][[c for c, _, _ in COLUMNS]]
+        out: List[Tuple[str, ...]] = []
+        for rec in part.itertuples(index=False, name=None):
+            out.append(tuple("" if (v is None or v != v) else str(v) for v in rec))
+        return out
+
+
+class ResultsTable(ttk.Frame):
+    """가상화된 결과 테이블.
+
+    Treeview에는 화면에 보이는 줄 수만큼의 행만 두고, 스크롤 시 값만 바꿔 끼운다.
+    행이 수만 건이어도 위젯 항목 수는 일정하다.
+    """
+
+    def __init__(self, master, model: Optional[ResultsModel] = None, refresh_ms: int = 300) -> None:
+        super().__init__(master)
+        self.model = model or ResultsModel()
+        self.refresh_ms = max(50, refresh_ms)
+        self.first = 0
+        self.visible = 20
+        self._iids: List[str] = []
+        self._filter_after: Optional[str] = None
+
+        self._build_filter_bar()
+
+        body = ttk.Frame(self)
+        body.pack(fill=tk.BOTH, expand=True)
+        cols = [c for c, _, _ in COLUMNS]
+        self.tree = ttk.Treeview(body, columns=cols, show="headings", selectmode="browse")
+        for key, title, width in COLUMNS:
+            self.tree.heading(key, text=title, command=lambda k=key: self._on_sort(k))
+            self.tree.column(key, width=width, stretch=key in ("address", "url"))
+        self.scroll = ttk.Scrollbar(body, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.var_count = tk.StringVar(value="0건")
+        ttk.Label(self, textvariable=self.var_count).pack(anchor="e")
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", self._on_wheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_by(3))
+        self._after_id: Optional[str] = self.after(self.refresh_ms, self._tick)
+
+    def _build_filter_bar(self) -> None:
+        bar = ttk.Frame(self)
+        bar.pack(fill=tk.X, pady=(0, 4))
+        self.var_price_min = tk.StringVar()
+        self.var_price_max = tk.StringVar()
+        self.var_realtor = tk.StringVar()
+        self.var_region = tk.StringVar()
+        for label, var, width in (
+            ("최소금액(원)", self.var_price_min, 10),
+            ("최대금액(원)", self.var_price_max, 10),
+            ("부동산", self.var_realtor, 14),
+            ("지역", self.var_region, 14),
+        ):
+            ttk.Label(bar, text=label).pack(side=tk.LEFT, padx=(6, 2))
+            entry = ttk.Entry(bar, textvariable=var, width=width)
+            entry.pack(side=tk.LEFT)
+            entry.bind("<KeyRelease>", self._on_filter_changed)
+
+    # ---- 데이터 공급 ----
+    def append_item(self, item: Any) -> None:
+        """스크래퍼 콜백용 (워커 스레드에서 호출 가능)."""
+        self.model.append(item)
+
+    def clear(self) -> None:
+        self.model.clear()
+        self.first = 0
+        self._render()
+
+    def _tick(self) -> None:
+        try:
+            if self.model.commit():
+                self._render()
+        finally:
+            self._after_id = self.after(self.refresh_ms, self._tick)
+
+    # ---- 정렬/필터 ----
+    def _on_sort(self, key: str) -> None:
+        self.model.set_sort(key)
+        for k, title, _ in COLUMNS:
+            mark = ""
+            if k == self.model.sort_col:
+                mark = " ▲" if self.model.ascending else " ▼"
+            self.tree.heading(k, text=title + mark)
+        self._render()
+
+    def _on_filter_changed(self, *_) -> None:
+        if self._filter_after:
+            try:
+                self.after_cancel(self._filter_after)
+            except Exception:
+                pass
+        self._filter_after = self.after(250, self._apply_filter)
+
+    @staticmethod
+    def _to_int(s: str) -> Optional[int]:
+        s = (s or "").replace(",", "").strip()
+        return int(s) if s.isdigit() else None
+
+    def _apply_filter(self) -> None:
+        self._filter_after = None
+        self.model.set_filter(
+            price_min=self._to_int(self.var_price_min.get()),
+            price_max=self._to_int(self.var_price_max.get()),
+            realtor=self.var_realtor.get(),
+            region=self.var_region.get(),
+        )
+        self.first = 0
+        self._render()
+
+    # ---- 가상 스크롤 ----
+    def _on_resize(self, event) -> None:
+        row_h = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        visible = max(1, (event.height - row_h) // row_h)
+        if visible != self.visible:
+            self.visible = visible
+            self._render()
+
+    def _on_wheel(self, event) -> str:
+        self._scroll_by(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def _on_scrollbar(self, action: str, value: str, unit: str = "units") -> None:
+        if action == "moveto":
+            self._scroll_to(int(float(value) * len(self.model)))
+        elif action == "scroll":
+            step = int(value) * (self.visible if unit == "pages" else 1)
+            self._scroll_by(step)
+
+    def _scroll_by(self, delta: int) -> None:
+        self._scroll_to(self.first + delta)
+
+    def _scroll_to(self, first: int) -> None:
+        first = max(0, min(first, max(0, len(self.model) - self.visible)))
+        if first != self.first:
+            self.first = first
+            self._render()
+
+    def _render(self) -> None:
+        n = len(self.model)
+        self.first = max(0, min(self.first, max(0, n - self.visible)))
+        rows = self.model.rows(self.first, self.visible)
+        # 필요한 만큼만 행을 만들고, 이후에는 값만 교체
+        while len(self._iids) < len(rows):
+            self._iids.append(self.tree.insert("", tk.END, values=()))
+        while len(self._iids) > len(rows):
+            self.tree.delete(self._iids.pop())
+        for iid, values in zip(self._iids, rows):
+            self.tree.item(iid, values=values)
+        if n:
+            self.scroll.set(self.first / n, min(1.0, (self.first + self.visible) / n))
+        else:
+            self.scroll.set(0.0, 1.0)
+        shown = f"{n:,}건" if n == self.model.total else f"{n:,}/{self.model.total:,}건"
+        self.var_count.set(shown)
+
+    def destroy(self) -> None:
+        for attr in ("_after_id", "_filter_after"):
+            aid = getattr(self, attr, None)
+            if aid:
+                try:
+                    self.after_cancel(aid)
+                except Exception:
+                    pass
+                setattr(self, attr, None)
+        super().destroy()
@@ -47,12 +47,16 @@ if not exist "package\data" mkdir package\data
 if not exist "package\logs" mkdir package\logs
 if not exist "package\output" mkdir package\output
 
+REM 지역 데이터 .bin을 JSON 기준으로 다시 생성 (체크아웃 순서로 JSON이 더 새로워지는 경우 대비)
+python scripts\build_regions_from_mois.py --from-json
+
 REM 파일 복사
 echo 파일을 복사합니다...
 if exist "dist\다방크롤러.exe" copy "dist\다방크롤러.exe" "package\"
 if exist "dist\다방크롤러_CLI.exe" copy "dist\다방크롤러_CLI.exe" "package\"
 if exist "config\settings.toml" copy "config\settings.toml" "package\config\"
 if exist "data\regions_kr.json" copy "data\regions_kr.json" "package\data\"
+if exist "data\regions_kr.bin" copy "data\regions_kr.bin" "package\data\"
 if exist "README.md" copy "README.md" "package\"
 if exist "LICENSE" copy "LICENSE" "package\"
 
@@ -41,10 +41,12 @@ if not exist "package\assets" mkdir package\assets
 echo.
 
 echo 5. 파일 복사...
+python scripts\build_regions_from_mois.py --from-json
 copy "dist\다방크롤러.exe" "package\"
 copy "dist\다방크롤러_CLI.exe" "package\"
 copy "config\settings.toml" "package\config\"
 copy "data\regions_kr.json" "package\data\"
+copy "data\regions_kr.bin" "package\data\"
 copy "scraper\selectors.json" "package\scraper\"
 copy "scraper\selectors_direct.json" "package\scraper\"
 copy "scraper\selectors_enhanced.json" "package\scraper\"
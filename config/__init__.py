@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import tomli
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -21,6 +21,8 @@ class BrowserCfg:
     headless: bool = True
     block_images: bool = True
     detail_pages_pool: int = 2
+    # GUI에서 여러 매물 유형을 동시에 돌릴 때 최대 브라우저 수
+    max_concurrency: int = 3
 
 
 @dataclass
@@ -29,12 +31,80 @@ class PathsCfg:
     logs: str = "logs"
 
 
+@dataclass
+class GuiCfg:
+    log_level: str = "INFO"
+    log_buffer_size: int = 5000
+    log_max_lines: int = 2000
+    log_flush_ms: int = 200
+
+
+@dataclass
+class LoggingCfg:
+    # 파일 로그 레벨: 아이템별 상세는 DEBUG (기본 INFO에서는 남기지 않음)
+    file_level: str = "INFO"
+    # 반복 메시지(아이템 수집 등)는 처음 sample_burst건, 이후 sample_every건마다 1건만 기록
+    sample_burst: int = 5
+    sample_every: int = 50
+    # 파일 로그를 JSON 줄(구조화 필드 포함)로 기록
+    json: bool = False
+
+
+@dataclass
+class DaemonCfg:
+    # 로컬 수집 데몬: 127.0.0.1:port JSON API, 작업 저장소(SQLite), warm 브라우저(=동시 작업) 수
+    host: str = "127.0.0.1"
+    port: int = 8766
+    db: str = "output/daemon_jobs.sqlite3"
+    workers: int = 1
+
+
+@dataclass
+class WorkQueueCfg:
+    # 여러 머신 분산 수집용 작업 대기열 (지역 × 매물 종류 단위 작업)
+    path: str = "output/work_queue.sqlite3"
+    lease_s: float = 600.0  # 하트비트 없이 이 시간이 지나면 다른 작업자가 가져갈 수 있다
+    heartbeat_s: float = 60.0
+    max_attempts: int = 3
+    upload_batch: int = 20  # 결과를 이만큼 모일 때마다 올린다
+
+
+@dataclass
+class PacingCfg:
+    # 요청 간격 적응 제어(AIMD). 간격은 min_delay~max_delay(초) 사이에서 움직인다
+    min_delay: float = 0.3
+    max_delay: float = 30.0
+    initial_delay: float = 1.0
+    # 응답 지연이 이 값(초)을 넘으면 감속
+    latency_target: float = 2.5
+
+
+@dataclass
+class RetryCfg:
+    # 지수 백오프(full jitter): 0 ~ min(max_delay, base_delay * 2^n)초
+    tries: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    # 실행당 재시도 예산: budget_min + budget_ratio * 시도 수
+    budget_ratio: float = 0.2
+    budget_min: int = 10
+    # 작업 종류(navigation/detail)별 연속 실패 failure_threshold회면 reset_timeout초 동안 전체 대기
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+
 @dataclass
 class Settings:
     defaults: Defaults
     browser: BrowserCfg
     paths: PathsCfg
+    gui: GuiCfg = field(default_factory=GuiCfg)
     append_mode: bool = False
+    pacing: PacingCfg = field(default_factory=PacingCfg)
+    retry: RetryCfg = field(default_factory=RetryCfg)
+    logging: LoggingCfg = field(default_factory=LoggingCfg)
+    daemon: DaemonCfg = field(default_factory=DaemonCfg)
+    work_queue: WorkQueueCfg = field(default_factory=WorkQueueCfg)
 
 
 def _load_settings() -> Settings:
@@ -45,6 +115,12 @@ def _load_settings() -> Settings:
     d = data.get("defaults", {})
     b = data.get("browser", {})
     p = data.get("paths", {})
+    g = data.get("gui", {})
+    pc = data.get("pacing", {})
+    rt = data.get("retry", {})
+    lg = data.get("logging", {})
+    dm = data.get("daemon", {})
+    wq = data.get("work_queue", {})
     app = bool(data.get("append_mode", False))
     return Settings(
         Defaults(
@@ -59,9 +135,50 @@ def _load_settings() -> Settings:
             headless=bool(b.get("headless", True)),
             block_images=bool(b.get("block_images", True)),
             detail_pages_pool=int(b.get("detail_pages_pool", 2)),
+            max_concurrency=max(1, int(b.get("max_concurrency", BrowserCfg.max_concurrency))),
         ),
         PathsCfg(output=p.get("output", "output"), logs=p.get("logs", "logs")),
+        GuiCfg(
+            log_level=str(g.get("log_level", GuiCfg.log_level)).upper(),
+            log_buffer_size=int(g.get("log_buffer_size", GuiCfg.log_buffer_size)),
+            log_max_lines=int(g.get("log_max_lines", GuiCfg.log_max_lines)),
+            log_flush_ms=int(g.get("log_flush_ms", GuiCfg.log_flush_ms)),
+        ),
         append_mode=app,
+        pacing=PacingCfg(
+            min_delay=float(pc.get("min_delay", PacingCfg.min_delay)),
+            max_delay=float(pc.get("max_delay", PacingCfg.max_delay)),
+            initial_delay=float(pc.get("initial_delay", PacingCfg.initial_delay)),
+            latency_target=float(pc.get("latency_target", PacingCfg.latency_target)),
+        ),
+        retry=RetryCfg(
+            tries=max(1, int(rt.get("tries", RetryCfg.tries))),
+            base_delay=float(rt.get("base_delay", RetryCfg.base_delay)),
+            max_delay=float(rt.get("max_delay", RetryCfg.max_delay)),
+            budget_ratio=float(rt.get("budget_ratio", RetryCfg.budget_ratio)),
+            budget_min=int(rt.get("budget_min", RetryCfg.budget_min)),
+            failure_threshold=max(1, int(rt.get("failure_threshold", RetryCfg.failure_threshold))),
+            reset_timeout=float(rt.get("reset_timeout", RetryCfg.reset_timeout)),
+        ),
+        logging=LoggingCfg(
+            file_level=str(lg.get("file_level", LoggingCfg.file_level)).upper(),
+            sample_burst=int(lg.get("sample_burst", LoggingCfg.sample_burst)),
+            sample_every=int(lg.get("sample_every", LoggingCfg.sample_every)),
+            json=bool(lg.get("json", LoggingCfg.json)),
+        ),
+        daemon=DaemonCfg(
+            host=str(dm.get("host", DaemonCfg.host)),
+            port=int(dm.get("port", DaemonCfg.port)),
+            db=str(dm.get("db", DaemonCfg.db)),
+            workers=max(1, int(dm.get("workers", DaemonCfg.workers))),
+        ),
+        work_queue=WorkQueueCfg(
+            path=str(wq.get("path", WorkQueueCfg.path)),
+            lease_s=float(wq.get("lease_s", WorkQueueCfg.lease_s)),
+            heartbeat_s=float(wq.get("heartbeat_s", WorkQueueCfg.heartbeat_s)),
+            max_attempts=max(1, int(wq.get("max_attempts", WorkQueueCfg.max_attempts))),
+            upload_batch=max(1, int(wq.get("upload_batch", WorkQueueCfg.upload_batch))),
+        ),
     )
 
 
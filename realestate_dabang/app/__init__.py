@@ -3,13 +3,13 @@ from __future__ import annotations
 from pathlib import Path
 from loguru import logger
 
-from .config import LOG_DIR, ensure_dirs
+from .config import LOG_DIR, LOG_FILE_LEVEL, LOG_JSON, ensure_dirs
 
 
 def _setup_logging() -> None:
     ensure_dirs()
     logger.remove()
-    logger.add(lambda msg: print(msg, end=""))  # 콘솔
+    logger.add(lambda msg: print(msg, end=""), level="INFO")  # 콘솔
     log_path = Path(LOG_DIR) / "dabang_{time:YYYYMMDD}.log"
     logger.add(
         str(log_path),
@@ -17,7 +17,8 @@ def _setup_logging() -> None:
         retention="14 days",
         encoding="utf-8",
         enqueue=True,
-        level="INFO",
+        serialize=LOG_JSON,
+        level=LOG_FILE_LEVEL,  # 아이템 상세 로그는 DEBUG일 때만 파일에 기록
     )
 
 
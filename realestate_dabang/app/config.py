@@ -21,6 +21,18 @@ SCROLL_PAUSE_SECONDS: float = float(os.getenv("SCROLL_PAUSE_SECONDS", "1.2"))
 RANDOM_DELAY_MIN: float = float(os.getenv("RANDOM_DELAY_MIN", "0.8"))
 RANDOM_DELAY_MAX: float = float(os.getenv("RANDOM_DELAY_MAX", "2.4"))
 RETRY_MAX_TRIES: int = int(os.getenv("RETRY_MAX_TRIES", "3"))
+# 재시도 백오프(초): 0 ~ min(MAX, BASE * 2^n) / 실행당 재시도는 시도 수의 RATIO배(+10)까지
+RETRY_BASE_DELAY: float = float(os.getenv("RETRY_BASE_DELAY", "1.0"))
+RETRY_MAX_DELAY: float = float(os.getenv("RETRY_MAX_DELAY", "30"))
+RETRY_BUDGET_RATIO: float = float(os.getenv("RETRY_BUDGET_RATIO", "0.2"))
+# 작업 종류별 회로 차단: 연속 실패 N회면 RESET초 동안 전체 대기
+BREAKER_FAILURES: int = int(os.getenv("BREAKER_FAILURES", "5"))
+BREAKER_RESET_SECONDS: float = float(os.getenv("BREAKER_RESET_SECONDS", "30"))
+
+# 적응형 요청 간격(AIMD). 끄면 RANDOM_DELAY_MIN~MAX 균등 난수 대기
+PACING_ADAPTIVE: bool = os.getenv("PACING_ADAPTIVE", "true").lower() in {"1", "true", "yes"}
+PACING_MIN_DELAY: float = float(os.getenv("PACING_MIN_DELAY", "0.3"))
+PACING_MAX_DELAY: float = float(os.getenv("PACING_MAX_DELAY", "30"))
 
 USER_AGENT: str = os.getenv(
     "USER_AGENT",
@@ -31,6 +43,11 @@ USER_AGENT: str = os.getenv(
     ),
 )
 
+# GUI 로그 뷰: 링버퍼 크기 / 위젯 최대 줄 수 / 반영 주기(ms)
+GUI_LOG_BUFFER: int = int(os.getenv("GUI_LOG_BUFFER", "5000"))
+GUI_LOG_MAX_LINES: int = int(os.getenv("GUI_LOG_MAX_LINES", "2000"))
+GUI_LOG_FLUSH_MS: int = int(os.getenv("GUI_LOG_FLUSH_MS", "200"))
+
 # 설치된 Chrome 메이저 버전을 강제로 지정하고 싶을 때 사용 (예: 138)
 CHROME_VERSION_MAIN = os.getenv("CHROME_VERSION_MAIN")
 if CHROME_VERSION_MAIN is not None:
@@ -39,6 +56,18 @@ if CHROME_VERSION_MAIN is not None:
     except Exception:
         CHROME_VERSION_MAIN = None
 
+# 파일 로그 레벨(아이템별 상세는 DEBUG) / 반복 메시지 샘플링: 처음 BURST건, 이후 EVERY건마다 1건 / JSON 줄 기록
+LOG_FILE_LEVEL: str = os.getenv("LOG_FILE_LEVEL", "INFO").upper()
+LOG_SAMPLE_BURST: int = int(os.getenv("LOG_SAMPLE_BURST", "5"))
+LOG_SAMPLE_EVERY: int = int(os.getenv("LOG_SAMPLE_EVERY", "50"))
+LOG_JSON: bool = os.getenv("LOG_JSON", "false").lower() in {"1", "true", "yes"}
+
+# Selenium 드라이버 풀: 유휴 드라이버 수(0이면 재사용 안 함) / 드라이버당 최대 재사용 횟수
+DRIVER_POOL_SIZE: int = int(os.getenv("DRIVER_POOL_SIZE", "1"))
+DRIVER_MAX_USES: int = int(os.getenv("DRIVER_MAX_USES", "20"))
+# GUI 시작 시 드라이버 미리 띄우기
+DRIVER_PREWARM: bool = os.getenv("DRIVER_PREWARM", "true").lower() in {"1", "true", "yes"}
+
 
 def ensure_dirs() -> None:
     """필요한 출력/로그 디렉터리 생성."""
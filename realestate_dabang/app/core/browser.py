@@ -1,25 +1,38 @@
 from __future__ import annotations
 
+import atexit
 import contextlib
-from typing import Callable, List, Optional
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, List, Optional
 
 from loguru import logger
-from selenium.webdriver import ChromeOptions
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
-import undetected_chromedriver as uc
-import subprocess
-import re
+from scraper.driver_pool import DriverPool, detect_chrome_version_main, reset_driver
+from scraper.metrics import record_selector, selector_group
+from scraper.selector_stats import shared_selector_stats
 
 from .. import config
 
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+# 드라이버 기본 암묵적 대기(초)
+IMPLICIT_WAIT_SECONDS = 2
+
+_pool: Optional[DriverPool] = None
+_pool_lock = threading.Lock()
+
 
 def create_chrome_driver(headless: bool | None = None) -> WebDriver:
     """undetected-chromedriver 기반 Chrome 드라이버 생성."""
 
+    # uc/selenium 드라이버 모듈은 무거워 실제로 브라우저를 띄울 때만 불러온다
+    import undetected_chromedriver as uc
+    from selenium.webdriver import ChromeOptions
+
     headless = config.HEADLESS_DEFAULT if headless is None else headless
     logger.info("브라우저 초기화(headless={})", headless)
 
@@ -44,25 +57,8 @@ def create_chrome_driver(headless: bool | None = None) -> WebDriver:
     }
     options.add_experimental_option("prefs", prefs)
 
-    # 설치된 Chrome 메이저 버전 감지(맥)
-    version_main: Optional[int] = None
-    if config.CHROME_VERSION_MAIN:
-        version_main = int(config.CHROME_VERSION_MAIN)  # type: ignore[arg-type]
-    else:
-        try:
-            # macOS Chrome 버전 확인
-            out = subprocess.check_output(
-                [
-                    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-                    "--version",
-                ],
-                stderr=subprocess.STDOUT,
-            ).decode("utf-8", "ignore")
-            m = re.search(r"(\d+)\.\d+\.\d+\.\d+", out)
-            if m:
-                version_main = int(m.group(1))
-        except Exception:
-            version_main = None
+    # 설치된 Chrome 메이저 버전 (설정값 우선, 설치본 조회는 프로세스당 한 번)
+    version_main = detect_chrome_version_main(config.CHROME_VERSION_MAIN)
 
     # undetected-chromedriver에 버전 힌트를 전달하면 맞는 드라이버를 받기 쉬움
     try:
@@ -77,16 +73,50 @@ def create_chrome_driver(headless: bool | None = None) -> WebDriver:
         )
         raise
     driver.set_page_load_timeout(config.TIMEOUT_SECONDS)
-    driver.implicitly_wait(2)
+    driver.implicitly_wait(IMPLICIT_WAIT_SECONDS)
     return driver
 
 
+def _reset_for_reuse(driver: WebDriver) -> None:
+    reset_driver(driver)
+    driver.implicitly_wait(IMPLICIT_WAIT_SECONDS)
+
+
+def driver_pool() -> DriverPool:
+    """프로세스 공용 드라이버 풀 (실행 간 드라이버 재사용, prewarm 지원)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool(
+                create_chrome_driver,
+                max_idle=config.DRIVER_POOL_SIZE,
+                max_uses=config.DRIVER_MAX_USES,
+                reset=_reset_for_reuse,
+            )
+            atexit.register(_pool.close)
+        return _pool
+
+
+@contextlib.contextmanager
+def implicit_wait(driver: WebDriver, seconds: float = 0):
+    """블록 동안만 암묵적 대기를 바꾼다. 후보 셀렉터를 여러 개 찔러볼 때 miss마다 기다리지 않도록."""
+    driver.implicitly_wait(seconds)
+    try:
+        yield driver
+    finally:
+        with contextlib.suppress(Exception):
+            driver.implicitly_wait(IMPLICIT_WAIT_SECONDS)
+
+
 def wait_for_visible(
     driver: WebDriver,
     by: By,
     value: str,
     timeout: Optional[int] = None,
 ):
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
     timeout = timeout or config.TIMEOUT_SECONDS
     return WebDriverWait(driver, timeout).until(EC.visibility_of_element_located((by, value)))
 
@@ -97,6 +127,9 @@ def wait_for_all_present(
     value: str,
     timeout: Optional[int] = None,
 ):
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
     timeout = timeout or config.TIMEOUT_SECONDS
     return WebDriverWait(driver, timeout).until(EC.presence_of_all_elements_located((by, value)))
 
@@ -108,17 +141,28 @@ def try_select_first(driver: WebDriver, selectors: List[str]):
     실패 시 None 리턴.
     """
 
-    for sel in selectors:
+    chain = len(selectors) > 1
+    group = selector_group(selectors)
+    stats = shared_selector_stats()
+    for i, sel in enumerate(selectors):
+        t = time.perf_counter()
         try:
             if sel.startswith("xpath:"):
                 xpath = sel.split("xpath:", 1)[1]
                 el = driver.find_element(By.XPATH, xpath)
             else:
                 el = driver.find_element(By.CSS_SELECTOR, sel)
+            stats.record(group, sel, bool(el), time.perf_counter() - t)
             if el:
+                if chain:
+                    record_selector(group, i)
                 return el
         except Exception:
+            # 못 찾음(NoSuchElement)도 여기로 온다: 암묵적 대기만큼 걸린 시간까지 기록
+            stats.record(group, sel, False, time.perf_counter() - t)
             continue
+    if chain:
+        record_selector(group, None)
     return None
 
 
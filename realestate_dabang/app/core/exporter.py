@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable, List
+from typing import TYPE_CHECKING, Iterable, List
 
-import pandas as pd
 from loguru import logger
 
 from .. import config
 from ..utils.time import now_timestamp_str, slugify_for_filename
 from .models import Record
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 COLUMNS_ORDER: List[str] = [
     "lot_address",
@@ -45,6 +47,8 @@ def deduplicate_records(records: List[Record]) -> List[Record]:
 
 
 def records_to_dataframe(records: Iterable[Record]) -> pd.DataFrame:
+    import pandas as pd
+
     data = [r.model_dump() for r in records]
     df = pd.DataFrame(data, columns=COLUMNS_ORDER)
     return df
@@ -63,6 +67,8 @@ def save_excel(records: List[Record], region_keyword: str, dedupe: bool = True)
     df = records_to_dataframe(records)
     output_path = build_output_path(region_keyword)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    import pandas as pd
+
     with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
         df.to_excel(writer, sheet_name="dabang", index=False)
     logger.success("엑셀 저장 완료: {} ({}건)", str(output_path), len(df))
@@ -3,49 +3,72 @@ from __future__ import annotations
 import random
 import time
 from functools import wraps
-from typing import Any, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
 
-from loguru import logger
+from scraper.pacing import AdaptivePacer, shared_pacer
+from scraper.retry import Retrier, shared_retrier
 
 from .. import config
 
+if TYPE_CHECKING:
+    from scraper.control import CrawlControl
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 
-def random_sleep(min_seconds: float | None = None, max_seconds: float | None = None) -> None:
-    """랜덤 슬립으로 요청 속도 제어."""
+def pacer() -> AdaptivePacer:
+    """프로세스 공용 적응형 페이서 (동시에 도는 모든 수집 스레드가 같은 간격 예산을 쓴다)."""
+    return shared_pacer(
+        min_delay=config.PACING_MIN_DELAY,
+        max_delay=config.PACING_MAX_DELAY,
+        initial_delay=config.RANDOM_DELAY_MIN,
+    )
+
+
+def random_sleep(
+    min_seconds: float | None = None,
+    max_seconds: float | None = None,
+    control: Optional[CrawlControl] = None,
+) -> None:
+    """요청 속도 제어 대기. control이 있으면 정지 요청 시 바로 깨어난다.
+
+    범위를 주지 않으면 적응형 페이서가 간격을 정하고(PACING_ADAPTIVE), 범위를 주면 그 안의 균등 난수만큼 쉰다.
+    """
+    if min_seconds is None and max_seconds is None and config.PACING_ADAPTIVE:
+        pacer().pace(control)
+        return
     lo = min_seconds if min_seconds is not None else config.RANDOM_DELAY_MIN
     hi = max_seconds if max_seconds is not None else config.RANDOM_DELAY_MAX
     duration = random.uniform(lo, hi)
-    time.sleep(duration)
+    if control is not None:
+        control.sleep(duration)
+    else:
+        time.sleep(duration)
 
 
-def with_retry(max_tries: int | None = None) -> Callable[[F], F]:
-    """재시도 데코레이터. 예외 발생 시 최대 N회 재시도."""
+def retrier() -> Retrier:
+    """프로세스 공용 Retrier (재시도 예산/회로 차단기를 모든 호출부가 공유)."""
+    return shared_retrier(
+        tries=config.RETRY_MAX_TRIES,
+        base_delay=config.RETRY_BASE_DELAY,
+        max_delay=config.RETRY_MAX_DELAY,
+        budget_ratio=config.RETRY_BUDGET_RATIO,
+        failure_threshold=config.BREAKER_FAILURES,
+        reset_timeout=config.BREAKER_RESET_SECONDS,
+    )
 
-    tries = max_tries if max_tries is not None else config.RETRY_MAX_TRIES
+
+def with_retry(max_tries: int | None = None, op: str = "default") -> Callable[[F], F]:
+    """재시도 데코레이터. 예외 발생 시 최대 N회, 지수 백오프(jitter)로 재시도.
+
+    op은 회로 차단기 단위(navigation, search, detail 등)이며 재시도 예산은 공용이다.
+    """
 
     def decorator(func: F) -> F:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            attempt = 0
-            while True:
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:  # noqa: BLE001
-                    attempt += 1
-                    if attempt >= tries:
-                        logger.error("재시도 초과: {} ({}회)", e, attempt)
-                        raise
-                    delay = random.uniform(
-                        config.RANDOM_DELAY_MIN * attempt,
-                        config.RANDOM_DELAY_MAX * attempt,
-                    )
-                    logger.warning("오류 발생, 재시도 {}회/{}회 후 {:.2f}s 대기: {}", attempt, tries, delay, e)
-                    time.sleep(delay)
+            return retrier().call(op, func, *args, tries=max_tries, **kwargs)
 
         return wrapper  # type: ignore[return-value]
 
     return decorator
-
-
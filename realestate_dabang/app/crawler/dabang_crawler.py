@@ -1,66 +1,79 @@
 from __future__ import annotations
 
-import threading
 import time
-from typing import Callable, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
 from bs4 import BeautifulSoup
 from loguru import logger
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.remote.webdriver import WebDriver
 
-from ..core.browser import create_chrome_driver, try_select_all, try_select_first, safe_quit
+from scraper import metrics
+from scraper.block_detector import BlockDetector, for_selenium
+from scraper.control import CrawlControl, CrawlStopped
+from scraper.log_events import LogSampler, level_callback, log_event
+from scraper.progress import ProgressTracker
+from scraper.selector_stats import shared_selector_stats
+from scraper.site import site_url
+
+from ..core.browser import driver_pool, implicit_wait, try_select_all, try_select_first
 from ..core.models import CrawlerInput, Record
-from ..core.throttling import random_sleep
+from ..core.throttling import pacer, random_sleep, retrier
 from ..utils.text import extract_lot_address, parse_maintenance_fee_to_won, parse_price_to_won
 from .. import config
 from . import selectors as S
+from .page_scripts import EXTRACT_CARDS_JS, HARVESTER_DRAIN_JS, HARVESTER_INSTALL_JS, NAV_TIMING_JS, selectors_payload
 
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
-class PauseSignal:
-    """CAPTCHA 대응을 위한 일시정지/재개 제어 신호."""
-
-    def __init__(self) -> None:
-        self._stop_event = threading.Event()
-        self._pause_event = threading.Event()
-
-    def request_stop(self) -> None:
-        self._stop_event.set()
-
-    def request_pause(self) -> None:
-        self._pause_event.set()
-
-    def resume(self) -> None:
-        self._pause_event.clear()
+metrics.name_selector_groups(S)
 
-    def should_stop(self) -> bool:
-        return self._stop_event.is_set()
+# 예전 이름 호환. 일시정지/재개/정지/마감 시각은 모든 엔진이 같은 CrawlControl을 쓴다.
+PauseSignal = CrawlControl
 
-    def wait_if_paused(self) -> None:
-        while self._pause_event.is_set() and not self._stop_event.is_set():
-            time.sleep(0.3)
 
-
-def detect_captcha(driver: WebDriver) -> bool:
-    """캡차/차단 감지: 힌트 요소 또는 페이지 소스 텍스트 검사."""
+def detect_captcha(driver: WebDriver, detector: Optional[BlockDetector] = None) -> bool:
+    """캡차/차단 감지: 페이지에 심은 감지기 플래그 조회, 감지기를 쓸 수 없으면 힌트 요소 검사."""
+    detector = detector or for_selenium(driver)
+    reason = detector.reason()
+    if reason is not None:
+        return bool(reason)
     try:
-        hints = try_select_all(driver, S.CAPTCHA_HINTS)
-        if hints:
-            return True
+        return bool(try_select_all(driver, S.CAPTCHA_HINTS))
     except Exception:
-        pass
-    html = driver.page_source.lower()
-    for kw in ["captcha", "자동입력", "보안문자"]:
-        if kw in html:
-            return True
-    return False
+        return False
 
 
 def absolute_url(href: str) -> str:
-    if href.startswith("http://") or href.startswith("https://"):
-        return href
-    return "https://www.dabangapp.com" + href
+    return site_url(href)
+
+
+def harvest_key(row: dict) -> str:
+    """카드 식별 키 (페이지 수집기의 key()와 동일 규칙)."""
+    if row.get("href"):
+        return row["href"]
+    if row.get("address") or row.get("price"):
+        return f"{row.get('address') or ''}|{row.get('price') or ''}"
+    return row.get("text") or ""
+
+
+def record_from_fields(fields: dict) -> Optional[Record]:
+    """페이지 스크립트가 뽑은 카드 필드 → Record. 필드가 비면 카드 전체 텍스트로 대체."""
+    text = fields.get("text") or ""
+    lot_address = extract_lot_address(fields.get("address") or text)
+    if not lot_address:
+        logger.warning("지번 미노출 카드 스킵")
+        return None
+    href = fields.get("href") or ""
+    return Record(
+        lot_address=lot_address,
+        price=parse_price_to_won(fields.get("price") or text),
+        property_type=fields.get("type") or text,
+        maintenance_fee=parse_maintenance_fee_to_won(fields.get("maint") or text),
+        url=absolute_url(href) if href else "",
+        collected_at=time.strftime("%Y-%m-%d %H:%M:%S"),
+    )
 
 
 class DabangCrawler:
@@ -73,24 +86,39 @@ class DabangCrawler:
     def __init__(
         self,
         user_input: CrawlerInput,
-        pause_signal: Optional[PauseSignal] = None,
-        progress_callback: Optional[Callable[[str], None]] = None,
+        pause_signal: Optional[CrawlControl] = None,
+        progress_callback: Optional[Callable[..., None]] = None,
+        progress: Optional[ProgressTracker] = None,
     ) -> None:
         self.user_input = user_input
-        self.pause_signal = pause_signal or PauseSignal()
-        self.progress_callback = progress_callback
-
-    def _emit(self, msg: str) -> None:
-        logger.info(msg)
-        if self.progress_callback:
-            try:
-                self.progress_callback(msg)
-            except Exception:
-                pass
+        self.control = pause_signal or CrawlControl()
+        self.pause_signal = self.control  # 예전 속성 이름 호환
+        # progress_callback(msg, level) 또는 예전 progress_callback(msg) 모두 받는다
+        self.progress_callback = level_callback(progress_callback)
+        # 처리량/ETA 표시용 진행 상황 (목표 건수는 카드 수집 후 확정)
+        self.progress = progress or ProgressTracker()
+        self._sampler = LogSampler(config.LOG_SAMPLE_BURST, config.LOG_SAMPLE_EVERY)
+
+    def _emit(self, msg: str, level: str = "INFO", *args: Any, sample: bool = False, **fields: Any) -> None:
+        """msg는 "{}" 템플릿, args는 출력할 때만 채운다. sample=True면 반복 메시지를 솎아낸다."""
+        log_event(
+            msg, level, args,
+            callback=self.progress_callback,
+            sampler=self._sampler if sample else None,
+            depth=2,
+            **fields,
+        )
 
     def _search_region(self, driver: WebDriver) -> None:
-        driver.get("https://www.dabangapp.com/")
-        random_sleep()
+        self.progress.set_phase("navigate")
+        t0 = time.monotonic()
+        # 재시도는 바깥 run()의 "search" 한 층에서만 한다 (중첩되면 시도 횟수가 곱해진다).
+        # 여기서는 navigation 회로 차단기 대기/기록만 한다.
+        with retrier().guard("navigation", control=self.control):
+            driver.get(site_url("/"))
+        self._record_navigation(driver, time.monotonic() - t0)
+        random_sleep(control=self.control)
+        self.progress.set_phase("search")
         input_el = None
         for sel in S.SEARCH_INPUT:
             input_el = try_select_first(driver, [sel])
@@ -100,15 +128,15 @@ class DabangCrawler:
             raise RuntimeError("검색 입력창을 찾을 수 없습니다. 셀렉터를 업데이트 해주세요.")
 
         input_el.click()
-        random_sleep(0.2, 0.6)
+        random_sleep(0.2, 0.6, control=self.control)
         input_el.clear()
         input_el.send_keys(self.user_input.region_keyword)
-        random_sleep(0.2, 0.6)
+        random_sleep(0.2, 0.6, control=self.control)
         # 1차: ENTER
         input_el.send_keys(Keys.ENTER)
 
         # 2차: 자동완성 첫 항목 클릭 시도
-        time.sleep(0.8)
+        self.control.sleep(0.8)
         ac = try_select_first(driver, S.AUTOCOMPLETE_FIRST)
         if ac:
             try:
@@ -117,7 +145,7 @@ class DabangCrawler:
                 pass
 
         # 결과 컨테이너/카드 등장 대기 (soft wait)
-        time.sleep(2.5)
+        self.control.sleep(2.5)
 
         # 원룸 필터 적용(가능한 경우)
         try:
@@ -127,7 +155,7 @@ class DabangCrawler:
                 if more_btn:
                     try:
                         more_btn.click()
-                        time.sleep(0.6)
+                        self.control.sleep(0.6)
                     except Exception:
                         pass
                 # 방구조 섹션 내 원룸 버튼
@@ -135,7 +163,7 @@ class DabangCrawler:
                 if one_btn:
                     try:
                         one_btn.click()
-                        time.sleep(0.8)
+                        self.control.sleep(0.8)
                     except Exception:
                         pass
             # 아파트 탭 전환(요청 시)
@@ -145,7 +173,7 @@ class DabangCrawler:
                 if apt_tab:
                     try:
                         apt_tab.click()
-                        time.sleep(1.2)
+                        self.control.sleep(1.2)
                     except Exception:
                         pass
             # 오피스텔 탭 전환(요청 시)
@@ -155,7 +183,7 @@ class DabangCrawler:
                 if ofc_tab:
                     try:
                         ofc_tab.click()
-                        time.sleep(1.2)
+                        self.control.sleep(1.2)
                     except Exception:
                         pass
             # 주택/빌라 탭 전환(요청 시)
@@ -165,7 +193,7 @@ class DabangCrawler:
                 if hv_tab:
                     try:
                         hv_tab.click()
-                        time.sleep(1.2)
+                        self.control.sleep(1.2)
                     except Exception:
                         pass
             # 분양 관련 필터(옵션) 적용
@@ -173,13 +201,25 @@ class DabangCrawler:
         except Exception as e:
             logger.debug("유형/원룸 필터 적용 실패(무시): {}", e)
 
+    def _record_navigation(self, driver: WebDriver, elapsed: float) -> None:
+        """문서 응답 상태/지연을 페이서에 반영. Navigation Timing을 못 읽으면 경과 시간만."""
+        status = latency = None
+        try:
+            nav = driver.execute_script(NAV_TIMING_JS)
+            if nav:
+                status = int(nav.get("status") or 0) or None
+                latency = nav.get("ttfb")
+        except Exception:
+            pass
+        pacer().record(latency=latency if latency is not None else elapsed, status=status)
+
     def _click_candidates(self, driver: WebDriver, selectors: list[str]) -> bool:
         for sel in selectors:
             try:
                 el = try_select_first(driver, [sel])
                 if el:
                     el.click()
-                    time.sleep(0.5)
+                    self.control.sleep(0.5)
                     return True
             except Exception:
                 continue
@@ -197,7 +237,7 @@ class DabangCrawler:
                 opts = S.SALE_BUILDING_OPTIONS.get(label, [])
                 if opts:
                     self._click_candidates(driver, opts)
-            time.sleep(0.4)
+            self.control.sleep(0.4)
         # 분양단계
         if ui.sale_stages:
             self._click_candidates(driver, S.SALE_STAGE_TOGGLE)
@@ -205,7 +245,7 @@ class DabangCrawler:
                 opts = S.SALE_STAGE_OPTIONS.get(label, [])
                 if opts:
                     self._click_candidates(driver, opts)
-            time.sleep(0.4)
+            self.control.sleep(0.4)
         # 분양일정
         if ui.sale_schedules:
             self._click_candidates(driver, S.SALE_SCHEDULE_TOGGLE)
@@ -213,7 +253,7 @@ class DabangCrawler:
                 opts = S.SALE_SCHEDULE_OPTIONS.get(label, [])
                 if opts:
                     self._click_candidates(driver, opts)
-            time.sleep(0.4)
+            self.control.sleep(0.4)
         # 공급유형
         if ui.sale_supply_types:
             self._click_candidates(driver, S.SALE_SUPPLY_TOGGLE)
@@ -221,7 +261,7 @@ class DabangCrawler:
                 opts = S.SALE_SUPPLY_OPTIONS.get(label, [])
                 if opts:
                     self._click_candidates(driver, opts)
-            time.sleep(0.4)
+            self.control.sleep(0.4)
 
     def _try_load_more_or_next(self, driver: WebDriver) -> bool:
         """더보기/다음 페이지 시도. 성공 시 True."""
@@ -230,7 +270,8 @@ class DabangCrawler:
                 btn = try_select_first(driver, [sel])
                 if btn:
                     btn.click()
-                    time.sleep(config.SCROLL_PAUSE_SECONDS)
+                    self.progress.page_done()
+                    self.control.sleep(config.SCROLL_PAUSE_SECONDS)
                     return True
             except Exception:
                 continue
@@ -239,39 +280,83 @@ class DabangCrawler:
                 btn = try_select_first(driver, [sel])
                 if btn:
                     btn.click()
-                    time.sleep(config.SCROLL_PAUSE_SECONDS)
+                    self.progress.page_done()
+                    self.control.sleep(config.SCROLL_PAUSE_SECONDS)
                     return True
             except Exception:
                 continue
         return False
 
+    def _install_harvester(self, driver: WebDriver) -> bool:
+        try:
+            return bool(driver.execute_script(HARVESTER_INSTALL_JS, selectors_payload()))
+        except Exception as e:  # noqa: BLE001
+            logger.warning("카드 수집기 설치 실패(기존 방식 사용): {}", e)
+            return False
+
+    def _drain_harvester(self, driver: WebDriver, seen: set, out: List[dict]) -> bool:
+        """버퍼에 쌓인 새 카드를 out에 추가. 수집기가 사라졌으면(페이지 이동) 다시 설치."""
+        try:
+            rows = driver.execute_script(HARVESTER_DRAIN_JS)
+        except Exception as e:  # noqa: BLE001
+            logger.debug("카드 버퍼 읽기 실패: {}", e)
+            return False
+        if rows is None:
+            return self._install_harvester(driver) and self._drain_harvester(driver, seen, out)
+        for row in rows:
+            key = harvest_key(row)
+            if key in seen:
+                continue
+            seen.add(key)
+            out.append(row)
+        return True
+
     def _scroll_collect_cards(self, driver: WebDriver) -> List:
+        """결과 목록을 끝까지 스크롤하며 카드 수집.
+
+        가능하면 페이지 안 MutationObserver 수집기가 새로 렌더링된 카드의 필드를 바로 뽑아 두고,
+        스크롤마다 그 버퍼만 비워 온다(반환: 필드 dict 목록). 설치에 실패하면 기존처럼
+        WebElement 목록을 반환한다.
+        """
+        self.progress.set_phase("list")
         last_count = 0
         stable_rounds = 0
         max_scrolls = 50
         scrolls = 0
         collected = []
+        harvested: List[dict] = []
+        seen: set = set()
+        harvest = self._install_harvester(driver)
+        block = for_selenium(driver)
+        block.install()
         while True:
-            if self.pause_signal.should_stop():
+            if self.control.should_stop():
                 break
-            if detect_captcha(driver):
+            if detect_captcha(driver, block):
+                pacer().record(blocked=True)
+                metrics.record_block("selenium")
                 self._emit("CAPTCHA 감지됨: 인증 후 재개 버튼을 눌러주세요.")
-                self.pause_signal.request_pause()
-                self.pause_signal.wait_if_paused()
+                self.control.request_pause()
+                self.control.wait_if_paused()
+                block.reset()
                 self._emit("재개됨. 계속 진행합니다.")
 
             # 현재 카드 수집
-            cards = try_select_all(driver, S.CARD)
-            if cards:
-                collected = cards
-            
+            if harvest:
+                harvest = self._drain_harvester(driver, seen, harvested)
+                current_count = len(harvested)
+            if not harvest:
+                cards = try_select_all(driver, S.CARD)
+                if cards:
+                    collected = cards
+                current_count = len(cards)
+
             # 스크롤 다운
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(config.SCROLL_PAUSE_SECONDS)
+            self.control.sleep(config.SCROLL_PAUSE_SECONDS)
             scrolls += 1
 
             # 증가 확인
-            current_count = len(cards)
             if current_count <= last_count:
                 stable_rounds += 1
             else:
@@ -280,7 +365,7 @@ class DabangCrawler:
 
             if stable_rounds >= 4:
                 # 추가 대기
-                time.sleep(2.0)
+                self.control.sleep(2.0)
                 # 더보기/다음 시도 후 다시 스크롤 루프 이어감
                 if not self._try_load_more_or_next(driver):
                     break
@@ -288,9 +373,72 @@ class DabangCrawler:
             if scrolls >= max_scrolls:
                 break
 
+        if harvest:
+            self._drain_harvester(driver, seen, harvested)
+            self._emit(f"카드 수집 완료: {len(harvested)}개")
+            return harvested
         self._emit(f"카드 수집 완료: {len(collected)}개")
         return collected
 
+    def _extract_cards(self, driver: WebDriver, cards: List) -> Optional[List[Optional[dict]]]:
+        """모든 카드의 필드를 execute_script 한 번으로 추출. 실패 시 None."""
+        if not cards:
+            return []
+        try:
+            rows = driver.execute_script(EXTRACT_CARDS_JS, cards, selectors_payload())
+        except Exception as e:  # noqa: BLE001
+            logger.warning("카드 일괄 추출 실패: {}", e)
+            return None
+        if not isinstance(rows, list) or len(rows) != len(cards):
+            logger.warning("카드 일괄 추출 결과 불일치: {}", type(rows).__name__)
+            return None
+        return rows
+
+    def _parse_cards(self, driver: WebDriver, cards: List, offset: int = 0, tag: str = "") -> List[Record]:
+        """카드 목록 → Record 목록. 일괄 추출을 우선 쓰고, 실패한 카드만 기존 파싱 경로로 처리."""
+        out: List[Record] = []
+        # 수집기가 이미 필드를 뽑아 온 경우(dict 목록)는 그대로 사용
+        rows = cards if cards and isinstance(cards[0], dict) else self._extract_cards(driver, cards)
+        if rows is None:
+            self._emit("일괄 추출 실패 → 카드별 파싱으로 대체", "WARNING")
+        self.progress.add_target(len(cards))
+        self.progress.set_phase("detail")
+        # 폴백 경로에서 셀렉터 miss마다 암묵적 대기가 걸리지 않도록 0초로
+        with implicit_wait(driver, 0):
+            for idx, card in enumerate(cards, start=1):
+                if self.control.should_stop():
+                    break
+                self.control.wait_if_paused()
+                t0 = time.monotonic()
+                fields = rows[idx - 1] if rows is not None else None
+                if fields is not None:
+                    rec = record_from_fields(fields)
+                elif isinstance(card, dict):
+                    rec = None
+                else:
+                    rec = self._parse_card(driver, card)
+                    random_sleep(control=self.control)
+                self.progress.detail_latency(time.monotonic() - t0)
+                if not rec:
+                    # 파싱 실패 카드는 처리량/ETA에 세지 않는다
+                    self.progress.item_skipped()
+                else:
+                    out.append(rec)
+                    self.progress.item_done()
+                    # 한 줄 요약은 샘플링, 상세 항목은 DEBUG 파일 로그에만
+                    self._emit(
+                        "아이템 {} 수집{}: {} | {:,}원", "INFO", offset + len(out), tag, rec.lot_address, rec.price,
+                        sample=True, event="item",
+                    )
+                    self._emit(
+                        "  매물유형={} 관리비={} URL={} 수집시간={}", "DEBUG",
+                        rec.property_type, rec.maintenance_fee or "-", rec.url, rec.collected_at,
+                        event="item_detail",
+                    )
+                if idx % 20 == 0:
+                    self._emit(f"파싱 진행{tag}: {idx}/{len(cards)}")
+        return out
+
     def _parse_card(self, driver: WebDriver, card) -> Optional[Record]:
         try:
             html = card.get_attribute("innerHTML")
@@ -408,68 +556,50 @@ class DabangCrawler:
 
     def run(self) -> tuple[List[Record], int]:
         records: List[Record] = []
-        with safe_quit(create_chrome_driver(self.user_input.headless)) as driver:
-            self._emit(f"다방 메인 진입 및 검색: {self.user_input.region_keyword}")
-            self._search_region(driver)
-            self._emit("결과 페이지 로딩. 스크롤 시작")
-            cards = self._scroll_collect_cards(driver)
-            for idx, card in enumerate(cards, start=1):
-                if self.pause_signal.should_stop():
-                    break
-                self.pause_signal.wait_if_paused()
-                rec = self._parse_card(driver, card)
-                if rec:
-                    records.append(rec)
-                    # 상세한 아이템 정보 로그 출력
-                    maintenance_info = f"관리비: {rec.maintenance_fee:,}원" if rec.maintenance_fee else "관리비: 없음"
-                    self._emit(f"아이템 {len(records)} 수집 완료:")
-                    self._emit(f"  📍 주소: {rec.lot_address}")
-                    self._emit(f"  💰 가격: {rec.price:,}원")
-                    self._emit(f"  🏠 매물유형: {rec.property_type}")
-                    self._emit(f"  💸 {maintenance_info}")
-                    self._emit(f"  🔗 URL: {rec.url}")
-                    self._emit(f"  📅 수집시간: {rec.collected_at}")
-                    self._emit("  " + "─" * 50)
-                if idx % 20 == 0:
-                    self._emit(f"파싱 진행: {idx}/{len(cards)}")
-                random_sleep()
-        total_cards = len(cards)
-        if total_cards == 0:
-            self._dump_diagnostics(driver, "headless" if self.user_input.headless else "nonheadless")
-        
+        # 드라이버는 풀에서 빌려 쓰고, 끝나면 쿠키/스토리지를 지운 뒤 다음 실행을 위해 돌려준다
+        pool = driver_pool()
+        # 재시도 예산은 실행 단위, 회로 차단기(navigation/search)는 프로세스 공용
+        retry = retrier()
+        retry.new_run()
+        total_cards = 0
+        try:
+            with pool.lease(self.user_input.headless) as driver:
+                self._emit(f"다방 메인 진입 및 검색: {self.user_input.region_keyword}")
+                retry.call("search", self._search_region, driver, control=self.control)
+                self._emit("결과 페이지 로딩. 스크롤 시작")
+                cards = self._scroll_collect_cards(driver)
+                records.extend(self._parse_cards(driver, cards))
+                total_cards = len(cards)
+                if total_cards == 0:
+                    self._dump_diagnostics(driver, "headless" if self.user_input.headless else "nonheadless")
+                    if self.user_input.headless and not self.control.should_stop():
+                        # 재시도용 비헤드리스 드라이버를 진단 덤프와 겹쳐 미리 띄운다
+                        pool.prewarm(False)
+        except CrawlStopped as e:
+            self._emit(f"수집 중지({e or self.control.stop_reason})", "WARNING")
+
         # 헤드리스에서 0건일 때 비헤드리스 재시도
-        if total_cards == 0 and self.user_input.headless:
+        if total_cards == 0 and self.user_input.headless and not self.control.should_stop():
             self._emit("헤드리스에서 0건 감지 → non-headless로 1회 재시도")
             try:
-                with safe_quit(create_chrome_driver(False)) as driver2:
-                    self._search_region(driver2)
+                with pool.lease(False) as driver2:
+                    retry.call("search", self._search_region, driver2, control=self.control)
                     cards2 = self._scroll_collect_cards(driver2)
-                    for idx, card in enumerate(cards2, start=1):
-                        if self.pause_signal.should_stop():
-                            break
-                        self.pause_signal.wait_if_paused()
-                        rec2 = self._parse_card(driver2, card)
-                        if rec2:
-                            records.append(rec2)
-                            # 상세한 아이템 정보 로그 출력 (비헤드리스 재시도)
-                            maintenance_info = f"관리비: {rec2.maintenance_fee:,}원" if rec2.maintenance_fee else "관리비: 없음"
-                            self._emit(f"아이템 {len(records)} 수집 완료 (비헤드리스):")
-                            self._emit(f"  📍 주소: {rec2.lot_address}")
-                            self._emit(f"  💰 가격: {rec2.price:,}원")
-                            self._emit(f"  🏠 매물유형: {rec2.property_type}")
-                            self._emit(f"  💸 {maintenance_info}")
-                            self._emit(f"  🔗 URL: {rec2.url}")
-                            self._emit(f"  📅 수집시간: {rec2.collected_at}")
-                            self._emit("  " + "─" * 50)
-                        if idx % 20 == 0:
-                            self._emit(f"비헤드리스 파싱 진행: {idx}/{len(cards2)}")
-                        random_sleep()
+                    records.extend(self._parse_cards(driver2, cards2, offset=len(records), tag=" (비헤드리스)"))
                     total_cards = len(cards2)
                     if total_cards == 0:
                         self._dump_diagnostics(driver2, "nonheadless")
+            except CrawlStopped as e:
+                self._emit(f"수집 중지({e or self.control.stop_reason})", "WARNING")
             except Exception as e:
                 logger.warning("non-headless 재시도 중 오류: {}", e)
 
+        self.progress.set_phase("done")
+        # 후보 셀렉터별 시도/적중/소요 시간을 실행 간 누적 (tools/selector_report.py)
+        try:
+            shared_selector_stats().flush(config.LOG_DIR / "selector_stats.json")
+        except OSError as e:
+            logger.warning("셀렉터 통계 저장 실패: {}", e)
         return records, total_cards
 
 
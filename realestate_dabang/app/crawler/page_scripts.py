@@ -0,0 +1,138 @@
+"""브라우저 안에서 실행하는 스크립트 모음.
+
+카드 필드 추출을 페이지 안에서 한 번에 처리해 WebDriver 왕복(find_element,
+get_attribute, 암묵적 대기)을 없앤다. 셀렉터는 selectors.py의 CSS 후보를 그대로 넘긴다
+(xpath 후보는 카드 기준 검색이 어려워 기존 파이썬 경로에서도 건너뛰었다).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+from . import selectors as S
+
+
+# card(Element), sel(dict) -> {address, price, maint, type, href, text}
+_EXTRACT_FN = r"""
+function (card, sel) {
+  function text(el) {
+    return ((el && (el.innerText || el.textContent)) || '').replace(/\s+/g, ' ').trim();
+  }
+  function first(list) {
+    for (var i = 0; i < list.length; i++) {
+      var el = null;
+      try { el = card.querySelector(list[i]); } catch (e) { continue; }
+      var t = text(el);
+      if (t) return t;
+    }
+    return '';
+  }
+  function link(list) {
+    for (var i = 0; i < list.length; i++) {
+      var a = null;
+      try { a = card.querySelector(list[i]); } catch (e) { continue; }
+      if (a) {
+        var h = a.href || a.getAttribute('href');
+        if (h) return String(h);
+      }
+    }
+    return '';
+  }
+  return {
+    address: first(sel.address),
+    price: first(sel.price),
+    maint: first(sel.maint),
+    type: first(sel.type),
+    href: link(sel.link),
+    text: text(card)
+  };
+}
+"""
+
+# arguments[0]: 카드 WebElement 배열, arguments[1]: selectors_payload()
+EXTRACT_CARDS_JS = (
+    "var extract = " + _EXTRACT_FN + ";\n"
+    "var cards = arguments[0], sel = arguments[1];\n"
+    "return Array.prototype.map.call(cards, function (c) {\n"
+    "  try { return extract(c, sel); } catch (e) { return null; }\n"
+    "});\n"
+)
+
+
+# arguments[0]: selectors_payload(). 이미 설치돼 있으면 아무것도 하지 않는다.
+# 새로 렌더링된(또는 내용이 바뀐) 카드만 추출해 버퍼에 쌓고, drain()으로 꺼낸다.
+# 가상 스크롤로 DOM에서 빠진 카드도 버퍼에 남아 있으므로 한 번씩만 파싱된다.
+HARVESTER_INSTALL_JS = (
+    "var sel = arguments[0];\n"
+    "if (window.__dabangHarvest) { return true; }\n"
+    "var extract = " + _EXTRACT_FN + ";\n"
+    r"""
+var cardSel = sel.card.filter(function (s) {
+  try { document.createDocumentFragment().querySelector(s); return true; } catch (e) { return false; }
+}).join(',');
+if (!cardSel) { return false; }
+var h = { seen: new Set(), buf: [], total: 0 };
+function key(row) { return row.href || ((row.address || row.price) ? row.address + '|' + row.price : row.text); }
+function take(card) {
+  var row;
+  try { row = extract(card, sel); } catch (e) { return; }
+  if (!row.text) return;  // 아직 내용이 렌더링되지 않음 → 나중에 변경 시 다시 시도
+  var k = key(row);
+  if (!k || h.seen.has(k)) return;
+  h.seen.add(k);
+  h.buf.push(row);
+  h.total++;
+}
+function scan(node) {
+  if (!node || node.nodeType !== 1) {
+    node = node && node.parentElement;
+    if (!node) return;
+  }
+  var own = node.closest(cardSel);
+  if (own) { take(own); return; }
+  var list = node.querySelectorAll(cardSel);
+  for (var i = 0; i < list.length; i++) take(list[i]);
+}
+h.observer = new MutationObserver(function (muts) {
+  for (var i = 0; i < muts.length; i++) {
+    var m = muts[i];
+    if (m.type === 'childList') {
+      for (var j = 0; j < m.addedNodes.length; j++) scan(m.addedNodes[j]);
+    } else {
+      scan(m.target);
+    }
+  }
+});
+h.observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+h.drain = function () { var out = h.buf; h.buf = []; return out; };
+window.__dabangHarvest = h;
+scan(document.body);
+return true;
+"""
+)
+
+# 설치돼 있지 않으면(페이지 이동 등) null
+HARVESTER_DRAIN_JS = "return window.__dabangHarvest ? window.__dabangHarvest.drain() : null;"
+
+# 현재 문서의 응답 상태/첫 바이트 지연(초). responseStatus는 Chrome 109+ (없으면 0)
+NAV_TIMING_JS = r"""
+var n = performance.getEntriesByType('navigation')[0];
+if (!n) { return null; }
+return { status: n.responseStatus || 0, ttfb: Math.max(0, n.responseStart - n.requestStart) / 1000 };
+"""
+
+
+def _css_only(selectors: List[str]) -> List[str]:
+    return [s for s in selectors if not s.startswith("xpath:")]
+
+
+def selectors_payload() -> Dict[str, List[str]]:
+    """페이지 스크립트에 넘길 CSS 셀렉터 묶음."""
+    return {
+        "card": _css_only(S.CARD),
+        "address": _css_only(S.ADDRESS),
+        "price": _css_only(S.PRICE),
+        "maint": _css_only(S.MAINT_FEE),
+        "type": _css_only(S.TYPE),
+        "link": _css_only(S.DETAIL_LINK),
+    }
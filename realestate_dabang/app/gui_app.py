@@ -1,46 +1,71 @@
 from __future__ import annotations
 
-import queue
 import threading
 import tkinter.filedialog as fd
 import webbrowser
+from collections import deque
 from pathlib import Path
 from typing import List
 
 import customtkinter as ctk  # type: ignore[reportMissingImports]
 from loguru import logger
 
-from .config import ensure_dirs, OUTPUT_DIR
+from scraper.control import CrawlControl
+from scraper.progress import ProgressTracker
+
+from .config import DRIVER_PREWARM, ensure_dirs, GUI_LOG_BUFFER, GUI_LOG_FLUSH_MS, GUI_LOG_MAX_LINES, OUTPUT_DIR
+from .core.browser import driver_pool
 from .core.exporter import save_excel
 from .core.filters import apply_filters
 from .core.models import CrawlerInput
-from .crawler.dabang_crawler import DabangCrawler, PauseSignal
+from .crawler.dabang_crawler import DabangCrawler
 
 
 class TkLogHandler:
-    """loguru를 Text 위젯으로 보냄."""
-
-    def __init__(self, text_widget: ctk.CTkTextbox) -> None:
+    """loguru를 Text 위젯으로 보냄.
+
+    워커 스레드의 로그는 고정 크기 링버퍼에만 쌓고, UI 타이머(pump)가
+    한 번에 모아 넣는다. 위젯에는 최대 max_lines 줄만 유지한다.
+    """
+
+    def __init__(
+        self,
+        text_widget: ctk.CTkTextbox,
+        capacity: int = GUI_LOG_BUFFER,
+        max_lines: int = GUI_LOG_MAX_LINES,
+        level: str = "INFO",
+    ) -> None:
         self.text_widget = text_widget
-        self.queue: queue.Queue[str] = queue.Queue()
-        logger.add(self._write_from_loguru, level="INFO")
+        self.max_lines = max_lines
+        self.lines: deque[str] = deque(maxlen=capacity)
+        self.dropped = 0
+        self._lock = threading.Lock()
+        logger.add(self._write_from_loguru, level=level, format="{time:HH:mm:ss} | {level: <8} | {message}")
 
     def _write_from_loguru(self, message) -> None:
-        try:
-            # message는 loguru의 Message 객체
-            self.queue.put_nowait(str(message))
-        except Exception:
-            pass
+        # message는 loguru의 Message 객체
+        text = str(message).rstrip("\n")
+        with self._lock:
+            if len(self.lines) == self.lines.maxlen:
+                self.dropped += 1
+            self.lines.append(text)
 
     def pump(self) -> None:
-        try:
-            while True:
-                msg = self.queue.get_nowait()
-                self.text_widget.insert("end", msg)
-                self.text_widget.insert("end", "\n")
-                self.text_widget.see("end")
-        except queue.Empty:
+        with self._lock:
+            batch = list(self.lines)
+            self.lines.clear()
+            dropped, self.dropped = self.dropped, 0
+        if not batch and not dropped:
             return
+        chunk = ""
+        if dropped:
+            chunk += f"… 로그 {dropped}줄 생략 (전체 로그는 logs/ 파일 참고)\n"
+        chunk += "\n".join(batch) + ("\n" if batch else "")
+        self.text_widget.insert("end", chunk)
+        total = int(self.text_widget.index("end-1c").split(".")[0]) - 1
+        if total > self.max_lines:
+            self.text_widget.delete("1.0", f"{total - self.max_lines + 1}.0")
+        self.text_widget.see("end")
 
 
 class App(ctk.CTk):
@@ -103,10 +128,11 @@ class App(ctk.CTk):
             "민간임대": ctk.BooleanVar(value=False),
         }
 
-        self.pause_signal = PauseSignal()
+        self.pause_signal = CrawlControl()
         self.worker: threading.Thread | None = None
         self.records_count = 0
         self.done_count = 0
+        self.tracker: ProgressTracker | None = None
         self.latest_output: Path | None = None
         self.advanced_visible = False
 
@@ -116,6 +142,10 @@ class App(ctk.CTk):
         self.tk_log_handler = TkLogHandler(self.log_text)
         self.after(200, self._poll_logs)
 
+        # 첫 수집 시작 전에 드라이버를 백그라운드에서 미리 띄워 둔다
+        if DRIVER_PREWARM:
+            driver_pool().prewarm(self.headless_var.get())
+
     def _build_ui(self) -> None:
         pad = 8
         frm = ctk.CTkFrame(self)
@@ -210,8 +240,11 @@ class App(ctk.CTk):
 
     def _poll_logs(self) -> None:
         self.tk_log_handler.pump()
-        self.progress_label.configure(text=f"진행: {self.done_count}건 완료")
-        self.after(300, self._poll_logs)
+        if self.tracker is not None:
+            self.progress_label.configure(text=self.tracker.snapshot().format())
+        else:
+            self.progress_label.configure(text=f"진행: {self.done_count}건 완료")
+        self.after(GUI_LOG_FLUSH_MS, self._poll_logs)
 
     def _collect_types(self) -> List[str]:
         return [k for k, v in self.type_vars.items() if v.get()]
@@ -244,11 +277,13 @@ class App(ctk.CTk):
                 user_input,
                 pause_signal=self.pause_signal,
                 progress_callback=lambda m: None,
+                progress=self.tracker,
             )
             records, total_cards = crawler.run()
             self.done_count = len(records)
             filtered = apply_filters(records, user_input)
             self.done_count = len(filtered)
+            self.tracker.set_phase("export")
             output = save_excel(filtered, user_input.region_keyword, dedupe=user_input.dedupe)
             self.latest_output = output
             self.path_label.configure(text=f"저장경로: {output}")
@@ -256,13 +291,15 @@ class App(ctk.CTk):
         except Exception as e:  # noqa: BLE001
             logger.exception("작업 실패: {}", e)
         finally:
+            self.tracker.set_phase("done")
             self.start_btn.configure(state="normal")
 
     def on_start(self) -> None:
         if self.worker and self.worker.is_alive():
             return
         self.done_count = 0
-        self.pause_signal = PauseSignal()
+        self.tracker = ProgressTracker()
+        self.pause_signal = CrawlControl()
         self.start_btn.configure(state="disabled")
         self.worker = threading.Thread(target=self._run_worker, daemon=True)
         self.worker.start()
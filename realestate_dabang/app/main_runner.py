@@ -3,6 +3,10 @@ from __future__ import annotations
 import argparse
 from loguru import logger
 
+from scraper.control import CrawlControl
+from scraper.metrics import REGISTRY, serve_metrics
+from scraper.progress import ProgressTracker, start_reporter
+
 from pathlib import Path
 from . import config as cfg
 from .config import ensure_dirs
@@ -27,6 +31,10 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--sale-stage", action="append", default=[], help="분양 단계(복수 지정)")
     p.add_argument("--sale-schedule", action="append", default=[], help="분양 일정(복수 지정)")
     p.add_argument("--sale-supply", action="append", default=[], help="공급 유형(복수 지정)")
+    p.add_argument("--progress-interval", type=float, default=10.0, help="진행 요약 출력 주기(초), 0이면 끔")
+    p.add_argument("--deadline", type=float, default=0, help="최대 실행 시간(초). 지나면 모은 결과까지만 저장, 0이면 무제한")
+    p.add_argument("--metrics-port", type=int, default=0, help="127.0.0.1:<port>/metrics 로 지표 노출, 0이면 끔")
+    p.add_argument("--metrics-out", type=str, default=None, help="종료 시 지표 저장 경로(.json이면 JSON)")
     return p.parse_args()
 
 
@@ -48,11 +56,27 @@ def main() -> None:
         sale_schedules=args.sale_schedule,
         sale_supply_types=args.sale_supply,
     )
-    crawler = DabangCrawler(user_input)
+    tracker = ProgressTracker()
+    control = CrawlControl(deadline_s=args.deadline or None)
+    crawler = DabangCrawler(user_input, pause_signal=control, progress=tracker)
+    metrics_server = serve_metrics(args.metrics_port) if args.metrics_port else None
+    stop_reporter = start_reporter(tracker, logger.info, args.progress_interval) if args.progress_interval > 0 else None
     logger.info("크롤링 시작: {}", user_input.model_dump())
-    records, total_cards = crawler.run()
-    filtered = apply_filters(records, user_input)
-    out = save_excel(filtered, user_input.region_keyword, dedupe=user_input.dedupe)
+    try:
+        records, total_cards = crawler.run()
+        if control.stop_reason == "deadline":
+            logger.warning("마감 시각 도달: 카드 {}개까지 수집", total_cards)
+        filtered = apply_filters(records, user_input)
+        tracker.set_phase("export")
+        out = save_excel(filtered, user_input.region_keyword, dedupe=user_input.dedupe)
+    finally:
+        tracker.set_phase("done")
+        if stop_reporter is not None:
+            stop_reporter.set()
+        if args.metrics_out:
+            logger.info("지표 저장: {}", REGISTRY.dump(Path(args.metrics_out)))
+        if metrics_server is not None:
+            metrics_server.shutdown()
     logger.success("완료: 카드 {}개 중 {}건 저장 → {}", total_cards, len(filtered), out)
 
 
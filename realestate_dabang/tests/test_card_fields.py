@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import unittest
+
+from realestate_dabang.app.core.models import CrawlerInput
+from realestate_dabang.app.crawler.dabang_crawler import DabangCrawler, harvest_key, record_from_fields
+from realestate_dabang.app.crawler.page_scripts import HARVESTER_DRAIN_JS, HARVESTER_INSTALL_JS
+
+
+class _FakeDriver:
+    """execute_script 결과만 흉내내는 드라이버."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.scripts = 0
+        self.waits = []
+
+    def execute_script(self, script, *args):
+        self.scripts += 1
+        if isinstance(self.rows, Exception):
+            raise self.rows
+        return self.rows
+
+    def implicitly_wait(self, seconds):
+        self.waits.append(seconds)
+
+
+class TestCardFields(unittest.TestCase):
+    def test_fields_to_record(self):
+        rec = record_from_fields({
+            "address": "부산 기장 대변리 123-4",
+            "price": "월세 500/50",
+            "maint": "관리비 5만",
+            "type": "원룸",
+            "href": "/room/abc",
+            "text": "",
+        })
+        self.assertIsNotNone(rec)
+        self.assertEqual(rec.property_type, "원룸")
+        self.assertEqual(rec.url, "https://www.dabangapp.com/room/abc")
+        self.assertGreater(rec.price, 0)
+
+    def test_missing_fields_fall_back_to_card_text(self):
+        rec = record_from_fields({"text": "원룸 부산 기장 대변리 123-4 월세 500/50"})
+        self.assertIsNotNone(rec)
+        self.assertEqual(rec.url, "")
+        self.assertIsNone(record_from_fields({"text": "주소 없음"}))
+
+    def test_bulk_extraction_uses_one_script_call(self):
+        crawler = DabangCrawler(CrawlerInput(region_keyword="부산 기장"))
+        rows = [{"text": f"부산 기장 대변리 {i}-1 월세 500/50", "href": f"/room/{i}"} for i in range(30)]
+        driver = _FakeDriver(rows)
+        out = crawler._parse_cards(driver, [object()] * 30)
+        self.assertEqual(len(out), 30)
+        self.assertEqual(driver.scripts, 1)
+        # 블록 동안 0초, 끝나면 기본값으로 복구
+        self.assertEqual(driver.waits[0], 0)
+        self.assertGreater(driver.waits[-1], 0)
+
+    def test_script_failure_returns_none(self):
+        crawler = DabangCrawler(CrawlerInput(region_keyword="부산 기장"))
+        self.assertIsNone(crawler._extract_cards(_FakeDriver(RuntimeError("js")), [object()]))
+        self.assertIsNone(crawler._extract_cards(_FakeDriver([{}]), [object(), object()]))
+
+
+class _HarvestDriver:
+    """페이지 수집기 버퍼를 흉내: drain 호출마다 준비된 배치를 하나씩 돌려준다."""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.installs = 0
+
+    def execute_script(self, script, *args):
+        if script == HARVESTER_INSTALL_JS:
+            self.installs += 1
+            return True
+        if script == HARVESTER_DRAIN_JS:
+            return self.batches.pop(0) if self.batches else []
+        return None
+
+
+class TestHarvester(unittest.TestCase):
+    def test_drain_dedupes_and_reinstalls_after_navigation(self):
+        crawler = DabangCrawler(CrawlerInput(region_keyword="부산 기장"))
+        a = {"href": "/room/1", "text": "a"}
+        b = {"address": "대변리 1", "price": "월세 1/1", "text": "b"}
+        driver = _HarvestDriver([[a, b], None, [dict(a), {"href": "/room/2", "text": "c"}]])
+        seen, out = set(), []
+        self.assertTrue(crawler._drain_harvester(driver, seen, out))
+        # 페이지 이동으로 수집기가 사라짐(None) → 재설치 후 다시 읽음, 중복은 버림
+        self.assertTrue(crawler._drain_harvester(driver, seen, out))
+        self.assertEqual(driver.installs, 1)
+        self.assertEqual([harvest_key(r) for r in out], ["/room/1", "대변리 1|월세 1/1", "/room/2"])
+
+    def test_harvested_rows_parse_without_extra_script(self):
+        crawler = DabangCrawler(CrawlerInput(region_keyword="부산 기장"))
+        rows = [{"text": "부산 기장 대변리 1-1 월세 500/50", "href": "/room/1"}]
+        driver = _FakeDriver(RuntimeError("should not be called"))
+        out = crawler._parse_cards(driver, rows)
+        self.assertEqual(len(out), 1)
+        self.assertEqual(driver.scripts, 0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
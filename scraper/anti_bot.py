@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import random
 import time
-from typing import Dict
+from typing import Dict, Optional
+
+from scraper.pacing import shared_pacer
 
 
 UAS = [
@@ -20,8 +22,16 @@ def build_context_kwargs() -> Dict:
     }
 
 
-def human_sleep(min_s: float = 0.8, max_s: float = 2.4) -> None:
-    time.sleep(random.uniform(min_s, max_s))
+def human_sleep(min_s: Optional[float] = None, max_s: Optional[float] = None, control=None) -> None:
+    """요청 사이 대기. 범위를 주지 않으면 공용 적응형 페이서(scraper.pacing)가 간격을 정한다."""
+    if min_s is None and max_s is None:
+        shared_pacer().pace(control)
+        return
+    duration = random.uniform(min_s if min_s is not None else 0.8, max_s if max_s is not None else 2.4)
+    if control is not None:
+        control.sleep(duration)
+    else:
+        time.sleep(duration)
 
 
 def infinite_scroll(page, max_scrolls: int = 50, stop_flag=None) -> None:
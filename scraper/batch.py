@@ -0,0 +1,91 @@
+"""여러 매물 유형 동시 수집.
+
+유형마다 DabangScraper를 별도 스레드에서 실행한다. 각 스크래퍼는 자기 스레드에서
+sync_playwright/브라우저를 따로 띄우므로 컨텍스트가 섞이지 않는다.
+결과는 선택 순서대로 합쳐 한 번에 저장할 수 있게 돌려준다.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, replace
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+from loguru import logger
+
+from scraper.control import CrawlControl
+from scraper.dabang_scraper import DabangScraper, Item, ScrapeOptions
+from scraper.log_events import level_callback
+from scraper.progress import ProgressTracker
+from scraper.retry import Retrier
+from config import settings
+
+
+@dataclass
+class BatchResult:
+    items_by_type: Dict[str, List[Item]] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    order: List[str] = field(default_factory=list)
+
+    @property
+    def items(self) -> List[Item]:
+        """선택 순서대로 합친 전체 결과."""
+        out: List[Item] = []
+        for t in self.order:
+            out.extend(self.items_by_type.get(t, []))
+        return out
+
+
+def run_types(
+    base_opts: ScrapeOptions,
+    property_types: Sequence[str],
+    stop_flag: Union[CrawlControl, threading.Event],
+    max_concurrency: int = 3,
+    log_cb: Optional[Callable[..., None]] = None,
+    item_cb: Optional[Callable[[Item], None]] = None,
+    progress: Optional[ProgressTracker] = None,
+    on_type_done: Optional[Callable[[str, List[Item], Optional[BaseException]], None]] = None,
+) -> BatchResult:
+    """property_types를 최대 max_concurrency개씩 동시에 수집.
+
+    stop_flag로 CrawlControl을 넘기면 모든 유형 스레드가 같은 정지/일시정지/마감 신호를 공유한다.
+    """
+    result = BatchResult(order=list(property_types))
+    if not property_types:
+        return result
+    workers = max(1, min(max_concurrency, len(property_types)))
+    # 재시도 예산/회로 차단기는 이번 실행의 모든 유형이 공유 (사이트 장애 시 함께 멈춘다)
+    retrier = Retrier(**asdict(settings.retry))
+
+    def job(ptype: str) -> List[Item]:
+        if stop_flag.is_set():
+            return []
+        opts = replace(base_opts, property_type=ptype)
+        # 동시 실행 시 로그가 섞이므로 유형을 앞에 붙인다 (레벨과 받는 쪽 min_level은 그대로 전달)
+        cb = level_callback(log_cb, f"[{ptype}] " if workers > 1 else "")
+        scraper = DabangScraper(opts, stop_flag, log_cb=cb, item_cb=item_cb, progress=progress, retrier=retrier)
+        items = scraper.run()
+        # run()은 예외를 삼키고 error에만 남긴다 → 실패한 유형으로 보고되도록 다시 던진다
+        if scraper.error:
+            raise RuntimeError(scraper.error)
+        return items
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dabang-type") as pool:
+        futures = {pool.submit(job, t): t for t in property_types}
+        for fut in as_completed(futures):
+            ptype = futures[fut]
+            err: Optional[BaseException] = None
+            try:
+                items = fut.result()
+            except Exception as e:  # noqa: BLE001
+                logger.exception("{} 수집 실패", ptype)
+                items, err = [], e
+                result.errors[ptype] = str(e)
+            result.items_by_type[ptype] = items
+            if on_type_done:
+                try:
+                    on_type_done(ptype, items, err)
+                except Exception:
+                    pass
+    return result
@@ -0,0 +1,229 @@
+"""페이지 안에 심는 캡차/차단 감지기.
+
+기존 감지는 스크롤마다 힌트 셀렉터를 찾고, 없으면 page_source 전체를 받아 소문자로 바꾼 뒤
+키워드를 찾았다. 여기서는 MutationObserver가 새로 붙은 노드만 보고 challenge iframe, 힌트
+셀렉터, 키워드 텍스트를 검사해 window.__blockDetector.reason 하나로 노출한다.
+조회는 문자열 하나를 돌려받는 호출 한 번이면 된다('' = 정상).
+
+Selenium(execute_script / CDP)과 Playwright(evaluate / add_init_script) 모두에서 쓸 수 있다.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import weakref
+from typing import Any, Callable, List, Optional, Sequence
+
+HINT_SELECTORS: List[str] = [
+    'iframe[src*="captcha"]',
+    'iframe[src*="challenges.cloudflare.com"]',
+    '[id*="captcha"]',
+    '#challenge-form',
+]
+KEYWORDS: List[str] = ["captcha", "자동입력", "보안문자"]
+
+# 설치돼 있지 않으면 null
+PROBE_JS = "window.__blockDetector ? window.__blockDetector.reason : null"
+RESET_JS = "window.__blockDetector ? window.__blockDetector.reset() : null"
+
+# cfg: {selectors, keywords}. 이미 설치돼 있으면 현재 reason만 돌려준다.
+# add_init_script로 문서 생성 직후 실행될 수 있으므로 documentElement를 관찰한다.
+_DETECTOR_FN = r"""
+function (cfg) {
+  if (window.__blockDetector) return window.__blockDetector.reason;
+  var selector = cfg.selectors.filter(function (s) {
+    try { document.createDocumentFragment().querySelector(s); return true; } catch (e) { return false; }
+  }).join(',');
+  var keywords = cfg.keywords.map(function (k) { return k.toLowerCase(); });
+  var SKIP = { SCRIPT: 1, STYLE: 1, NOSCRIPT: 1, TEMPLATE: 1 };
+  var d = { reason: '', pending: [], timer: 0 };
+
+  function hasKeyword(text) {
+    text = (text || '').toLowerCase();
+    for (var i = 0; i < keywords.length; i++) {
+      if (text.indexOf(keywords[i]) !== -1) return keywords[i];
+    }
+    return '';
+  }
+  function textOf(node) {
+    if (node.nodeType === 3) {
+      var p = node.parentNode;
+      return p && SKIP[p.nodeName] ? '' : node.data;
+    }
+    if (node.nodeType !== 1 || SKIP[node.nodeName]) return '';
+    return node.innerText || node.textContent || '';
+  }
+  function hint() {
+    if (!selector) return '';
+    try {
+      var el = document.querySelector(selector);
+      return el ? 'selector:' + (el.id ? '#' + el.id : el.nodeName.toLowerCase()) : '';
+    } catch (e) { return ''; }
+  }
+  function flush() {
+    d.timer = 0;
+    var nodes = d.pending;
+    d.pending = [];
+    if (d.reason) return;
+    var r = hint();
+    for (var i = 0; !r && i < nodes.length; i++) {
+      var k = hasKeyword(textOf(nodes[i]));
+      if (k) r = 'text:' + k;
+    }
+    if (!r) { var t = hasKeyword(document.title); if (t) r = 'title:' + t; }
+    d.reason = r;
+  }
+  function queue(node) {
+    if (d.reason || !node) return;
+    d.pending.push(node);
+    if (!d.timer) d.timer = setTimeout(flush, 100);
+  }
+  d.reset = function () {
+    d.reason = '';
+    d.pending = [];
+    if (document.body) d.pending.push(document.body);
+    flush();
+    return d.reason;
+  };
+  d.observer = new MutationObserver(function (muts) {
+    if (d.reason) return;
+    for (var i = 0; i < muts.length; i++) {
+      var m = muts[i];
+      if (m.type === 'childList') {
+        for (var j = 0; j < m.addedNodes.length; j++) queue(m.addedNodes[j]);
+      } else {
+        queue(m.target);
+      }
+    }
+  });
+  d.observer.observe(document.documentElement || document, { childList: true, subtree: true, characterData: true });
+  window.__blockDetector = d;
+  return d.reset();
+}
+"""
+
+
+def build_detector_js(
+    selectors: Sequence[str] = HINT_SELECTORS, keywords: Sequence[str] = KEYWORDS
+) -> str:
+    """감지기 설치 식(expression). 평가 결과는 현재 reason."""
+    cfg = json.dumps({"selectors": list(selectors), "keywords": list(keywords)}, ensure_ascii=False)
+    return "(" + _DETECTOR_FN.strip() + ")(" + cfg + ")"
+
+
+DETECTOR_JS = build_detector_js()
+
+# 연속으로 이만큼 실패하면 감지기를 끈다 (페이지 이동 중 일시 오류는 한두 번에 그친다)
+MAX_FAILURES = 3
+_UNSUPPORTED_HINTS = ("not supported", "javascript is disabled", "not implemented")
+
+
+def _is_unsupported(exc: BaseException) -> bool:
+    """스크립트 실행 자체가 불가능한 오류인지 (일시적인 컨텍스트 소멸과 구분)."""
+    if isinstance(exc, (AttributeError, NotImplementedError)):
+        return True
+    msg = str(exc).lower()
+    return any(h in msg for h in _UNSUPPORTED_HINTS)
+
+
+class BlockDetector:
+    """엔진별 스크립트 실행 함수로 감지기를 설치/조회한다.
+
+    run(expr)은 식을 평가해 값을 돌려주고, add_init(expr)는 이후 모든 문서에 미리 심는다(선택).
+    """
+
+    def __init__(
+        self,
+        run: Callable[[str], Any],
+        add_init: Optional[Callable[[str], Any]] = None,
+        script: str = DETECTOR_JS,
+    ) -> None:
+        self._run = run
+        self._add_init = add_init
+        self.script = script
+        self.available = True
+        self.failures = 0
+        self._init_added = False
+
+    def install(self) -> bool:
+        if self._add_init is not None and not self._init_added:
+            try:
+                self._add_init(self.script)
+                self._init_added = True
+            except Exception:
+                pass
+        return self.reason() is not None
+
+    def reason(self) -> Optional[str]:
+        """'' = 정상, 그 외 = 차단 사유, None = 이번 조회 실패 또는 감지기를 쓸 수 없음.
+
+        "Execution context was destroyed" 같은 이동 중 오류는 이번 조회만 None으로 넘긴다.
+        지원하지 않는 엔진이거나 MAX_FAILURES번 연속 실패하면 그때 끈다.
+        """
+        if not self.available:
+            return None
+        try:
+            value = self._run(PROBE_JS)
+            if value is None:
+                # 페이지 이동 등으로 사라짐 → 다시 심는다
+                value = self._run(self.script)
+        except Exception as e:
+            self.failures += 1
+            if _is_unsupported(e) or self.failures >= MAX_FAILURES:
+                self.available = False
+            return None
+        self.failures = 0
+        return None if value is None else str(value)
+
+    def blocked(self) -> bool:
+        return bool(self.reason())
+
+    def reset(self) -> None:
+        """사용자가 인증을 마친 뒤 현재 문서 기준으로 다시 판정한다."""
+        if not self.available:
+            return
+        try:
+            self._run(RESET_JS)
+        except Exception:
+            pass
+
+
+# 드라이버별 감지기. 풀(driver_pool)에서 재사용되는 드라이버에 실행마다 감지기를 새로 만들면
+# Page.addScriptToEvaluateOnNewDocument가 실행 수만큼 쌓이므로 드라이버당 하나만 둔다.
+_selenium_detectors: "weakref.WeakKeyDictionary[Any, BlockDetector]" = weakref.WeakKeyDictionary()
+_selenium_lock = threading.Lock()
+
+
+def for_selenium(driver, script: str = DETECTOR_JS) -> BlockDetector:
+    """driver의 감지기 (같은 드라이버·같은 스크립트면 이전에 만든 것을 돌려준다)."""
+    with _selenium_lock:
+        try:
+            cached = _selenium_detectors.get(driver)
+        except TypeError:  # weakref 불가 객체
+            cached = None
+        if cached is not None and cached.script == script:
+            return cached
+
+        try:
+            # 캐시 값이 드라이버를 붙잡으면 WeakKeyDictionary 항목이 영영 풀리지 않는다
+            ref = weakref.ref(driver)
+        except TypeError:
+            ref = lambda: driver  # noqa: E731
+
+        def run(js: str) -> Any:
+            return ref().execute_script("return " + js)
+
+        def add_init(js: str) -> Any:
+            return ref().execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": js})
+
+        detector = BlockDetector(run, add_init if hasattr(driver, "execute_cdp_cmd") else None, script)
+        try:
+            _selenium_detectors[driver] = detector
+        except TypeError:
+            pass
+        return detector
+
+
+def for_playwright(page, script: str = DETECTOR_JS) -> BlockDetector:
+    return BlockDetector(page.evaluate, page.add_init_script, script)
@@ -0,0 +1,151 @@
+"""수집 제어 신호 (정지/일시정지/재개/마감 시각).
+
+세 엔진(Playwright DabangScraper, DabangSelenium, realestate_dabang DabangCrawler)이 함께 쓴다.
+Condition 하나로 상태를 보호하고, 상태가 바뀌면 notify_all로 기다리던 스레드를 즉시 깨운다.
+긴 대기는 sleep()/wait()로 하면 정지 요청이나 마감 시각에 바로 풀린다.
+
+threading.Event와 같은 is_set/set/clear/wait를 제공하므로 기존 stop_flag 자리에 그대로 넘길 수 있다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+
+class CrawlStopped(BaseException):
+    """checkpoint()에서 정지 요청/마감 시각 도달 시 발생.
+
+    KeyboardInterrupt처럼 BaseException을 상속해, 수집 코드 곳곳의 `except Exception`이
+    삼키지 않고 중지를 처리하는 곳까지 곧장 올라가게 한다.
+    """
+
+
+class CrawlControl:
+    def __init__(self, deadline_s: Optional[float] = None, stop_event: Optional[threading.Event] = None) -> None:
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._paused = False
+        self._deadline: Optional[float] = None
+        self.stop_reason = ""
+        # 외부 Event와 연동할 때는 notify를 받을 수 없으므로 짧게 나눠 기다린다
+        self._external = stop_event
+        if deadline_s:
+            self.set_deadline(deadline_s)
+
+    # ---- 제어 ----
+    def request_stop(self, reason: str = "user") -> None:
+        with self._cond:
+            if not self._stopped:
+                self._stopped = True
+                self.stop_reason = reason
+            self._cond.notify_all()
+
+    def request_pause(self) -> None:
+        with self._cond:
+            self._paused = True
+            self._cond.notify_all()
+
+    def resume(self) -> None:
+        with self._cond:
+            self._paused = False
+            self._cond.notify_all()
+
+    def set_deadline(self, seconds: Optional[float]) -> None:
+        """지금부터 seconds초 뒤를 마감 시각으로 설정 (None/0이면 해제)."""
+        with self._cond:
+            self._deadline = time.monotonic() + seconds if seconds else None
+            self._cond.notify_all()
+
+    def reset(self) -> None:
+        """다음 실행을 위해 정지/일시정지 상태와 마감 시각을 지운다."""
+        with self._cond:
+            self._stopped = False
+            self._paused = False
+            self._deadline = None
+            self.stop_reason = ""
+            self._cond.notify_all()
+
+    # ---- 조회 ----
+    def _check_locked(self) -> bool:
+        if not self._stopped:
+            if self._external is not None and self._external.is_set():
+                self._stopped, self.stop_reason = True, "user"
+            elif self._deadline is not None and time.monotonic() >= self._deadline:
+                self._stopped, self.stop_reason = True, "deadline"
+        return self._stopped
+
+    def should_stop(self) -> bool:
+        with self._cond:
+            return self._check_locked()
+
+    def is_paused(self) -> bool:
+        with self._cond:
+            return self._paused
+
+    def remaining(self) -> Optional[float]:
+        """마감까지 남은 초 (마감 없음이면 None)."""
+        with self._cond:
+            if self._deadline is None:
+                return None
+            return max(0.0, self._deadline - time.monotonic())
+
+    # ---- 대기 ----
+    def _timeout_locked(self, until: Optional[float]) -> Optional[float]:
+        ends = [t for t in (until, self._deadline) if t is not None]
+        timeout = max(0.0, min(ends) - time.monotonic()) if ends else None
+        if self._external is not None:
+            timeout = 0.2 if timeout is None else min(timeout, 0.2)
+        return timeout
+
+    def sleep(self, seconds: float) -> bool:
+        """최대 seconds초 대기. 정지되면 즉시 False, 끝까지 기다렸으면 True."""
+        until = time.monotonic() + max(0.0, seconds)
+        with self._cond:
+            while not self._check_locked():
+                if time.monotonic() >= until:
+                    return True
+                self._cond.wait(self._timeout_locked(until))
+            return False
+
+    def wait_if_paused(self, timeout: Optional[float] = None) -> bool:
+        """일시정지 중이면 재개/정지까지 대기. 계속 진행해도 되면 True."""
+        until = time.monotonic() + timeout if timeout is not None else None
+        with self._cond:
+            while self._paused and not self._check_locked():
+                if until is not None and time.monotonic() >= until:
+                    break
+                self._cond.wait(self._timeout_locked(until))
+            return not self._check_locked()
+
+    def checkpoint(self) -> None:
+        """루프 머리에서 호출: 일시정지면 기다리고, 정지면 CrawlStopped."""
+        if not self.wait_if_paused():
+            raise CrawlStopped(self.stop_reason)
+
+    # ---- threading.Event 호환 ----
+    def is_set(self) -> bool:
+        return self.should_stop()
+
+    def set(self) -> None:
+        self.request_stop()
+
+    def clear(self) -> None:
+        self.reset()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """정지될 때까지(최대 timeout초) 대기. Event.wait처럼 정지 여부를 돌려준다."""
+        if timeout is None:
+            with self._cond:
+                while not self._check_locked():
+                    self._cond.wait(self._timeout_locked(None))
+                return True
+        return not self.sleep(timeout)
+
+
+def as_control(flag) -> CrawlControl:
+    """CrawlControl이면 그대로, threading.Event(또는 None)면 감싸서 돌려준다."""
+    if isinstance(flag, CrawlControl):
+        return flag
+    return CrawlControl(stop_event=flag)
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
+import math
 import random
 import time
-from typing import Callable, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
 from urllib.parse import urljoin
 from pathlib import Path
 import hashlib
 
 from loguru import logger
-from playwright.sync_api import sync_playwright, Page, Browser, expect  # type: ignore[reportMissingImports]
 import re
 
 from scraper.parsers import (
@@ -24,11 +24,28 @@ from scraper.parsers import (
     to_ymd,
 )
 from scraper.anti_bot import build_context_kwargs, human_sleep, infinite_scroll, scroll_container
+from scraper.block_detector import BlockDetector, for_playwright
+from scraper import metrics
+from scraper.control import CrawlControl, CrawlStopped, as_control
+from scraper import har
+from scraper.log_events import LogSampler, level_callback, log_event
+from scraper.memprof import MemoryProfiler
+from scraper.pacing import AdaptivePacer, playwright_response_hook, shared_pacer
+from scraper.retry import Retrier
+from scraper.progress import ProgressTracker
+from scraper.selector_stats import shared_selector_stats
 from scraper.selectors import *
+from scraper.site import site_host, site_url
+from scraper.tracing import span, traced
 import scraper.selectors as S
-from scraper.utils.locators import first_locator_sync, click_first_sync, fill_first_sync, text_first_sync, first_locator_from_element_sync, text_first_from_element_sync
+from scraper.utils.locators import count_sync, first_locator_sync, click_first_sync, fill_first_sync, text_first_sync, first_locator_from_element_sync, text_first_from_element_sync
 from config import settings
 
+metrics.name_selector_groups(S)
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page  # type: ignore[reportMissingImports]
+
 
 @dataclass
 class ScrapeOptions:
@@ -39,6 +56,13 @@ class ScrapeOptions:
     max_items: int
     max_pages: int
     headless: bool = True
+    # 세션을 HAR로 기록 (.har 또는 .zip) / 기록한 HAR로 네트워크 없이 재생
+    record_har_path: Optional[str] = None
+    replay_har_path: Optional[str] = None
+    # 응답 지연(ms): 재생 중에는 HAR 응답마다, 라이브에서는 CDP RTT로 추가 / 라이브 대역폭 제한(kbps, 0이면 무제한)
+    net_latency_ms: float = 0.0
+    net_jitter_ms: float = 0.0
+    net_download_kbps: float = 0.0
 
 
 @dataclass
@@ -60,74 +84,196 @@ class Item:
     details: Optional[str] = None
 
 
+# chromium.launch 인자 (데몬의 warm 브라우저도 같은 인자로 띄운다)
+LAUNCH_ARGS = ["--no-sandbox", "--disable-setuid-sandbox"]
+
+
 class DabangScraper:
-    def __init__(self, opts: ScrapeOptions, stop_flag, log_cb: Optional[Callable[[str], None]] = None) -> None:
+    def __init__(
+        self,
+        opts: ScrapeOptions,
+        stop_flag,
+        log_cb: Optional[Callable[..., None]] = None,
+        item_cb: Optional[Callable[[Item], None]] = None,
+        progress: Optional[ProgressTracker] = None,
+        retrier: Optional[Retrier] = None,
+        memprof: Optional[MemoryProfiler] = None,
+        browser=None,
+    ) -> None:
         self.opts = opts
-        self.stop_flag = stop_flag
-        self.log_cb = log_cb
+        # threading.Event를 받아도 CrawlControl로 감싸 대기 중에도 정지를 바로 반영한다
+        self.control: CrawlControl = as_control(stop_flag)
+        self.stop_flag = self.control
+        # log_cb(msg, level) 또는 예전 log_cb(msg) 모두 받는다
+        self.log_cb = level_callback(log_cb)
+        # 아이템이 수집될 때마다 호출 (GUI 실시간 결과 테이블 등)
+        self.item_cb = item_cb
+        # 진행 상황: 외부에서 받지 않으면 자체 생성 (목표 건수도 여기서 설정)
+        self._owns_progress = progress is None
+        self.progress = progress or ProgressTracker()
         self._context = None
-
-    def _log(self, msg: str) -> None:
-        logger.info(msg)
-        if self.log_cb:
+        self._block: Optional[BlockDetector] = None
+        # 요청 간격: 프로세스 공용 페이서 (동시에 도는 유형 스레드와 예산 공유)
+        self.pacer: AdaptivePacer = shared_pacer(**asdict(settings.pacing))
+        # 재시도 예산/회로 차단기: 여러 유형을 함께 돌릴 때는 batch가 하나를 넘겨 공유한다
+        self.retrier: Retrier = retrier or Retrier(**asdict(settings.retry))
+        self._sampler = LogSampler(settings.logging.sample_burst, settings.logging.sample_every)
+        # 메모리 계측(opt-in): run()에서 시작/종료, 보고는 호출 측이 memprof.format_report()로
+        self.memprof = memprof
+        # 미리 띄워 둔 Playwright 브라우저 (같은 스레드에서 만든 것). 없으면 run()마다 새로 띄운다
+        self.browser = browser
+        # run()이 삼킨 마지막 실행 오류 (재시도 판단용, 정상 종료면 None)
+        self.error: Optional[str] = None
+
+    def _log(self, msg: str, level: str = "INFO", *args: Any, sample: bool = False, lazy: bool = False, **fields: Any) -> None:
+        """로그 기록. UI 콜백에는 레벨을 함께 넘기고, 받는 쪽 min_level 미만(기본 DEBUG 이하)은 보내지 않는다.
+
+        msg는 "{}" 템플릿이고 args는 출력할 때만 채운다 (lazy=True면 함수 인자도 그때 호출).
+        sample=True면 아이템마다 반복되는 메시지를 솎아낸다. 나머지 키워드는 구조화 필드.
+        """
+        log_event(
+            msg, level, args,
+            callback=self.log_cb,
+            sampler=self._sampler if sample else None,
+            lazy=lazy,
+            depth=2,
+            **fields,
+        )
+
+    def _wait(self, page: Page, ms: float) -> None:
+        """page.wait_for_timeout을 잘게 나눠 대기. 정지되면 CrawlStopped, 일시정지면 그 자리에서 대기."""
+        end = time.monotonic() + ms / 1000
+        while True:
+            self.control.checkpoint()
+            left = end - time.monotonic()
+            if left <= 0:
+                return
+            page.wait_for_timeout(min(left, 0.25) * 1000)
+
+    def _goto(self, page: Page, url: str, **kwargs):
+        """navigation 재시도/회로 차단을 거친 page.goto."""
+        with span("goto", url=url):
+            return self.retrier.call("navigation", page.goto, url, control=self.control, **kwargs)
+
+    def _pace(self, page: Page) -> None:
+        """다음 요청 슬롯까지 대기 (고정 대기 대신 공용 페이서가 간격을 정한다)."""
+        wait = self.pacer.reserve()
+        if wait > 0:
+            self._wait(page, wait * 1000)
+
+    def _emit_item(self, item: Item) -> None:
+        if self.item_cb:
             try:
-                self.log_cb(msg)
+                self.item_cb(item)
             except Exception:
                 pass
 
     def run(self) -> List[Item]:
         """크롤링 실행 - 모든 매물 종류 지원"""
         items: List[Item] = []
+        if self._owns_progress:
+            n_types = 6 if self.opts.property_type == "전체" else 1
+            self.progress.set_target((self.opts.max_items or 0) * n_types)
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(
-                    headless=self.opts.headless,
-                    args=["--no-sandbox", "--disable-setuid-sandbox"]
-                )
-                page = browser.new_page()
-                try:
-                    # 데스크톱 레이아웃 강제: 모바일/좁은 화면 분기 회피
-                    page.set_viewport_size({"width": 1440, "height": 960})
-                except Exception:
-                    pass
-
-                # 모든 매물 종류 크롤링
-                if self.opts.property_type == "전체":
-                    property_types = ["원룸", "투룸", "오피스텔", "아파트", "주택", "빌라"]
-                    self._log(f"전체 매물 종류 크롤링 시작: {property_types}")
-
-                    for prop_type in property_types:
-                        self._log(f"=== {prop_type} 매물 크롤링 시작 ===")
-                        self.opts.property_type = prop_type
-                        try:
-                            type_items = self._crawl_single_property_type(page, prop_type)
-                            items.extend(type_items)
-                            self._log(f"{prop_type} 매물 {len(type_items)}건 수집 완료")
-                        except Exception as e:
-                            self._log(f"{prop_type} 매물 크롤링 실패: {e}")
-                            continue
-                        # 매물 종류 간 대기
-                        page.wait_for_timeout(2000)
-                else:
-                    # 단일 매물 종류 크롤링
-                    items = self._crawl_single_property_type(page, self.opts.property_type)
-
-                browser.close()
+            if self.browser is not None:
+                # 데몬 등이 미리 띄워 둔(warm) 브라우저: 컨텍스트만 새로 만들고 브라우저는 그대로 둔다
+                self._run_in_browser(self.browser, items)
+            else:
+                # playwright는 실제 수집을 시작할 때만 불러온다
+                from playwright.sync_api import sync_playwright  # type: ignore[reportMissingImports]
+
+                with sync_playwright() as p:
+                    browser = p.chromium.launch(headless=self.opts.headless, args=LAUNCH_ARGS)
+                    self._run_in_browser(browser, items)
+                    browser.close()
+        except CrawlStopped as e:
+            self._log(f"수집 중지({e})")
         except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
             self._log(f"크롤링 실행 실패: {e}")
 
+        if self._owns_progress:
+            self.progress.set_phase("done")
+        # 후보 셀렉터별 시도/적중/소요 시간을 실행 간 누적 (tools/selector_report.py)
+        try:
+            shared_selector_stats().flush(Path(settings.paths.logs) / "selector_stats.json")
+        except OSError as e:
+            self._log(f"셀렉터 통계 저장 실패: {e}", "WARNING")
+
         # 중복 제거
         items = self._remove_duplicates(items)
         return items
 
+    def _run_in_browser(self, browser, items: List[Item]) -> None:
+        """browser에 새 컨텍스트(HAR 기록/재생 포함)를 열어 수집하고 컨텍스트를 닫는다."""
+        context = browser.new_context(**har.record_kwargs(self.opts.record_har_path))
+        if self.opts.replay_har_path:
+            har.install_replay(
+                context, self.opts.replay_har_path,
+                latency_ms=self.opts.net_latency_ms, jitter_ms=self.opts.net_jitter_ms,
+            )
+        page = context.new_page()
+        if not self.opts.replay_har_path:
+            har.shape_network(page, self.opts.net_latency_ms, self.opts.net_download_kbps)
+        try:
+            # 데스크톱 레이아웃 강제: 모바일/좁은 화면 분기 회피
+            page.set_viewport_size({"width": 1440, "height": 960})
+        except Exception:
+            pass
+        # 응답 상태/지연을 페이서에 반영 (429/5xx면 감속)
+        page.on("response", playwright_response_hook(self.pacer, host=site_host()))
+        # 캡차/차단 감지기: 이후 모든 문서에 자동으로 심긴다
+        self._block = for_playwright(page)
+        self._block.install()
+        if self.memprof is not None:
+            self.memprof.start().attach(page)
+
+        try:
+            self._crawl_types(page, items)
+        finally:
+            if self.memprof is not None:
+                self.memprof.stop()
+            # HAR은 컨텍스트를 닫을 때 기록되므로 중지/실패해도 닫아 둔다
+            context.close()
+
+    def _crawl_types(self, page: Page, items: List[Item]) -> None:
+        """선택한 매물 종류(전체면 6종)를 차례로 수집해 items에 더한다."""
+        # 모든 매물 종류 크롤링
+        if self.opts.property_type == "전체":
+            property_types = ["원룸", "투룸", "오피스텔", "아파트", "주택", "빌라"]
+            self._log(f"전체 매물 종류 크롤링 시작: {property_types}")
+
+            for prop_type in property_types:
+                if self.control.should_stop():
+                    break
+                self._log(f"=== {prop_type} 매물 크롤링 시작 ===")
+                self.opts.property_type = prop_type
+                try:
+                    with span("property_type", type=prop_type):
+                        type_items = self._crawl_single_property_type(page, prop_type)
+                    items.extend(type_items)
+                    self._log(f"{prop_type} 매물 {len(type_items)}건 수집 완료")
+                except Exception as e:
+                    self._log(f"{prop_type} 매물 크롤링 실패: {e}")
+                    continue
+                # 매물 종류 간 대기
+                if not self.control.sleep(2.0):
+                    break
+        else:
+            # 단일 매물 종류 크롤링
+            with span("property_type", type=self.opts.property_type):
+                items.extend(self._crawl_single_property_type(page, self.opts.property_type))
+
     def _crawl_single_property_type(self, page: Page, property_type: str) -> List[Item]:
         """단일 매물 종류 크롤링"""
         items: List[Item] = []
+        self.progress.set_label(property_type)
         
         try:
             # 다방 메인 페이지로 이동
-            page.goto("https://www.dabangapp.com/", wait_until="domcontentloaded")
-            page.wait_for_timeout(3000)
+            self.progress.set_phase("navigate")
+            self._goto(page, site_url("/"), wait_until="domcontentloaded")
+            self._wait(page, 3000)
             self._log(f"현재 URL: {page.url}")
             
             # 매물 종류별 페이지 이동
@@ -139,12 +285,13 @@ class DabangScraper:
                 self._switch_to_property_type(page, property_type)
             
             # 지역 검색 (지정된 경우)
+            self.progress.set_phase("search")
             if self.opts.region:
                 self._search_and_confirm_region(page, self.opts.region)
             
             # 지역 검색 후 추가 대기
             self._log("지역 검색 후 추가 대기 중...")
-            page.wait_for_timeout(15000)  # 15초 대기
+            self._wait(page, 15000)  # 15초 대기
             
             # 매물 수집
             items = self._collect_items(page)
@@ -153,6 +300,8 @@ class DabangScraper:
             for item in items:
                 item.property_type = property_type
             
+        except CrawlStopped as e:
+            self._log(f"{property_type} 수집 중지({e})")
         except Exception as e:
             self._log(f"{property_type} 매물 크롤링 실패: {e}")
         
@@ -190,9 +339,9 @@ class DabangScraper:
             for selector in filter_selectors:
                 try:
                     filter_btn = page.locator(selector).first
-                    if filter_btn.count() > 0:
+                    if count_sync(page, selector, "room_filter_button") > 0:
                         filter_btn.click()
-                        page.wait_for_timeout(1000)
+                        self._wait(page, 1000)
                         break
                 except Exception:
                     continue
@@ -202,7 +351,7 @@ class DabangScraper:
                 room_structure_btn = page.locator(f"button:has-text('{room_type}')").first
                 if room_structure_btn.count() > 0:
                     room_structure_btn.click()
-                    page.wait_for_timeout(1000)
+                    self._wait(page, 1000)
                     self._log(f"{room_type} 필터 적용 완료")
             except Exception as e:
                 self._log(f"방구조 필터 적용 실패: {e}")
@@ -210,7 +359,7 @@ class DabangScraper:
             # 필터 닫기
             try:
                 page.keyboard.press("Escape")
-                page.wait_for_timeout(500)
+                self._wait(page, 500)
             except Exception:
                 pass
                 
@@ -241,18 +390,18 @@ class DabangScraper:
                     return
                 
                 # 해당 매물 종류 페이지로 직접 이동
-                full_url = f"https://www.dabangapp.com{target_url}"
+                full_url = site_url(target_url)
                 self._log(f"{property_type} 페이지로 이동: {full_url}")
                 
-                page.goto(full_url, wait_until="domcontentloaded")
-                page.wait_for_timeout(3000)
+                self._goto(page, full_url, wait_until="domcontentloaded")
+                self._wait(page, 3000)
                 
                 # 지도 탭 클릭 (필요한 경우)
                 try:
                     map_tab = page.locator("a:has-text('지도')").first
                     if map_tab.count() > 0:
                         map_tab.click()
-                        page.wait_for_timeout(2000)
+                        self._wait(page, 2000)
                         self._log("지도 탭 클릭 완료")
                 except Exception as e:
                     self._log(f"지도 탭 클릭 실패: {e}")
@@ -274,6 +423,7 @@ class DabangScraper:
     def _norm(s: str) -> str:
         return re.sub(r"\s+|[()·,]", "", (s or "").strip())
 
+    @traced("region_search")
     def _search_and_confirm_region(self, page: Page, region_text: str) -> None:
         # uses selectors.py
         mode_all = len((region_text or "").strip()) == 0
@@ -286,34 +436,34 @@ class DabangScraper:
             pass
         if mode_all:
             # 지역 입력 없이 기본 목록을 스크롤로 로딩
-            page.wait_for_timeout(1500)
+            self._wait(page, 1500)
             self._open_list_panel(page)
             return
         # 이하: 특정 지역 검색 모드
         try:
             # selectors.py의 REGION_INPUT 사용
             fill_first_sync(page, REGION_INPUT, region_text)
-            page.wait_for_timeout(900)
+            self._wait(page, 900)
             
             # 개선된 지역 선택 로직 (이미지에서 확인된 실제 구조 반영)
             clicked = self._select_region_from_suggestions(page, region_text)
             
-            page.wait_for_timeout(1200)
+            self._wait(page, 1200)
             # 좌측 리스트 패널 열기
             self._open_list_panel(page)
             # 매물 탭 클릭 이후 네트워크 안정 + 컨테이너/카드 텍스트까지 대기
             try:
                 page.wait_for_load_state('networkidle')
-                page.wait_for_timeout(400)
+                self._wait(page, 400)
                 page.wait_for_selector('#onetwo-list, #map-list-tab-container, [id^="map-list-"]', state='visible', timeout=10000)
                 page.wait_for_selector(':text("월세"), :text("전세"), a[href*="detail_type=room"]', timeout=8000)
             except Exception:
                 pass
             # 지역 검색 후 컨테이너가 다시 로드될 수 있으므로 추가 대기
-            page.wait_for_timeout(3000)
+            self._wait(page, 3000)
             
             # 지역 검색 후 컨테이너 재확인 (대기 시간 증가)
-            page.wait_for_timeout(10000)  # 10초 대기로 증가
+            self._wait(page, 10000)  # 10초 대기로 증가
             self._ensure_list_container_after_search(page)
         except Exception as e:
             self._log(f"지역 검색 실패: {e}")
@@ -336,7 +486,7 @@ class DabangScraper:
             if exact_button.count() > 0:
                 self._log(f"정확한 지역 버튼 발견: {region_text}")
                 exact_button.click()
-                page.wait_for_timeout(1000)
+                self._wait(page, 1000)
                 return True
         except Exception as e:
             self._log(f"정확한 지역 버튼 클릭 실패: {e}")
@@ -353,7 +503,7 @@ class DabangScraper:
                             if region_text in button_text:
                                 self._log(f"부분 일치 지역 버튼 발견: {button_text}")
                                 button.click()
-                                page.wait_for_timeout(1000)
+                                self._wait(page, 1000)
                                 return True
                         except Exception:
                             continue
@@ -392,6 +542,7 @@ class DabangScraper:
         
         return clicked
 
+    @traced("open_list_panel")
     def _open_list_panel(self, page: Page) -> None:
         # uses selectors.py
         """좌측 '매물' 리스트 패널이 보이도록 보장.
@@ -403,7 +554,7 @@ class DabangScraper:
         # selectors.py의 LIST_OPEN_BUTTON 사용
         try:
             click_first_sync(page, LIST_OPEN_BUTTON)
-            page.wait_for_timeout(2000)
+            self._wait(page, 2000)
             self._log("매물 버튼 클릭 성공")
         except Exception as e:
             self._log(f"매물 버튼 클릭 실패: {e}")
@@ -411,13 +562,13 @@ class DabangScraper:
             for sel in LIST_OPEN_BUTTON:
                 try:
                     loc = page.locator(sel).first
-                    if loc.count() > 0:
+                    if count_sync(page, sel, LIST_OPEN_BUTTON) > 0:
                         self._log(f"매물 버튼을 찾았습니다: {sel}")
                         
                         # 방법 1: JavaScript 클릭 시도
                         try:
                             page.evaluate("(element) => element.click()", loc)
-                            page.wait_for_timeout(2000)
+                            self._wait(page, 2000)
                             self._log("JavaScript 클릭 성공")
                             break
                         except Exception as e:
@@ -426,9 +577,9 @@ class DabangScraper:
                         # 방법 2: 포커스 후 클릭 시도
                         try:
                             loc.focus()
-                            page.wait_for_timeout(500)
+                            self._wait(page, 500)
                             loc.click(timeout=5000)
-                            page.wait_for_timeout(2000)
+                            self._wait(page, 2000)
                             self._log("포커스 후 클릭 성공")
                             break
                         except Exception as e:
@@ -437,9 +588,9 @@ class DabangScraper:
                         # 방법 3: 스크롤 후 클릭 시도
                         try:
                             loc.scroll_into_view_if_needed()
-                            page.wait_for_timeout(500)
+                            self._wait(page, 500)
                             loc.click(timeout=5000)
-                            page.wait_for_timeout(2000)
+                            self._wait(page, 2000)
                             self._log("스크롤 후 클릭 성공")
                             break
                         except Exception as e:
@@ -449,7 +600,7 @@ class DabangScraper:
                         try:
                             loc.focus()
                             page.keyboard.press("Enter")
-                            page.wait_for_timeout(2000)
+                            self._wait(page, 2000)
                             self._log("키보드 엔터 성공")
                             break
                         except Exception as e:
@@ -466,7 +617,7 @@ class DabangScraper:
             if handle.count() > 0:
                 # focus to ensure it's interactable
                 handle.hover(timeout=1000)
-                page.wait_for_timeout(500)
+                self._wait(page, 500)
                 self._log("사이드 핸들을 찾았습니다.")
         except Exception:
             pass
@@ -477,18 +628,18 @@ class DabangScraper:
                 # 정의된 후보들을 순회하여 하나라도 보이면 성공
                 found = False
                 for sel in getattr(S, 'LIST_CONTAINER_SELECTORS', []):
-                    if page.locator(sel).count() > 0:
+                    if count_sync(page, sel, S.LIST_CONTAINER_SELECTORS) > 0:
                         self._log(f"리스트 컨테이너를 찾았습니다: {sel}")
                         found = True
                         break
                 if found:
                     # 매물 버튼 클릭 후 추가 대기
                     self._log("매물 버튼 클릭 후 대기 중...")
-                    page.wait_for_timeout(8000)  # 8초 대기
+                    self._wait(page, 8000)  # 8초 대기
                     return
             except Exception:
                 pass
-            page.wait_for_timeout(500)  # 대기 시간 증가
+            self._wait(page, 500)  # 대기 시간 증가
             if i % 5 == 0:  # 5초마다 로그 출력
                 self._log(f"리스트 컨테이너 대기 중... ({i+1}/20)")
         
@@ -504,7 +655,7 @@ class DabangScraper:
                     if t in sel:
                         try:
                             page.locator(sel).first.click(timeout=2000)
-                            page.wait_for_timeout(800)
+                            self._wait(page, 800)
                             break
                         except Exception:
                             continue
@@ -528,11 +679,25 @@ class DabangScraper:
     def _collect_items(self, page: Page) -> List[Item]:
         """목록을 "끝까지 수집"하도록 페이지네이션 루프 추가"""
         self._log("매물 수집 시작...")
+        self.progress.set_phase("list")
         items: List[Item] = []
+        try:
+            self._collect_pages(page, items)
+        except CrawlStopped as e:
+            self._log(f"수집 중지({e}): {len(items)}건까지 보존")
+            return items
+        self._log(f"수집 완료: {len(items)}건 ({self.pacer.snapshot().format()})")
+        return items
+
+    def _collect_pages(self, page: Page, items: List[Item]) -> None:
+        """페이지를 넘기며 items에 채운다. 중간에 멈춰도 그때까지의 결과가 남는다."""
         seen_ids = set()
         page_idx = 1
 
         while True:
+            self.control.checkpoint()
+            if self._wait_if_blocked(page):
+                break
             list_el = self._resolve_list_container_improved(page)
 
             # 카드 기다리기
@@ -540,10 +705,10 @@ class DabangScraper:
             cards = None
             # onetwo는 li.sc-bNShyZ
             for sel in CARD_ROOT_SELECTORS:
-                loc = list_el.locator(sel)
-                if loc.count() > 0:
-                    cards = loc
-                    self._log(f"카드 선택자 사용: {sel}, 개수: {loc.count()}")
+                n = count_sync(list_el, sel, CARD_ROOT_SELECTORS)
+                if n > 0:
+                    cards = list_el.locator(sel)
+                    self._log(f"카드 선택자 사용: {sel}, 개수: {n}")
                     break
             if cards is None:
                 self._log("카드 없음 – selectors.py 점검 필요")
@@ -551,18 +716,25 @@ class DabangScraper:
 
             # 페이지 내 카드 파싱
             limit_this_page = cards.count()
+            if page_idx == 1 and limit_this_page:
+                self.progress.set_pages_estimated(self._estimate_pages(page, limit_this_page))
             for i in range(limit_this_page):
                 # 수집 개수 제한 도달 시 즉시 종료
                 if self.opts.max_items and len(items) >= self.opts.max_items:
                     self._log(f"요청 수({self.opts.max_items}) 도달")
-                    return items
-                
+                    return
+                self.control.checkpoint()
+                if self._wait_if_blocked(page):
+                    self._log(f"수집 중단: {len(items)}건")
+                    return
+
+                card_span = span("card", page=page_idx, index=i)
                 try:
                     card = cards.nth(i)
                     
                     # 디버깅: 카드의 실제 텍스트 내용 출력
-                    card_text = card.inner_text()
-                    self._log(f"카드 {i+1} 텍스트 내용: {card_text[:200]}...")
+                    # inner_text()는 DEBUG 로그를 받는 싱크가 있을 때만 호출된다
+                    self._log("카드 {} 텍스트 내용: {}...", "DEBUG", i + 1, lambda: card.inner_text()[:200], lazy=True)
                     
                     link_el = card.locator("a[href^='/room/']").first
                     href = link_el.get_attribute("href") if link_el.count() else None
@@ -586,11 +758,19 @@ class DabangScraper:
                     maintenance = ""
                     posted_date = ""
                     
+                    detail_started = time.monotonic()
+                    self.progress.set_phase("detail")
+                    # 상세 이동이 연속으로 실패하면 차단기가 열려 여기서 수집 전체가 잠시 멈춘다
+                    self.retrier.wait_for_breaker("detail", self.control)
+                    self.control.checkpoint()
+                    detail_breaker = self.retrier.breaker("detail")
+                    detail_span = span("detail")
                     try:
                         # 카드 클릭하여 상세 페이지로 이동
-                        self._log(f"카드 {i+1} 클릭하여 상세 페이지로 이동...")
+                        self._pace(page)
+                        self._log("카드 {} 클릭하여 상세 페이지로 이동...", "DEBUG", i + 1)
                         card.click()
-                        page.wait_for_timeout(3000)  # 페이지 로딩 대기
+                        self._wait(page, 3000)  # 페이지 로딩 대기
                         
                         # 상세 페이지에서 정보 추출 - TypeScript 파일 참고하여 수정
                         # 주소 찾기
@@ -611,16 +791,16 @@ class DabangScraper:
                              for selector in address_selectors:
                                  try:
                                      address_elements = page.locator(selector)
-                                     if address_elements.count() > 0:
+                                     if count_sync(page, selector, "detail_address") > 0:
                                          address = address_elements.first.inner_text().strip()
                                          # 주소 형식 검증 (시/군/구/동/읍/리 포함)
                                          if len(address) >= 8 and re.search(r'시|군|구|동|읍|리', address):
-                                             self._log(f"주소 찾음: {address}")
+                                             self._log("주소 찾음: {}", "DEBUG", address)
                                              break
                                  except Exception:
                                      continue
                         except Exception as e:
-                            self._log(f"주소 추출 실패: {e}")
+                            self._log("주소 추출 실패: {}", "INFO", e, sample=True)
                         
                         # 부동산 정보 찾기
                         try:
@@ -642,17 +822,17 @@ class DabangScraper:
                              for selector in realtor_selectors:
                                  try:
                                      realtor_elements = page.locator(selector)
-                                     if realtor_elements.count() > 0:
+                                     if count_sync(page, selector, "detail_realtor") > 0:
                                          realtor = realtor_elements.first.inner_text().strip()
                                          # 불필요 접두사 제거 및 정리
                                          realtor = re.sub(r'\s*(공인중개사|중개사무소|중개사)\s*', '', realtor).strip()
                                          if len(realtor) >= 3:  # 최소 3자 이상
-                                             self._log(f"부동산 찾음: {realtor}")
+                                             self._log("부동산 찾음: {}", "DEBUG", realtor)
                                              break
                                  except Exception:
                                      continue
                         except Exception as e:
-                            self._log(f"부동산 추출 실패: {e}")
+                            self._log("부동산 추출 실패: {}", "INFO", e, sample=True)
                         
                         # 관리비 정보 찾기
                         try:
@@ -668,17 +848,17 @@ class DabangScraper:
                              for selector in maintenance_selectors:
                                  try:
                                      maintenance_elements = page.locator(selector)
-                                     if maintenance_elements.count() > 0:
+                                     if count_sync(page, selector, "detail_maintenance") > 0:
                                          maintenance_text = maintenance_elements.first.inner_text()
                                          maintenance_match = re.search(r'관리비\s*(없음|\d+만?)', maintenance_text)
                                          if maintenance_match:
                                              maintenance = maintenance_match.group(0).strip()
-                                             self._log(f"관리비 찾음: {maintenance}")
+                                             self._log("관리비 찾음: {}", "DEBUG", maintenance)
                                              break
                                  except Exception:
                                      continue
                         except Exception as e:
-                            self._log(f"관리비 추출 실패: {e}")
+                            self._log("관리비 추출 실패: {}", "INFO", e, sample=True)
                         
                         # 등록일 찾기
                         try:
@@ -696,32 +876,44 @@ class DabangScraper:
                              for selector in date_selectors:
                                  try:
                                      date_elements = page.locator(selector)
-                                     if date_elements.count() > 0:
+                                     if count_sync(page, selector, "detail_posted_date") > 0:
                                          date_text = date_elements.first.inner_text()
                                          # 날짜 형식 검증 (YYYY.MM.DD 또는 YYYY-MM-DD)
                                          date_match = re.search(r'(\d{4}[.-]\d{2}[.-]\d{2})', date_text)
                                          if date_match:
                                              posted_date = date_match.group(1)
-                                             self._log(f"등록일 찾음: {posted_date}")
+                                             self._log("등록일 찾음: {}", "DEBUG", posted_date)
                                              break
                                  except Exception:
                                      continue
                         except Exception as e:
-                            self._log(f"등록일 추출 실패: {e}")
+                            self._log("등록일 추출 실패: {}", "INFO", e, sample=True)
                         
                         # 뒤로 가기
-                        self._log(f"상세 페이지에서 뒤로 가기...")
-                        page.go_back()
-                        page.wait_for_timeout(2000)  # 페이지 로딩 대기
+                        detail_span.end()
+                        self._log("상세 페이지에서 뒤로 가기...", "DEBUG")
+                        with span("go_back"):
+                            page.go_back()
+                            self._wait(page, 2000)  # 페이지 로딩 대기
+                        detail_breaker.record_success()
                         
+                    except CrawlStopped:
+                        detail_span.end()
+                        detail_breaker.release()
+                        raise
                     except Exception as e:
-                        self._log(f"상세 페이지 정보 추출 실패: {e}")
+                        detail_span.end(error=type(e).__name__)
+                        detail_breaker.record_failure()
+                        self._log("상세 페이지 정보 추출 실패: {}", "INFO", e, sample=True)
                         # 뒤로 가기 시도
                         try:
-                            page.go_back()
-                            page.wait_for_timeout(2000)
+                            with span("go_back"):
+                                page.go_back()
+                                self._wait(page, 2000)
                         except Exception:
                             pass
+                    self.progress.detail_latency(time.monotonic() - detail_started)
+                    self.progress.set_phase("list")
 
                     item = Item(
                         address=address,
@@ -738,32 +930,79 @@ class DabangScraper:
                     )
                     items.append(item)
                     seen_ids.add(pid)
-                    # 상세한 아이템 정보 로그 출력
-                    maintenance_info = f"관리비: {item.maintenance_fee:,}원" if item.maintenance_fee else "관리비: 없음"
-                    self._log(f"아이템 {len(items)} 수집 완료:")
-                    self._log(f"  📍 주소: {item.address}")
-                    self._log(f"  💰 가격: {item.price_text}")
-                    self._log(f"  🏢 부동산: {item.realtor}")
-                    self._log(f"  📅 등록일: {item.posted_at}")
-                    self._log(f"  💸 {maintenance_info}")
-                    self._log(f"  🔗 URL: {item.url}")
-                    self._log("  " + "─" * 50)
+                    self.progress.item_done()
+                    self._emit_item(item)
+                    # 한 줄 요약은 샘플링해서 UI/파일에, 상세 항목은 DEBUG 파일 로그에만 기록
+                    self._log(
+                        "아이템 {} 수집: {} | {}", "INFO", len(items), item.address or "-", item.price_text or "-",
+                        sample=True, event="item",
+                    )
+                    self._log(
+                        "  주소={} 가격={} 부동산={} 등록일={} 관리비={} URL={}", "DEBUG",
+                        item.address, item.price_text, item.realtor, item.posted_at, item.maintenance_fee or "-", item.url,
+                        event="item_detail",
+                    )
                 except Exception as e:
-                    self._log(f"카드 파싱 실패: {e}")
+                    self._log("카드 파싱 실패: {}", "INFO", e, sample=True)
                     continue
+                finally:
+                    card_span.end()
 
+            self.progress.page_done()
+            if self.memprof is not None:
+                self.memprof.maybe_sample(items=len(items))
             # 페이지네이션 마운트 대기
-            page.wait_for_timeout(400)  # 페이지네이션 마운트 대기
+            self._wait(page, 400)  # 페이지네이션 마운트 대기
             # 다음 페이지가 없으면 종료
-            if not self._go_next_page_onetwo(page, list_el):
+            with span("paginate", page=page_idx):
+                has_next = self._go_next_page_onetwo(page, list_el)
+            if not has_next:
                 self._log("다음 페이지 없음 – 종료")
                 break
 
             page_idx += 1
-            page.wait_for_timeout(1500)
+            self._wait(page, 1500)
 
-        self._log(f"수집 완료: {len(items)}건")
-        return items
+    def _wait_if_blocked(self, page: Page, timeout_s: float = 300.0) -> bool:
+        """캡차/차단이 감지되면 대기. 계속 진행할 수 없으면 True.
+
+        창이 보이는 모드에서는 사용자가 인증을 마칠 때까지(최대 timeout_s) 기다리고,
+        headless에서는 풀 수 없으므로 바로 중단한다.
+        """
+        if self._block is None:
+            return False
+        reason = self._block.reason()
+        if not reason:
+            return False
+        self.pacer.record(blocked=True)
+        metrics.record_block("playwright")
+        if self.opts.headless:
+            self._log(f"CAPTCHA/차단 감지({reason}) – headless 모드라 수집을 중단합니다.", "WARNING")
+            return True
+        self._log(f"CAPTCHA/차단 감지({reason}) – 브라우저에서 인증을 완료하면 자동으로 재개합니다.", "WARNING")
+        deadline = time.monotonic() + timeout_s
+        while time.monotonic() < deadline:
+            if self.control.should_stop():
+                return True
+            self._wait(page, 2000)
+            self._block.reset()
+            if not self._block.reason():
+                self._log("차단 해제 확인 – 수집 재개")
+                return False
+        self._log("차단이 해제되지 않아 수집을 중단합니다.", "WARNING")
+        return True
+
+    def _estimate_pages(self, page: Page, cards_per_page: int) -> int:
+        """예상 페이지 수: 요청 건수 ÷ 페이지당 카드 수, 페이지 버튼 최대 번호가 더 작으면 그 값."""
+        est = math.ceil(self.opts.max_items / cards_per_page) if self.opts.max_items else 0
+        try:
+            labels = page.locator("#onetwo-list button").all_inner_texts()
+            numbers = [int(t) for t in (x.strip() for x in labels) if t.isdigit()]
+            if numbers:
+                est = min(est, max(numbers)) if est else max(numbers)
+        except Exception:
+            pass
+        return est
 
     def _go_next_page_onetwo(self, page: Page, list_el):
         """다음 페이지로 이동.
@@ -794,7 +1033,7 @@ class DabangScraper:
                 list_el.evaluate('el => el.scrollTo(0, el.scrollHeight)')
             except Exception:
                 page.mouse.wheel(0, 2500)
-        page.wait_for_timeout(700)
+        self._wait(page, 700)
 
         # 2) 페이지네이션 컨테이너 탐색 (컨테이너 기준 → 형제/조상 범위)
         pagination_candidates = [
@@ -810,8 +1049,9 @@ class DabangScraper:
         pag = None
         for sel in getattr(S, 'PAGINATION_CONTAINER', []) + pagination_candidates:
             try:
-                candidate = base.locator(sel).first if sel.startswith("xpath=") else page.locator(sel).first
-                if candidate.count() > 0:
+                root = base if sel.startswith("xpath=") else page
+                candidate = root.locator(sel).first
+                if count_sync(root, sel, S.PAGINATION_CONTAINER) > 0:
                     pag = candidate
                     break
             except Exception:
@@ -832,7 +1072,7 @@ class DabangScraper:
         for nx in next_selectors:
             try:
                 btn = pag.locator(nx).first
-                if btn.count() == 0:
+                if count_sync(pag, nx, S.NEXT_PAGE_BUTTON) == 0:
                     continue
                 # 비활성 확인
                 dis = btn.get_attribute("disabled") is not None
@@ -876,7 +1116,7 @@ class DabangScraper:
             cur = _first_card_id()
             if cur and cur != prev_id:
                 break
-            page.wait_for_timeout(250)
+            self._wait(page, 250)
         return True
 
     def _open_all_detail_tabs(self, page: Page):
@@ -884,16 +1124,16 @@ class DabangScraper:
         for sel in DETAIL_TAB_BUTTONS:
             try:
                 el = page.locator(sel).first
-                if el.count():
+                if count_sync(page, sel, DETAIL_TAB_BUTTONS):
                     el.click()
-                    page.wait_for_timeout(300)
+                    self._wait(page, 300)
             except Exception:
                 continue
 
     def _goto_onetwo_map(self, page: Page) -> None:
         try:
-            page.goto("https://www.dabangapp.com", timeout=30000, wait_until="domcontentloaded")
-            page.wait_for_timeout(5000)
+            self._goto(page, site_url("/"), timeout=30000, wait_until="domcontentloaded")
+            self._wait(page, 5000)
             self._log(f"현재 URL: {page.url}")
 
             try:
@@ -902,24 +1142,24 @@ class DabangScraper:
                     self._log("원/투룸 링크를 찾았습니다. 클릭합니다.")
                     onetwo_link.click()
                     page.wait_for_load_state("domcontentloaded")
-                    page.wait_for_timeout(5000)
+                    self._wait(page, 5000)
                     self._log(f"원/투룸 클릭 후 URL: {page.url}")
                 else:
                     self._log("원/투룸 링크를 찾지 못했습니다. 직접 URL로 이동합니다.")
-                    page.goto("https://www.dabangapp.com/map/onetwo", timeout=30000, wait_until="domcontentloaded")
-                    page.wait_for_timeout(5000)
+                    self._goto(page, site_url("/map/onetwo"), timeout=30000, wait_until="domcontentloaded")
+                    self._wait(page, 5000)
                     self._log(f"직접 이동 후 URL: {page.url}")
             except Exception as e:
                 self._log(f"원/투룸 클릭 실패: {e}. 직접 URL로 이동합니다.")
-                page.goto("https://www.dabangapp.com/map/onetwo", timeout=30000, wait_until="domcontentloaded")
-                page.wait_for_timeout(5000)
+                self._goto(page, site_url("/map/onetwo"), timeout=30000, wait_until="domcontentloaded")
+                self._wait(page, 5000)
                 self._log(f"직접 이동 후 URL: {page.url}")
 
             # 지도 탭 클릭 (안전) - selectors.py 사용
             try:
                 click_first_sync(page, NAVIGATION_TABS)
                 page.wait_for_load_state("domcontentloaded")
-                page.wait_for_timeout(3000)
+                self._wait(page, 3000)
                 self._log(f"지도 탭 클릭 후 URL: {page.url}")
             except Exception as e:
                 self._log(f"지도 탭 클릭 실패: {e}")
@@ -940,13 +1180,13 @@ class DabangScraper:
         try:
             # 페이지네이션 컨테이너 확인 - selectors.py 사용
             for sel in PAGINATION_CONTAINER:
-                if page.locator(sel).count() > 0:
+                if count_sync(page, sel, PAGINATION_CONTAINER) > 0:
                     self._log(f"페이지네이션 컨테이너 발견: {sel}")
                     
                     # 다음 페이지 버튼 확인 - selectors.py 사용
                     for next_sel in NEXT_PAGE_BUTTON:
                         next_btn = page.locator(next_sel).first
-                        if next_btn.count() > 0:
+                        if count_sync(page, next_sel, NEXT_PAGE_BUTTON) > 0:
                             # 버튼이 비활성화되어 있는지 확인
                             try:
                                 is_disabled = next_btn.get_attribute("disabled") is not None
@@ -972,7 +1212,7 @@ class DabangScraper:
             # selectors.py의 NEXT_PAGE_BUTTON 사용
             click_first_sync(page, NEXT_PAGE_BUTTON)
             page.wait_for_load_state("domcontentloaded")
-            page.wait_for_timeout(3000)
+            self._wait(page, 3000)
             return True
         except Exception as e:
             self._log(f"다음 페이지 클릭 실패: {e}")
@@ -984,7 +1224,7 @@ class DabangScraper:
         try:
             for sel in PAGE_NUMBER_BUTTONS:
                 buttons = page.locator(sel)
-                for i in range(buttons.count()):
+                for i in range(count_sync(page, sel, PAGE_NUMBER_BUTTONS)):
                     try:
                         btn = buttons.nth(i)
                         # 현재 페이지 버튼은 보통 다른 스타일을 가집니다
@@ -1008,16 +1248,16 @@ class DabangScraper:
         3) 후보에 data-picked="1"를 달아 Locator로 재획득 후 카드 존재성 검증
         """
         try:
-            page.wait_for_timeout(600)
+            self._wait(page, 600)
             anchors = page.locator("a[href^='/room/']")
             if anchors.count() == 0:
                 # 리스트 패널 열기 후보 시도 - selectors.py 사용
                 try:
                     click_first_sync(page, LIST_OPEN_BUTTON)
-                    page.wait_for_timeout(500)
+                    self._wait(page, 500)
                 except Exception:
                     pass
-                page.wait_for_timeout(600)
+                self._wait(page, 600)
             if anchors.count() == 0:
                 return None
 
@@ -1048,7 +1288,7 @@ class DabangScraper:
             loc = page.locator('[data-picked="1"]').first
             # 카드 후보 존재 확인
             for csel in S.CARD_ROOT_SELECTORS:
-                if loc.locator(csel).count() > 0:
+                if count_sync(loc, csel, S.CARD_ROOT_SELECTORS) > 0:
                     self._log("컨테이너(앵커기반) 확정: data-picked=1")
                     return loc
             return None
@@ -1066,7 +1306,7 @@ class DabangScraper:
         for sel in LIST_CONTAINER_SELECTORS:
             try:
                 loc = page.locator(sel).first
-                if loc.count() == 0:
+                if count_sync(page, sel, LIST_CONTAINER_SELECTORS) == 0:
                     continue
                 loc.wait_for(state="visible", timeout=3000)
                 self._log(f"컨테이너 후보 발견: {sel}")
@@ -1079,7 +1319,7 @@ class DabangScraper:
                 # 카드 존재 확인(성급탈락 방지) - selectors.py 사용
                 has_cards = False
                 for csel in CARD_ROOT_SELECTORS:
-                    card_count = loc.locator(csel).count()
+                    card_count = count_sync(loc, csel, CARD_ROOT_SELECTORS)
                     if card_count > 0:
                         has_cards = True
                         self._log(f"  카드 발견: {csel} - {card_count}개")
@@ -1121,7 +1361,7 @@ class DabangScraper:
                 loc = page.locator('[data-picked="1"]').first
                 # 검증 - selectors.py 사용
                 for csel in CARD_ROOT_SELECTORS:
-                    if loc.locator(csel).count() > 0:
+                    if count_sync(loc, csel, CARD_ROOT_SELECTORS) > 0:
                         self._log("컨테이너(휴리스틱) 확정: data-picked=1")
                         return loc
         except Exception:
@@ -1131,7 +1371,8 @@ class DabangScraper:
             # 전체 페이지에서 카드 요소 찾기 - selectors.py 사용
             for csel in CARD_ROOT_SELECTORS:
                 cards = page.locator(csel)
-                if cards.count() > 0:
+                card_count = count_sync(page, csel, CARD_ROOT_SELECTORS)
+                if card_count > 0:
                     self._log(f"카드 발견: {csel} - {card_count}개")
                     # 카드의 부모 컨테이너 찾기
                     first_card = cards.first
@@ -1217,8 +1458,9 @@ class DabangScraper:
                 for sel in getattr(S, 'CARD_ADDRESS', []):
                     try:
                         address_elements = card_element.locator(sel)
-                        if address_elements.count() > 0:
-                            for i in range(min(address_elements.count(), 3)):  # 최대 3개만 시도
+                        n = count_sync(card_element, sel, S.CARD_ADDRESS)
+                        if n > 0:
+                            for i in range(min(n, 3)):  # 최대 3개만 시도
                                 try:
                                     text = address_elements.nth(i).inner_text(timeout=3000).strip()  # 타임아웃 단축
                                     if self._is_valid_address(text):
@@ -1241,7 +1483,7 @@ class DabangScraper:
                         if href:
                             # 상대 URL을 절대 URL로 변환
                             if href.startswith('/'):
-                                room_url = f"https://www.dabangapp.com{href}"
+                                room_url = site_url(href)
                             else:
                                 room_url = href
                             
@@ -1259,8 +1501,9 @@ class DabangScraper:
             for sel in getattr(S, 'CARD_ADDRESS', []):
                 try:
                     address_elements = page.locator(sel)
-                    if address_elements.count() > 0:
-                        for i in range(address_elements.count()):
+                    n = count_sync(page, sel, S.CARD_ADDRESS)
+                    if n > 0:
+                        for i in range(n):
                             text = address_elements.nth(i).inner_text(timeout=1000).strip()
                             if self._is_valid_address(text):
                                 self._log(f"현재 페이지에서 주소 발견: {text}")
@@ -1335,7 +1578,7 @@ class DabangScraper:
             
             detail_page = new_page_info.value
             detail_page.wait_for_load_state("domcontentloaded")
-            detail_page.wait_for_timeout(3000)
+            self._wait(detail_page, 3000)
             
             # 페이지 로딩 확인
             try:
@@ -1390,8 +1633,9 @@ class DabangScraper:
             for selector in location_selectors:
                 try:
                     location_elements = page.locator(selector)
-                    if location_elements.count() > 0:
-                        for i in range(location_elements.count()):
+                    n = count_sync(page, selector, "detail_location_section")
+                    if n > 0:
+                        for i in range(n):
                             element = location_elements.nth(i)
                             # 섹션 내의 모든 텍스트 확인
                             all_text = element.inner_text(timeout=2000).strip()
@@ -1424,8 +1668,9 @@ class DabangScraper:
             for selector in detail_selectors:
                 try:
                     detail_elements = page.locator(selector)
-                    if detail_elements.count() > 0:
-                        for i in range(detail_elements.count()):
+                    n = count_sync(page, selector, "detail_info_section")
+                    if n > 0:
+                        for i in range(n):
                             element = detail_elements.nth(i)
                             all_text = element.inner_text(timeout=2000).strip()
                             lines = all_text.split('\n')
@@ -1515,18 +1760,19 @@ class DabangScraper:
                         if material_btn.count() > 0:
                             material_btn.focus()
                             page.keyboard.press("Enter")
-                            page.wait_for_timeout(2000)
+                            self._wait(page, 2000)
                     except Exception as e:
                         self._log(f"매물 버튼 재클릭 실패: {e}")
                 
-                page.wait_for_timeout(3000)  # 대기 시간 증가 (2초 → 3초)
+                self._wait(page, 3000)  # 대기 시간 증가 (2초 → 3초)
                 
             except Exception as e:
                 self._log(f"컨테이너 확인 중 오류: {e}")
-                page.wait_for_timeout(3000)  # 대기 시간 증가 (2초 → 3초)
+                self._wait(page, 3000)  # 대기 시간 증가 (2초 → 3초)
         
         self._log("지역 검색 후 컨테이너 확인 실패")
 
+    @traced("resolve_container")
     def _resolve_list_container_improved(self, page: Page):
         """개선된 컨테이너 해결 로직 - onetwo 전용 UL 우선"""
         self._log("개선된 컨테이너 해결 로직 시작...")
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
+import atexit
 from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
-from urllib.parse import urljoin
 import hashlib
-import time
 
 from loguru import logger
 import undetected_chromedriver as uc
@@ -13,10 +12,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.remote.webdriver import WebDriver
-import os
-import subprocess
-import re
 
+from scraper.control import CrawlControl
+from scraper.driver_pool import DriverPool, detect_chrome_version_main
+from scraper.progress import ProgressTracker
+from scraper.site import site_url
 from scraper.parsers import (
     extract_address,
     extract_price_text,
@@ -57,34 +57,13 @@ LIST_SELECTORS = [
 ]
 
 
-def _detect_chrome_version_main() -> Optional[int]:
-    env = os.getenv("CHROME_VERSION_MAIN")
-    if env:
-        try:
-            return int(env)
-        except Exception:
-            return None
-    # macOS Chrome path
-    try:
-        out = subprocess.check_output([
-            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-            "--version",
-        ], stderr=subprocess.STDOUT).decode("utf-8", "ignore")
-        m = re.search(r"(\d+)\.\d+\.\d+\.\d+", out)
-        if m:
-            return int(m.group(1))
-    except Exception:
-        return None
-    return None
-
-
 def create_driver(headless: bool) -> WebDriver:
     opts = Options()
     if headless:
         opts.add_argument("--headless=new")
     opts.add_argument("--disable-gpu")
     opts.add_argument("--lang=ko-KR")
-    ver = _detect_chrome_version_main()
+    ver = detect_chrome_version_main()
     if ver:
         driver = uc.Chrome(options=opts, version_main=ver)
     else:
@@ -94,18 +73,33 @@ def create_driver(headless: bool) -> WebDriver:
     return driver
 
 
+# 같은 프로세스에서 여러 번 실행할 때 드라이버를 재사용
+POOL = DriverPool(create_driver)
+atexit.register(POOL.close)
+
+
 class DabangSelenium:
-    def __init__(self, opts: SelOptions) -> None:
+    def __init__(
+        self,
+        opts: SelOptions,
+        control: Optional[CrawlControl] = None,
+        progress: Optional[ProgressTracker] = None,
+    ) -> None:
         self.opts = opts
+        self.control = control or CrawlControl()
+        # 단계별 시간 (엔진 벤치마크에서 다른 엔진과 같은 단계 이름으로 비교)
+        self.progress = progress or ProgressTracker()
 
     def run(self) -> List[Row]:
         rows: List[Row] = []
-        driver = create_driver(self.opts.headless)
-        try:
+        with POOL.lease(self.opts.headless) as driver:
             logger.info("접속: 다방")
-            driver.get("https://www.dabangapp.com/")
-            time.sleep(1.5)
+            self.progress.set_phase("navigate")
+            driver.get(site_url("/"))
+            if not self.control.sleep(1.5):
+                return rows
             # 검색
+            self.progress.set_phase("search")
             box = None
             for css in [
                 'input[placeholder*="검색"]',
@@ -122,17 +116,21 @@ class DabangSelenium:
             box.click()
             box.clear()
             box.send_keys(self.opts.region)
-            time.sleep(0.5)
+            self.control.sleep(0.5)
             box.send_keys(Keys.ENTER)
-            time.sleep(2.0)
+            if not self.control.sleep(2.0):
+                return rows
 
             # 왼쪽 목록 패널 끝까지 스크롤
+            self.progress.set_phase("list")
             self._scroll_list(driver)
 
             # 카드 수집
             cards = self._find_cards(driver)
             logger.info("카드: {}개", len(cards))
             for card in cards[: self.opts.max_items]:
+                if not self.control.wait_if_paused():
+                    break
                 try:
                     html = card.get_attribute("innerText") or ""
                     addr = extract_address(html) or ""
@@ -150,7 +148,7 @@ class DabangSelenium:
                         link = a.get_attribute('href') or ""
                     except Exception:
                         pass
-                    url_abs = urljoin("https://www.dabangapp.com/", link) if link else ""
+                    url_abs = site_url(link) if link else ""
                     if not (addr and price):
                         continue
                     item_id = hashlib.sha1((url_abs or addr + price).encode('utf-8')).hexdigest()
@@ -170,11 +168,7 @@ class DabangSelenium:
                     )
                 except Exception:
                     continue
-        finally:
-            try:
-                driver.quit()
-            except Exception:
-                pass
+        self.progress.set_phase("done")
         logger.info("수집 완료: {}건", len(rows))
         return rows
 
@@ -182,7 +176,8 @@ class DabangSelenium:
         # 페이지 전체 스크롤과 목록 패널 스크롤 병행
         for _ in range(40):
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(0.6)
+            if not self.control.sleep(0.6):
+                return
         # 목록 패널 추정 요소들 내부 스크롤
         for sel in [
             'div[role="list"]',
@@ -193,7 +188,8 @@ class DabangSelenium:
                 el = driver.find_element(By.CSS_SELECTOR, sel)
                 for _ in range(60):
                     driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", el)
-                    time.sleep(0.4)
+                    if not self.control.sleep(0.4):
+                        return
             except Exception:
                 continue
 
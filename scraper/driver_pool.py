@@ -0,0 +1,203 @@
+"""Selenium Chrome 드라이버 풀.
+
+드라이버를 만들 때마다 Chrome 실행 파일을 subprocess로 불러 버전을 확인하고 uc.Chrome을
+콜드 스타트하던 비용을 줄인다.
+- 설치된 Chrome 메이저 버전은 프로세스당 한 번만 확인해 캐시한다.
+- prewarm()으로 다음 실행에 쓸 드라이버를 백그라운드에서 미리 띄워 둔다.
+- 실행이 끝난 드라이버는 쿠키/스토리지를 지우고 about:blank로 돌려 다음 실행에 재사용한다.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import platform
+import re
+import shutil
+import subprocess
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from loguru import logger
+
+_VERSION_RE = re.compile(r"(\d+)\.\d+\.\d+\.\d+")
+
+
+def _chrome_version_commands() -> List[List[str]]:
+    system = platform.system()
+    if system == "Darwin":
+        return [["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"]]
+    if system == "Windows":
+        # 실행 파일 --version은 창을 띄우므로 레지스트리에서 읽는다
+        return [
+            ["reg", "query", r"HKCU\Software\Google\Chrome\BLBeacon", "/v", "version"],
+            ["reg", "query", r"HKLM\Software\Google\Chrome\BLBeacon", "/v", "version"],
+        ]
+    cmds = []
+    for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser"):
+        path = shutil.which(name)
+        if path:
+            cmds.append([path, "--version"])
+    return cmds
+
+
+@lru_cache(maxsize=1)
+def _installed_chrome_version() -> Optional[int]:
+    for cmd in _chrome_version_commands():
+        try:
+            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, timeout=10).decode("utf-8", "ignore")
+        except Exception:
+            continue
+        m = _VERSION_RE.search(out)
+        if m:
+            return int(m.group(1))
+    return None
+
+
+def detect_chrome_version_main(override: Optional[Any] = None) -> Optional[int]:
+    """Chrome 메이저 버전. override(설정값) → 환경변수 CHROME_VERSION_MAIN → 설치본 순 (설치본 조회는 캐시)."""
+    for value in (override, os.getenv("CHROME_VERSION_MAIN")):
+        if value:
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return None
+    return _installed_chrome_version()
+
+
+def reset_driver(driver: Any) -> None:
+    """다음 실행에 넘기기 전 세션 흔적 제거: 쿠키, 현재 오리진 스토리지, 추가 창."""
+    try:
+        handles = driver.window_handles
+        for h in handles[1:]:
+            driver.switch_to.window(h)
+            driver.close()
+        driver.switch_to.window(handles[0])
+    except Exception:
+        pass
+    try:
+        driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+    except Exception:
+        pass
+    try:
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    except Exception:
+        driver.delete_all_cookies()
+    driver.get("about:blank")
+
+
+def _alive(driver: Any) -> bool:
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+def _quit(driver: Any) -> None:
+    with contextlib.suppress(Exception):
+        driver.quit()
+
+
+class DriverPool:
+    """headless 여부별로 유휴 드라이버를 보관한다. factory(headless)는 새 드라이버를 만든다."""
+
+    def __init__(
+        self,
+        factory: Callable[[bool], Any],
+        max_idle: int = 1,
+        max_uses: int = 20,
+        reset: Callable[[Any], None] = reset_driver,
+    ) -> None:
+        self._factory = factory
+        self._reset = reset
+        self.max_idle = max_idle
+        self.max_uses = max_uses
+        self._cond = threading.Condition()
+        self._idle: Dict[bool, List[Any]] = {True: [], False: []}
+        self._warming: Dict[bool, int] = {True: 0, False: 0}
+        self._uses: Dict[int, int] = {}
+        self._closed = False
+
+    def prewarm(self, headless: bool, count: int = 1) -> None:
+        """유휴 드라이버가 count개가 되도록 백그라운드에서 미리 띄운다."""
+        with self._cond:
+            need = min(count, self.max_idle) - len(self._idle[headless]) - self._warming[headless]
+            if self._closed or need <= 0:
+                return
+            self._warming[headless] += need
+        for _ in range(need):
+            threading.Thread(target=self._warm_one, args=(headless,), daemon=True, name="driver-prewarm").start()
+
+    def _warm_one(self, headless: bool) -> None:
+        driver = None
+        try:
+            driver = self._factory(headless)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("드라이버 미리 띄우기 실패: {}", e)
+        with self._cond:
+            self._warming[headless] -= 1
+            if driver is not None and not self._closed:
+                self._idle[headless].append(driver)
+                driver = None
+            self._cond.notify_all()
+        if driver is not None:
+            _quit(driver)
+
+    def acquire(self, headless: bool) -> Any:
+        """유휴 드라이버가 있으면(또는 미리 띄우는 중이면 기다려) 재사용, 없으면 새로 만든다.
+
+        생존 확인(WebDriver 왕복)은 잠금 밖에서 해 다른 acquire/release를 막지 않는다.
+        """
+        while True:
+            with self._cond:
+                while not self._idle[headless] and self._warming[headless]:
+                    self._cond.wait()
+                if not self._idle[headless]:
+                    break
+                driver = self._idle[headless].pop()
+            if _alive(driver):
+                logger.info("드라이버 재사용(headless={})", headless)
+                return driver
+            with self._cond:
+                self._uses.pop(id(driver), None)
+            _quit(driver)
+        return self._factory(headless)
+
+    def release(self, driver: Any, headless: bool) -> None:
+        """드라이버를 초기화해 풀로 돌려준다. 사용 횟수 초과/오류/풀이 가득 차면 종료."""
+        uses = self._uses.get(id(driver), 0) + 1
+        keep = uses < self.max_uses and not self._closed
+        if keep:
+            try:
+                self._reset(driver)
+            except Exception as e:  # noqa: BLE001
+                logger.debug("드라이버 초기화 실패 → 폐기: {}", e)
+                keep = False
+        with self._cond:
+            if keep and len(self._idle[headless]) < self.max_idle:
+                self._uses[id(driver)] = uses
+                self._idle[headless].append(driver)
+                self._cond.notify_all()
+                return
+            self._uses.pop(id(driver), None)
+        _quit(driver)
+
+    @contextlib.contextmanager
+    def lease(self, headless: bool) -> Iterator[Any]:
+        driver = self.acquire(headless)
+        try:
+            yield driver
+        finally:
+            self.release(driver, headless)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            drivers = self._idle[True] + self._idle[False]
+            self._idle = {True: [], False: []}
+            self._uses.clear()
+        for d in drivers:
+            _quit(d)
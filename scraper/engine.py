@@ -0,0 +1,154 @@
+"""수집 엔진 공통 인터페이스.
+
+세 엔진(Playwright DabangScraper, Selenium DabangSelenium, realestate_dabang DabangCrawler)을
+같은 입력(CrawlRequest)과 같은 결과(EngineResult: Item 목록 + 단계별 시간)로 감싸는 얇은 어댑터다.
+수집 흐름과 추출 규칙은 각 엔진 것을 그대로 쓰므로, 벤치마크는 GUI/CLI가 실제로 돌리는 코드를 잰다.
+엔진 모듈(playwright/selenium/pydantic 의존)은 crawl()을 처음 부를 때 불러온다.
+
+공통 규약은 crawl() 진입점 하나뿐이다. navigate/search/list/detail/extract를 단계별 메서드로
+나누지 않았다: 엔진마다 단계가 섞여 있어(DabangScraper는 목록을 넘기며 카드마다 상세를 방문하고,
+DabangCrawler는 스크롤과 추출을 한 루프에서 한다) 나누려면 수집 흐름을 다시 구현해야 하기 때문이다.
+단계는 호출 단위가 아니라 측정 단위로만 공유한다 — 각 엔진이 ProgressTracker.set_phase()로
+navigate/search/list/detail 구간을 표시하고, crawl()이 그 누적 시간을 EngineResult.phases로 돌려준다.
+"""
+
+from __future__ import annotations
+
+import abc
+import dataclasses
+import hashlib
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Type
+
+from scraper.control import CrawlControl
+from scraper.dabang_scraper import Item
+from scraper.progress import ProgressTracker
+
+
+@dataclass
+class CrawlRequest:
+    region: str
+    property_type: str = "원룸"
+    limit: int = 100
+    headless: bool = True
+    # 목록 한 페이지 카드 수 추정치 (max_pages 계산용)
+    page_size: int = 24
+
+
+@dataclass
+class EngineResult:
+    items: List[Item]
+    # 단계 → 누적 초 (ProgressTracker 단계: navigate/search/list/detail)
+    phases: Dict[str, float] = field(default_factory=dict)
+    elapsed_s: float = 0.0
+
+
+class CrawlEngine(abc.ABC):
+    """엔진 어댑터. crawl()은 한 번의 수집 실행이며 실패하면 예외를 던진다.
+
+    하위 클래스는 _crawl()만 구현한다 (단계별 메서드 없음, 단계는 progress.set_phase()로 표시).
+    """
+
+    name = "base"
+
+    def __init__(self, control: Optional[CrawlControl] = None) -> None:
+        self.control = control or CrawlControl()
+
+    @abc.abstractmethod
+    def _crawl(self, req: CrawlRequest, progress: ProgressTracker) -> List[Item]:
+        ...
+
+    def crawl(self, req: CrawlRequest) -> EngineResult:
+        progress = ProgressTracker(target=req.limit)
+        t = time.perf_counter()
+        items = self._crawl(req, progress)[: req.limit]
+        elapsed = time.perf_counter() - t
+        return EngineResult(items, dict(progress.snapshot().phase_times), elapsed)
+
+
+class ScraperEngine(CrawlEngine):
+    """scraper.dabang_scraper.DabangScraper (Playwright, GUI/CLI 기본 엔진). 상세 페이지까지 방문한다.
+
+    options는 ScrapeOptions에 그대로 넘긴다 (replay_har_path, net_latency_ms 등).
+    """
+
+    name = "scraper"
+
+    def __init__(self, control: Optional[CrawlControl] = None, **options: Any) -> None:
+        super().__init__(control)
+        self.options = options
+
+    def _crawl(self, req: CrawlRequest, progress: ProgressTracker) -> List[Item]:
+        from scraper.dabang_scraper import DabangScraper, ScrapeOptions
+
+        opts = ScrapeOptions(
+            region=req.region,
+            property_type=req.property_type,
+            price_min=0,
+            price_max=0,
+            max_items=req.limit,
+            max_pages=math.ceil(req.limit / req.page_size) + 1,
+            headless=req.headless,
+            **self.options,
+        )
+        scraper = DabangScraper(opts, self.control, progress=progress)
+        items = scraper.run()
+        if scraper.error:
+            raise RuntimeError(scraper.error)
+        return items
+
+
+class SeleniumEngine(CrawlEngine):
+    """scraper.dabang_selenium.DabangSelenium (undetected-chromedriver, 목록 카드만)."""
+
+    name = "selenium"
+
+    def _crawl(self, req: CrawlRequest, progress: ProgressTracker) -> List[Item]:
+        from scraper.dabang_selenium import DabangSelenium, SelOptions
+
+        opts = SelOptions(region=req.region, property_type=req.property_type, max_items=req.limit, headless=req.headless)
+        rows = DabangSelenium(opts, self.control, progress=progress).run()
+        return [Item(**dataclasses.asdict(row)) for row in rows]
+
+
+class CrawlerEngine(CrawlEngine):
+    """realestate_dabang DabangCrawler (Selenium, 스크롤 목록 → Record)."""
+
+    name = "crawler"
+
+    def _crawl(self, req: CrawlRequest, progress: ProgressTracker) -> List[Item]:
+        from realestate_dabang.app.core.models import CrawlerInput
+        from realestate_dabang.app.crawler.dabang_crawler import DabangCrawler
+
+        user_input = CrawlerInput(region_keyword=req.region, property_types=[req.property_type], headless=req.headless)
+        records, _ = DabangCrawler(user_input, self.control, progress=progress).run()
+        return [
+            Item(
+                address=rec.lot_address,
+                price_text=f"{rec.price:,}원",
+                maintenance_fee=rec.maintenance_fee,
+                realtor="",
+                posted_at=rec.collected_at,
+                property_type=req.property_type,
+                url=rec.url,
+                item_id=hashlib.sha1((rec.url or rec.lot_address).encode("utf-8")).hexdigest(),
+            )
+            for rec in records
+        ]
+
+
+ENGINES: Dict[str, Type[CrawlEngine]] = {
+    ScraperEngine.name: ScraperEngine,
+    SeleniumEngine.name: SeleniumEngine,
+    CrawlerEngine.name: CrawlerEngine,
+}
+
+
+def create_engine(name: str, control: Optional[CrawlControl] = None, **options: Any) -> CrawlEngine:
+    try:
+        cls = ENGINES[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 엔진: {name} (가능: {', '.join(ENGINES)})") from None
+    return cls(control, **options)
@@ -0,0 +1,460 @@
+"""다방 지도/목록/상세 흐름을 흉내내는 로컬 fixture 사이트 (표준 라이브러리만 사용).
+
+셀렉터가 겨냥하는 DOM을 그대로 재현한다.
+- /              : '원/투룸' 링크, 검색창
+- /map/onetwo    : 검색창(input#search-input) + 제안 목록, #onetwo-list > ul > li 카드,
+                   /room/<id>?detail_type=room&detail_id=<id> 링크, div.pagination 버튼
+- /room/<id>     : section[data-scroll-spy-element] 블록(가격/상세/near/agent-info)
+- /api/rooms, /api/regions : 목록 페이지가 fetch로 불러오는 JSON
+
+응답 지연, 매물 수, 페이지 크기, 실패 주입(비율/주기), CAPTCHA 주입을 설정할 수 있고
+같은 seed면 매물 데이터가 항상 같으므로 처리량·정확도를 네트워크 없이 재현성 있게 잴 수 있다.
+
+    python -m scraper.fixture_site --port 8765 --count 500 --latency 0.05
+    DABANG_BASE_URL=http://127.0.0.1:8765 python tools/bench_engines.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import html
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# (시/도, 시/군/구, 동/읍/면) — 매물 주소와 지역 제안에 쓴다
+DISTRICTS: List[Tuple[str, str, str]] = [
+    ("서울특별시", "강남구", "역삼동"),
+    ("서울특별시", "강남구", "논현동"),
+    ("서울특별시", "마포구", "서교동"),
+    ("서울특별시", "관악구", "신림동"),
+    ("부산광역시", "해운대구", "우동"),
+    ("부산광역시", "기장군", "기장읍"),
+    ("경기도", "성남시", "분당동"),
+    ("인천광역시", "남동구", "구월동"),
+]
+
+AGENCIES = ["역삼", "한빛", "행복", "새롬", "바다", "으뜸", "미래", "중앙"]
+
+_BASE_DATE = date(2025, 8, 1)
+
+
+@dataclass
+class FixtureConfig:
+    count: int = 120  # 검색 결과 매물 수
+    page_size: int = 24  # 목록 한 페이지 카드 수
+    latency_s: float = 0.0  # 모든 응답에 더하는 지연
+    jitter_s: float = 0.0  # 추가 지연 상한 (0~jitter 균등)
+    fail_rate: float = 0.0  # fail_paths 요청 중 실패 비율
+    fail_every: int = 0  # N번째 fail_paths 요청마다 실패 (0이면 끔)
+    fail_status: int = 503
+    retry_after: Optional[int] = None  # 실패 응답의 Retry-After(초)
+    fail_paths: Tuple[str, ...] = ("/api/", "/room/")
+    captcha_after: int = 0  # 상세 페이지 N회 이후 CAPTCHA 화면 (0이면 끔)
+    seed: int = 7
+
+
+def room_id(seed: int, index: int) -> str:
+    """다방 매물 id처럼 보이는 24자리 16진수."""
+    return hashlib.md5(f"{seed}:{index}".encode()).hexdigest()[:24]
+
+
+def make_listing(seed: int, index: int) -> Dict[str, Any]:
+    rng = random.Random(f"{seed}:{index}")
+    sido, sigungu, dong = DISTRICTS[index % len(DISTRICTS)]
+    lot = f"{rng.randint(1, 999)}-{rng.randint(1, 40)}"
+    if index % 5 == 0:
+        price = f"전세 {rng.randint(1, 3)}억 {rng.choice(['', '2000', '5000'])}".strip()
+    else:
+        price = f"월세 {rng.choice([300, 500, 1000])}/{rng.randint(30, 90)}"
+    maint = rng.choice([0, 3, 5, 7, 10, 12])
+    return {
+        "id": room_id(seed, index),
+        "number": 50000000 + index,
+        "index": index,
+        "price": price,
+        "maintenance": f"관리비 {maint}만원" if maint else "관리비 없음",
+        "maintenance_won": maint * 10000 or None,
+        "floor": f"{rng.randint(1, 15)}층",
+        "area_m2": round(rng.uniform(16, 60), 1),
+        "address": f"{sido} {sigungu} {dong} {lot}",
+        "dong": dong,
+        "realtor": f"{AGENCIES[index % len(AGENCIES)]}공인중개사사무소",
+        "posted": (_BASE_DATE - timedelta(days=index % 90)).strftime("%Y.%m.%d"),
+        "room_type": "투룸" if index % 3 == 0 else "원룸",
+    }
+
+
+def room_href(room: Dict[str, Any]) -> str:
+    return f"/room/{room['id']}?detail_type=room&detail_id={room['id']}"
+
+
+_STYLE = """
+body { font-family: sans-serif; margin: 0; }
+#onetwo-list { position: absolute; left: 0; top: 60px; bottom: 0; width: 420px; overflow-y: auto; }
+#onetwo-list ul { list-style: none; margin: 0; padding: 0; }
+#onetwo-list li { border-bottom: 1px solid #ddd; padding: 12px; }
+#onetwo-list li a { display: block; color: inherit; text-decoration: none; }
+.map { position: absolute; left: 420px; right: 0; top: 60px; bottom: 0; background: #eef; }
+.pagination button.active { font-weight: bold; }
+#search-region-subway-univ-list button { display: block; }
+"""
+
+HOME_HTML = """<!doctype html>
+<html lang="ko"><head><meta charset="utf-8"><title>다방 fixture</title></head>
+<body>
+<nav class="sc-eYRUSB gnvA0">
+  <a href="/map/onetwo">지도</a>
+  <a class="sc-evlKSw gfXolk" href="/map/onetwo">원/투룸</a>
+  <a class="sc-evlKSw gfXolk" href="/map/apt">아파트</a>
+  <a class="sc-evlKSw gfXolk" href="/map/house">주택/빌라</a>
+  <a class="sc-erobCP bsOpZZ" href="/map/officetel">오피스텔</a>
+</nav>
+<input id="search-input" placeholder="지역, 지하철역, 매물번호 검색">
+</body></html>
+"""
+
+# 목록 앱: 검색/제안 → /api/rooms fetch → 카드·페이지 버튼 렌더링. 상태는 URL(search, page)에 두어
+# 상세에서 뒤로 가기 하면 같은 페이지가 다시 그려진다.
+_MAP_JS = r"""
+(function () {
+  var input = document.getElementById('search-input');
+  var suggest = document.getElementById('search-region-subway-univ-list');
+  var list = document.querySelector('#onetwo-list ul');
+  var pager = document.querySelector('#onetwo-list .pagination');
+  var status = document.getElementById('list-status');
+  var state = { region: '', page: 1 };
+
+  function esc(s) {
+    return String(s).replace(/[&<>"]/g, function (c) { return { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' }[c]; });
+  }
+  function card(r) {
+    return '<li class="sc-bNShyZ" role="listitem"><a href="' + esc(r.href) + '">' +
+      '<p class="sc-cBzQip">' + esc(r.room_type) + '</p>' +
+      '<h1 class="sc-gtGlis islzsw">' + esc(r.price) + '</h1>' +
+      '<p class="sc-fLMXbb jZjfUh">' + esc(r.floor) + ', ' + esc(r.area_m2) + 'm², ' + esc(r.maintenance) + '</p>' +
+      '<p class="sc-dPDzVR">' + esc(r.dong) + '</p>' +
+      '</a></li>';
+  }
+  function button(label, page, disabled, active) {
+    return '<button type="button" data-page="' + page + '"' + (disabled ? ' disabled' : '') +
+      (active ? ' class="active" aria-current="page"' : '') + '>' + label + '</button>';
+  }
+  function renderPager(page, pages) {
+    var start = Math.floor((page - 1) / 10) * 10 + 1, end = Math.min(pages, start + 9), html = '';
+    html += button('&lt;', page - 1, page <= 1, false);
+    for (var p = start; p <= end; p++) html += button(String(p), p, false, p === page);
+    html += button('&gt;', page + 1, page >= pages, false);
+    pager.innerHTML = pages > 0 ? html : '';
+  }
+  function load(region, page) {
+    status.textContent = '불러오는 중';
+    fetch('/api/rooms?region=' + encodeURIComponent(region) + '&page=' + page)
+      .then(function (res) { if (!res.ok) throw new Error('HTTP ' + res.status); return res.json(); })
+      .then(function (data) {
+        state.region = region; state.page = data.page;
+        list.innerHTML = data.rooms.map(card).join('');
+        renderPager(data.page, data.pages);
+        status.textContent = data.total + '개의 방';
+        history.replaceState(null, '', '/map/onetwo?search=' + encodeURIComponent(region) + '&page=' + data.page);
+        var panel = document.getElementById('onetwo-list');
+        panel.scrollTop = 0;
+      })
+      .catch(function (e) { status.textContent = '목록을 불러오지 못했습니다 (' + e.message + ')'; });
+  }
+  function suggestions(q) {
+    if (!q) { suggest.innerHTML = ''; return; }
+    fetch('/api/regions?q=' + encodeURIComponent(q))
+      .then(function (res) { return res.ok ? res.json() : []; })
+      .then(function (names) {
+        suggest.innerHTML = names.map(function (n) {
+          return '<button type="button" class="sc-fEETNT cGRZls" role="option">' + esc(n) + '</button>';
+        }).join('');
+      })
+      .catch(function () {});
+  }
+  input.addEventListener('input', function () { suggestions(input.value.trim()); });
+  input.addEventListener('keydown', function (e) {
+    if (e.key === 'Enter') { suggest.innerHTML = ''; load(input.value.trim(), 1); }
+  });
+  suggest.addEventListener('click', function (e) {
+    var b = e.target.closest('button');
+    if (!b) return;
+    input.value = b.textContent;
+    suggest.innerHTML = '';
+    load(b.textContent, 1);
+  });
+  pager.addEventListener('click', function (e) {
+    var b = e.target.closest('button');
+    if (b && !b.disabled) load(state.region, parseInt(b.getAttribute('data-page'), 10));
+  });
+  var params = new URLSearchParams(location.search);
+  load(params.get('search') || '', parseInt(params.get('page') || '1', 10));
+})();
+"""
+
+MAP_HTML = (
+    """<!doctype html>
+<html lang="ko"><head><meta charset="utf-8"><title>다방 fixture 지도</title><style>"""
+    + _STYLE
+    + """</style></head>
+<body>
+<header>
+  <nav class="sc-eYRUSB gnvA0"><a href="/map/onetwo">지도</a></nav>
+  <input id="search-input" placeholder="지역, 지하철역, 매물번호 검색" autocomplete="off">
+  <div id="search-region-subway-univ-list"></div>
+  <button class="sc-hGqmkL kOEMcC" type="button">매물</button>
+</header>
+<div id="onetwo-list">
+  <p id="list-status"></p>
+  <ul role="list"></ul>
+  <div class="sc-efUvXT fvodgZ pagination"></div>
+</div>
+<div class="map" data-testid="map"><canvas width="10" height="10"></canvas></div>
+<script>"""
+    + _MAP_JS
+    + """</script>
+</body></html>
+"""
+)
+
+CAPTCHA_HTML = """<!doctype html>
+<html lang="ko"><head><meta charset="utf-8"><title>보안 확인</title></head>
+<body><form id="challenge-form"><div id="captcha-box">자동입력 방지를 위해 보안문자를 입력해 주세요</div></form></body></html>
+"""
+
+
+def render_detail(room: Dict[str, Any]) -> str:
+    e = {k: html.escape(str(v)) for k, v in room.items()}
+    return f"""<!doctype html>
+<html lang="ko"><head><meta charset="utf-8"><title>{e['price']}</title></head>
+<body>
+<div id="container-room-root">
+  <h1>매물 {e['number']}</h1>
+  <section data-scroll-spy-element="price">
+    <h1 class="sc-hoq0XT kiYwXU">{e['price']}</h1>
+    <ul><li>{e['maintenance']}</li></ul>
+  </section>
+  <section data-scroll-spy-element="detail-info">
+    <ul>
+      <li>방종류 {e['room_type']}</li>
+      <li>해당층 {e['floor']}</li>
+      <li>전용면적 {e['area_m2']}m²</li>
+      <li>최초등록일 {e['posted']}</li>
+    </ul>
+  </section>
+  <section data-scroll-spy-element="near">
+    <h2>위치</h2>
+    <p>{e['address']}</p>
+  </section>
+  <section data-scroll-spy-element="agent-info">
+    <h1>{e['realtor']}</h1>
+    <p>대표 김다방</p>
+  </section>
+</div>
+</body></html>
+"""
+
+
+@dataclass
+class FixtureStats:
+    requests: int = 0
+    failures: int = 0
+    detail_views: int = 0
+    by_kind: Dict[str, int] = field(default_factory=dict)
+
+
+class FixtureSite:
+    """ThreadingHTTPServer를 백그라운드 스레드로 띄운다. with 문으로 쓰면 끝날 때 닫힌다."""
+
+    def __init__(self, config: Optional[FixtureConfig] = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or FixtureConfig()
+        self.rooms = [make_listing(self.config.seed, i) for i in range(self.config.count)]
+        self._by_id = {r["id"]: r for r in self.rooms}
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._fail_counter = 0
+        self.stats = FixtureStats()
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FixtureSite":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="fixture-site", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread = None
+
+    def __enter__(self) -> "FixtureSite":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    # ---- 요청 처리 규칙 ----
+    def _count(self, kind: str) -> None:
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.by_kind[kind] = self.stats.by_kind.get(kind, 0) + 1
+
+    def _delay(self) -> float:
+        cfg = self.config
+        with self._lock:
+            extra = self._rng.uniform(0, cfg.jitter_s) if cfg.jitter_s else 0.0
+        return cfg.latency_s + extra
+
+    def _should_fail(self, path: str) -> bool:
+        cfg = self.config
+        if not any(path.startswith(p) for p in cfg.fail_paths):
+            return False
+        with self._lock:
+            self._fail_counter += 1
+            fail = bool(cfg.fail_every and self._fail_counter % cfg.fail_every == 0)
+            fail = fail or bool(cfg.fail_rate and self._rng.random() < cfg.fail_rate)
+            if fail:
+                self.stats.failures += 1
+            return fail
+
+    def _captcha_now(self) -> bool:
+        with self._lock:
+            self.stats.detail_views += 1
+            return bool(self.config.captcha_after and self.stats.detail_views > self.config.captcha_after)
+
+    def room_page(self, page: int) -> Dict[str, Any]:
+        size = max(1, self.config.page_size)
+        pages = (len(self.rooms) + size - 1) // size
+        page = min(max(1, page), max(1, pages))
+        chunk = self.rooms[(page - 1) * size: page * size]
+        return {
+            "total": len(self.rooms),
+            "page": page,
+            "pages": pages,
+            "rooms": [dict(r, href=room_href(r)) for r in chunk],
+        }
+
+    def region_names(self, q: str) -> List[str]:
+        names: List[str] = []
+        for sido, sigungu, dong in DISTRICTS:
+            for name in (f"{sido} {sigungu}", f"{sigungu} {dong}"):
+                if q in name and name not in names:
+                    names.append(name)
+        return names[:10] or [q]
+
+    def respond(self, path: str, query: Dict[str, List[str]]) -> Tuple[int, str, bytes, Dict[str, str]]:
+        """(상태, content-type, 본문, 추가 헤더)."""
+        html_type = "text/html; charset=utf-8"
+        if self._should_fail(path):
+            headers = {"Retry-After": str(self.config.retry_after)} if self.config.retry_after is not None else {}
+            return self.config.fail_status, "text/plain; charset=utf-8", b"fixture failure", headers
+        if path == "/":
+            return 200, html_type, HOME_HTML.encode(), {}
+        if path.startswith("/map/"):
+            return 200, html_type, MAP_HTML.encode(), {}
+        if path == "/api/rooms":
+            page = int((query.get("page") or ["1"])[0] or 1)
+            body = json.dumps(self.room_page(page), ensure_ascii=False).encode()
+            return 200, "application/json; charset=utf-8", body, {}
+        if path == "/api/regions":
+            names = self.region_names((query.get("q") or [""])[0])
+            return 200, "application/json; charset=utf-8", json.dumps(names, ensure_ascii=False).encode(), {}
+        if path.startswith("/room/"):
+            room = self._by_id.get(path[len("/room/"):].strip("/"))
+            if room is None:
+                return 404, html_type, b"<h1>not found</h1>", {}
+            if self._captcha_now():
+                return 200, html_type, CAPTCHA_HTML.encode(), {}
+            return 200, html_type, render_detail(room).encode(), {}
+        if path == "/favicon.ico":
+            return 204, "image/x-icon", b"", {}
+        return 404, html_type, b"<h1>not found</h1>", {}
+
+
+def _kind(path: str) -> str:
+    if path.startswith("/api/"):
+        return path
+    if path.startswith("/room/"):
+        return "/room"
+    if path.startswith("/map/"):
+        return "/map"
+    return path
+
+
+def _make_handler(site: FixtureSite) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802
+            parsed = urlparse(self.path)
+            site._count(_kind(parsed.path))
+            delay = site._delay()
+            if delay > 0:
+                time.sleep(delay)
+            status, ctype, body, headers = site.respond(parsed.path, parse_qs(parsed.query))
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            for k, v in headers.items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="다방 흐름을 흉내내는 로컬 fixture 사이트")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--count", type=int, default=FixtureConfig.count)
+    p.add_argument("--page-size", type=int, default=FixtureConfig.page_size)
+    p.add_argument("--latency", type=float, default=0.0, help="응답 지연(초)")
+    p.add_argument("--jitter", type=float, default=0.0, help="추가 지연 상한(초)")
+    p.add_argument("--fail-rate", type=float, default=0.0)
+    p.add_argument("--fail-every", type=int, default=0)
+    p.add_argument("--captcha-after", type=int, default=0)
+    p.add_argument("--seed", type=int, default=FixtureConfig.seed)
+    args = p.parse_args()
+    cfg = FixtureConfig(
+        count=args.count,
+        page_size=args.page_size,
+        latency_s=args.latency,
+        jitter_s=args.jitter,
+        fail_rate=args.fail_rate,
+        fail_every=args.fail_every,
+        captcha_after=args.captcha_after,
+        seed=args.seed,
+    )
+    site = FixtureSite(cfg, host=args.host, port=args.port)
+    print(f"fixture site: {site.url} (매물 {cfg.count}건, 페이지당 {cfg.page_size}건)", flush=True)
+    try:
+        site._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        site._server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
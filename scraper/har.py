@@ -0,0 +1,83 @@
+"""HAR 기록/재생과 네트워크 조건 조절 (Playwright/Chromium).
+
+- 기록: new_context(**record_kwargs(path))로 세션의 요청/응답을 HAR에 남긴다.
+  파일은 context.close() 시점에 쓰인다. 확장자가 .zip이면 본문을 별도 파일로 묶는다.
+- 재생: install_replay(context, path)가 route_from_har로 HAR 응답을 돌려준다.
+  HAR에 없는 요청은 기본적으로 막는다(not_found="abort"). 이렇게 하면 네트워크 없이 같은 페이로드로 반복 측정할 수 있다.
+  latency_ms를 주면 응답마다 지연(± jitter)을 넣어 실제 사이트 속도를 흉내 낸다.
+- 라이브 조절: shape_network(page, ...)는 CDP Network.emulateNetworkConditions로 RTT와 대역폭을 제한한다.
+  HAR로 채운 응답은 네트워크 스택을 거치지 않으므로, 재생 중에는 지연 라우트만 효과가 있다.
+"""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+
+
+def record_kwargs(path: Optional[str], url_filter: Optional[str] = None) -> Dict[str, Any]:
+    """HAR 기록용 new_context 인자 (path가 없으면 빈 dict)."""
+    if not path:
+        return {}
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    kwargs: Dict[str, Any] = {"record_har_path": str(path), "record_har_mode": "full"}
+    if not str(path).endswith(".zip"):
+        kwargs["record_har_content"] = "embed"
+    if url_filter:
+        kwargs["record_har_url_filter"] = url_filter
+    return kwargs
+
+
+def _delay_route(latency_ms: float, jitter_ms: float, rng: random.Random) -> Callable[[Any], None]:
+    def handle(route: Any) -> None:
+        delay = max(0.0, latency_ms + rng.uniform(-jitter_ms, jitter_ms))
+        try:
+            # 페이지 대기는 이벤트 루프를 막지 않아 다른 요청은 그동안 계속 처리된다
+            route.request.frame.page.wait_for_timeout(delay)
+        except Exception:
+            pass
+        route.fallback()
+
+    return handle
+
+
+def install_replay(
+    context: Any,
+    path: str,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    not_found: str = "abort",
+    url_filter: Optional[str] = None,
+    seed: Optional[int] = None,
+) -> None:
+    """context의 요청을 HAR 응답으로 채운다. 지연 라우트는 HAR 라우트보다 나중에 등록해 먼저 실행된다."""
+    if not Path(path).exists():
+        raise FileNotFoundError(f"HAR 파일이 없습니다: {path}")
+    context.route_from_har(path, not_found=not_found, url=url_filter)
+    if latency_ms > 0 or jitter_ms > 0:
+        context.route(url_filter or "**/*", _delay_route(latency_ms, jitter_ms, random.Random(seed)))
+    logger.info("HAR 재생: {} (지연 {:.0f}±{:.0f}ms, 미기록 요청 {})", path, latency_ms, jitter_ms, not_found)
+
+
+def shape_network(page: Any, latency_ms: float = 0.0, download_kbps: float = 0.0, upload_kbps: float = 0.0) -> bool:
+    """CDP로 네트워크 조건 설정 (Chromium 전용). 0은 제한 없음. 적용하면 True."""
+    if latency_ms <= 0 and download_kbps <= 0 and upload_kbps <= 0:
+        return False
+    try:
+        cdp = page.context.new_cdp_session(page)
+        cdp.send("Network.enable")
+        cdp.send("Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": latency_ms,
+            # CDP 단위는 bytes/s, -1은 제한 없음
+            "downloadThroughput": download_kbps * 1024 / 8 if download_kbps > 0 else -1,
+            "uploadThroughput": upload_kbps * 1024 / 8 if upload_kbps > 0 else -1,
+        })
+    except Exception as e:
+        logger.warning("네트워크 조건 설정 실패(Chromium 전용): {}", e)
+        return False
+    logger.info("네트워크 조건: RTT +{:.0f}ms, 다운 {} / 업 {} kbps", latency_ms, download_kbps or "무제한", upload_kbps or "무제한")
+    return True
@@ -0,0 +1,152 @@
+"""수집 핫패스용 구조화·지연 포맷·샘플링 로그.
+
+- 메시지는 "{}" 자리표시자 템플릿 + 인자로 받는다. 해당 레벨을 받는 싱크가 없으면
+  loguru가 포맷 전에 돌려보내므로 DEBUG 상세 로그는 거의 공짜다.
+  lazy=True면 인자로 넘긴 함수(예: lambda: card.inner_text())도 출력할 때만 호출된다.
+- event와 필드는 logger.bind()로 record["extra"]에 실린다 (serialize=True 싱크에서 JSON 필드).
+- 아이템마다 반복되는 메시지는 LogSampler가 처음 burst건, 이후 every건마다 1건만 남기고
+  그 사이 생략한 건수를 덧붙인다.
+- UI 콜백은 callback(msg, level)로 부른다. 메시지 하나만 받는 예전 콜백도 LevelCallback이 감싸서 받는다.
+  받는 쪽(LogBuffer.push 등)이 min_level을 가지고 있으면 그 미만은 렌더링 없이 건너뛴다.
+"""
+
+from __future__ import annotations
+
+import inspect
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Union
+
+from loguru import logger
+
+_INFO = 20
+
+
+def _level_no(level: Union[str, int]) -> int:
+    if isinstance(level, int):
+        return level
+    try:
+        return logger.level(str(level).upper()).no
+    except ValueError:
+        return _INFO
+
+
+def _accepts_level(fn: Callable[..., Any]) -> bool:
+    """fn(msg, level)로 부를 수 있는지 (아니면 fn(msg)만)."""
+    try:
+        params = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    positional = 0
+    for p in params:
+        if p.kind is p.VAR_POSITIONAL:
+            return True
+        if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD):
+            positional += 1
+    return positional >= 2
+
+
+class LevelCallback:
+    """UI 로그 콜백 어댑터. 레벨을 받는 콜백에는 (msg, level)을, 예전 콜백에는 msg만 넘긴다.
+
+    min_level: 받는 쪽 객체(바운드 메서드의 __self__)에 정수 min_level이 있으면 그 값을 그때그때 따르고
+    (GUI 레벨 선택이 바로 반영), 없거나 예전 콜백이면 INFO.
+    """
+
+    def __init__(self, fn: Callable[..., Any], prefix: str = "") -> None:
+        self.fn = fn
+        self.prefix = prefix
+        self._with_level = _accepts_level(fn)
+
+    @property
+    def min_level(self) -> int:
+        if not self._with_level:
+            return _INFO
+        no = getattr(getattr(self.fn, "__self__", self.fn), "min_level", None)
+        return no if isinstance(no, int) else _INFO
+
+    def __call__(self, msg: str, level: str = "INFO") -> None:
+        if self.prefix:
+            msg = self.prefix + msg
+        if self._with_level:
+            self.fn(msg, level)
+        else:
+            self.fn(msg)
+
+
+def level_callback(fn: Optional[Callable[..., Any]], prefix: str = "") -> Optional[LevelCallback]:
+    """fn을 LevelCallback으로 감싼다 (이미 감싼 것이면 prefix만 덧붙여 새로)."""
+    if fn is None:
+        return None
+    if isinstance(fn, LevelCallback):
+        return LevelCallback(fn.fn, fn.prefix + prefix) if prefix else fn
+    return LevelCallback(fn, prefix)
+
+
+class LogSampler:
+    """같은 키(메시지 템플릿)의 반복 로그를 솎아낸다."""
+
+    def __init__(self, burst: int = 5, every: int = 50) -> None:
+        self.burst = max(0, burst)
+        self.every = max(0, every)
+        self._seen: Dict[Hashable, int] = {}
+        self._skipped: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def admit(self, key: Hashable) -> Optional[int]:
+        """이번 건을 남길 차례면 그동안 생략한 건수, 아니면 None. every=0이면 burst 이후 모두 생략."""
+        with self._lock:
+            n = self._seen.get(key, 0) + 1
+            self._seen[key] = n
+            if n <= self.burst or (self.every and (n - self.burst) % self.every == 0):
+                return self._skipped.pop(key, 0)
+            self._skipped[key] = self._skipped.get(key, 0) + 1
+            return None
+
+    def suppressed(self) -> int:
+        with self._lock:
+            return sum(self._skipped.values())
+
+
+def _render(msg: str, args: Sequence[Any], lazy: bool) -> str:
+    if not args:
+        return msg
+    if lazy:
+        args = [a() if callable(a) else a for a in args]
+    return msg.format(*args)
+
+
+def log_event(
+    msg: str,
+    level: str = "INFO",
+    args: Sequence[Any] = (),
+    *,
+    callback: Optional[Callable[..., None]] = None,
+    sampler: Optional[LogSampler] = None,
+    lazy: bool = False,
+    event: Optional[str] = None,
+    depth: int = 1,
+    **fields: Any,
+) -> None:
+    """한 건 기록. callback(UI)에는 받는 쪽 min_level(기본 INFO) 이상만 (msg, level)로 보낸다.
+
+    args가 없으면 msg를 포맷하지 않으므로 이미 만들어진 문자열(중괄호 포함)도 그대로 넘겨도 된다.
+    depth는 log_event를 감싼 함수 수 (record의 함수/줄 번호가 실제 호출 지점을 가리키도록).
+    """
+    if sampler is not None:
+        skipped = sampler.admit((level, msg))
+        if skipped is None:
+            return
+        if skipped:
+            msg = f"{msg} (+{skipped}건 생략)"
+            fields["suppressed"] = skipped
+    if event is not None:
+        fields["event"] = event
+    target = logger.bind(**fields) if fields else logger
+    target.opt(depth=depth, lazy=lazy).log(level, msg, *args)
+    if callback is not None:
+        cb = level_callback(callback)
+        if _level_no(level) >= cb.min_level:
+            try:
+                cb(_render(msg, args, lazy), level)
+            except Exception:
+                pass
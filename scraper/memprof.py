@@ -0,0 +1,268 @@
+"""장시간 수집용 메모리 계측 (opt-in).
+
+N페이지마다 다음을 한 줄(sample)로 남기고, 끝나면 증가 추세와 가장 많이 늘어난 할당 위치를 보고한다.
+- Python: tracemalloc 현재/최대 할당량과 프로세스 RSS
+- Chromium: CDP Performance.getMetrics (JS 힙, 문서/노드/리스너 수)와 열린 탭 수
+  + SystemInfo.getProcessInfo로 얻은 브라우저/렌더러 프로세스별 RSS (Linux /proc)
+- 호출 측이 넘긴 값 (예: 누적 아이템 수)
+
+상세 페이지 탭(context.expect_page)이나 Locator가 쌓이는지 확인하는 용도이며,
+tracemalloc은 할당마다 비용이 들어 평소에는 끈다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+MB = 1024 * 1024
+
+# Performance.getMetrics 중 기록할 항목
+CDP_METRICS = ("JSHeapUsedSize", "JSHeapTotalSize", "Documents", "Frames", "Nodes", "JSEventListeners", "LayoutObjects")
+
+# 할당 위치 비교에서 뺄 모듈 (계측 자신)
+_IGNORE = (tracemalloc.__file__, "<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>", "<unknown>")
+
+
+def rss_mb(pid: int) -> float:
+    """Linux /proc 기준 RSS(MB). 읽을 수 없으면 0."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+def descendant_pids(root: int) -> List[int]:
+    """root의 모든 하위 프로세스 pid (/proc의 ppid로 추적)."""
+    children: Dict[int, List[int]] = {}
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return []
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as f:
+                stat = f.read().decode(errors="replace")
+            ppid = int(stat[stat.rindex(")") + 2:].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    out, stack = [], list(children.get(root, []))
+    while stack:
+        pid = stack.pop()
+        out.append(pid)
+        stack.extend(children.get(pid, []))
+    return out
+
+
+@dataclass
+class MemorySample:
+    page: int
+    t: float
+    py_current_mb: float
+    py_peak_mb: float
+    rss_mb: float
+    browser_rss_mb: float = 0.0
+    browser_rss_by_type: Dict[str, float] = field(default_factory=dict)
+    open_pages: int = 0
+    cdp: Dict[str, float] = field(default_factory=dict)
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+class MemoryProfiler:
+    """every_pages 페이지마다 sample()을 기록. start() → attach(page) → maybe_sample() ... → stop()."""
+
+    def __init__(self, every_pages: int = 5, frames: int = 10, top: int = 15) -> None:
+        self.every_pages = max(1, every_pages)
+        self.frames = frames
+        self.top = top
+        self.samples: List[MemorySample] = []
+        self._pages = 0
+        self._t0 = time.monotonic()
+        self._owns_tracemalloc = False
+        self._first: Optional[tracemalloc.Snapshot] = None
+        self._last: Optional[tracemalloc.Snapshot] = None
+        self._page: Any = None
+        self._cdp: Any = None
+        self._browser_cdp: Any = None
+
+    def start(self) -> "MemoryProfiler":
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._owns_tracemalloc = True
+        self._first = self._snapshot()
+        return self
+
+    def attach(self, page: Any) -> None:
+        """Playwright 페이지의 CDP 세션을 연다 (Chromium 전용, 실패해도 Python 계측은 계속)."""
+        self._page = page
+        try:
+            self._cdp = page.context.new_cdp_session(page)
+            self._cdp.send("Performance.enable")
+        except Exception as e:
+            self._cdp = None
+            logger.debug("CDP Performance 사용 불가: {}", e)
+        try:
+            self._browser_cdp = page.context.browser.new_browser_cdp_session()
+        except Exception:
+            self._browser_cdp = None
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, p) for p in _IGNORE])
+
+    def _browser_rss(self) -> Dict[str, float]:
+        """프로세스 종류(browser/renderer/gpu...)별 RSS 합계."""
+        by_type: Dict[str, float] = {}
+        if self._browser_cdp is not None:
+            try:
+                info = self._browser_cdp.send("SystemInfo.getProcessInfo")
+                for proc in info.get("processInfo", []):
+                    kind = proc.get("type", "other")
+                    by_type[kind] = by_type.get(kind, 0.0) + rss_mb(int(proc["id"]))
+                if any(by_type.values()):
+                    return by_type
+            except Exception:
+                pass
+        # CDP로 pid를 못 얻으면 자기 하위 프로세스 트리(드라이버/브라우저) 합계
+        total = sum(rss_mb(pid) for pid in descendant_pids(os.getpid()))
+        return {"children": total} if total else {}
+
+    def _cdp_metrics(self) -> Dict[str, float]:
+        if self._cdp is None:
+            return {}
+        try:
+            metrics = {m["name"]: m["value"] for m in self._cdp.send("Performance.getMetrics").get("metrics", [])}
+        except Exception:
+            return {}
+        return {k: metrics[k] for k in CDP_METRICS if k in metrics}
+
+    def maybe_sample(self, **extra: Any) -> Optional[MemorySample]:
+        """페이지 하나 처리할 때마다 호출. every_pages번째마다 기록한다."""
+        self._pages += 1
+        if self._pages % self.every_pages:
+            return None
+        return self.sample(**extra)
+
+    def sample(self, **extra: Any) -> MemorySample:
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        if tracemalloc.is_tracing():
+            self._last = self._snapshot()
+        by_type = self._browser_rss()
+        open_pages = 0
+        if self._page is not None:
+            try:
+                open_pages = len(self._page.context.pages)
+            except Exception:
+                pass
+        s = MemorySample(
+            page=self._pages,
+            t=round(time.monotonic() - self._t0, 1),
+            py_current_mb=round(current / MB, 2),
+            py_peak_mb=round(peak / MB, 2),
+            rss_mb=round(rss_mb(os.getpid()), 1),
+            browser_rss_mb=round(sum(by_type.values()), 1),
+            browser_rss_by_type={k: round(v, 1) for k, v in by_type.items()},
+            open_pages=open_pages,
+            cdp=self._cdp_metrics(),
+            extra=extra,
+        )
+        self.samples.append(s)
+        logger.debug(
+            "[memprof] page={} py={:.1f}MB rss={:.0f}MB browser={:.0f}MB tabs={} js_heap={:.1f}MB",
+            s.page, s.py_current_mb, s.rss_mb, s.browser_rss_mb, s.open_pages, s.cdp.get("JSHeapUsedSize", 0) / MB,
+        )
+        return s
+
+    def top_growth(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """첫 스냅숏 대비 가장 많이 늘어난 할당 위치 (파일:줄)."""
+        if self._first is None or self._last is None:
+            return []
+        stats = self._last.compare_to(self._first, "lineno")
+        out = []
+        for st in stats[: limit or self.top]:
+            if st.size_diff <= 0:
+                break
+            frame = st.traceback[0]
+            out.append({
+                "site": f"{frame.filename}:{frame.lineno}",
+                "size_diff_kb": round(st.size_diff / 1024, 1),
+                "count_diff": st.count_diff,
+                "size_kb": round(st.size / 1024, 1),
+            })
+        return out
+
+    def growth_per_page(self) -> Dict[str, float]:
+        """첫/마지막 샘플 사이 페이지당 증가량 (MB/페이지, 탭/문서 수/페이지)."""
+        if len(self.samples) < 2:
+            return {}
+        a, b = self.samples[0], self.samples[-1]
+        pages = max(1, b.page - a.page)
+        out = {
+            "py_current_mb": (b.py_current_mb - a.py_current_mb) / pages,
+            "rss_mb": (b.rss_mb - a.rss_mb) / pages,
+            "browser_rss_mb": (b.browser_rss_mb - a.browser_rss_mb) / pages,
+            "open_pages": (b.open_pages - a.open_pages) / pages,
+        }
+        for key in ("JSHeapUsedSize", "Documents", "Nodes", "JSEventListeners"):
+            if key in a.cdp and key in b.cdp:
+                scale = MB if key == "JSHeapUsedSize" else 1
+                out[key] = (b.cdp[key] - a.cdp[key]) / scale / pages
+        return {k: round(v, 4) for k, v in out.items()}
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "every_pages": self.every_pages,
+            "samples": [asdict(s) for s in self.samples],
+            "growth_per_page": self.growth_per_page(),
+            "top_growth": self.top_growth(),
+        }
+
+    def format_report(self) -> str:
+        lines = [f"메모리 샘플 {len(self.samples)}개 (페이지 {self.every_pages}개마다)"]
+        for s in self.samples:
+            lines.append(
+                f"  p{s.page:>4} {s.t:>7.0f}s py {s.py_current_mb:7.1f}MB rss {s.rss_mb:6.0f}MB "
+                f"browser {s.browser_rss_mb:6.0f}MB tabs {s.open_pages:>2} docs {s.cdp.get('Documents', 0):>4.0f}"
+            )
+        growth = self.growth_per_page()
+        if growth:
+            lines.append("페이지당 증가: " + ", ".join(f"{k} {v:+.3f}" for k, v in growth.items()))
+        top = self.top_growth()
+        if top:
+            lines.append("할당 증가 상위:")
+            lines += [f"  {t['size_diff_kb']:>9.1f}KB {t['count_diff']:>+7} {t['site']}" for t in top]
+        return "\n".join(lines)
+
+    def export(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), ensure_ascii=False, indent=1), encoding="utf-8")
+        return path
+
+    def stop(self) -> None:
+        """마지막 샘플을 남기고 CDP 세션/추적을 정리한다."""
+        if tracemalloc.is_tracing():
+            self.sample(final=True)
+        for session in (self._cdp, self._browser_cdp):
+            if session is not None:
+                try:
+                    session.detach()
+                except Exception:
+                    pass
+        self._cdp = self._browser_cdp = self._page = None
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
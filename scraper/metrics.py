@@ -0,0 +1,322 @@
+"""수집 지표 레지스트리 (Prometheus 텍스트 형식).
+
+몇 시간씩 무인으로 도는 수집을 로그 파일 없이도 지켜볼 수 있게 카운터·게이지·히스토그램을 모은다.
+- render(): Prometheus 텍스트 노출 형식 (0.0.4)
+- serve_metrics(port): 127.0.0.1:<port>/metrics 로 노출 (선택)
+- dump(path): 실행 종료 시 파일로 저장 (.json이면 JSON, 아니면 텍스트 형식)
+
+계측 지점은 record_* 함수만 부르면 된다. 외부 라이브러리 없이 표준 라이브러리만 쓴다.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelKey = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 8.0, 13.0, 21.0, 34.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _num(v: float) -> str:
+    v = float(v)
+    return str(int(v)) if v.is_integer() else repr(v)
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelKey:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 라벨 {self.labelnames} 필요, 받은 값 {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [(self.name, _labels(self.labelnames, k), v) for k, v in items]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._fn: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def set_function(self, fn: Optional[Callable[[], float]]) -> None:
+        """라벨 없는 게이지 값을 읽을 때마다 fn()으로 계산."""
+        self._fn = fn
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        if self._fn is not None:
+            try:
+                return [(self.name, "", float(self._fn()))]
+            except Exception:
+                return []
+        return super().samples()
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨별 [버킷별 개수..., 합계, 개수]
+        self._data: Dict[LabelKey, List[float]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            row = self._data.setdefault(key, [0.0] * (len(self.buckets) + 2))
+            if i < len(self.buckets):
+                row[i] += 1
+            row[-2] += value
+            row[-1] += 1
+
+    def count(self, **labels: Any) -> int:
+        with self._lock:
+            row = self._data.get(self._key(labels))
+            return int(row[-1]) if row else 0
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        out: List[Tuple[str, str, float]] = []
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._data.items())
+        for key, row in items:
+            cumulative = 0.0
+            for bound, n in zip(self.buckets, row):
+                cumulative += n
+                out.append((self.name + "_bucket", _labels(self.labelnames, key, f'le="{_num(bound)}"'), cumulative))
+            out.append((self.name + "_bucket", _labels(self.labelnames, key, 'le="+Inf"'), row[-1]))
+            out.append((self.name + "_sum", _labels(self.labelnames, key), row[-2]))
+            out.append((self.name + "_count", _labels(self.labelnames, key), row[-1]))
+        return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls: type, name: str, help: str, labelnames: Sequence[str], **kw: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, labelnames, **kw)
+            elif type(metric) is not cls:
+                raise ValueError(f"{name}은(는) 이미 {metric.kind}로 등록됨")
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get(Gauge, name, help, labelnames)
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for m in metrics:
+            lines.extend(m.header())
+            lines.extend(f"{name}{labels} {_num(value)}" for name, labels, value in m.samples())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """{이름{라벨}: 값} 평면 사전 (JSON 덤프/로그용)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {f"{name}{labels}": value for m in metrics for name, labels, value in m.samples()}
+
+    def dump(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".json":
+            path.write_text(json.dumps(self.snapshot(), ensure_ascii=False, indent=1), encoding="utf-8")
+        else:
+            path.write_text(self.render(), encoding="utf-8")
+        return path
+
+    def reset(self) -> None:
+        """카운터/히스토그램 값만 비운다 (게이지와 등록 정보는 유지)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for m in metrics:
+            if m.kind != "gauge":
+                m.reset()  # type: ignore[attr-defined]
+
+
+class _RateWindow:
+    """최근 window_s 동안의 사건 수 → 분당 비율."""
+
+    def __init__(self, window_s: float = 300.0) -> None:
+        self.window_s = window_s
+        self._times: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def mark(self) -> None:
+        with self._lock:
+            self._times.append(time.monotonic())
+
+    def per_minute(self) -> float:
+        now = time.monotonic()
+        with self._lock:
+            while self._times and now - self._times[0] > self.window_s:
+                self._times.popleft()
+            n = len(self._times)
+        return n * 60.0 / self.window_s
+
+
+REGISTRY = MetricsRegistry()
+
+ITEMS = REGISTRY.counter("dabang_items_collected_total", "수집 완료한 매물 수")
+PAGES = REGISTRY.counter("dabang_pages_total", "처리한 목록 페이지 수")
+PAGES_PER_MINUTE = REGISTRY.gauge("dabang_pages_per_minute", "최근 5분 목록 페이지 처리율")
+DETAIL_SECONDS = REGISTRY.histogram("dabang_detail_seconds", "상세 방문 1건 소요(초)")
+RETRIES = REGISTRY.counter("dabang_retries_total", "작업 종류별 재시도 횟수", ("op",))
+CIRCUIT_OPEN = REGISTRY.counter("dabang_circuit_open_total", "회로 차단으로 수집이 멈춘 횟수", ("op",))
+BLOCKS = REGISTRY.counter("dabang_blocks_detected_total", "CAPTCHA/차단 감지 횟수", ("engine",))
+SELECTOR_FALLBACKS = REGISTRY.counter(
+    "dabang_selector_fallbacks_total", "첫 후보가 아닌 셀렉터를 쓰거나(fallback) 모두 실패(miss)한 횟수", ("group", "outcome")
+)
+START_TIME = REGISTRY.gauge("dabang_start_time_seconds", "프로세스 시작 시각 (unix epoch)")
+START_TIME.set(time.time())
+
+_page_rate = _RateWindow()
+PAGES_PER_MINUTE.set_function(_page_rate.per_minute)
+
+
+def record_item(n: int = 1) -> None:
+    ITEMS.inc(n)
+
+
+def record_page() -> None:
+    PAGES.inc()
+    _page_rate.mark()
+
+
+def record_detail(seconds: float) -> None:
+    DETAIL_SECONDS.observe(seconds)
+
+
+def record_retry(op: str) -> None:
+    RETRIES.inc(op=op)
+
+
+def record_circuit_open(op: str) -> None:
+    CIRCUIT_OPEN.inc(op=op)
+
+
+def record_block(engine: str) -> None:
+    BLOCKS.inc(engine=engine)
+
+
+_GROUP_NAMES: Dict[int, str] = {}
+
+
+def name_selector_groups(namespace: Any) -> None:
+    """모듈의 대문자 셀렉터 목록 변수(CARD_PRICE 등) 이름을 그룹 이름으로 등록."""
+    for name, value in vars(namespace).items():
+        if name.isupper() and isinstance(value, list) and value and all(isinstance(v, str) for v in value):
+            _GROUP_NAMES[id(value)] = name.lower()
+
+
+def selector_group(selectors: Sequence[str]) -> str:
+    """등록된 목록이면 변수 이름, 아니면 첫 후보 셀렉터(40자)."""
+    name = _GROUP_NAMES.get(id(selectors))
+    if name:
+        return name
+    return selectors[0][:40] if selectors else "?"
+
+
+def record_selector(group: str, index: Optional[int]) -> None:
+    """후보 목록에서 index번째가 맞았음을 기록 (None이면 모두 실패). 0번째는 기록하지 않는다."""
+    if index == 0:
+        return
+    SELECTOR_FALLBACKS.inc(group=group, outcome="miss" if index is None else "fallback")
+
+
+def serve_metrics(port: int, host: str = "127.0.0.1", registry: MetricsRegistry = REGISTRY) -> ThreadingHTTPServer:
+    """백그라운드 스레드에서 /metrics를 노출. 끝낼 때 server.shutdown()."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
@@ -0,0 +1,181 @@
+"""적응형 요청 간격 제어 (AIMD).
+
+고정 범위 난수 대기(0.8~2.4초) 대신 사이트 상태에 따라 간격을 조절한다.
+- 정상 응답이 이어지면 간격을 조금씩 줄인다 (요청률 가산 증가).
+- 응답 지연이 목표를 넘거나 429/5xx, 차단 감지가 오면 간격을 배수로 늘린다 (요청률 배수 감소).
+  배수 감소는 쿨다운 창마다 한 번만 적용하고, 창 안에서는 가속도 하지 않는다.
+  Retry-After가 있으면 그 시각까지는 다음 요청을 내보내지 않는다.
+
+간격은 "다음 요청 가능 시각" 하나로 관리하므로 같은 페이서를 쓰는 모든 작업 스레드가
+하나의 요청 예산을 나눠 쓴다(shared_pacer). 한동안 요청이 없었다면 바로 진행한다.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Optional
+
+# 응답 지연 EWMA 가중치
+_ALPHA = 0.3
+
+
+@dataclass(frozen=True)
+class PacerSnapshot:
+    delay: float
+    latency: Optional[float]
+    backoffs: int
+    requests: int
+
+    def format(self) -> str:
+        lat = f"{self.latency:.2f}s" if self.latency is not None else "-"
+        return f"간격 {self.delay:.2f}s · 응답 {lat} · 감속 {self.backoffs}회"
+
+
+class AdaptivePacer:
+    def __init__(
+        self,
+        min_delay: float = 0.3,
+        max_delay: float = 30.0,
+        initial_delay: float = 1.0,
+        step: float = 0.05,
+        backoff: float = 2.0,
+        block_backoff: float = 4.0,
+        latency_target: float = 2.5,
+        jitter: float = 0.25,
+        cooldown: float = 10.0,
+    ) -> None:
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.step = step
+        self.backoff = backoff
+        self.block_backoff = block_backoff
+        self.latency_target = latency_target
+        self.jitter = jitter
+        # 감속 후 이 시간(초) 동안은 다시 가속하지 않는다 (진동 방지)
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._delay = min(max(initial_delay, min_delay), max_delay)
+        self._next = 0.0
+        self._hold_until = 0.0
+        self._latency: Optional[float] = None
+        self._backoffs = 0
+        self._requests = 0
+
+    @property
+    def delay(self) -> float:
+        return self._delay
+
+    # ---- 대기 ----
+    def reserve(self) -> float:
+        """다음 요청 슬롯을 예약하고 그때까지 기다려야 할 초를 돌려준다."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+            self._requests += 1
+            return start - now
+
+    def pace(self, control: Any = None) -> float:
+        """슬롯까지 대기. control(CrawlControl)이 있으면 정지 요청에 바로 깨어난다."""
+        wait = self.reserve()
+        if wait > 0:
+            if control is not None:
+                control.sleep(wait)
+            else:
+                time.sleep(wait)
+        return wait
+
+    # ---- 신호 ----
+    def _slow_down_locked(self, factor: float, now: float) -> None:
+        # 쿨다운 창마다 배수 감소는 한 번만 (XHR이 많은 느린 페이지 하나가 1.25ⁿ로 max_delay까지 밀지 않도록)
+        if now < self._hold_until:
+            return
+        self._delay = min(self.max_delay, max(self._delay * factor, self.min_delay * factor))
+        self._hold_until = now + self.cooldown
+        self._next = max(self._next, now + self._delay)
+        self._backoffs += 1
+
+    def record(
+        self,
+        latency: Optional[float] = None,
+        status: Optional[int] = None,
+        blocked: bool = False,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """응답/차단 신호 반영. latency는 초, status는 HTTP 상태 코드."""
+        with self._lock:
+            now = time.monotonic()
+            if retry_after:
+                self._next = max(self._next, now + retry_after)
+            if blocked:
+                self._slow_down_locked(self.block_backoff, now)
+                return
+            if status is not None and (status == 429 or status >= 500):
+                self._slow_down_locked(self.backoff, now)
+                return
+            if latency is not None:
+                self._latency = latency if self._latency is None else _ALPHA * latency + (1 - _ALPHA) * self._latency
+                if self._latency > self.latency_target:
+                    self._slow_down_locked(1 + (self.backoff - 1) / 2, now)
+                    return
+            if now >= self._hold_until:
+                self._delay = max(self.min_delay, self._delay - self.step)
+
+    def snapshot(self) -> PacerSnapshot:
+        with self._lock:
+            return PacerSnapshot(self._delay, self._latency, self._backoffs, self._requests)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 단위만 지원)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def playwright_response_hook(pacer: AdaptivePacer, host: str = "dabangapp.com") -> Callable[[Any], None]:
+    """page.on("response", ...)에 거는 콜백. 대상 호스트의 문서/XHR 응답만 반영한다."""
+
+    def on_response(response: Any) -> None:
+        try:
+            request = response.request
+            if request.resource_type not in ("document", "xhr", "fetch") or host not in response.url:
+                return
+            timing: Mapping[str, float] = request.timing or {}
+            start, first = timing.get("requestStart", -1), timing.get("responseStart", -1)
+            latency = (first - start) / 1000 if start >= 0 and first >= start else None
+            headers = response.headers or {}
+            pacer.record(
+                latency=latency,
+                status=response.status,
+                retry_after=parse_retry_after(headers.get("retry-after")),
+            )
+        except Exception:
+            pass
+
+    return on_response
+
+
+_shared: Optional[AdaptivePacer] = None
+_shared_lock = threading.Lock()
+
+
+def shared_pacer(**kwargs: Any) -> AdaptivePacer:
+    """프로세스 공용 페이서. kwargs는 처음 만들 때만 적용된다."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = AdaptivePacer(**kwargs)
+        return _shared
+
+
+def reset_shared_pacer() -> None:
+    global _shared
+    with _shared_lock:
+        _shared = None
@@ -75,6 +75,33 @@ def extract_floor(text: str) -> Optional[str]:
     return m.group(1) if m else None
 
 
+# 가격 텍스트 → 원 단위 금액 (정렬/필터용)
+# 예: "월세 500/45" → 450000 (월세), "전세 1억 2000" → 120000000, "매매 3억" → 300000000
+MANWON_AMOUNT_RE = re.compile(r"(?:(\d+(?:\.\d+)?)\s*억)?\s*(\d[\d,]*)?")
+
+
+def _manwon_to_won(part: str) -> Optional[int]:
+    m = MANWON_AMOUNT_RE.search((part or "").strip())
+    if not m or not (m.group(1) or m.group(2)):
+        return None
+    eok = float(m.group(1)) if m.group(1) else 0.0
+    man = int(m.group(2).replace(",", "")) if m.group(2) else 0
+    return int(eok * 100_000_000) + man * 10_000
+
+
+def price_to_won(text: str) -> Optional[int]:
+    """다방 가격 문자열의 대표 금액(원). 월세는 월 임대료, 그 외는 총액.
+
+    숫자가 없으면 None.
+    """
+    s = re.sub(r"(월세|전세|매매|단기)", "", (text or "")).replace("만원", "").replace("만", "").strip()
+    if not s:
+        return None
+    if "/" in s:
+        return _manwon_to_won(s.split("/", 1)[1])
+    return _manwon_to_won(s)
+
+
 # 주소/지번/행정주소 추출(지번/도로명 우선, 실패 시 행정주소 허용)
 LOT_ADDR_RE = re.compile(r"([가-힣]+(?:동|읍|면|리)\s*\d+(?:-\d+)?)")
 ROAD_ADDR_RE = re.compile(r"([가-힣]+(?:로|길)\s*\d+(?:-\d+)?)")
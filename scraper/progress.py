@@ -0,0 +1,228 @@
+"""크롤링 진행 상황 모델.
+
+스크래퍼가 단계(phase)·아이템·페이지·상세 방문 지연을 기록하고,
+GUI/CLI는 snapshot()으로 처리량과 ETA를 읽어 표시한다. 모든 메서드는 스레드 안전.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Iterator, Optional
+
+from scraper import metrics
+
+
+PHASES = ("navigate", "search", "list", "detail", "export")
+
+PHASE_LABELS = {
+    "idle": "대기",
+    "navigate": "페이지 이동",
+    "search": "지역 검색",
+    "list": "목록 수집",
+    "detail": "상세 방문",
+    "export": "저장",
+    "done": "완료",
+}
+
+# 이 시간(초) 동안 아이템/페이지 진척이 없으면 정체로 간주
+STALL_SECONDS = 90.0
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    if seconds is None or math.isinf(seconds) or seconds < 0:
+        return "--:--"
+    seconds = int(round(seconds))
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
+
+
+@dataclass
+class ProgressSnapshot:
+    phase: str
+    label: str
+    items: int
+    target: int
+    pages_done: int
+    pages_estimated: int
+    items_per_min: float
+    detail_latency_s: Optional[float]
+    elapsed_s: float
+    idle_s: float
+    eta_s: Optional[float]
+    phase_times: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def fraction(self) -> Optional[float]:
+        if self.target <= 0:
+            return None
+        return min(1.0, self.items / self.target)
+
+    @property
+    def stalled(self) -> bool:
+        return self.phase not in ("idle", "done") and self.idle_s >= STALL_SECONDS
+
+    def format(self) -> str:
+        """한 줄 요약 (상태바/CLI 출력용)."""
+        phase = PHASE_LABELS.get(self.phase, self.phase)
+        if self.label:
+            phase = f"{self.label} · {phase}"
+        count = f"{self.items}/{self.target}건" if self.target else f"{self.items}건"
+        pages = f"{self.pages_done}/{self.pages_estimated or '?'}p"
+        parts = [phase, count, pages, f"{self.items_per_min:.1f}건/분"]
+        if self.detail_latency_s is not None:
+            parts.append(f"상세 {self.detail_latency_s:.1f}s")
+        parts.append(f"ETA {format_duration(self.eta_s)}")
+        if self.stalled:
+            parts.append(f"⚠ {int(self.idle_s)}초간 진척 없음")
+        return " | ".join(parts)
+
+
+class ProgressTracker:
+    """스크래퍼가 기록하고 UI가 읽는 진행 상황 저장소."""
+
+    def __init__(self, target: int = 0, window_s: float = 300.0, on_update: Optional[Callable[[ProgressSnapshot], None]] = None) -> None:
+        self._lock = threading.Lock()
+        self.window_s = window_s
+        self.on_update = on_update
+        self._target = max(0, target)
+        self._items = 0
+        self._pages_done = 0
+        self._pages_estimated = 0
+        self._item_times: Deque[float] = deque()
+        self._detail_ewma: Optional[float] = None
+        self._phase = "idle"
+        self._label = ""
+        self._phase_started = time.monotonic()
+        self._phase_times: Dict[str, float] = {}
+        self._started = time.monotonic()
+        self._last_progress = self._started
+
+    # ---- 기록 (스크래퍼 측) ----
+    def set_target(self, target: int) -> None:
+        with self._lock:
+            self._target = max(0, target)
+        self._notify()
+
+    def add_target(self, n: int) -> None:
+        with self._lock:
+            self._target += max(0, n)
+        self._notify()
+
+    def set_label(self, label: str) -> None:
+        with self._lock:
+            self._label = label
+
+    def set_phase(self, phase: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if phase == self._phase:
+                return
+            self._phase_times[self._phase] = self._phase_times.get(self._phase, 0.0) + (now - self._phase_started)
+            self._phase, self._phase_started = phase, now
+            if phase not in ("done", "idle"):
+                self._last_progress = now
+        self._notify()
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """with 블록 동안 phase로 전환했다가 이전 단계로 복귀."""
+        prev = self._phase
+        self.set_phase(phase)
+        try:
+            yield
+        finally:
+            self.set_phase(prev)
+
+    def item_done(self, n: int = 1) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._items += n
+            for _ in range(n):
+                self._item_times.append(now)
+            self._last_progress = now
+        metrics.record_item(n)
+        self._notify()
+
+    def item_skipped(self, n: int = 1) -> None:
+        """목표에 넣었지만 결과가 되지 못한 건(파싱 실패 등). 처리량에 세지 않고 목표에서 뺀다."""
+        with self._lock:
+            self._target = max(self._items, self._target - max(0, n))
+            self._last_progress = time.monotonic()
+        self._notify()
+
+    def page_done(self) -> None:
+        with self._lock:
+            self._pages_done += 1
+            self._last_progress = time.monotonic()
+        metrics.record_page()
+        self._notify()
+
+    def set_pages_estimated(self, n: int) -> None:
+        with self._lock:
+            self._pages_estimated = max(n, self._pages_done)
+
+    def detail_latency(self, seconds: float, alpha: float = 0.3) -> None:
+        metrics.record_detail(seconds)
+        with self._lock:
+            prev = self._detail_ewma
+            self._detail_ewma = seconds if prev is None else (alpha * seconds + (1 - alpha) * prev)
+
+    # ---- 조회 (UI 측) ----
+    def snapshot(self) -> ProgressSnapshot:
+        now = time.monotonic()
+        with self._lock:
+            while self._item_times and now - self._item_times[0] > self.window_s:
+                self._item_times.popleft()
+            elapsed = now - self._started
+            # 최근 window 내 처리량, 시작 직후에는 전체 경과 기준
+            span = min(self.window_s, elapsed)
+            recent = len(self._item_times)
+            rate = (recent / span * 60.0) if span > 0 and recent else 0.0
+            remaining = max(0, self._target - self._items) if self._target else None
+            if remaining == 0:
+                eta: Optional[float] = 0.0
+            elif remaining and rate > 0:
+                eta = remaining / rate * 60.0
+            else:
+                eta = None
+            times = dict(self._phase_times)
+            times[self._phase] = times.get(self._phase, 0.0) + (now - self._phase_started)
+            return ProgressSnapshot(
+                phase=self._phase,
+                label=self._label,
+                items=self._items,
+                target=self._target,
+                pages_done=self._pages_done,
+                pages_estimated=self._pages_estimated,
+                items_per_min=rate,
+                detail_latency_s=self._detail_ewma,
+                elapsed_s=elapsed,
+                idle_s=now - self._last_progress,
+                eta_s=eta,
+                phase_times={k: v for k, v in times.items() if k in PHASES},
+            )
+
+    def _notify(self) -> None:
+        if self.on_update:
+            try:
+                self.on_update(self.snapshot())
+            except Exception:
+                pass
+
+
+def start_reporter(tracker: ProgressTracker, emit: Callable[[str], None], interval: float = 10.0) -> threading.Event:
+    """interval 초마다 진행 요약을 emit으로 출력하는 백그라운드 스레드. 반환된 Event를 set하면 종료."""
+    stop = threading.Event()
+
+    def loop() -> None:
+        while not stop.wait(interval):
+            emit(tracker.snapshot().format())
+
+    threading.Thread(target=loop, name="progress-reporter", daemon=True).start()
+    return stop
@@ -0,0 +1,253 @@
+"""재시도 정책: 지수 백오프 + full jitter, 실행 단위 재시도 예산, 작업 종류별 회로 차단기.
+
+호출부마다 따로 재시도하면 사이트 전체 장애 때 모든 카드가 각자 재시도하며 시간을 버린다.
+- 재시도 예산: 실행 중 시도 수 대비 재시도 비율을 제한한다 (최소 보장치 포함).
+- 회로 차단기: 작업 종류(navigation/search/detail 등)별로 연속 실패가 쌓이면 열리고,
+  열려 있는 동안 같은 Retrier를 쓰는 모든 작업자가 대기한다 → 수집 전체가 잠시 멈춘다.
+  reset_timeout 뒤 한 번만 시험 호출을 허용하고, 성공하면 닫는다.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type, TypeVar
+
+from loguru import logger
+
+from scraper import metrics
+from scraper.control import CrawlStopped
+
+T = TypeVar("T")
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """attempt번째 재시도 대기(초): 0 ~ min(cap, base * 2^attempt) 균등 난수 (full jitter)."""
+    return random.uniform(0.0, min(cap, base * (2 ** max(0, attempt))))
+
+
+class RetryBudget:
+    """재시도 수를 min_retries + ratio * 시도 수 이하로 제한."""
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10) -> None:
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.retries = 0
+
+    def record_call(self) -> None:
+        with self._lock:
+            self.calls += 1
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.retries < self.min_retries + self.ratio * self.calls:
+                self.retries += 1
+                return True
+            return False
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.retries = 0
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state_locked(time.monotonic())
+
+    def _state_locked(self, now: float) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if now - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def acquire(self) -> Optional[float]:
+        """호출해도 되면 None, 아니면 다시 확인할 때까지 기다릴 초."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._state_locked(now)
+            if state == self.CLOSED:
+                return None
+            if state == self.HALF_OPEN and not self._trial:
+                self._trial = True
+                return None
+            if state == self.HALF_OPEN:
+                return 0.5
+            return self._opened_at + self.reset_timeout - now  # type: ignore[operator]
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial = False
+
+    def release(self) -> None:
+        """결과 없이 끝난 시험 호출(정지 등)을 반납."""
+        with self._lock:
+            self._trial = False
+
+
+class Retrier:
+    def __init__(
+        self,
+        tries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        budget_ratio: float = 0.2,
+        budget_min: int = 10,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ) -> None:
+        self.tries = tries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.budget = RetryBudget(budget_ratio, budget_min)
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def new_run(self) -> None:
+        """실행 시작 시 호출: 재시도 예산을 새로 채운다 (차단기 상태는 유지)."""
+        self.budget.reset()
+
+    def breaker(self, op: str) -> CircuitBreaker:
+        with self._lock:
+            br = self._breakers.get(op)
+            if br is None:
+                br = self._breakers[op] = CircuitBreaker(op, self.failure_threshold, self.reset_timeout)
+            return br
+
+    def wait_for_breaker(self, op: str, control: Any = None) -> bool:
+        """op 차단기가 열려 있으면 닫히거나 시험 호출 차례가 올 때까지 대기. 정지되면 False."""
+        br = self.breaker(op)
+        announced = False
+        while True:
+            wait = br.acquire()
+            if wait is None:
+                if announced:
+                    logger.info("회로 차단 해제 시도: {}", op)
+                return True
+            if not announced:
+                logger.warning("회로 차단({}): 연속 실패로 {:.0f}초간 수집을 멈춥니다", op, wait)
+                metrics.record_circuit_open(op)
+                announced = True
+            step = min(wait, 1.0)
+            if control is not None:
+                if not control.sleep(step):
+                    return False
+            else:
+                time.sleep(step)
+
+    def _sleep(self, seconds: float, control: Any) -> bool:
+        if control is not None:
+            return control.sleep(seconds)
+        time.sleep(seconds)
+        return True
+
+    def call(
+        self,
+        op: str,
+        fn: Callable[..., T],
+        *args: Any,
+        tries: Optional[int] = None,
+        control: Any = None,
+        retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+        **kwargs: Any,
+    ) -> T:
+        """fn을 op 종류로 호출. 실패 시 백오프 후 재시도 (횟수/예산/차단기 제한)."""
+        tries = tries or self.tries
+        br = self.breaker(op)
+        attempt = 0
+        while True:
+            if not self.wait_for_breaker(op, control):
+                raise CrawlStopped("stopped while circuit open")
+            self.budget.record_call()
+            try:
+                result = fn(*args, **kwargs)
+            except CrawlStopped:
+                br.release()
+                raise
+            except retry_on as e:
+                br.record_failure()
+                attempt += 1
+                if attempt >= tries:
+                    logger.error("재시도 초과({}): {} ({}회)", op, e, attempt)
+                    raise
+                if not self.budget.try_spend():
+                    logger.error("재시도 예산 소진({}): {}", op, e)
+                    raise
+                metrics.record_retry(op)
+                delay = backoff_delay(attempt, self.base_delay, self.max_delay)
+                logger.warning("오류 발생({}), 재시도 {}회/{}회 후 {:.2f}s 대기: {}", op, attempt, tries, delay, e)
+                if not self._sleep(delay, control):
+                    raise CrawlStopped("stopped during backoff") from e
+                continue
+            except BaseException:
+                br.release()
+                raise
+            br.record_success()
+            return result
+
+    @contextlib.contextmanager
+    def guard(self, op: str, control: Any = None) -> Iterator[None]:
+        """재시도 없이 한 번 실행하되 차단기 대기/성공·실패 기록만 한다."""
+        if not self.wait_for_breaker(op, control):
+            raise CrawlStopped("stopped while circuit open")
+        br = self.breaker(op)
+        self.budget.record_call()
+        try:
+            yield
+        except CrawlStopped:
+            br.release()
+            raise
+        except Exception:
+            br.record_failure()
+            raise
+        br.record_success()
+
+
+_shared: Optional[Retrier] = None
+_shared_lock = threading.Lock()
+
+
+def shared_retrier(**kwargs: Any) -> Retrier:
+    """프로세스 공용 Retrier. kwargs는 처음 만들 때만 적용된다."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = Retrier(**kwargs)
+        return _shared
+
+
+def reset_shared_retrier() -> None:
+    global _shared
+    with _shared_lock:
+        _shared = None
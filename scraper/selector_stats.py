@@ -0,0 +1,149 @@
+"""셀렉터 후보별 시도/적중/소요 시간 집계.
+
+first_locator_sync 등 후보 목록을 차례로 시도하는 곳에서 record()를 부르고,
+실행이 끝나면 flush(path)로 기존 파일(logs/selector_stats.json)에 더해 저장한다
+(이번 실행에 기록이 하나도 없으면 파일을 건드리지 않는다).
+여러 실행에 걸쳐 쌓인 값으로 tools/selector_report.py가 적중당 비용 순위와
+한 번도 맞지 않은 후보를 보여 준다.
+
+파일 형식:
+    {"version": 1, "runs": 3, "updated": "...",
+     "groups": {"card_price": {"span.price": {"attempts": 10, "hits": 9, "seconds": 0.8,
+                                              "errors": 0, "last_hit": "2025-..."}}}}
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+VERSION = 1
+
+Key = Tuple[str, str]
+
+
+def _empty() -> Dict[str, Any]:
+    return {"attempts": 0, "hits": 0, "seconds": 0.0, "errors": 0, "last_hit": None}
+
+
+class SelectorStats:
+    # 같은 파일에 여러 스레드가 flush해도 읽기-더하기-쓰기가 겹치지 않게
+    _file_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self._stats: Dict[Key, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, group: str, selector: str, hit: bool, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            st = self._stats.get((group, selector))
+            if st is None:
+                st = self._stats[(group, selector)] = _empty()
+            st["attempts"] += 1
+            st["seconds"] += seconds
+            if hit:
+                st["hits"] += 1
+                st["last_hit"] = datetime.now().isoformat(timespec="seconds")
+            if error:
+                st["errors"] += 1
+
+    def get(self, group: str, selector: str) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats.get((group, selector)) or _empty())
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def drain(self) -> Dict[Key, Dict[str, Any]]:
+        """지금까지 값을 꺼내고 비운다."""
+        with self._lock:
+            stats, self._stats = self._stats, {}
+        return stats
+
+    def flush(self, path: Path) -> Optional[Path]:
+        """기존 파일에 이번 값을 더해 저장 (한 번 flush한 값은 다시 더하지 않는다).
+
+        기록이 없으면 쓰지 않고 None (runs도 늘리지 않는다).
+        """
+        stats = self.drain()
+        if not stats:
+            return None
+        path = Path(path)
+        with self._file_lock:
+            return self._merge_into(path, stats)
+
+    def _merge_into(self, path: Path, stats: Dict[Key, Dict[str, Any]]) -> Path:
+        data = load(path)
+        for (group, selector), st in stats.items():
+            cur = data["groups"].setdefault(group, {}).setdefault(selector, _empty())
+            cur["attempts"] += st["attempts"]
+            cur["hits"] += st["hits"]
+            cur["seconds"] = round(cur["seconds"] + st["seconds"], 4)
+            cur["errors"] += st["errors"]
+            if st["last_hit"]:
+                cur["last_hit"] = st["last_hit"]
+        data["runs"] += 1
+        data["updated"] = datetime.now().isoformat(timespec="seconds")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp, path)
+        return path
+
+
+def load(path: Path) -> Dict[str, Any]:
+    """저장 파일 읽기. 없거나 깨졌으면 빈 구조."""
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if data.get("version") == VERSION and isinstance(data.get("groups"), dict):
+            return data
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"version": VERSION, "runs": 0, "updated": None, "groups": {}}
+
+
+def rank(data: Dict[str, Any], min_attempts: int = 5) -> List[Dict[str, Any]]:
+    """후보별 행 목록: 적중당 비용(초)이 큰 순. dead = min_attempts번 이상 시도했는데 적중 0."""
+    rows: List[Dict[str, Any]] = []
+    for group, selectors in data.get("groups", {}).items():
+        for selector, st in selectors.items():
+            attempts, hits, seconds = st.get("attempts", 0), st.get("hits", 0), st.get("seconds", 0.0)
+            rows.append({
+                "group": group,
+                "selector": selector,
+                "attempts": attempts,
+                "hits": hits,
+                "hit_rate": hits / attempts if attempts else 0.0,
+                "seconds": seconds,
+                "ms_per_attempt": seconds * 1000 / attempts if attempts else 0.0,
+                "cost_per_hit": seconds / hits if hits else math.inf,
+                "errors": st.get("errors", 0),
+                "last_hit": st.get("last_hit"),
+                "dead": hits == 0 and attempts >= min_attempts,
+            })
+    rows.sort(key=lambda r: (-r["cost_per_hit"], -r["seconds"]))
+    return rows
+
+
+_shared: Optional[SelectorStats] = None
+_shared_lock = threading.Lock()
+
+
+def shared_selector_stats() -> SelectorStats:
+    """프로세스 공용 집계 (동시에 도는 수집 스레드가 함께 기록)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = SelectorStats()
+        return _shared
+
+
+def reset_shared_selector_stats() -> None:
+    global _shared
+    with _shared_lock:
+        _shared = None
@@ -0,0 +1,24 @@
+"""다방 사이트 주소.
+
+DABANG_BASE_URL 환경변수로 바꾸면(예: 로컬 fixture 사이트) 모든 엔진이 그 주소로 접속한다.
+"""
+
+from __future__ import annotations
+
+import os
+from urllib.parse import urljoin, urlparse
+
+DEFAULT_BASE_URL = "https://www.dabangapp.com"
+
+
+def base_url() -> str:
+    return (os.getenv("DABANG_BASE_URL") or DEFAULT_BASE_URL).rstrip("/")
+
+
+def site_url(path: str = "/") -> str:
+    """사이트 기준 절대 URL. 이미 절대 URL이면 그대로 돌려준다."""
+    return urljoin(base_url() + "/", path or "/")
+
+
+def site_host() -> str:
+    return urlparse(base_url()).netloc
@@ -0,0 +1,178 @@
+"""가벼운 구간(span) 추적과 Chrome trace-event JSON 내보내기.
+
+수집 단계(goto, 지역 검색, 목록 패널, 컨테이너 탐색, 카드, 상세, 뒤로 가기, 페이지 이동, 저장)를
+span으로 감싸 시작 시각과 길이를 기록한다. 같은 스레드의 span은 시간이 겹치는 만큼 중첩되어
+보이므로 매물 종류 span 안에 카드 → 상세 span이 쌓인다.
+
+export()로 쓴 파일은 chrome://tracing 이나 ui.perfetto.dev 에서 열 수 있다.
+기본 추적기는 꺼져 있어 span()은 아무것도 기록하지 않는다 (set_tracer(Tracer())로 켠다).
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Span:
+    """시작된 구간. end()를 여러 번 불러도 한 번만 기록된다."""
+
+    __slots__ = ("_tracer", "name", "cat", "args", "start", "tid", "_done")
+
+    def __init__(self, tracer: "Tracer", name: str, cat: str, args: Dict[str, Any]) -> None:
+        self._tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = time.perf_counter()
+        self.tid = threading.get_ident()
+        self._done = False
+
+    def end(self, **args: Any) -> None:
+        if self._done:
+            return
+        self._done = True
+        if args:
+            self.args.update(args)
+        self._tracer._record(self, time.perf_counter())
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.end()
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def end(self, **args: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class Tracer:
+    def __init__(self, enabled: bool = True, max_events: int = 200_000) -> None:
+        self.enabled = enabled
+        self.max_events = max_events
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._events: List[Dict[str, Any]] = []
+        self._threads: Dict[int, str] = {}
+        self.dropped = 0
+
+    def span(self, name: str, cat: str = "crawl", **args: Any) -> Any:
+        """with 문 또는 .end()로 닫는 구간. 꺼져 있으면 비용 없는 빈 객체."""
+        if not self.enabled:
+            return _NOOP
+        return Span(self, name, cat, args)
+
+    def instant(self, name: str, cat: str = "crawl", **args: Any) -> None:
+        if not self.enabled:
+            return
+        self._append({"name": name, "cat": cat, "ph": "i", "s": "t", "ts": self._us(time.perf_counter()), "args": args})
+
+    def _us(self, t: float) -> float:
+        return round((t - self._origin) * 1_000_000, 1)
+
+    def _record(self, span: Span, end: float) -> None:
+        self._append({
+            "name": span.name,
+            "cat": span.cat,
+            "ph": "X",
+            "ts": self._us(span.start),
+            "dur": round((end - span.start) * 1_000_000, 1),
+            "tid": span.tid,
+            "args": span.args,
+        })
+
+    def _append(self, event: Dict[str, Any]) -> None:
+        tid = event.setdefault("tid", threading.get_ident())
+        with self._lock:
+            if len(self._events) >= self.max_events:
+                self.dropped += 1
+                return
+            self._events.append(event)
+            if tid not in self._threads:
+                self._threads[tid] = threading.current_thread().name
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Chrome trace-event 형식 이벤트 목록 (스레드 이름 메타데이터 포함)."""
+        pid = os.getpid()
+        with self._lock:
+            events = [dict(e, pid=pid) for e in self._events]
+            threads = dict(self._threads)
+        meta = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "dabang-crawler"}}]
+        meta += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}} for tid, name in threads.items()]
+        return meta + events
+
+    def export(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"traceEvents": self.events(), "displayTimeUnit": "ms"}
+        path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        return path
+
+    def summary(self) -> Dict[str, Tuple[int, float]]:
+        """span 이름별 (횟수, 총 초)."""
+        out: Dict[str, Tuple[int, float]] = {}
+        with self._lock:
+            for e in self._events:
+                if e.get("ph") != "X":
+                    continue
+                n, total = out.get(e["name"], (0, 0.0))
+                out[e["name"]] = (n + 1, total + e["dur"] / 1_000_000)
+        return out
+
+    def format_summary(self, top: int = 10) -> str:
+        rows = sorted(self.summary().items(), key=lambda kv: -kv[1][1])[:top]
+        return " · ".join(f"{name} {n}회 {total:.1f}s(평균 {total / n:.2f}s)" for name, (n, total) in rows)
+
+
+_current = Tracer(enabled=False)
+
+
+def get_tracer() -> Tracer:
+    return _current
+
+
+def set_tracer(tracer: Optional[Tracer]) -> Tracer:
+    """현재 추적기를 바꾸고 이전 것을 돌려준다. None이면 끈다."""
+    global _current
+    prev, _current = _current, tracer or Tracer(enabled=False)
+    return prev
+
+
+def span(name: str, cat: str = "crawl", **args: Any) -> Any:
+    return _current.span(name, cat, **args)
+
+
+def traced(name: str, cat: str = "crawl") -> Callable[[F], F]:
+    """함수 호출 전체를 span으로 감싸는 데코레이터 (호출 시점의 추적기 사용)."""
+
+    def deco(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with _current.span(name, cat):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return deco
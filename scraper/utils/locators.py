@@ -1,6 +1,14 @@
-from typing import Iterable, Optional, Union
-from playwright.async_api import Page as AsyncPage, Locator as AsyncLocator
-from playwright.sync_api import Page as SyncPage, Locator as SyncLocator
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence, Union
+
+from scraper.metrics import record_selector, selector_group
+from scraper.selector_stats import shared_selector_stats
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page as AsyncPage, Locator as AsyncLocator
+    from playwright.sync_api import Page as SyncPage, Locator as SyncLocator
 
 # Async versions
 async def first_locator(page: AsyncPage, selectors: Iterable[str]) -> AsyncLocator:
@@ -55,23 +63,48 @@ async def text_first_from_element(element: AsyncLocator, selectors: Iterable[str
     loc = await first_locator_from_element(element, selectors)
     return (await loc.first.text_content() or "").strip()
 
+def _record(selectors: Iterable[str], index: Optional[int]) -> None:
+    """후보가 둘 이상인 목록만 fallback/miss 지표에 남긴다."""
+    if isinstance(selectors, (list, tuple)) and len(selectors) > 1:
+        record_selector(selector_group(selectors), index)
+
+def count_sync(root: Any, selector: str, group: Union[str, Sequence[str]]) -> int:
+    """root.locator(selector).count(). 시도/적중/소요 시간을 selector_stats에 기록하고 잘못된 셀렉터면 0.
+
+    후보 목록을 직접 순회하는 곳(for sel in CARD_ROOT_SELECTORS: ...)에서 count() 대신 쓴다.
+    group은 그룹 이름 또는 후보 목록(selector_group으로 이름을 정한다).
+    """
+    name = group if isinstance(group, str) else selector_group(group)
+    t = time.perf_counter()
+    try:
+        n = root.locator(selector).count()
+    except Exception:
+        shared_selector_stats().record(name, selector, False, time.perf_counter() - t, error=True)
+        return 0
+    shared_selector_stats().record(name, selector, n > 0, time.perf_counter() - t)
+    return n
+
+def _first_match_sync(root: Any, selectors: Iterable[str]) -> Optional[SyncLocator]:
+    """root.locator(s).count()>0 인 첫 후보. 후보별 시도/적중/소요 시간을 selector_stats에 기록."""
+    group = selector_group(selectors) if isinstance(selectors, (list, tuple)) else "?"
+    last: Optional[SyncLocator] = None
+    for i, s in enumerate(selectors):
+        last = root.locator(s)
+        # 유효하지 않은 selector는 0으로 기록되고 다음 후보로 넘어간다
+        if count_sync(root, s, group) > 0:
+            _record(selectors, i)
+            return last
+    _record(selectors, None)
+    return last
+
 # Sync versions
 def first_locator_sync(page: SyncPage, selectors: Iterable[str]) -> SyncLocator:
     """
     selectors 순서대로 시도하여 count()>0 인 Locator를 반환.
     전부 실패하면 마지막 시도의 Locator를 반환(추가 디버깅 용이).
     """
-    last: Optional[SyncLocator] = None
-    for s in selectors:
-        loc = page.locator(s)
-        last = loc
-        try:
-            if loc.count() > 0:
-                return loc
-        except Exception:
-            # 유효하지 않은 selector는 무시하고 다음으로
-            continue
-    return last if last is not None else page.locator("html")
+    loc = _first_match_sync(page, selectors)
+    return loc if loc is not None else page.locator("html")
 
 def click_first_sync(page: SyncPage, selectors: Iterable[str]) -> None:
     """첫 번째로 매칭되는 요소를 클릭합니다."""
@@ -96,16 +129,8 @@ def first_locator_from_element_sync(element: SyncLocator, selectors: Iterable[st
     """
     요소 내에서 selectors 순서대로 시도하여 count()>0 인 Locator를 반환.
     """
-    last: Optional[SyncLocator] = None
-    for s in selectors:
-        loc = element.locator(s)
-        last = loc
-        try:
-            if loc.count() > 0:
-                return loc
-        except Exception:
-            continue
-    return last if last is not None else element.locator("div")
+    loc = _first_match_sync(element, selectors)
+    return loc if loc is not None else element.locator("div")
 
 def text_first_from_element_sync(element: SyncLocator, selectors: Iterable[str]) -> str:
     """요소 내에서 첫 번째로 매칭되는 요소의 텍스트를 반환합니다."""
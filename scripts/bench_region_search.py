@@ -0,0 +1,75 @@
+"""지역 검색 인덱스 벤치마크.
+
+사용법:
+  python scripts/bench_region_search.py [--data data/regions_kr.json] [--repeat 200]
+
+출력: 인덱스 빌드 시간, 질의 유형별 평균/p95 지연(ms), 타이핑 시뮬레이션(한 글자씩 입력) 지연.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.widgets.region_picker import RegionIndex  # noqa: E402
+
+
+QUERIES = {
+    "접두": ["기장", "해운대", "서울", "강남", "수원", "중"],
+    "부분": ["앙동", "운대구", "원시", "1가", "읍"],
+    "초성": ["ㄱㅈ", "ㅎㅇㄷ", "ㅅㅇ", "ㄱㄴ"],
+    "상위조건": ["부산 중구", "서울 중앙동", "경기 광주"],
+}
+
+
+def _ms(samples):
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return statistics.mean(samples) * 1000, p95 * 1000
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="RegionIndex 검색 지연 측정")
+    ap.add_argument("--data", default=str(ROOT / "data" / "regions_kr.json"))
+    ap.add_argument("--repeat", type=int, default=200)
+    args = ap.parse_args()
+
+    data = json.loads(Path(args.data).read_text("utf-8"))
+    t0 = time.perf_counter()
+    index = RegionIndex(data)
+    index.search("가")  # 정렬까지 포함
+    print(f"build: {(time.perf_counter() - t0) * 1000:.1f} ms ({len(index.entries)} nodes)")
+
+    for kind, queries in QUERIES.items():
+        samples = []
+        for _ in range(args.repeat):
+            for q in queries:
+                index._last = ("", [])  # 증분 캐시 없이 측정
+                t = time.perf_counter()
+                index.search(q)
+                samples.append(time.perf_counter() - t)
+        mean, p95 = _ms(samples)
+        print(f"{kind:<6} mean={mean:.3f} ms  p95={p95:.3f} ms")
+
+    # 한 글자씩 입력하는 경우 (증분 축소 적용)
+    samples = []
+    for _ in range(args.repeat):
+        for word in ("해운대구", "중앙동1가", "기장읍"):
+            for k in range(1, len(word) + 1):
+                t = time.perf_counter()
+                index.search(word[:k])
+                samples.append(time.perf_counter() - t)
+    mean, p95 = _ms(samples)
+    print(f"{'타이핑':<6} mean={mean:.3f} ms  p95={p95:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,9 +8,11 @@ from __future__ import annotations
 
 사용법:
   python scripts/build_regions_from_mois.py /path/법정동코드_전체자료.txt
+  python scripts/build_regions_from_mois.py --from-json   # 기존 JSON에서 .bin만 다시 생성
 
 출력:
   data/regions_kr.json (시/도 → 시/군/구 → 읍/면/동 구조)
+  data/regions_kr.bin  (GUI용 사전 컴파일본: 시/도 단위로 지연 로딩)
 """
 
 import json
@@ -18,6 +20,18 @@ import sys
 from collections import defaultdict
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.widgets.region_data import BIN_PATH, JSON_PATH, write_region_bin  # noqa: E402
+
+
+def write_bin_from_json(json_path: Path = JSON_PATH) -> None:
+    data = json.loads(Path(json_path).read_text("utf-8"))
+    out = write_region_bin(data, Path(json_path).with_suffix(".bin"), source_path=json_path)
+    print(f"written: {out} ({out.stat().st_size:,} bytes)")
+
 
 def main(src_path: str) -> None:
     path = Path(src_path)
@@ -88,16 +102,21 @@ def main(src_path: str) -> None:
         prov["children"] = list(cities.values())
 
     out = {"provinces": list(provinces.values())}
-    out_path = Path(__file__).resolve().parents[1] / "data" / "regions_kr.json"
+    out_path = JSON_PATH
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_path.write_text(json.dumps(out, ensure_ascii=False, indent=2), encoding="utf-8")
     print(f"written: {out_path} (provinces={len(out['provinces'])})")
+    bin_path = write_region_bin(out, BIN_PATH, source_path=out_path)
+    print(f"written: {bin_path} ({bin_path.stat().st_size:,} bytes)")
 
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python scripts/build_regions_from_mois.py /path/법정동코드_전체자료.txt")
+        print("Usage: python scripts/build_regions_from_mois.py /path/법정동코드_전체자료.txt | --from-json")
         raise SystemExit(2)
-    main(sys.argv[1])
+    if sys.argv[1] == "--from-json":
+        write_bin_from_json()
+    else:
+        main(sys.argv[1])
 
 
@@ -3,13 +3,13 @@ from __future__ import annotations
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
-import pandas as pd
-
-from scraper.dabang_scraper import Item
 from config import settings
 
+if TYPE_CHECKING:
+    from scraper.dabang_scraper import Item
+
 
 COLS = [
     "address",
@@ -43,6 +43,9 @@ def save_to_excel(items: Iterable[Item], outdir: Path, region: str) -> Path:
     - 기존 시트가 있으면 새 데이터를 추가 (중복 제거 없음)
     - 항상 새로운 시트에 저장
     """
+    # pandas는 저장 시점에만 불러온다 (GUI/CLI 시작 시간 단축)
+    import pandas as pd
+
     outdir.mkdir(parents=True, exist_ok=True)
     data = [asdict(i) for i in items]
     df = pd.DataFrame(data, columns=COLS)
@@ -0,0 +1,388 @@
+"""여러 머신에 나눠 도는 수집용 작업 대기열.
+
+작업 = (지역, 매물 종류) 하나. 작업자는 acquire()로 작업을 임대(lease)받고, 수집하는 동안
+heartbeat()로 임대를 연장하며, 결과를 upload()로 조금씩 올린 뒤 complete()한다.
+- 작업자가 죽으면 임대가 만료되어 다른 작업자가 다시 가져간다 (max_attempts번까지)
+- 임대마다 새 token을 발급하므로, 만료 뒤 늦게 돌아온 작업자의 upload/complete는 LeaseLost로 거절된다
+- 결과는 item_id로 합쳐지므로 같은 작업을 다시 돌려도 중복되지 않는다 (나중 값으로 갱신)
+
+WorkQueue가 추상 인터페이스이고, SqliteWorkQueue는 파일 하나로 동작하는 기본 구현이다 (WAL 대신 롤백 저널).
+한 머신이나 공유 디스크(잠금이 제대로 되는 파일시스템)에서는 그대로 쓰고,
+규모가 커지면 같은 인터페이스로 서버형 구현을 만들어 바꿔 끼운다.
+임대 만료는 작업자 시계로 판정하므로 머신 간 시계가 맞아 있어야 한다 (lease_s보다 훨씬 작은 오차).
+"""
+
+from __future__ import annotations
+
+import abc
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from loguru import logger
+
+from scraper.control import CrawlControl
+
+PROPERTY_TYPES = ["원룸", "투룸", "오피스텔", "아파트", "주택", "빌라"]
+
+class LeaseLost(RuntimeError):
+    """임대가 만료되어 다른 작업자에게 넘어갔다."""
+
+
+@dataclass
+class Task:
+    id: str
+    region: str
+    property_type: str
+    params: Dict[str, Any]
+    status: str = "pending"  # pending / leased / done / failed
+    attempts: int = 0
+    owner: Optional[str] = None
+    lease_expires: Optional[float] = None
+    error: Optional[str] = None
+    items: int = 0
+
+
+@dataclass
+class Lease:
+    task: Task
+    owner: str
+    token: str
+    expires: float
+
+
+def task_id(region: str, property_type: str) -> str:
+    return f"{region}|{property_type}"
+
+
+class WorkQueue(abc.ABC):
+    """작업 대기열 인터페이스. 구현은 여러 프로세스/머신이 동시에 불러도 안전해야 한다."""
+
+    @abc.abstractmethod
+    def add_tasks(self, regions: Iterable[str], property_types: Iterable[str], params: Optional[Dict[str, Any]] = None) -> int:
+        """지역 × 매물 종류 작업을 넣는다. 이미 있는 작업은 건너뛰고 새로 넣은 수를 돌려준다."""
+
+    @abc.abstractmethod
+    def acquire(self, owner: str, lease_s: float) -> Optional[Lease]:
+        """대기 중이거나 임대가 만료된 작업 하나를 임대. 없으면 None."""
+
+    @abc.abstractmethod
+    def heartbeat(self, lease: Lease, lease_s: float) -> bool:
+        """임대 연장. 이미 잃었으면 False."""
+
+    @abc.abstractmethod
+    def upload(self, lease: Lease, items: List[Dict[str, Any]]) -> int:
+        """결과를 item_id 기준으로 합친다. 새로 생긴 건수를 돌려준다. 임대를 잃었으면 LeaseLost."""
+
+    @abc.abstractmethod
+    def complete(self, lease: Lease) -> None:
+        """작업 완료. 임대를 잃었으면 LeaseLost."""
+
+    @abc.abstractmethod
+    def fail(self, lease: Lease, error: str) -> str:
+        """작업 실패. 시도가 남았으면 다시 대기(pending), 아니면 failed. 바뀐 상태를 돌려준다."""
+
+    @abc.abstractmethod
+    def tasks(self) -> List[Task]:
+        ...
+
+    @abc.abstractmethod
+    def results(self) -> Iterator[Dict[str, Any]]:
+        """합쳐진 결과 전체."""
+
+    def stats(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {"pending": 0, "leased": 0, "done": 0, "failed": 0}
+        for t in self.tasks():
+            counts[t.status] = counts.get(t.status, 0) + 1
+        return counts
+
+    def close(self) -> None:
+        pass
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    region TEXT NOT NULL,
+    property_type TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    owner TEXT,
+    token TEXT,
+    lease_expires REAL,
+    error TEXT,
+    items INTEGER NOT NULL DEFAULT 0,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    item_id TEXT PRIMARY KEY,
+    task_id TEXT NOT NULL,
+    item TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+
+_TASK_COLUMNS = "id, region, property_type, params, status, attempts, owner, lease_expires, error, items"
+
+
+class SqliteWorkQueue(WorkQueue):
+    """SQLite 파일 하나로 된 구현. 임대는 BEGIN IMMEDIATE 트랜잭션 안에서 고르고 바꾼다."""
+
+    def __init__(self, path: Path, max_attempts: int = 3, clock: Callable[[], float] = time.time) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max(1, max_attempts)
+        self._clock = clock
+        # 하트비트 스레드와 수집 스레드가 한 연결을 나눠 쓴다
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            # WAL은 공유 메모리 인덱스(-shm)가 호스트 로컬이라 네트워크 파일시스템에서 깨진다.
+            # 여러 머신이 파일 하나를 나눠 쓰므로 롤백 저널(파일 잠금만 사용)로 고정한다.
+            self._conn.execute("PRAGMA journal_mode=DELETE")
+            self._conn.executescript(_SCHEMA)
+
+    def _tx(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                out = fn(self._conn)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return out
+
+    @staticmethod
+    def _task(row: Any) -> Task:
+        tid, region, ptype, params, status, attempts, owner, expires, error, items = row
+        return Task(tid, region, ptype, json.loads(params), status, attempts, owner, expires, error, items)
+
+    def _check(self, conn: sqlite3.Connection, lease: Lease) -> None:
+        row = conn.execute("SELECT token, status FROM tasks WHERE id = ?", (lease.task.id,)).fetchone()
+        if row is None or row[0] != lease.token or row[1] != "leased":
+            raise LeaseLost(f"{lease.task.id}: 임대를 잃었습니다 ({lease.owner})")
+
+    def add_tasks(self, regions: Iterable[str], property_types: Iterable[str], params: Optional[Dict[str, Any]] = None) -> int:
+        blob = json.dumps(params or {}, ensure_ascii=False)
+        pairs = [(r, t) for r in regions for t in property_types]
+        now = self._clock()
+
+        def run(conn: sqlite3.Connection) -> int:
+            added = 0
+            for region, ptype in pairs:
+                cur = conn.execute(
+                    "INSERT OR IGNORE INTO tasks (id, region, property_type, params, created) VALUES (?, ?, ?, ?, ?)",
+                    (task_id(region, ptype), region, ptype, blob, now),
+                )
+                added += cur.rowcount
+            return added
+
+        return self._tx(run)
+
+    def acquire(self, owner: str, lease_s: float) -> Optional[Lease]:
+        now = self._clock()
+
+        def run(conn: sqlite3.Connection) -> Optional[Lease]:
+            # 만료된 임대 중 시도를 다 쓴 작업은 실패 처리
+            conn.execute(
+                "UPDATE tasks SET status = 'failed', owner = NULL, token = NULL,"
+                " error = COALESCE(error, '임대 만료') WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, self.max_attempts),
+            )
+            row = conn.execute(
+                "SELECT id FROM tasks WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?)"
+                " ORDER BY attempts, created, id LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+            token = uuid.uuid4().hex
+            conn.execute(
+                "UPDATE tasks SET status = 'leased', attempts = attempts + 1, owner = ?, token = ?, lease_expires = ?"
+                " WHERE id = ?",
+                (owner, token, now + lease_s, row[0]),
+            )
+            task = self._task(conn.execute(f"SELECT {_TASK_COLUMNS} FROM tasks WHERE id = ?", (row[0],)).fetchone())
+            return Lease(task, owner, token, now + lease_s)
+
+        return self._tx(run)
+
+    def heartbeat(self, lease: Lease, lease_s: float) -> bool:
+        expires = self._clock() + lease_s
+
+        def run(conn: sqlite3.Connection) -> bool:
+            cur = conn.execute(
+                "UPDATE tasks SET lease_expires = ? WHERE id = ? AND token = ? AND status = 'leased'",
+                (expires, lease.task.id, lease.token),
+            )
+            return cur.rowcount == 1
+
+        ok = self._tx(run)
+        if ok:
+            lease.expires = expires
+        return ok
+
+    def upload(self, lease: Lease, items: List[Dict[str, Any]]) -> int:
+        now = self._clock()
+
+        def run(conn: sqlite3.Connection) -> int:
+            self._check(conn, lease)
+            added = 0
+            for item in items:
+                item_id = str(item.get("item_id") or "")
+                if not item_id:
+                    continue
+                exists = conn.execute("SELECT 1 FROM results WHERE item_id = ?", (item_id,)).fetchone()
+                conn.execute(
+                    "INSERT INTO results (item_id, task_id, item, updated) VALUES (?, ?, ?, ?)"
+                    " ON CONFLICT(item_id) DO UPDATE SET task_id = excluded.task_id, item = excluded.item,"
+                    " updated = excluded.updated",
+                    (item_id, lease.task.id, json.dumps(item, ensure_ascii=False), now),
+                )
+                added += exists is None
+            conn.execute(
+                "UPDATE tasks SET items = (SELECT COUNT(*) FROM results WHERE task_id = ?) WHERE id = ?",
+                (lease.task.id, lease.task.id),
+            )
+            return added
+
+        return self._tx(run)
+
+    def complete(self, lease: Lease) -> None:
+        def run(conn: sqlite3.Connection) -> None:
+            self._check(conn, lease)
+            conn.execute(
+                "UPDATE tasks SET status = 'done', token = NULL, lease_expires = NULL, error = NULL WHERE id = ?",
+                (lease.task.id,),
+            )
+
+        self._tx(run)
+
+    def fail(self, lease: Lease, error: str) -> str:
+        def run(conn: sqlite3.Connection) -> str:
+            self._check(conn, lease)
+            row = conn.execute("SELECT attempts FROM tasks WHERE id = ?", (lease.task.id,)).fetchone()
+            status = "failed" if row[0] >= self.max_attempts else "pending"
+            conn.execute(
+                "UPDATE tasks SET status = ?, owner = NULL, token = NULL, lease_expires = NULL, error = ? WHERE id = ?",
+                (status, error[:500], lease.task.id),
+            )
+            return status
+
+        return self._tx(run)
+
+    def tasks(self) -> List[Task]:
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {_TASK_COLUMNS} FROM tasks ORDER BY created, id").fetchall()
+        return [self._task(r) for r in rows]
+
+    def results(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT item FROM results ORDER BY task_id, updated, item_id").fetchall()
+        for (item,) in rows:
+            yield json.loads(item)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_queue(path: Optional[Path] = None, max_attempts: Optional[int] = None) -> WorkQueue:
+    """설정(settings.work_queue)대로 대기열을 연다."""
+    from config import settings
+
+    cfg = settings.work_queue
+    return SqliteWorkQueue(
+        Path(path or cfg.path), max_attempts=max_attempts if max_attempts is not None else cfg.max_attempts
+    )
+
+
+# (작업, 정지 신호, 결과 한 건 콜백) → 수집 함수
+ScrapeFn = Callable[[Task, CrawlControl, Callable[[Dict[str, Any]], None]], None]
+
+
+def run_worker(
+    queue: WorkQueue,
+    owner: str,
+    scrape: ScrapeFn,
+    control: Optional[CrawlControl] = None,
+    lease_s: float = 600.0,
+    heartbeat_s: float = 60.0,
+    upload_batch: int = 20,
+    max_tasks: int = 0,
+) -> int:
+    """대기열이 빌 때까지(또는 max_tasks개) 작업을 가져와 수집한다. 완료한 작업 수를 돌려준다.
+
+    작업마다 control에 연동된 CrawlControl을 따로 만들어 scrape에 넘긴다. 임대를 잃으면 그 작업만
+    멈추고(stop_reason="lease_lost") 다음 작업으로 넘어간다. 이미 올린 결과는 item_id로 합쳐지므로 그대로 둔다.
+    """
+    control = control or CrawlControl()
+    done = 0
+    while not control.should_stop() and (max_tasks <= 0 or done < max_tasks):
+        lease = queue.acquire(owner, lease_s)
+        if lease is None:
+            break
+        task = lease.task
+        logger.info("작업 임대 {} (시도 {}회째)", task.id, task.attempts)
+        task_control = CrawlControl(stop_event=control)
+        lost = threading.Event()
+        finished = threading.Event()
+
+        def beat() -> None:
+            while not finished.wait(heartbeat_s):
+                try:
+                    if not queue.heartbeat(lease, lease_s):
+                        lost.set()
+                        task_control.request_stop("lease_lost")
+                        return
+                except Exception as e:
+                    # 일시적인 저장소 오류는 다음 주기에 다시 시도 (만료 전까지)
+                    logger.warning("하트비트 실패 {}: {}", task.id, e)
+
+        beater = threading.Thread(target=beat, name=f"heartbeat-{task.id}", daemon=True)
+        beater.start()
+        buf: List[Dict[str, Any]] = []
+
+        def flush() -> None:
+            if buf and not lost.is_set():
+                batch, buf[:] = list(buf), []
+                queue.upload(lease, batch)
+
+        def on_item(item: Dict[str, Any]) -> None:
+            buf.append(item)
+            if len(buf) >= upload_batch:
+                flush()
+
+        try:
+            scrape(task, task_control, on_item)
+            flush()
+            if lost.is_set():
+                pass
+            elif task_control.should_stop():
+                # 중간에 멈춘 작업은 다른 작업자가 이어 받도록 돌려준다 (시도 1회로 계산)
+                queue.fail(lease, f"중지됨: {task_control.stop_reason}")
+            else:
+                queue.complete(lease)
+                done += 1
+                logger.info("작업 완료 {}", task.id)
+        except LeaseLost:
+            lost.set()
+        except Exception as e:
+            logger.exception("작업 실패 {}", task.id)
+            try:
+                logger.info("작업 {} → {}", task.id, queue.fail(lease, f"{type(e).__name__}: {e}"))
+            except LeaseLost:
+                lost.set()
+        finally:
+            finished.set()
+            beater.join()
+        if lost.is_set():
+            logger.warning("임대를 잃어 작업을 놓았습니다: {}", task.id)
+    return done
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+
+import pytest
+
+# realestate_dabang은 import 시점에 LOG_DIR로 파일 로그를 연다 → 저장소의 logs/ 대신 임시 폴더로
+_LOG_DIR = tempfile.mkdtemp(prefix="dabang-test-logs-")
+os.environ.setdefault("LOG_DIR", _LOG_DIR)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_logs_dir(tmp_path, monkeypatch):
+    """수집 실행이 남기는 logs/selector_stats.json 등을 테스트마다 tmp_path 아래로."""
+    from config import settings
+
+    monkeypatch.setattr(settings.paths, "logs", str(tmp_path / "logs"))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_LOG_DIR, ignore_errors=True)
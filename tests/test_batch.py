@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from scraper import batch
+from scraper.dabang_scraper import ScrapeOptions
+
+
+class _FakeScraper:
+    retriers = []
+
+    def __init__(self, opts, stop_flag, log_cb=None, item_cb=None, progress=None, retrier=None):
+        self.opts = opts
+        self.log_cb = log_cb
+        self.error = None
+        _FakeScraper.retriers.append(retrier)
+
+    def run(self):
+        # 실제 DabangScraper.run처럼 예외를 던지지 않고 error에 남긴다
+        if self.opts.property_type == "아파트":
+            self.error = "RuntimeError: boom"
+            return []
+        time.sleep(0.2)
+        if self.log_cb:
+            self.log_cb("done")
+        return [f"{self.opts.property_type}-{i}" for i in range(2)]
+
+
+def _opts() -> ScrapeOptions:
+    return ScrapeOptions(region="부산 기장", property_type="원룸", price_min=0, price_max=0, max_items=2, max_pages=1)
+
+
+def test_types_run_concurrently_and_aggregate_in_order(monkeypatch):
+    monkeypatch.setattr(batch, "DabangScraper", _FakeScraper)
+    logs = []
+    done = []
+    t0 = time.monotonic()
+    result = batch.run_types(
+        _opts(),
+        ["원룸", "투룸", "오피스텔"],
+        threading.Event(),
+        max_concurrency=3,
+        log_cb=logs.append,
+        on_type_done=lambda t, items, err: done.append(t),
+    )
+    assert time.monotonic() - t0 < 0.5
+    assert result.items == ["원룸-0", "원룸-1", "투룸-0", "투룸-1", "오피스텔-0", "오피스텔-1"]
+    assert sorted(done) == sorted(["원룸", "투룸", "오피스텔"])
+    assert all(line.endswith("done") and line.startswith("[") for line in logs)
+
+
+def test_types_share_one_retrier(monkeypatch):
+    monkeypatch.setattr(batch, "DabangScraper", _FakeScraper)
+    _FakeScraper.retriers = []
+    batch.run_types(_opts(), ["원룸", "투룸"], threading.Event(), max_concurrency=2)
+    assert len(_FakeScraper.retriers) == 2
+    assert _FakeScraper.retriers[0] is not None and _FakeScraper.retriers[0] is _FakeScraper.retriers[1]
+
+
+def test_failed_type_is_reported_without_losing_others(monkeypatch):
+    monkeypatch.setattr(batch, "DabangScraper", _FakeScraper)
+    done = {}
+    result = batch.run_types(
+        _opts(), ["원룸", "아파트"], threading.Event(), max_concurrency=2,
+        on_type_done=lambda t, items, err: done.__setitem__(t, err),
+    )
+    assert result.items == ["원룸-0", "원룸-1"]
+    assert "boom" in result.errors["아파트"]
+    assert isinstance(done["아파트"], RuntimeError) and done["원룸"] is None
+
+
+def test_stop_before_start_skips_jobs(monkeypatch):
+    monkeypatch.setattr(batch, "DabangScraper", _FakeScraper)
+    stop = threading.Event()
+    stop.set()
+    result = batch.run_types(_opts(), ["원룸", "투룸"], stop, max_concurrency=1)
+    assert result.items == []
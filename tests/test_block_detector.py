@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import gc
+import weakref
+
+from scraper.block_detector import DETECTOR_JS, MAX_FAILURES, PROBE_JS, RESET_JS, BlockDetector, build_detector_js, for_selenium
+
+
+class _FakePage:
+    """감지기 스크립트 평가를 흉내 내는 페이지 (설치 여부와 reason만 가진다)."""
+
+    def __init__(self) -> None:
+        self.installed = False
+        self.reason = ""
+        self.calls = []
+        self.init_scripts = []
+
+    def run(self, js: str):
+        self.calls.append(js)
+        if js == PROBE_JS:
+            return self.reason if self.installed else None
+        if js == RESET_JS:
+            return None
+        self.installed = True
+        return self.reason
+
+    def add_init(self, js: str) -> None:
+        self.init_scripts.append(js)
+
+
+def test_probe_is_one_small_call_once_installed():
+    page = _FakePage()
+    det = BlockDetector(page.run, page.add_init)
+    assert det.install()
+    assert page.init_scripts == [DETECTOR_JS]
+    page.calls.clear()
+    assert det.reason() == ""
+    assert page.calls == [PROBE_JS]
+    page.reason = "text:보안문자"
+    assert det.blocked()
+
+
+def test_reinstalls_after_navigation():
+    page = _FakePage()
+    det = BlockDetector(page.run)
+    det.install()
+    page.installed = False
+    page.reason = "selector:iframe"
+    assert det.reason() == "selector:iframe"
+    assert page.installed
+
+
+def test_unavailable_engine_returns_none():
+    def boom(js):
+        raise RuntimeError("no js")
+
+    det = BlockDetector(boom)
+    assert not det.install()
+    assert det.reason() is None
+    assert not det.blocked()
+    assert not det.available
+
+
+def test_transient_failure_keeps_detector():
+    page = _FakePage()
+    navigating = [True]
+
+    def run(js):
+        if navigating[0]:
+            raise RuntimeError("Execution context was destroyed, most likely because of a navigation")
+        return page.run(js)
+
+    det = BlockDetector(run)
+    for _ in range(MAX_FAILURES - 1):
+        assert det.reason() is None
+    assert det.available
+    navigating[0] = False
+    page.reason = "text:captcha"
+    assert det.reason() == "text:captcha"
+    assert det.failures == 0
+
+
+def test_unsupported_engine_disabled_immediately():
+    def unsupported(js):
+        raise NotImplementedError("evaluate")
+
+    det = BlockDetector(unsupported)
+    assert det.reason() is None
+    assert not det.available
+
+
+def test_selenium_adapter_wraps_return_and_cdp():
+    class Driver:
+        def __init__(self):
+            self.scripts = []
+            self.cdp = []
+
+        def execute_script(self, js):
+            self.scripts.append(js)
+            return ""
+
+        def execute_cdp_cmd(self, cmd, params):
+            self.cdp.append((cmd, params["source"]))
+
+    driver = Driver()
+    det = for_selenium(driver)
+    assert det.install()
+    assert driver.cdp == [("Page.addScriptToEvaluateOnNewDocument", DETECTOR_JS)]
+    assert driver.scripts == ["return " + PROBE_JS]
+
+    # 풀에서 재사용된 드라이버: 같은 감지기를 돌려주므로 init 스크립트가 쌓이지 않는다
+    again = for_selenium(driver)
+    assert again is det and again.install()
+    assert len(driver.cdp) == 1
+
+    # 감지기가 드라이버를 붙잡지 않는다 (드라이버를 버리면 캐시 항목도 사라진다)
+    ref = weakref.ref(driver)
+    del driver, det, again
+    gc.collect()
+    assert ref() is None
+
+
+def test_custom_config_is_embedded():
+    js = build_detector_js(["#blocked"], ["접근 제한"])
+    assert '"#blocked"' in js and "접근 제한" in js
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from scraper.control import CrawlControl, CrawlStopped, as_control
+
+
+def _later(delay: float, fn) -> threading.Thread:
+    t = threading.Timer(delay, fn)
+    t.start()
+    return t
+
+
+def test_stop_wakes_long_sleep_immediately():
+    ctl = CrawlControl()
+    _later(0.05, ctl.request_stop)
+    t = time.monotonic()
+    assert ctl.sleep(30) is False
+    assert time.monotonic() - t < 1.0
+    assert ctl.stop_reason == "user"
+
+
+def test_sleep_runs_to_completion_without_stop():
+    ctl = CrawlControl()
+    assert ctl.sleep(0.02) is True
+    assert not ctl.should_stop()
+
+
+def test_pause_blocks_until_resume():
+    ctl = CrawlControl()
+    ctl.request_pause()
+    _later(0.05, ctl.resume)
+    t = time.monotonic()
+    assert ctl.wait_if_paused() is True
+    assert 0.03 < time.monotonic() - t < 1.0
+
+
+def test_stop_releases_paused_worker():
+    ctl = CrawlControl()
+    ctl.request_pause()
+    _later(0.05, ctl.request_stop)
+    assert ctl.wait_if_paused() is False
+    with pytest.raises(CrawlStopped):
+        ctl.checkpoint()
+
+
+def test_stop_is_not_swallowed_by_broad_handlers():
+    ctl = CrawlControl()
+    ctl.request_stop("deadline")
+    with pytest.raises(CrawlStopped):
+        try:
+            ctl.checkpoint()
+        except Exception:
+            pass
+
+
+def test_deadline_stops_and_interrupts_sleep():
+    ctl = CrawlControl(deadline_s=0.05)
+    assert ctl.remaining() is not None
+    t = time.monotonic()
+    assert ctl.sleep(30) is False
+    assert time.monotonic() - t < 1.0
+    assert ctl.stop_reason == "deadline"
+
+
+def test_event_compatible_and_reset():
+    ctl = CrawlControl()
+    assert not ctl.is_set()
+    assert ctl.wait(0.01) is False
+    ctl.set()
+    assert ctl.is_set() and ctl.wait(5) is True
+    ctl.clear()
+    assert not ctl.is_set() and ctl.stop_reason == ""
+
+
+def test_as_control_wraps_plain_event():
+    ev = threading.Event()
+    ctl = as_control(ev)
+    assert as_control(ctl) is ctl
+    _later(0.05, ev.set)
+    t = time.monotonic()
+    assert ctl.sleep(30) is False
+    assert time.monotonic() - t < 1.0
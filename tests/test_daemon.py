@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app.daemon import CrawlDaemon, JobStore, WarmBrowser, make_server, scrape_job
+from app.daemon_client import DaemonClient, DaemonError
+
+
+def test_store_claim_items_cancel_and_requeue(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    a = store.submit({"region": "강남구"})
+    b = store.submit({"region": "마포구"})
+    assert a["status"] == "queued" and a["params"] == {"region": "강남구"}
+
+    claimed = store.claim_next()
+    assert claimed["id"] == a["id"] and claimed["status"] == "running"
+    assert store.add_item(a["id"], {"item_id": "1"}) == 1
+    assert store.add_item(a["id"], {"item_id": "2"}) == 2
+    assert store.items(a["id"], after=1) == [(2, {"item_id": "2"})]
+
+    # 대기 중이면 바로 취소, 실행 중이면 표시만
+    assert store.request_cancel(b["id"]) == "cancelled"
+    assert store.request_cancel(a["id"]) == "running"
+    assert store.get(a["id"])["cancel"] is True
+    assert store.claim_next() is None
+    store.close()
+
+    # 데몬이 죽었다 살아난 경우: 실행 중이던 작업은 결과를 비우고 다시 대기열로
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    assert store.requeue_running() == 1
+    job = store.get(a["id"])
+    assert job["status"] == "queued" and job["items"] == 0 and store.items(a["id"]) == []
+    store.close()
+
+
+@pytest.fixture
+def daemon_api(tmp_path):
+    gate = threading.Event()
+
+    def runner(job, control, on_item, progress, warm):
+        if job["params"].get("fail"):
+            raise RuntimeError("boom")
+        for i in range(int(job["params"].get("max_items", 3))):
+            on_item({"item_id": str(i), "address": job["params"]["region"]})
+        if job["params"].get("block"):
+            gate.set()
+            while not control.should_stop():
+                control.sleep(0.01)
+        return "out.xlsx"
+
+    daemon = CrawlDaemon(JobStore(tmp_path / "jobs.sqlite3"), runner=runner, prewarm=False).start()
+    server = make_server(daemon)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = DaemonClient(f"http://127.0.0.1:{server.server_address[1]}")
+    yield client, gate
+    server.shutdown()
+    daemon.stop()
+    daemon.store.close()
+
+
+def test_submit_stream_and_fetch_items(daemon_api):
+    client, _ = daemon_api
+    assert client.health()["ok"]
+    job_id = client.submit(region="강남구", max_items=3)
+    events = list(client.stream(job_id))
+    assert [e["item"]["item_id"] for e in events if e["type"] == "item"] == ["0", "1", "2"]
+    end = events[-1]
+    assert end["type"] == "end" and end["job"]["status"] == "done" and end["job"]["output"] == "out.xlsx"
+
+    page = client.items(job_id, after=2)
+    assert [r["seq"] for r in page["items"]] == [3] and page["next"] == 3
+    assert client.jobs()[0]["id"] == job_id
+
+
+def test_cancel_running_job_and_failures(daemon_api):
+    client, gate = daemon_api
+    job_id = client.submit(region="마포구", max_items=1, block=True)
+    assert gate.wait(5)
+    assert client.cancel(job_id) == "running"
+    end = list(client.stream(job_id))[-1]
+    assert end["job"]["status"] == "cancelled" and end["job"]["items"] == 1
+
+    failed = list(client.stream(client.submit(region="x", fail=True)))[-1]["job"]
+    assert failed["status"] == "failed" and "boom" in failed["error"]
+
+    with pytest.raises(DaemonError):
+        client.submit(max_items=1)
+    with pytest.raises(DaemonError):
+        client.job("nope")
+
+
+def test_shutdown_mid_job_requeues_on_restart(tmp_path):
+    started = threading.Event()
+
+    def runner(job, control, on_item, progress, warm):
+        on_item({"item_id": "0"})
+        started.set()
+        # 실제 DabangScraper처럼 중단을 삼키고 일부 결과만 돌려준다
+        while not control.should_stop():
+            control.sleep(0.01)
+        return "partial.xlsx"
+
+    db = tmp_path / "jobs.sqlite3"
+    daemon = CrawlDaemon(JobStore(db), runner=runner, prewarm=False).start()
+    job_id = daemon.submit({"region": "강남구"})["id"]
+    assert started.wait(5)
+    daemon.stop()
+    assert daemon.store.get(job_id)["status"] == "running"
+    daemon.store.close()
+
+    store = JobStore(db)
+    assert store.requeue_running() == 1
+    job = store.get(job_id)
+    assert job["status"] == "queued" and job["items"] == 0
+    store.close()
+
+
+def test_client_reports_daemon_not_running():
+    assert DaemonClient("http://127.0.0.1:9").health() is None
+
+
+class _FakeBrowser:
+    def __init__(self, headless):
+        self.headless = headless
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    def close(self):
+        self.connected = False
+
+
+def test_warm_browser_keeps_one_playwright_per_worker(monkeypatch):
+    pytest.importorskip("playwright")
+    import playwright.sync_api as sync_api
+
+    starts = []
+
+    class _Chromium:
+        def launch(self, headless, args):
+            return _FakeBrowser(headless)
+
+    class _Pw:
+        chromium = _Chromium()
+
+        def stop(self):
+            pass
+
+    class _Manager:
+        def start(self):
+            starts.append(1)
+            return _Pw()
+
+    monkeypatch.setattr(sync_api, "sync_playwright", lambda: _Manager())
+    warm = WarmBrowser(headless=True)
+    headless = warm.get()
+    headed = warm.get(False)
+    # 창 표시 작업도 같은 Playwright에서 띄우고, 모드별 브라우저를 계속 재사용한다
+    assert headless.headless is True and headed.headless is False
+    assert warm.get(True) is headless and warm.get(False) is headed
+    assert starts == [1] and warm.ready
+    warm.close()
+    assert not headless.connected and not headed.connected
+
+
+def test_scrape_job_fails_when_scraper_records_error(monkeypatch):
+    import scraper.dabang_scraper as ds
+
+    class _Scraper:
+        def __init__(self, opts, control, item_cb=None, progress=None, browser=None):
+            self.error = None
+
+        def run(self):
+            self.error = "Error: using Sync API inside the asyncio loop"
+            return []
+
+    class _Warm:
+        headless = True
+
+        def get(self, headless=None):
+            return object()
+
+    monkeypatch.setattr(ds, "DabangScraper", _Scraper)
+    with pytest.raises(RuntimeError, match="Sync API"):
+        scrape_job({"params": {"region": "강남구", "headless": False}}, None, lambda it: None, None, _Warm())
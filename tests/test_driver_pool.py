@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import threading
+
+import scraper.driver_pool as dp
+from scraper.driver_pool import DriverPool
+
+
+class _FakeDriver:
+    def __init__(self, headless: bool) -> None:
+        self.headless = headless
+        self.quit_called = False
+        self.dead = False
+        self.resets = 0
+
+    @property
+    def current_url(self) -> str:
+        if self.dead:
+            raise RuntimeError("session gone")
+        return "about:blank"
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+def _pool(**kw):
+    made = []
+
+    def factory(headless: bool) -> _FakeDriver:
+        d = _FakeDriver(headless)
+        made.append(d)
+        return d
+
+    def reset(d: _FakeDriver) -> None:
+        d.resets += 1
+
+    return DriverPool(factory, reset=reset, **kw), made
+
+
+def test_released_driver_is_reset_and_reused():
+    pool, made = _pool()
+    with pool.lease(True) as d1:
+        pass
+    assert d1.resets == 1 and not d1.quit_called
+    with pool.lease(True) as d2:
+        assert d2 is d1
+    # headless 여부가 다르면 새로 만든다
+    with pool.lease(False) as d3:
+        assert d3 is not d1
+    assert len(made) == 2
+
+
+def test_dead_or_worn_out_drivers_are_replaced():
+    pool, made = _pool(max_uses=2)
+    with pool.lease(True) as d1:
+        pass
+    d1.dead = True
+    with pool.lease(True) as d2:
+        assert d2 is not d1
+    assert d1.quit_called
+    with pool.lease(True):
+        pass
+    # 두 번째 사용 후 폐기
+    assert d2.quit_called
+    assert pool.acquire(True) is not d2
+
+
+def test_liveness_probe_runs_outside_lock():
+    pool, _ = _pool(max_idle=2)
+    probing, unblock = threading.Event(), threading.Event()
+
+    class _Slow(_FakeDriver):
+        @property
+        def current_url(self) -> str:
+            probing.set()
+            unblock.wait(5)
+            return "about:blank"
+
+    slow = _Slow(True)
+    pool.release(slow, True)
+    got = []
+    t = threading.Thread(target=lambda: got.append(pool.acquire(True)))
+    t.start()
+    assert probing.wait(5)
+    # 첫 번째 acquire가 생존 확인 중이어도 다른 release는 막히지 않는다
+    other = _FakeDriver(True)
+    done = threading.Event()
+    threading.Thread(target=lambda: (pool.release(other, True), done.set())).start()
+    assert done.wait(1)
+    unblock.set()
+    t.join(5)
+    assert got == [slow]
+
+
+def test_prewarm_hands_over_background_driver():
+    gate = threading.Event()
+    made = []
+
+    def slow_factory(headless: bool) -> _FakeDriver:
+        gate.wait(5)
+        d = _FakeDriver(headless)
+        made.append(d)
+        return d
+
+    pool = DriverPool(slow_factory, reset=lambda d: None)
+    pool.prewarm(True)
+    pool.prewarm(True)  # 이미 띄우는 중이면 추가로 띄우지 않는다
+    threading.Timer(0.05, gate.set).start()
+    d = pool.acquire(True)
+    assert made == [d]
+
+
+def test_close_quits_idle_and_later_releases():
+    pool, _ = _pool()
+    with pool.lease(True) as d1:
+        pass
+    d2 = pool.acquire(False)
+    pool.close()
+    assert d1.quit_called
+    pool.release(d2, False)
+    assert d2.quit_called
+
+
+def test_chrome_version_probed_once(monkeypatch):
+    calls = []
+
+    def fake_check_output(cmd, **kw):
+        calls.append(cmd)
+        return b"Google Chrome 138.0.7204.97\n"
+
+    monkeypatch.delenv("CHROME_VERSION_MAIN", raising=False)
+    monkeypatch.setattr(dp, "_chrome_version_commands", lambda: [["chrome", "--version"]])
+    monkeypatch.setattr(dp.subprocess, "check_output", fake_check_output)
+    dp._installed_chrome_version.cache_clear()
+    try:
+        assert dp.detect_chrome_version_main() == 138
+        assert dp.detect_chrome_version_main() == 138
+        assert len(calls) == 1
+        assert dp.detect_chrome_version_main(120) == 120
+        monkeypatch.setenv("CHROME_VERSION_MAIN", "131")
+        assert dp.detect_chrome_version_main() == 131
+    finally:
+        dp._installed_chrome_version.cache_clear()
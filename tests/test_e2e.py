@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import threading
+from pathlib import Path
+
+import pytest
 
 from scraper.dabang_scraper import DabangScraper, ScrapeOptions
 
@@ -23,3 +26,38 @@ def test_e2e_all_region_smoke():
     assert isinstance(items, list)
 
 
+def _chromium_installed() -> bool:
+    from playwright.sync_api import sync_playwright
+
+    try:
+        with sync_playwright() as p:
+            return Path(p.chromium.executable_path).exists()
+    except Exception:
+        return False
+
+
+def test_e2e_fixture_site(monkeypatch):
+    # 로컬 fixture 사이트: 네트워크 없이 수집 건수·필드까지 확인
+    pytest.importorskip("playwright")
+    if not _chromium_installed():
+        pytest.skip("Playwright Chromium 미설치 (playwright install chromium)")
+    from scraper.fixture_site import FixtureConfig, FixtureSite
+
+    with FixtureSite(FixtureConfig(count=30, page_size=10)) as site:
+        monkeypatch.setenv("DABANG_BASE_URL", site.url)
+        opts = ScrapeOptions(
+            region="강남구",
+            property_type="원룸",
+            price_min=0,
+            price_max=0,
+            max_items=12,
+            max_pages=2,
+            headless=True,
+        )
+        items = DabangScraper(opts, threading.Event()).run()
+        expected = {r["id"]: r for r in site.rooms}
+        assert len(items) == 12
+        for item in items:
+            room = expected[item.item_id]
+            assert item.address == room["address"]
+            assert item.price_text == room["price"]
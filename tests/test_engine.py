@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+
+import scraper.dabang_scraper as ds
+from scraper.dabang_scraper import Item
+from scraper.engine import ENGINES, CrawlEngine, CrawlRequest, create_engine
+from scraper.progress import ProgressTracker
+
+
+def _item(i: int) -> Item:
+    return Item(
+        address=f"서울특별시 강남구 역삼동 {i}",
+        price_text=f"월세 500/{40 + i}",
+        maintenance_fee=None,
+        realtor="",
+        posted_at="2026-01-01 00:00:00",
+        property_type="원룸",
+        url=f"http://127.0.0.1:8765/room/r{i}",
+        item_id=f"r{i}",
+    )
+
+
+class _FakeEngine(CrawlEngine):
+    name = "fake"
+
+    def _crawl(self, req: CrawlRequest, progress: ProgressTracker) -> List[Item]:
+        progress.set_phase("navigate")
+        progress.set_phase("list")
+        return [_item(i) for i in range(req.limit + 5)]
+
+
+def test_crawl_limits_items_and_reports_phases():
+    out = _FakeEngine().crawl(CrawlRequest(region="강남구", limit=3))
+    assert [i.item_id for i in out.items] == ["r0", "r1", "r2"]
+    assert {"navigate", "list"} <= set(out.phases)
+    assert out.elapsed_s >= 0
+
+
+def test_engine_base_is_abstract_and_registry_covers_shipped_engines():
+    with pytest.raises(TypeError):
+        CrawlEngine()  # type: ignore[abstract]
+    assert set(ENGINES) == {"scraper", "selenium", "crawler"}
+    with pytest.raises(ValueError):
+        create_engine("nope")
+
+
+def test_scraper_adapter_runs_dabang_scraper(monkeypatch):
+    seen = {}
+
+    class _Scraper:
+        def __init__(self, opts, stop_flag, progress=None, **kw):
+            seen["opts"] = opts
+            self.progress = progress
+            self.error = None
+
+        def run(self):
+            self.progress.set_phase("detail")
+            return [_item(1)]
+
+    monkeypatch.setattr(ds, "DabangScraper", _Scraper)
+    out = create_engine("scraper", replay_har_path="x.har").crawl(CrawlRequest(region="강남구", limit=50, page_size=24))
+    assert [i.item_id for i in out.items] == ["r1"]
+    assert seen["opts"].max_items == 50 and seen["opts"].max_pages == 4
+    assert seen["opts"].replay_har_path == "x.har"
+    assert "detail" in out.phases
+
+    _Scraper.run = lambda self: (setattr(self, "error", "TimeoutError: launch"), [])[1]
+    with pytest.raises(RuntimeError, match="launch"):
+        create_engine("scraper").crawl(CrawlRequest(region="강남구"))
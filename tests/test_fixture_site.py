@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import re
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import pytest
+
+from scraper.fixture_site import FixtureConfig, FixtureSite, make_listing
+
+
+def _get(url: str):
+    with urllib.request.urlopen(url, timeout=5) as res:
+        return res.status, res.read().decode("utf-8")
+
+
+@pytest.fixture
+def site():
+    with FixtureSite(FixtureConfig(count=50, page_size=20)) as s:
+        yield s
+
+
+def test_map_page_has_selector_targets(site):
+    status, body = _get(site.url + "/map/onetwo")
+    assert status == 200
+    for needle in ('id="onetwo-list"', 'id="search-input"', 'class="sc-efUvXT fvodgZ pagination"', "li class=\"sc-bNShyZ\""):
+        assert needle in body
+
+
+def test_rooms_api_paginates_deterministically(site):
+    region = urllib.parse.quote("강남구")
+    pages = [json.loads(_get(f"{site.url}/api/rooms?region={region}&page={p}")[1]) for p in (1, 2, 3)]
+    assert [len(p["rooms"]) for p in pages] == [20, 20, 10]
+    assert pages[0]["pages"] == 3 and pages[0]["total"] == 50
+    first = pages[0]["rooms"][0]
+    assert first["href"] == f"/room/{first['id']}?detail_type=room&detail_id={first['id']}"
+    assert first["id"] == make_listing(7, 0)["id"]
+
+
+def test_detail_page_sections(site):
+    room = site.rooms[3]
+    status, body = _get(site.url + "/room/" + room["id"])
+    assert status == 200
+    near = re.search(r'data-scroll-spy-element="near">.*?<p>(.*?)</p>', body, re.S).group(1)
+    assert near == room["address"]
+    assert 'data-scroll-spy-element="agent-info"' in body and room["realtor"] in body
+    assert "최초등록일 " + room["posted"] in body
+    with pytest.raises(urllib.error.HTTPError) as e:
+        _get(site.url + "/room/unknown")
+    assert e.value.code == 404
+
+
+def test_failure_injection_and_latency():
+    cfg = FixtureConfig(count=5, latency_s=0.05, fail_every=2, retry_after=3)
+    with FixtureSite(cfg) as s:
+        t = time.monotonic()
+        assert _get(s.url + "/")[0] == 200  # 실패 대상 경로가 아님
+        assert time.monotonic() - t >= 0.05
+        assert _get(s.url + "/api/rooms?page=1")[0] == 200
+        with pytest.raises(urllib.error.HTTPError) as e:
+            _get(s.url + "/api/rooms?page=1")
+        assert e.value.code == 503 and e.value.headers["Retry-After"] == "3"
+        assert s.stats.failures == 1 and s.stats.requests == 3
+
+
+def test_captcha_after_n_details():
+    with FixtureSite(FixtureConfig(count=3, captcha_after=1)) as s:
+        assert "captcha" not in _get(s.url + "/room/" + s.rooms[0]["id"])[1]
+        assert 'id="captcha-box"' in _get(s.url + "/room/" + s.rooms[1]["id"])[1]
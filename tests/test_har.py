@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from scraper import har
+
+
+class _Context:
+    def __init__(self):
+        self.calls = []
+
+    def route_from_har(self, path, **kw):
+        self.calls.append(("har", path, kw))
+
+    def route(self, url, handler):
+        self.calls.append(("route", url, handler))
+
+
+def test_record_kwargs(tmp_path):
+    assert har.record_kwargs(None) == {}
+    kw = har.record_kwargs(str(tmp_path / "sub" / "s.har"))
+    assert kw["record_har_content"] == "embed" and kw["record_har_mode"] == "full"
+    assert (tmp_path / "sub").is_dir()
+    assert "record_har_content" not in har.record_kwargs(str(tmp_path / "s.zip"))
+
+
+def test_install_replay_registers_delay_after_har(tmp_path):
+    path = tmp_path / "s.har"
+    path.write_text("{}", encoding="utf-8")
+    ctx = _Context()
+    har.install_replay(ctx, str(path), latency_ms=120, seed=1)
+    assert [c[0] for c in ctx.calls] == ["har", "route"]
+    assert ctx.calls[0][2]["not_found"] == "abort"
+
+    waits, fallbacks = [], []
+    page = SimpleNamespace(wait_for_timeout=waits.append)
+    route = SimpleNamespace(request=SimpleNamespace(frame=SimpleNamespace(page=page)), fallback=lambda: fallbacks.append(1))
+    ctx.calls[1][2](route)
+    assert waits == [120] and fallbacks == [1]
+
+    plain = _Context()
+    har.install_replay(plain, str(path))
+    assert [c[0] for c in plain.calls] == ["har"]
+
+
+def test_install_replay_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        har.install_replay(_Context(), str(tmp_path / "none.har"))
+
+
+def test_shape_network_sends_cdp_conditions():
+    sent = []
+    cdp = SimpleNamespace(send=lambda method, params=None: sent.append((method, params)))
+    page = SimpleNamespace()
+    page.context = SimpleNamespace(new_cdp_session=lambda p: cdp)
+    assert har.shape_network(page) is False
+    assert har.shape_network(page, latency_ms=200, download_kbps=800)
+    method, params = sent[-1]
+    assert method == "Network.emulateNetworkConditions"
+    assert params["latency"] == 200
+    assert params["downloadThroughput"] == 800 * 1024 / 8
+    assert params["uploadThroughput"] == -1
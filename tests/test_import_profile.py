@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import sys
+
+from app.import_profile import FLAG, ImportProfiler, enable_from_argv
+
+
+def test_records_first_load_with_nesting(tmp_path, monkeypatch):
+    (tmp_path / "ip_child_mod.py").write_text("import time\ntime.sleep(0.01)\n", encoding="utf-8")
+    (tmp_path / "ip_parent_mod.py").write_text("import ip_child_mod\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    prof = ImportProfiler().install()
+    try:
+        import ip_parent_mod  # noqa: F401
+        import ip_parent_mod  # noqa: F401,F811  (이미 로드됨 → 기록 안 함)
+    finally:
+        prof.uninstall()
+        for name in ("ip_parent_mod", "ip_child_mod"):
+            sys.modules.pop(name, None)
+    names = [r[0] for r in prof.records]
+    assert names.count("ip_parent_mod") == 1
+    parent = next(r for r in prof.records if r[0] == "ip_parent_mod")
+    child = next(r for r in prof.records if r[0] == "ip_child_mod")
+    assert child[3] == parent[3] + 1
+    assert parent[1] >= child[1] >= 0.01
+    assert parent[2] < child[1]
+    assert "ip_child_mod" in prof.report()
+
+
+def test_enable_from_argv_strips_flag():
+    argv = ["prog", FLAG, "--region", "x"]
+    prof = enable_from_argv(argv)
+    try:
+        assert prof is not None
+        assert argv == ["prog", "--region", "x"]
+    finally:
+        prof.uninstall()
+    assert enable_from_argv(["prog"]) is None
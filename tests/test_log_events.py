@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+from loguru import logger
+
+from app.widgets.log_view import LogBuffer
+from scraper.log_events import LogSampler, level_callback, log_event
+
+
+def _capture(level: str = "INFO"):
+    records = []
+    handler = logger.add(lambda m: records.append(m.record), level=level)
+    return records, handler
+
+
+@pytest.fixture
+def no_default_sink():
+    """loguru 기본 stderr 싱크(DEBUG)를 잠시 뗀다. 남아 있으면 DEBUG 지연 인자도 평가된다."""
+    logger.remove()
+    yield
+    logger.remove()
+    logger.add(sys.stderr)
+
+
+def test_sampler_keeps_burst_then_every_nth():
+    sampler = LogSampler(burst=2, every=3)
+    got = [sampler.admit("k") for _ in range(8)]
+    # 1,2 통과 → 3,4 생략 → 5 통과(2건 생략) → 6,7 생략 → 8 통과
+    assert got == [0, 0, None, None, 2, None, None, 2]
+    assert sampler.admit("other") == 0
+
+
+def test_lazy_args_not_evaluated_below_level(no_default_sink):
+    calls = []
+    records, handler = _capture("INFO")
+    try:
+        log_event("카드 {}", "DEBUG", (lambda: calls.append(1) or "x",), lazy=True)
+        log_event("아이템 {} 수집", "INFO", (lambda: "7",), lazy=True, event="item", item_id="a1")
+    finally:
+        logger.remove(handler)
+    assert calls == []
+    assert [r["message"] for r in records] == ["아이템 7 수집"]
+    assert records[0]["extra"] == {"item_id": "a1", "event": "item"}
+
+
+def test_callback_skips_debug_and_keeps_braces():
+    ui = []
+    log_event("상세", "DEBUG", callback=ui.append)
+    log_event("오류: {'a': 1}", "INFO", callback=ui.append)
+    log_event("아이템 {} 수집", "INFO", (3,), callback=ui.append)
+    assert ui == ["오류: {'a': 1}", "아이템 3 수집"]
+
+
+def test_level_reaches_level_aware_callback_and_follows_its_min_level(no_default_sink):
+    buf = LogBuffer(min_level="WARNING")
+    cb = level_callback(level_callback(buf.push), "[원룸] ")
+    calls = []
+    log_event("카드 {}", "DEBUG", (lambda: calls.append(1) or "x",), lazy=True, callback=cb)
+    log_event("진행", "INFO", callback=cb)
+    log_event("차단 의심", "WARNING", callback=cb)
+    # min_level 미만은 렌더링(지연 인자 호출)도 하지 않는다
+    assert calls == [] and buf.drain()[0] == ["[원룸] 차단 의심"]
+
+    buf.set_level("DEBUG")
+    log_event("카드 {}", "DEBUG", (lambda: "x",), lazy=True, callback=cb)
+    assert buf.drain()[0] == ["[원룸] 카드 x"]
+
+
+def test_sampled_item_log_volume_drops():
+    records, handler = _capture("INFO")
+    sampler = LogSampler(burst=5, every=50)
+    try:
+        for n in range(1, 1001):
+            log_event("아이템 {} 수집", "INFO", (n,), sampler=sampler)
+            log_event("  URL={}", "DEBUG", (n,))
+    finally:
+        logger.remove(handler)
+    # 아이템당 2줄(2000줄) → 5 + 995//50 = 24줄
+    assert len(records) == 24
+    assert records[5]["extra"]["suppressed"] == 49
+    assert records[5]["message"].endswith("(+49건 생략)")
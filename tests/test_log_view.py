@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from app.widgets.log_view import LogBuffer
+
+
+def test_ring_buffer_drops_oldest_and_counts():
+    buf = LogBuffer(capacity=3)
+    for i in range(5):
+        buf.push(f"line {i}")
+    lines, dropped = buf.drain()
+    assert lines == ["line 2", "line 3", "line 4"]
+    assert dropped == 2
+    # 카운터는 drain 시 초기화
+    assert buf.drain() == ([], 0)
+
+
+def test_level_filter_and_batched_drain():
+    buf = LogBuffer(capacity=100, min_level="INFO")
+    buf.push("상세", "DEBUG")
+    buf.push("요약 1")
+    buf.push("경고", "WARNING")
+    buf.push("요약 2")
+    first, _ = buf.drain(max_items=2)
+    assert first == ["요약 1", "경고"]
+    assert len(buf) == 1
+    buf.set_level("WARNING")
+    buf.push("무시됨")
+    rest, _ = buf.drain()
+    assert rest == ["요약 2"]
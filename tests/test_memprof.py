@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+import os
+from types import SimpleNamespace
+
+from scraper.memprof import MB, MemoryProfiler, rss_mb
+
+
+class _Cdp:
+    def __init__(self, heap):
+        self.heap = heap
+
+    def send(self, method, params=None):
+        if method == "Performance.getMetrics":
+            self.heap.append(self.heap[-1] + 2 * MB)
+            return {"metrics": [{"name": "JSHeapUsedSize", "value": self.heap[-1]}, {"name": "Documents", "value": 3}]}
+        return {}
+
+    def detach(self):
+        pass
+
+
+def _fake_page(pages):
+    heap = [10 * MB]
+    ctx = SimpleNamespace(pages=pages, browser=None)
+    ctx.new_cdp_session = lambda page: _Cdp(heap)
+    return SimpleNamespace(context=ctx)
+
+
+def test_samples_every_n_pages_and_reports_growth(tmp_path):
+    leak = []
+    tabs = ["main"]
+    prof = MemoryProfiler(every_pages=2).start()
+    prof.attach(_fake_page(tabs))
+    try:
+        for i in range(6):
+            leak.append(bytearray(256 * 1024))
+            tabs.append(f"detail-{i}")
+            prof.maybe_sample(items=i)
+    finally:
+        prof.stop()
+
+    # 2/4/6번째 페이지 + stop()의 마지막 샘플
+    assert [s.page for s in prof.samples] == [2, 4, 6, 6]
+    assert prof.samples[-1].extra == {"final": True}
+    assert prof.samples[0].cdp["Documents"] == 3
+    growth = prof.growth_per_page()
+    assert growth["py_current_mb"] > 0
+    assert growth["open_pages"] > 0
+    assert growth["JSHeapUsedSize"] > 0
+    assert any(__file__ in t["site"] for t in prof.top_growth())
+    assert "할당 증가 상위" in prof.format_report()
+
+    data = json.loads(prof.export(tmp_path / "mem.json").read_text(encoding="utf-8"))
+    assert len(data["samples"]) == 4 and data["top_growth"]
+
+
+def test_rss_of_current_process():
+    assert rss_mb(os.getpid()) > 0 or not os.path.isdir("/proc")
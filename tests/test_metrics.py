@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+import urllib.request
+from types import SimpleNamespace
+
+from scraper import metrics
+from scraper.metrics import MetricsRegistry, serve_metrics
+
+
+def test_counter_labels_and_histogram_render():
+    reg = MetricsRegistry()
+    retries = reg.counter("x_retries_total", "retries", ("op",))
+    retries.inc(op="goto")
+    retries.inc(2, op="goto")
+    retries.inc(op="detail")
+    hist = reg.histogram("x_detail_seconds", "detail", buckets=(1.0, 5.0))
+    for v in (0.5, 2.0, 9.0):
+        hist.observe(v)
+
+    text = reg.render()
+    assert "# TYPE x_retries_total counter" in text
+    assert 'x_retries_total{op="goto"} 3' in text
+    assert 'x_retries_total{op="detail"} 1' in text
+    assert 'x_detail_seconds_bucket{le="1"} 1' in text
+    assert 'x_detail_seconds_bucket{le="5"} 2' in text
+    assert 'x_detail_seconds_bucket{le="+Inf"} 3' in text
+    assert "x_detail_seconds_sum 11.5" in text
+    assert "x_detail_seconds_count 3" in text
+
+
+def test_dump_json_and_text(tmp_path):
+    reg = MetricsRegistry()
+    reg.counter("x_items_total", "items").inc(4)
+    data = json.loads(reg.dump(tmp_path / "m.json").read_text(encoding="utf-8"))
+    assert data == {"x_items_total": 4.0}
+    assert "x_items_total 4" in reg.dump(tmp_path / "m.prom").read_text(encoding="utf-8")
+
+
+def test_record_selector_counts_fallbacks_and_misses():
+    metrics.REGISTRY.reset()
+    card_price = ["span.price", "div.price", "text=만원"]
+    metrics.name_selector_groups(SimpleNamespace(CARD_PRICE=card_price))
+    assert metrics.selector_group(card_price) == "card_price"
+    assert metrics.selector_group(["div.other", "p"]) == "div.other"
+
+    metrics.record_selector("card_price", 0)
+    metrics.record_selector("card_price", 2)
+    metrics.record_selector("card_price", None)
+    fb = metrics.SELECTOR_FALLBACKS
+    assert fb.value(group="card_price", outcome="fallback") == 1
+    assert fb.value(group="card_price", outcome="miss") == 1
+
+
+def test_serve_metrics_endpoint():
+    metrics.REGISTRY.reset()
+    metrics.record_item(3)
+    metrics.record_block("playwright")
+    server = serve_metrics(0)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as resp:
+            body = resp.read().decode("utf-8")
+            assert resp.headers["Content-Type"].startswith("text/plain")
+    finally:
+        server.shutdown()
+    assert "dabang_items_collected_total 3" in body
+    assert 'dabang_blocks_detected_total{engine="playwright"} 1' in body
+    assert "dabang_pages_per_minute" in body
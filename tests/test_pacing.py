@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+from scraper.pacing import AdaptivePacer, parse_retry_after, playwright_response_hook, shared_pacer, reset_shared_pacer
+
+
+def _pacer(**kw) -> AdaptivePacer:
+    kw.setdefault("jitter", 0.0)
+    kw.setdefault("cooldown", 0.0)
+    return AdaptivePacer(**kw)
+
+
+def test_speeds_up_additively_when_healthy():
+    p = _pacer(min_delay=0.2, initial_delay=1.0, step=0.1)
+    for _ in range(5):
+        p.record(latency=0.1, status=200)
+    assert abs(p.delay - 0.5) < 1e-9
+    for _ in range(50):
+        p.record(latency=0.1, status=200)
+    assert p.delay == 0.2
+
+
+def test_backs_off_multiplicatively_on_pushback():
+    p = _pacer(initial_delay=1.0, max_delay=10.0)
+    p.record(status=429)
+    assert p.delay == 2.0
+    p.record(status=503)
+    assert p.delay == 4.0
+    p.record(blocked=True)
+    assert p.delay == 10.0
+    assert p.snapshot().backoffs == 3
+
+
+def test_slow_responses_back_off_and_cooldown_holds_speed():
+    p = _pacer(initial_delay=1.0, latency_target=1.0, cooldown=60.0)
+    p.record(latency=3.0)
+    assert p.delay == 1.5
+    p.record(latency=0.1)  # EWMA가 아직 목표 초과지만 같은 쿨다운 창이라 한 번만 감속
+    assert p.delay == 1.5
+    p._latency = 0.1
+    p.record(latency=0.1)  # 쿨다운 중이라 가속하지 않음
+    assert p.delay == 1.5
+
+
+def test_burst_of_slow_responses_backs_off_once_per_window():
+    p = _pacer(initial_delay=1.0, latency_target=1.0, cooldown=60.0)
+    for _ in range(40):  # 느린 페이지 하나의 XHR 폭주
+        p.record(latency=5.0)
+    p.record(status=503)
+    assert p.delay == 1.5
+    assert p.snapshot().backoffs == 1
+    p._hold_until = 0.0  # 창이 지나면 다시 감속할 수 있다
+    p.record(latency=5.0)
+    assert p.delay == 2.25
+
+
+def test_slots_are_shared_between_threads():
+    p = _pacer(min_delay=0.05, initial_delay=0.05)
+    waits = []
+    lock = threading.Lock()
+
+    def worker():
+        w = p.reserve()
+        with lock:
+            waits.append(w)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    waits.sort()
+    # 4개 스레드가 0, 0.05, 0.10, 0.15초 슬롯을 나눠 가진다
+    assert waits[0] < 0.01
+    assert abs(waits[-1] - 0.15) < 0.02
+
+
+def test_idle_pacer_does_not_sleep():
+    p = _pacer(initial_delay=5.0)
+    t = time.monotonic()
+    assert p.pace() == 0.0
+    assert time.monotonic() - t < 0.1
+
+
+def test_retry_after_delays_next_slot():
+    p = _pacer(initial_delay=0.1)
+    p.record(status=429, retry_after=parse_retry_after("3"))
+    assert p.reserve() > 2.5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") is None
+
+
+def test_playwright_hook_filters_and_records():
+    p = _pacer(initial_delay=1.0)
+    hook = playwright_response_hook(p)
+
+    def response(url, status, rtype="xhr", headers=None):
+        req = SimpleNamespace(resource_type=rtype, timing={"requestStart": 10.0, "responseStart": 110.0})
+        return SimpleNamespace(url=url, status=status, request=req, headers=headers or {})
+
+    hook(response("https://cdn.example.com/a.png", 503, rtype="image"))
+    hook(response("https://other.com/api", 503))
+    assert p.delay == 1.0
+    hook(response("https://www.dabangapp.com/api/3/room", 429, headers={"retry-after": "1"}))
+    assert p.delay == 2.0
+    hook(response("https://www.dabangapp.com/api/3/room", 200))
+    assert abs(p.snapshot().latency - 0.1) < 1e-9
+
+
+def test_shared_pacer_is_process_wide():
+    reset_shared_pacer()
+    try:
+        a = shared_pacer(initial_delay=2.0)
+        assert shared_pacer(initial_delay=9.0) is a
+        assert a.delay == 2.0
+    finally:
+        reset_shared_pacer()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import time
+
+from scraper import progress as progress_mod
+from scraper.progress import ProgressTracker, format_duration
+
+
+def test_rate_and_eta():
+    t = ProgressTracker(target=10)
+    t.set_phase("detail")
+    t.item_done(5)
+    snap = t.snapshot()
+    assert snap.items == 5 and snap.target == 10
+    assert snap.items_per_min > 0
+    assert snap.eta_s is not None and snap.eta_s > 0
+    assert snap.fraction == 0.5
+
+
+def test_eta_zero_when_target_reached_and_unknown_without_target():
+    t = ProgressTracker(target=2)
+    t.item_done(2)
+    assert t.snapshot().eta_s == 0.0
+    assert ProgressTracker().snapshot().eta_s is None
+
+
+def test_skipped_items_shrink_target_without_counting_as_done():
+    t = ProgressTracker(target=4)
+    t.item_done()
+    t.item_skipped(2)
+    snap = t.snapshot()
+    assert snap.items == 1 and snap.target == 2
+    t.item_skipped(5)
+    assert t.snapshot().target == 1
+
+
+def test_phase_times_accumulate():
+    t = ProgressTracker()
+    t.set_phase("list")
+    time.sleep(0.02)
+    with t.phase("detail"):
+        time.sleep(0.02)
+    t.set_phase("done")
+    times = t.snapshot().phase_times
+    assert times["list"] >= 0.02
+    assert times["detail"] >= 0.02
+    assert "done" not in times and "idle" not in times
+
+
+def test_stall_flag(monkeypatch):
+    monkeypatch.setattr(progress_mod, "STALL_SECONDS", 0.01)
+    t = ProgressTracker()
+    t.set_phase("list")
+    time.sleep(0.02)
+    snap = t.snapshot()
+    assert snap.stalled
+    assert "진척 없음" in snap.format()
+    t.set_phase("done")
+    assert not t.snapshot().stalled
+
+
+def test_format_duration():
+    assert format_duration(None) == "--:--"
+    assert format_duration(65) == "01:05"
+    assert format_duration(3725) == "1:02:05"
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+import os
+
+from app.widgets.region_data import BinRegionSource, JsonRegionSource, open_region_source, write_region_bin
+from app.widgets.region_picker import RegionIndex
+
+
+DATA = {
+    "provinces": [
+        {"code": "11", "name": "서울특별시", "children": [{"code": "11140", "name": "중구", "children": [{"code": "11140101", "name": "무교동"}]}]},
+        {"code": "26", "name": "부산광역시", "children": [{"code": "26710", "name": "기장군", "children": [{"code": "26710250", "name": "기장읍"}]}]},
+    ]
+}
+
+
+def test_bin_roundtrip_per_province(tmp_path):
+    path = write_region_bin(DATA, tmp_path / "regions.bin")
+    src = BinRegionSource(path)
+    assert src.provinces() == [("11", "서울특별시"), ("26", "부산광역시")]
+    assert src.load("26") == DATA["provinces"][1]
+    assert src.load("99") is None
+
+
+def test_open_prefers_bin_and_falls_back_to_json(tmp_path):
+    json_path = tmp_path / "regions.json"
+    json_path.write_text(json.dumps(DATA, ensure_ascii=False), encoding="utf-8")
+    assert isinstance(open_region_source(json_path), JsonRegionSource)
+    write_region_bin(DATA, tmp_path / "regions.bin", source_path=json_path)
+    assert isinstance(open_region_source(json_path), BinRegionSource)
+    (tmp_path / "regions.bin").write_bytes(b"garbage!")
+    src = open_region_source(json_path)
+    assert isinstance(src, JsonRegionSource)
+    assert src.load("11") == DATA["provinces"][0]
+
+
+def test_open_checks_bin_against_json_content_not_mtime(tmp_path):
+    json_path = tmp_path / "regions.json"
+    json_path.write_text(json.dumps(DATA, ensure_ascii=False), encoding="utf-8")
+    bin_path = write_region_bin(DATA, tmp_path / "regions.bin", source_path=json_path)
+    # git clone처럼 JSON이 .bin보다 나중에 쓰여도 내용이 같으면 .bin을 쓴다
+    st = bin_path.stat()
+    os.utime(json_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert isinstance(open_region_source(json_path), BinRegionSource)
+
+    changed = {"provinces": DATA["provinces"][:1]}
+    json_path.write_text(json.dumps(changed, ensure_ascii=False), encoding="utf-8")
+    assert isinstance(open_region_source(json_path), JsonRegionSource)
+    # 원본 지문이 없는 .bin은 JSON과 대조할 수 없으므로 쓰지 않는다
+    write_region_bin(changed, bin_path)
+    assert isinstance(open_region_source(json_path), JsonRegionSource)
+
+
+def test_index_built_incrementally_from_source(tmp_path):
+    src = BinRegionSource(write_region_bin(DATA, tmp_path / "regions.bin"))
+    index = RegionIndex()
+    for code, _ in src.provinces():
+        index.add_province(src.load(code))
+    assert [e.full_name for e in index.search("기장")] == ["부산광역시 기장군", "부산광역시 기장군 기장읍"]
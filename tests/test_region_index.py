@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from app.widgets.region_picker import RegionIndex, initials
+
+
+DATA = {
+    "provinces": [
+        {
+            "code": "26",
+            "name": "부산광역시",
+            "children": [
+                {"code": "26110", "name": "중구", "children": [{"code": "26110101", "name": "중앙동1가"}]},
+                {"code": "26710", "name": "기장군", "children": [{"code": "26710250", "name": "기장읍"}, {"code": "26710253", "name": "정관읍"}]},
+            ],
+        },
+        {
+            "code": "11",
+            "name": "서울특별시",
+            "children": [
+                {"code": "11140", "name": "중구", "children": [{"code": "11140101", "name": "무교동"}]},
+            ],
+        },
+    ]
+}
+
+
+def _names(results):
+    return [e.full_name for e in results]
+
+
+def test_all_levels_indexed_and_ranked():
+    index = RegionIndex(DATA)
+    assert len(index.entries) == 2 + 3 + 4
+    assert _names(index.search("기장")) == ["부산광역시 기장군", "부산광역시 기장군 기장읍"]
+    assert _names(index.search("정관"))[0] == "부산광역시 기장군 정관읍"
+
+
+def test_contains_and_initials():
+    index = RegionIndex(DATA)
+    assert "부산광역시 기장군 정관읍" in _names(index.search("관읍"))
+    assert initials("기장군") == "ㄱㅈㄱ"
+    assert _names(index.search("ㄱㅈ")) == ["부산광역시 기장군", "부산광역시 기장군 기장읍"]
+
+
+def test_context_tokens_filter_by_parent():
+    index = RegionIndex(DATA)
+    assert _names(index.search("중구")) == ["서울특별시 중구", "부산광역시 중구"]
+    assert _names(index.search("서울 중구")) == ["서울특별시 중구"]
+
+
+def test_incremental_narrowing_matches_fresh_search():
+    index = RegionIndex(DATA)
+    for k in range(1, 4):
+        index.search("앙동1"[:k])
+    narrowed = _names(index.search("앙동1가"))
+    fresh = _names(RegionIndex(DATA).search("앙동1가"))
+    assert narrowed == fresh == ["부산광역시 중구 중앙동1가"]
+
+
+def test_add_province_incrementally():
+    index = RegionIndex()
+    assert index.search("기장") == []
+    index.add_province(DATA["provinces"][0])
+    assert _names(index.search("기장"))[0] == "부산광역시 기장군"
+
+
+@pytest.mark.skipif(not (Path(__file__).resolve().parents[1] / "data" / "regions_kr.json").exists(), reason="no dataset")
+def test_full_dataset_latency():
+    path = Path(__file__).resolve().parents[1] / "data" / "regions_kr.json"
+    index = RegionIndex(json.loads(path.read_text("utf-8")))
+    index.search("가")
+    t = time.perf_counter()
+    for q in ("기장", "해운대", "앙동", "ㅎㅇㄷ", "부산 중구") * 20:
+        index.search(q)
+    # 질의당 평균 1 ms 이하 (CI 여유를 두고 5배)
+    assert (time.perf_counter() - t) / 100 < 0.005
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import time
+
+from app.widgets.results_table import ResultsModel
+from scraper.parsers import price_to_won
+
+
+def _row(i: int) -> dict:
+    return {
+        "property_type": "원룸",
+        "address": f"부산광역시 기장군 {'기장읍' if i % 2 else '정관읍'} {i}",
+        "price_text": f"월세 500/{i % 90 + 10}",
+        "maintenance_fee": 50000,
+        "realtor": f"중개사 {i % 7}",
+        "posted_at": "2025-01-01",
+        "url": f"https://www.dabangapp.com/room/?detail_id={i}",
+    }
+
+
+def test_price_to_won():
+    assert price_to_won("월세 500/45") == 450_000
+    assert price_to_won("전세 1억 2000") == 120_000_000
+    assert price_to_won("") is None
+
+
+def test_incremental_sort_filter_50k():
+    model = ResultsModel()
+    for i in range(50_000):
+        model.append(_row(i))
+    assert model.commit()
+    assert model.total == len(model) == 50_000
+
+    t0 = time.perf_counter()
+    model.set_sort("price_text")
+    model.set_filter(price_max=200_000, realtor="중개사 3", region="기장읍")
+    window = model.rows(0, 30)
+    assert time.perf_counter() - t0 < 1.0
+
+    assert 0 < len(model) < 50_000
+    prices = [price_to_won(r[2]) for r in window]
+    assert prices == sorted(prices)
+    assert all(p <= 200_000 for p in prices)
+    assert all("기장읍" in r[1] and r[4] == "중개사 3" for r in window)
+
+    # 새 행이 들어와도 필터/정렬은 유지
+    model.append(_row(50_001))
+    model.commit()
+    assert model.total == 50_001
+    assert all("기장읍" in r[1] for r in model.rows(0, 100))
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from scraper.control import CrawlControl, CrawlStopped
+from scraper.retry import CircuitBreaker, RetryBudget, Retrier, backoff_delay
+
+
+def _retrier(**kw) -> Retrier:
+    kw.setdefault("base_delay", 0.001)
+    kw.setdefault("max_delay", 0.002)
+    return Retrier(**kw)
+
+
+def test_backoff_is_capped_full_jitter():
+    for attempt in range(10):
+        d = backoff_delay(attempt, base=0.5, cap=4.0)
+        assert 0.0 <= d <= min(4.0, 0.5 * 2 ** attempt)
+
+
+def test_retries_until_success():
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise RuntimeError("temporary")
+        return "ok"
+
+    assert _retrier(tries=3).call("navigation", flaky) == "ok"
+    assert len(calls) == 3
+
+
+def test_budget_limits_retries_across_call_sites():
+    budget = RetryBudget(ratio=0.0, min_retries=2)
+    assert budget.try_spend() and budget.try_spend()
+    assert not budget.try_spend()
+
+    r = _retrier(tries=5, budget_min=1, budget_ratio=0.0, failure_threshold=100)
+    calls = []
+
+    def down():
+        calls.append(1)
+        raise RuntimeError("outage")
+
+    with pytest.raises(RuntimeError):
+        r.call("detail", down)
+    with pytest.raises(RuntimeError):
+        r.call("detail", down)
+    # 첫 호출이 예산(1회)을 다 써서 두 번째 호출은 재시도 없이 실패
+    assert len(calls) == 3
+    r.new_run()
+    assert r.budget.retries == 0
+
+
+def test_breaker_opens_half_opens_and_closes():
+    br = CircuitBreaker("search", failure_threshold=2, reset_timeout=0.05)
+    br.record_failure()
+    assert br.acquire() is None
+    br.record_failure()
+    assert br.state == CircuitBreaker.OPEN
+    assert br.acquire() > 0
+    time.sleep(0.06)
+    assert br.acquire() is None  # 시험 호출 한 번
+    assert br.acquire() is not None  # 결과가 나올 때까지 나머지는 대기
+    br.record_success()
+    assert br.state == CircuitBreaker.CLOSED
+
+
+def test_open_breaker_pauses_all_callers_then_recovers():
+    r = _retrier(tries=1, failure_threshold=1, reset_timeout=0.1)
+    with pytest.raises(RuntimeError):
+        r.call("navigation", lambda: (_ for _ in ()).throw(RuntimeError("down")))
+    t = time.monotonic()
+    assert r.call("navigation", lambda: "up") == "up"
+    assert time.monotonic() - t >= 0.05
+    assert r.breaker("navigation").state == CircuitBreaker.CLOSED
+    # 다른 종류는 영향 없음
+    assert r.breaker("detail").state == CircuitBreaker.CLOSED
+
+
+def test_stop_interrupts_open_breaker_wait():
+    r = _retrier(tries=1, failure_threshold=1, reset_timeout=60)
+    with pytest.raises(RuntimeError):
+        r.call("search", lambda: (_ for _ in ()).throw(RuntimeError("down")))
+    ctl = CrawlControl()
+    threading.Timer(0.05, ctl.request_stop).start()
+    t = time.monotonic()
+    with pytest.raises(CrawlStopped):
+        r.call("search", lambda: "never", control=ctl)
+    assert time.monotonic() - t < 1.5
+
+
+def test_guard_records_without_retrying():
+    r = _retrier(failure_threshold=2)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            with r.guard("detail"):
+                raise ValueError("no detail")
+    assert r.breaker("detail").state == CircuitBreaker.OPEN
+
+
+def test_guard_inside_retried_call_does_not_multiply_attempts():
+    r = _retrier(tries=3, budget_ratio=1.0)
+    navigations = []
+
+    def search():
+        with r.guard("navigation"):
+            navigations.append(1)
+            raise RuntimeError("page down")
+
+    with pytest.raises(RuntimeError):
+        r.call("search", search)
+    assert len(navigations) == 3
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import math
+
+from scraper.selector_stats import SelectorStats, load, rank, reset_shared_selector_stats, shared_selector_stats
+from scraper.utils.locators import count_sync, first_locator_from_element_sync
+
+
+def test_flush_accumulates_across_runs(tmp_path):
+    path = tmp_path / "selector_stats.json"
+    stats = SelectorStats()
+    stats.record("card_price", "span.price", True, 0.01)
+    stats.record("card_price", "div.old-hash", False, 0.2)
+    stats.flush(path)
+    # 두 번째 실행: 이전 값에 더해지고, 이미 flush한 값은 다시 더하지 않는다
+    stats.record("card_price", "div.old-hash", False, 0.3)
+    stats.flush(path)
+
+    # 기록 없는 실행(실패/테스트 등)은 파일을 건드리지 않는다
+    assert stats.flush(path) is None
+
+    data = load(path)
+    assert data["runs"] == 2
+    old = data["groups"]["card_price"]["div.old-hash"]
+    assert old["attempts"] == 2 and old["hits"] == 0 and math.isclose(old["seconds"], 0.5)
+    assert data["groups"]["card_price"]["span.price"]["last_hit"]
+
+
+def test_rank_orders_by_cost_and_flags_dead():
+    data = {"version": 1, "runs": 1, "groups": {"g": {
+        "fast": {"attempts": 10, "hits": 10, "seconds": 0.1},
+        "slow": {"attempts": 10, "hits": 2, "seconds": 4.0},
+        "never": {"attempts": 6, "hits": 0, "seconds": 3.0},
+        "new": {"attempts": 2, "hits": 0, "seconds": 0.1},
+    }}}
+    rows = rank(data, min_attempts=5)
+    assert [r["selector"] for r in rows] == ["never", "new", "slow", "fast"]
+    assert [r["dead"] for r in rows] == [True, False, False, False]
+
+
+class _Loc:
+    def __init__(self, n):
+        self.n = n
+
+    def count(self):
+        if self.n < 0:
+            raise ValueError("bad selector")
+        return self.n
+
+
+class _Root:
+    def __init__(self, counts):
+        self.counts = counts
+
+    def locator(self, sel):
+        return _Loc(self.counts.get(sel, 0))
+
+
+def test_locator_cascade_records_each_attempt():
+    reset_shared_selector_stats()
+    group = ["span.hash-a", "::bad", "span.price"]
+    loc = first_locator_from_element_sync(_Root({"::bad": -1, "span.price": 2}), group)
+    assert loc.count() == 2
+    stats = shared_selector_stats()
+    assert stats.get("span.hash-a", "span.hash-a")["attempts"] == 1
+    assert stats.get("span.hash-a", "::bad")["errors"] == 1
+    assert stats.get("span.hash-a", "span.price")["hits"] == 1
+    reset_shared_selector_stats()
+
+
+def test_count_sync_records_hand_written_loops():
+    reset_shared_selector_stats()
+    root = _Root({"li.card": 3, "::bad": -1})
+    assert count_sync(root, "li.card", "card_root_selectors") == 3
+    assert count_sync(root, "div.rotted", "card_root_selectors") == 0
+    assert count_sync(root, "::bad", ["div.rotted", "::bad"]) == 0
+    stats = shared_selector_stats()
+    assert stats.get("card_root_selectors", "li.card")["hits"] == 1
+    assert stats.get("card_root_selectors", "div.rotted")["hits"] == 0
+    assert stats.get("div.rotted", "::bad")["errors"] == 1
+    reset_shared_selector_stats()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+import threading
+
+from scraper.tracing import Tracer, get_tracer, set_tracer, span, traced
+
+
+def test_disabled_tracer_records_nothing():
+    prev = set_tracer(None)
+    try:
+        with span("goto", url="x") as s:
+            s.end()
+        assert get_tracer().events()[1:] == []
+    finally:
+        set_tracer(prev)
+
+
+def test_spans_nest_and_export_chrome_trace(tmp_path):
+    tracer = Tracer()
+    prev = set_tracer(tracer)
+
+    @traced("open_list_panel")
+    def open_panel():
+        return 1
+
+    try:
+        with span("property_type", type="원룸"):
+            assert open_panel() == 1
+            with span("card", index=0):
+                detail = span("detail")
+                detail.end(error="Timeout")
+                detail.end()  # 두 번 닫아도 한 번만 기록
+    finally:
+        set_tracer(prev)
+
+    path = tracer.export(tmp_path / "trace.json")
+    data = json.loads(path.read_text(encoding="utf-8"))
+    spans = {e["name"]: e for e in data["traceEvents"] if e["ph"] == "X"}
+    assert set(spans) == {"property_type", "open_list_panel", "card", "detail"}
+    outer, card, detail = spans["property_type"], spans["card"], spans["detail"]
+    assert outer["args"] == {"type": "원룸"} and detail["args"] == {"error": "Timeout"}
+    # 같은 스레드에서 바깥 span이 안쪽 span을 시간상 감싼다
+    assert outer["ts"] <= card["ts"] <= detail["ts"]
+    assert detail["ts"] + detail["dur"] <= card["ts"] + card["dur"] <= outer["ts"] + outer["dur"]
+    assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in data["traceEvents"])
+    assert tracer.summary()["detail"][0] == 1
+
+
+def test_exception_marks_span_and_threads_are_separate():
+    tracer = Tracer()
+    try:
+        with tracer.span("goto"):
+            raise RuntimeError("net")
+    except RuntimeError:
+        pass
+    t = threading.Thread(target=lambda: tracer.span("card").end(), name="worker-1")
+    t.start()
+    t.join()
+    events = [e for e in tracer.events() if e["ph"] == "X"]
+    assert events[0]["args"] == {"error": "RuntimeError"}
+    assert events[0]["tid"] != events[1]["tid"]
+    names = {e["args"]["name"] for e in tracer.events() if e["name"] == "thread_name"}
+    assert "worker-1" in names
+
+
+def test_event_cap():
+    tracer = Tracer(max_events=2)
+    for _ in range(5):
+        tracer.span("card").end()
+    assert len([e for e in tracer.events() if e["ph"] == "X"]) == 2 and tracer.dropped == 3
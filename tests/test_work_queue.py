@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from storage.work_queue import LeaseLost, SqliteWorkQueue, run_worker
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lease_expiry_fences_stale_worker_and_merges_by_item_id(tmp_path):
+    clock = _Clock()
+    q = SqliteWorkQueue(tmp_path / "q.sqlite3", max_attempts=3, clock=clock)
+    assert q.add_tasks(["강남구"], ["원룸", "투룸"]) == 2
+    assert q.add_tasks(["강남구"], ["원룸"]) == 0
+
+    a = q.acquire("node-a", lease_s=60)
+    b = q.acquire("node-b", lease_s=60)
+    assert {a.task.id, b.task.id} == {"강남구|원룸", "강남구|투룸"}
+    assert q.acquire("node-c", lease_s=60) is None
+    assert q.upload(a, [{"item_id": "1", "price_text": "100"}, {"item_id": "2"}]) == 2
+
+    # node-a가 멈춘 사이 임대가 만료되어 node-c가 이어 받는다
+    clock.now += 61
+    assert q.heartbeat(b, 60)
+    c = q.acquire("node-c", lease_s=60)
+    assert c.task.id == a.task.id and c.task.attempts == 2
+    assert not q.heartbeat(a, 60)
+    with pytest.raises(LeaseLost):
+        q.upload(a, [{"item_id": "3"}])
+    with pytest.raises(LeaseLost):
+        q.complete(a)
+
+    # 같은 매물을 다시 올리면 갱신만
+    assert q.upload(c, [{"item_id": "1", "price_text": "90"}, {"item_id": "3"}]) == 1
+    q.complete(c)
+    results = {r["item_id"]: r for r in q.results()}
+    assert sorted(results) == ["1", "2", "3"] and results["1"]["price_text"] == "90"
+    assert q.stats() == {"pending": 0, "leased": 1, "done": 1, "failed": 0}
+    q.close()
+
+
+def test_fail_retries_until_max_attempts(tmp_path):
+    q = SqliteWorkQueue(tmp_path / "q.sqlite3", max_attempts=2)
+    q.add_tasks(["마포구"], ["빌라"])
+    assert q.fail(q.acquire("w", 60), "timeout") == "pending"
+    assert q.fail(q.acquire("w", 60), "timeout") == "failed"
+    assert q.acquire("w", 60) is None
+    assert q.tasks()[0].error == "timeout"
+    q.close()
+
+
+def test_queue_file_uses_rollback_journal_for_shared_disks(tmp_path):
+    path = tmp_path / "q.sqlite3"
+    q = SqliteWorkQueue(path)
+    q.add_tasks(["강남구"], ["원룸"])
+    q.close()
+    # 공유 디스크에서는 WAL의 -shm 인덱스를 머신끼리 나눌 수 없다
+    assert not (tmp_path / "q.sqlite3-wal").exists() and not (tmp_path / "q.sqlite3-shm").exists()
+    q = SqliteWorkQueue(path)
+    assert q._conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    q.close()
+
+
+def test_workers_share_queue_and_retry_failures(tmp_path):
+    path = tmp_path / "q.sqlite3"
+    seed = SqliteWorkQueue(path)
+    seed.add_tasks(["강남구", "마포구", "서초구"], ["원룸", "투룸"])
+    seed.close()
+    flaky = {"서초구|투룸"}
+
+    def scrape(task, control, on_item):
+        if task.id in flaky:
+            flaky.discard(task.id)
+            raise RuntimeError("blocked")
+        for i in range(5):
+            # 지역이 겹치는 매물(같은 item_id)은 한 건으로 합쳐진다
+            on_item({"item_id": f"{task.property_type}-{i}", "address": task.region})
+
+    done = []
+
+    def worker(name):
+        q = SqliteWorkQueue(path)
+        done.append(run_worker(q, name, scrape, heartbeat_s=0.05, lease_s=30, upload_batch=2))
+        q.close()
+
+    threads = [threading.Thread(target=worker, args=(f"w{i}",)) for i in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(30)
+
+    q = SqliteWorkQueue(path)
+    assert sum(done) == 6
+    assert q.stats()["done"] == 6
+    retried = next(t for t in q.tasks() if t.id == "서초구|투룸")
+    assert retried.attempts == 2
+    assert len(list(q.results())) == 10
+    q.close()
+
+
+def test_lost_lease_stops_only_that_task(tmp_path):
+    clock = _Clock()
+    q = SqliteWorkQueue(tmp_path / "q.sqlite3", clock=clock)
+    q.add_tasks(["강남구"], ["원룸", "투룸"])
+    seen = []
+
+    def scrape(task, control, on_item):
+        seen.append(task.id)
+        if len(seen) == 1:
+            # 작업 도중 다른 작업자가 만료된 임대를 가져간다
+            clock.now += 100
+            assert q.acquire("other", 60).task.id == task.id
+            assert not control.sleep(5)
+            assert control.stop_reason == "lease_lost"
+        on_item({"item_id": task.id})
+
+    assert run_worker(q, "me", scrape, lease_s=10, heartbeat_s=0.02) == 1
+    assert len(seen) == 2
+    assert q.stats()["leased"] == 1
+    q.close()
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+수집 종단 간(end-to-end) 벤치마크 + 단계별 지연 예산
+
+로컬 fixture 사이트(scraper.fixture_site)를 규모별(기본 50/500/5000건)로 띄우고
+엔진마다 별도 프로세스에서 끝까지 수집한 뒤 다음을 기록한다.
+- 총 소요, items/s, 브라우저 왕복 수(Playwright 프로토콜 메시지 / WebDriver 명령)
+- Python 프로세스와 브라우저 프로세스 트리의 최대 RSS
+- 단계별 시간 (세 엔진 모두 scraper.engine 어댑터가 모은 ProgressTracker 단계)
+
+결과는 JSON 기록 파일에 누적하고, 같은 조건의 최근 기록과 비교해 처리량이 떨어지거나
+왕복 수가 늘었거나 단계 예산을 넘으면 종료 코드 1로 실패한다.
+작업자 프로세스(--worker)와 그 실행 도우미(worker_command/run_subprocess)는 tools/bench_engines.py도 쓴다.
+
+예) python tools/bench_crawl.py --engines scraper --scales 50,500
+    python tools/bench_crawl.py --engines selenium,crawler --budget list=0.2 --tolerance 0.1
+    python tools/bench_crawl.py --engines scraper --scales 50 --replay-har bench/gangnam.har --har-latency 150
+      (app/cli_collect.py --har bench/gangnam.har 로 기록한 실제 사이트 응답을 네트워크 없이 재생)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_HISTORY = ROOT / "bench" / "crawl_history.json"
+
+# 실행 전체에 한 번 드는 단계: 총 초
+TOTAL_BUDGETS: Dict[str, float] = {"navigate": 60.0, "search": 90.0}
+# 매물 수에 비례하는 단계: 건당 초
+PER_ITEM_BUDGETS: Dict[str, float] = {"list": 1.0, "detail": 8.0}
+
+try:  # Windows에는 resource 모듈이 없다
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+
+# ---------------------------------------------------------------------------
+# 측정 도구 (작업자 프로세스 안에서 사용)
+# ---------------------------------------------------------------------------
+
+def usage() -> Dict[str, float]:
+    """이 프로세스 + 종료된 하위 프로세스(브라우저, 드라이버)의 CPU 시간과 최대 RSS (resource 없으면 빈 dict)."""
+    if resource is None:
+        return {}
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    kids = resource.getrusage(resource.RUSAGE_CHILDREN)
+    # ru_maxrss 단위: Linux KB, macOS bytes
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "cpu_s": own.ru_utime + own.ru_stime + kids.ru_utime + kids.ru_stime,
+        "python_peak_mb": own.ru_maxrss / scale,
+        "browser_peak_mb": kids.ru_maxrss / scale,
+    }
+
+
+class RssSampler:
+    """자기 자신과 하위 프로세스(브라우저/드라이버) RSS 합계의 최댓값을 주기적으로 기록 (Linux /proc)."""
+
+    def __init__(self, interval_s: float = 0.5) -> None:
+        self.interval_s = interval_s
+        self.python_peak_mb = 0.0
+        self.browser_peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+        self.enabled = os.path.isdir("/proc")
+
+    def sample(self) -> None:
+        from scraper.memprof import descendant_pids, rss_mb
+
+        me = os.getpid()
+        self.python_peak_mb = max(self.python_peak_mb, rss_mb(me))
+        total = sum(rss_mb(pid) for pid in descendant_pids(me))
+        self.browser_peak_mb = max(self.browser_peak_mb, total)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            self.sample()
+
+    def __enter__(self) -> "RssSampler":
+        if self.enabled:
+            self.sample()
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stop.set()
+        if self.enabled:
+            self._thread.join(timeout=5)
+        else:
+            u = usage()
+            self.python_peak_mb = u.get("python_peak_mb", 0.0)
+            self.browser_peak_mb = u.get("browser_peak_mb", 0.0)
+
+
+class RoundTripCounter:
+    """Playwright 프로토콜 요청과 Selenium WebDriver 명령 수를 센다 (클래스 메서드 래핑)."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._lock = threading.Lock()
+        self._restore: List[Callable[[], None]] = []
+
+    def _hit(self) -> None:
+        with self._lock:
+            self.count += 1
+
+    def install(self) -> "RoundTripCounter":
+        try:
+            from playwright._impl._connection import Channel
+
+            name = "_inner_send" if hasattr(Channel, "_inner_send") else "send"
+            orig = getattr(Channel, name)
+            counter = self
+
+            async def counted(self: Any, *args: Any, **kwargs: Any) -> Any:
+                counter._hit()
+                return await orig(self, *args, **kwargs)
+
+            setattr(Channel, name, counted)
+            self._restore.append(lambda: setattr(Channel, name, orig))
+        except Exception:
+            pass
+        try:
+            from selenium.webdriver.remote.webdriver import WebDriver
+
+            orig_exec = WebDriver.execute
+            counter = self
+
+            def counted_exec(self: Any, *args: Any, **kwargs: Any) -> Any:
+                counter._hit()
+                return orig_exec(self, *args, **kwargs)
+
+            WebDriver.execute = counted_exec  # type: ignore[method-assign]
+            self._restore.append(lambda: setattr(WebDriver, "execute", orig_exec))
+        except Exception:
+            pass
+        return self
+
+    def uninstall(self) -> None:
+        while self._restore:
+            self._restore.pop()()
+
+
+def _run_engine(args: argparse.Namespace, phases: Dict[str, float]) -> int:
+    from scraper.engine import CrawlRequest, create_engine
+
+    options: Dict[str, Any] = {}
+    if args.worker == "scraper":
+        options.update(replay_har_path=args.replay_har, net_latency_ms=args.har_latency)
+    engine = create_engine(args.worker, **options)
+    out = engine.crawl(CrawlRequest(region=args.region, limit=args.scale, headless=not args.show, page_size=args.page_size))
+    phases.update(out.phases)
+    return len(out.items)
+
+
+def run_worker(args: argparse.Namespace) -> int:
+    """자식 프로세스: 한 엔진 × 한 규모를 수집하고 결과 JSON 한 줄을 출력."""
+    sys.path.insert(0, str(ROOT))
+    phases: Dict[str, float] = {}
+    result: Dict[str, Any] = {"items": 0, "error": None}
+    counter = RoundTripCounter().install()
+    with RssSampler() as rss:
+        t = time.perf_counter()
+        try:
+            result["items"] = _run_engine(args, phases)
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"
+        result["wall_s"] = time.perf_counter() - t
+    counter.uninstall()
+    result.update(
+        phases={k: round(v, 3) for k, v in phases.items()},
+        round_trips=counter.count,
+        cpu_s=round(usage().get("cpu_s", 0.0), 2),
+        python_peak_mb=round(rss.python_peak_mb, 1),
+        browser_peak_mb=round(rss.browser_peak_mb, 1),
+    )
+    print(json.dumps(result, ensure_ascii=False))
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# 실행/비교 (부모 프로세스)
+# ---------------------------------------------------------------------------
+
+def _git_rev() -> str:
+    try:
+        out = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL)
+        return out.decode().strip()
+    except Exception:
+        return ""
+
+
+def worker_command(
+    engine: str,
+    scale: int,
+    region: str,
+    page_size: int = 24,
+    show: bool = False,
+    replay_har: Optional[str] = None,
+    har_latency: float = 0.0,
+) -> List[str]:
+    """엔진 하나 × 매물 수 하나를 별도 프로세스로 수집하는 명령 (결과는 stdout 마지막 JSON 줄)."""
+    cmd = [
+        sys.executable, str(Path(__file__).resolve()), "--worker", engine,
+        "--scale", str(scale), "--page-size", str(page_size), "--region", region,
+    ]
+    if show:
+        cmd.append("--show")
+    if replay_har:
+        cmd += ["--replay-har", replay_har, "--har-latency", str(har_latency)]
+    return cmd
+
+
+def run_case(engine: str, scale: int, args: argparse.Namespace) -> Dict[str, Any]:
+    from scraper.fixture_site import FixtureConfig, FixtureSite
+
+    cfg = FixtureConfig(count=scale, page_size=args.page_size, latency_s=args.latency, seed=args.seed)
+    cmd = worker_command(engine, scale, args.region, args.page_size, args.show, args.replay_har, args.har_latency)
+    entry: Dict[str, Any] = {
+        "ts": datetime.now().isoformat(timespec="seconds"),
+        "rev": _git_rev(),
+        "engine": engine,
+        "scale": scale,
+        "latency_s": args.latency,
+        # scraper(DabangScraper)만 상세 페이지를 방문한다
+        "detail": engine == "scraper",
+    }
+    if args.replay_har:
+        # 기록한 실제 사이트 응답으로 재생: fixture 사이트 없이, 네트워크도 쓰지 않는다
+        entry.update(har=Path(args.replay_har).name, latency_s=args.har_latency / 1000)
+        env = {k: v for k, v in os.environ.items() if k != "DABANG_BASE_URL"}
+        entry.update(run_subprocess(cmd, env, args.timeout))
+        return _finish(entry)
+    with FixtureSite(cfg) as site:
+        result = run_subprocess(cmd, dict(os.environ, DABANG_BASE_URL=site.url), args.timeout)
+        entry["http_requests"] = site.stats.requests
+    entry.update(result)
+    return _finish(entry)
+
+
+def run_subprocess(cmd: List[str], env: Dict[str, str], timeout: float) -> Dict[str, Any]:
+    """작업자를 실행하고 stdout 마지막 JSON 줄을 돌려준다 (시간 초과/출력 없음은 error로)."""
+    try:
+        proc = subprocess.run(cmd, env=env, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"items": 0, "error": f"timeout {timeout:.0f}s"}
+    lines = [ln for ln in proc.stdout.splitlines() if ln.startswith("{")]
+    return json.loads(lines[-1]) if lines else {"items": 0, "error": (proc.stderr or "no output").strip()[-300:]}
+
+
+def _finish(entry: Dict[str, Any]) -> Dict[str, Any]:
+    wall, items = entry.get("wall_s") or 0.0, entry.get("items") or 0
+    entry["items_per_s"] = round(items / wall, 3) if wall else 0.0
+    entry["round_trips_per_item"] = round(entry.get("round_trips", 0) / items, 2) if items else None
+    return entry
+
+
+def _same_case(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    return all(a.get(k) == b.get(k) for k in ("engine", "scale", "latency_s", "detail", "har"))
+
+
+def check(entry: Dict[str, Any], history: List[Dict[str, Any]], args: argparse.Namespace) -> List[str]:
+    """실패 사유 목록 (비었으면 통과)."""
+    problems: List[str] = []
+    if entry.get("error"):
+        return [f"오류: {entry['error']}"]
+    if entry["items"] < entry["scale"]:
+        problems.append(f"수집 부족 {entry['items']}/{entry['scale']}")
+    items = max(1, entry["items"])
+    budgets = dict(PER_ITEM_BUDGETS)
+    totals = dict(TOTAL_BUDGETS)
+    for phase, limit in args.budget:
+        (totals if phase in totals else budgets)[phase] = limit
+    for phase, seconds in (entry.get("phases") or {}).items():
+        if phase in totals and seconds > totals[phase]:
+            problems.append(f"{phase} {seconds:.1f}s > 예산 {totals[phase]:.1f}s")
+        elif phase in budgets and seconds / items > budgets[phase]:
+            problems.append(f"{phase} 건당 {seconds / items:.2f}s > 예산 {budgets[phase]:.2f}s")
+    base = [h for h in history if _same_case(h, entry) and not h.get("error")][-args.baseline_runs:]
+    if base:
+        ref_rate = statistics.median(h["items_per_s"] for h in base)
+        if ref_rate and entry["items_per_s"] < ref_rate * (1 - args.tolerance):
+            problems.append(f"처리량 회귀 {entry['items_per_s']:.2f} < 기준 {ref_rate:.2f} items/s")
+        rts = [h["round_trips_per_item"] for h in base if h.get("round_trips_per_item")]
+        cur = entry.get("round_trips_per_item")
+        if rts and cur and cur > statistics.median(rts) * (1 + args.tolerance):
+            problems.append(f"왕복 수 회귀 {cur:.1f} > 기준 {statistics.median(rts):.1f} /건")
+    return problems
+
+
+def _parse_budget(text: str) -> Tuple[str, float]:
+    phase, _, value = text.partition("=")
+    try:
+        return phase.strip(), float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"예산 형식은 phase=초 입니다: {text}") from None
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="fixture 사이트 대상 종단 간 수집 벤치마크")
+    p.add_argument(
+        "--engines", default="scraper,selenium,crawler",
+        help="scraper(DabangScraper), selenium(DabangSelenium), crawler(realestate_dabang DabangCrawler)",
+    )
+    p.add_argument("--scales", default="50,500,5000", help="쉼표 구분 매물 수")
+    p.add_argument("--page-size", type=int, default=24)
+    p.add_argument("--latency", type=float, default=0.0, help="fixture 응답 지연(초)")
+    p.add_argument("--seed", type=int, default=7)
+    p.add_argument("--region", default="강남구")
+    p.add_argument("--show", action="store_true", help="브라우저 창 표시")
+    p.add_argument("--timeout", type=float, default=6 * 3600, help="케이스당 제한 시간(초)")
+    p.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="JSON 기록 파일")
+    p.add_argument("--no-record", action="store_true", help="기록 파일에 추가하지 않음")
+    p.add_argument("--baseline-runs", type=int, default=5, help="비교할 최근 기록 수")
+    p.add_argument("--tolerance", type=float, default=0.15, help="회귀 허용 비율")
+    p.add_argument("--budget", type=_parse_budget, action="append", default=[], help="단계 예산 덮어쓰기 (예: detail=5)")
+    p.add_argument("--replay-har", help="fixture 대신 기록한 HAR(실제 사이트 응답)로 재생 (scraper 엔진만)")
+    p.add_argument("--har-latency", type=float, default=0.0, help="HAR 재생 시 응답 지연(ms)")
+    p.add_argument("--worker", help=argparse.SUPPRESS)
+    p.add_argument("--scale", type=int, help=argparse.SUPPRESS)
+    args = p.parse_args()
+
+    if args.worker:
+        return run_worker(args)
+    if args.replay_har and args.engines != "scraper":
+        print("--replay-har는 scraper 엔진만 지원합니다 → --engines scraper", file=sys.stderr)
+        args.engines = "scraper"
+
+    sys.path.insert(0, str(ROOT))
+    history: List[Dict[str, Any]] = []
+    if args.history.exists():
+        history = json.loads(args.history.read_text(encoding="utf-8"))
+
+    failed = False
+    print(f"{'engine':<11}{'scale':>6}{'items':>7}{'wall s':>9}{'items/s':>9}{'rt/item':>9}{'py MB':>8}{'br MB':>8}  결과")
+    for engine in [e.strip() for e in args.engines.split(",") if e.strip()]:
+        for scale in [int(s) for s in args.scales.split(",") if s.strip()]:
+            entry = run_case(engine, scale, args)
+            problems = check(entry, history, args)
+            failed = failed or bool(problems)
+            rt = entry.get("round_trips_per_item")
+            print(
+                f"{engine:<11}{scale:>6}{entry['items']:>7}{entry.get('wall_s', 0):>9.1f}{entry['items_per_s']:>9.2f}"
+                f"{(f'{rt:.1f}' if rt else '-'):>9}{entry.get('python_peak_mb', 0):>8.0f}{entry.get('browser_peak_mb', 0):>8.0f}"
+                f"  {'; '.join(problems) or 'OK'}"
+            )
+            phases = entry.get("phases") or {}
+            if phases:
+                print("    " + ", ".join(f"{k} {v:.1f}s" for k, v in sorted(phases.items(), key=lambda kv: -kv[1])))
+            history.append(entry)
+
+    if not args.no_record:
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        args.history.write_text(json.dumps(history, ensure_ascii=False, indent=1), encoding="utf-8")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+수집 엔진 비교 벤치마크
+
+같은 사이트(기본: DABANG_BASE_URL, 보통 로컬 fixture 사이트)에 대해 실제로 배포되는 세 엔진
+(scraper: DabangScraper, selenium: DabangSelenium, crawler: realestate_dabang DabangCrawler)을
+scraper.engine 어댑터로 별도 프로세스에서 실행하고 처리량(items/s), CPU 시간, 최대 메모리를 비교한다.
+엔진마다 프로세스를 나눠 브라우저/드라이버 메모리가 서로 섞이지 않게 한다
+(작업자 프로세스와 측정은 tools/bench_crawl.py의 것을 그대로 쓴다).
+scraper는 상세 페이지까지 방문하고 나머지는 목록 카드만 읽으므로, 건당 시간은 단계별로 비교한다.
+
+예) python tools/bench_engines.py --fixture --fixture-count 500 --limit 200 --repeat 3
+    python tools/bench_engines.py --base-url http://127.0.0.1:8765 --limit 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from bench_crawl import ROOT, run_subprocess, worker_command
+
+
+def run_one(engine: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """bench_crawl 작업자 프로세스로 한 회차 수집 (결과: items, phases, wall_s, cpu_s, *_peak_mb)."""
+    env = dict(os.environ)
+    if args.base_url:
+        env["DABANG_BASE_URL"] = args.base_url
+    t = time.perf_counter()
+    result = run_subprocess(worker_command(engine, args.limit, args.region, show=args.show), env, args.timeout)
+    result["engine"] = engine
+    result["process_s"] = time.perf_counter() - t
+    return result
+
+
+def summarize(engine: str, runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    ok = [r for r in runs if not r.get("error")]
+    rates = [r["items"] / r["wall_s"] for r in ok if r.get("wall_s")]
+    cpu = [r["cpu_s"] for r in ok if "cpu_s" in r]
+    rss = [r.get("python_peak_mb", 0.0) + r.get("browser_peak_mb", 0.0) for r in ok if "python_peak_mb" in r]
+    return {
+        "engine": engine,
+        "runs": len(runs),
+        "failures": len(runs) - len(ok),
+        "items": statistics.median([r["items"] for r in ok]) if ok else 0,
+        "items_per_s": statistics.median(rates) if rates else 0.0,
+        "cpu_s": statistics.median(cpu) if cpu else None,
+        "peak_rss_mb": max(rss) if rss else None,
+        "errors": [r["error"] for r in runs if r.get("error")],
+    }
+
+
+def print_table(rows: List[Dict[str, Any]]) -> None:
+    print(f"{'engine':<12}{'items':>8}{'items/s':>10}{'cpu s':>9}{'rss MB':>9}{'fail':>6}")
+    for r in rows:
+        cpu = f"{r['cpu_s']:.1f}" if r.get("cpu_s") is not None else "-"
+        rss = f"{r['peak_rss_mb']:.0f}" if r.get("peak_rss_mb") else "-"
+        print(f"{r['engine']:<12}{r['items']:>8}{r['items_per_s']:>10.2f}{cpu:>9}{rss:>9}{r['failures']:>6}")
+        for err in r["errors"][:1]:
+            print(f"    오류: {err}")
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="수집 엔진(DabangScraper/DabangSelenium/DabangCrawler) 비교 벤치마크")
+    p.add_argument("--engines", default="scraper,selenium,crawler", help="쉼표 구분 엔진 목록 (scraper, selenium, crawler)")
+    p.add_argument("--base-url", default=os.getenv("DABANG_BASE_URL"), help="대상 사이트 (기본: DABANG_BASE_URL)")
+    p.add_argument("--region", default="강남구")
+    p.add_argument("--limit", type=int, default=100)
+    p.add_argument("--repeat", type=int, default=1)
+    p.add_argument("--show", action="store_true", help="브라우저 창 표시")
+    p.add_argument("--timeout", type=float, default=900.0, help="회차당 제한 시간(초)")
+    p.add_argument("--json", dest="json_path", help="요약을 JSON 파일로 저장")
+    p.add_argument("--fixture", action="store_true", help="로컬 fixture 사이트를 띄워 그 주소로 측정")
+    p.add_argument("--fixture-count", type=int, default=500)
+    p.add_argument("--fixture-latency", type=float, default=0.0, help="fixture 응답 지연(초)")
+    args = p.parse_args()
+
+    site = None
+    if args.fixture:
+        sys.path.insert(0, str(ROOT))
+        from scraper.fixture_site import FixtureConfig, FixtureSite
+
+        site = FixtureSite(FixtureConfig(count=args.fixture_count, latency_s=args.fixture_latency)).start()
+        args.base_url = site.url
+        print(f"fixture site: {site.url} (매물 {args.fixture_count}건)")
+    summaries = []
+    try:
+        for engine in [e.strip() for e in args.engines.split(",") if e.strip()]:
+            runs = [run_one(engine, args) for _ in range(args.repeat)]
+            summaries.append(summarize(engine, runs))
+    finally:
+        if site is not None:
+            site.stop()
+    print_table(summaries)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(summaries, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0 if all(s["failures"] == 0 for s in summaries) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+셀렉터 후보 적중률/비용 보고서
+
+수집기가 실행마다 누적한 logs/selector_stats.json (scraper.selector_stats)을 읽어
+후보별 시도·적중 수, 시도당 시간, 적중당 비용을 보여 준다.
+- 적중당 비용이 큰 순으로 정렬 (적중 0인 후보가 맨 위)
+- DEAD: --min-attempts번 이상 시도했는데 한 번도 맞지 않은 후보 → 목록에서 빼도 되는 후보
+- 그룹별로 DEAD 후보에 쓴 총 시간 (정리하면 아낄 수 있는 시간)
+
+예) python tools/selector_report.py
+    python tools/selector_report.py --group card_price --top 0
+    python tools/selector_report.py --dead-only --min-attempts 20 --json dead.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from scraper.selector_stats import load, rank  # noqa: E402
+
+
+def _default_path() -> Path:
+    try:
+        from config import settings
+
+        return ROOT / settings.paths.logs / "selector_stats.json"
+    except Exception:
+        return ROOT / "logs" / "selector_stats.json"
+
+
+def _short(text: str, width: int) -> str:
+    return text if len(text) <= width else text[: width - 1] + "…"
+
+
+def print_table(rows: List[Dict[str, Any]]) -> None:
+    print(f"{'group':<24}{'attempts':>9}{'hits':>7}{'hit%':>7}{'ms/try':>8}{'s/hit':>8}  selector")
+    for r in rows:
+        cost = "-" if math.isinf(r["cost_per_hit"]) else f"{r['cost_per_hit']:.3f}"
+        flag = "DEAD " if r["dead"] else ""
+        print(
+            f"{_short(r['group'], 23):<24}{r['attempts']:>9}{r['hits']:>7}{r['hit_rate'] * 100:>6.0f}%"
+            f"{r['ms_per_attempt']:>8.1f}{cost:>8}  {flag}{_short(r['selector'], 70)}"
+        )
+
+
+def dead_summary(rows: List[Dict[str, Any]]) -> List[str]:
+    by_group: Dict[str, List[Dict[str, Any]]] = {}
+    for r in rows:
+        if r["dead"]:
+            by_group.setdefault(r["group"], []).append(r)
+    lines = []
+    for group, dead in sorted(by_group.items(), key=lambda kv: -sum(r["seconds"] for r in kv[1])):
+        lines.append(f"  {group}: 후보 {len(dead)}개, 낭비 {sum(r['seconds'] for r in dead):.1f}s")
+    return lines
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="셀렉터 후보 적중률/비용 보고서")
+    p.add_argument("path", nargs="?", type=Path, default=_default_path(), help="selector_stats.json 경로")
+    p.add_argument("--group", help="이 그룹만 (예: card_price)")
+    p.add_argument("--min-attempts", type=int, default=5, help="DEAD 판정 최소 시도 수")
+    p.add_argument("--dead-only", action="store_true", help="DEAD 후보만 표시")
+    p.add_argument("--top", type=int, default=40, help="표시할 행 수, 0이면 전부")
+    p.add_argument("--json", dest="json_path", help="순위 전체를 JSON으로 저장")
+    args = p.parse_args()
+
+    data = load(args.path)
+    if not data["groups"]:
+        print(f"기록 없음: {args.path}", file=sys.stderr)
+        return 1
+    rows = rank(data, min_attempts=args.min_attempts)
+    if args.group:
+        rows = [r for r in rows if r["group"] == args.group]
+    if args.dead_only:
+        rows = [r for r in rows if r["dead"]]
+
+    print(f"{args.path} · 실행 {data['runs']}회 · 갱신 {data.get('updated') or '-'}")
+    print_table(rows[: args.top] if args.top else rows)
+    summary = dead_summary(rows)
+    if summary:
+        print(f"\n한 번도 맞지 않은 후보 (시도 {args.min_attempts}회 이상):")
+        print("\n".join(summary))
+    if args.json_path:
+        out = [dict(r, cost_per_hit=None if math.isinf(r["cost_per_hit"]) else r["cost_per_hit"]) for r in rows]
+        Path(args.json_path).write_text(json.dumps(out, ensure_ascii=False, indent=1), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())